@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
+from retro_fantasy.formulation import FormulationOptions
+from retro_fantasy.instrumentation import record_phases
 from retro_fantasy.io import load_rounds_from_json, load_team_rules_from_json
 from retro_fantasy.main import solve_retro_fantasy
 from retro_fantasy.solution import build_solution_summary, dumps_solution_summary_pretty
@@ -35,26 +38,46 @@ def main() -> None:
 
     rounds = load_rounds_from_json(data_dir / "rounds.json", num_rounds=num_rounds)
 
-    result = solve_retro_fantasy(
-        players_json_path=data_dir / "players_final.json",
-        position_updates_csv_path=data_dir / "position_updates.csv",
-        team_rules=team_rules,
-        rounds=rounds,
-        squad_id_filter=squad_id_filter,
-        solve=True,
-        enable_solver_output=False,
+    # Per-phase timings are written to output/phases.json. Set
+    # RETRO_FANTASY_TRACE_MEMORY=1 to also record tracemalloc deltas.
+    trace_memory = os.environ.get("RETRO_FANTASY_TRACE_MEMORY") == "1"
+
+    # Set RETRO_FANTASY_LEAN=1 to drop the provably redundant rows (smaller LP,
+    # faster build; same optimum), RETRO_FANTASY_TRADE_FLOW=1 to derive trades
+    # from squad changes with continuous trade variables and
+    # RETRO_FANTASY_CONTINUOUS_SCORING=1 to make the scored/captain flags
+    # continuous (fewer binaries either way).
+    formulation_options = FormulationOptions(
+        lean=os.environ.get("RETRO_FANTASY_LEAN") == "1",
+        trade_flow=os.environ.get("RETRO_FANTASY_TRADE_FLOW") == "1",
+        continuous_scoring=os.environ.get("RETRO_FANTASY_CONTINUOUS_SCORING") == "1",
     )
 
-    if result.status != "Optimal":
-        # Still emit something helpful.
-        print(json.dumps({"status": result.status, "objective_value": result.objective_value}, indent=2))
-        return
-
-    summary = build_solution_summary(
-        model_input_data=result.model_input_data,
-        decision_variables=result.decision_variables,
-        problem=result.problem,
-    )
+    with record_phases(trace_memory=trace_memory) as phases:
+        result = solve_retro_fantasy(
+            players_json_path=data_dir / "players_final.json",
+            position_updates_csv_path=data_dir / "position_updates.csv",
+            team_rules=team_rules,
+            rounds=rounds,
+            squad_id_filter=squad_id_filter,
+            solve=True,
+            enable_solver_output=False,
+            formulation_options=formulation_options,
+        )
+
+        if result.status != "Optimal":
+            phases.write_json(output_dir / "phases.json")
+            # Still emit something helpful.
+            print(json.dumps({"status": result.status, "objective_value": result.objective_value}, indent=2))
+            return
+
+        summary = build_solution_summary(
+            model_input_data=result.model_input_data,
+            decision_variables=result.decision_variables,
+            problem=result.problem,
+        )
+
+    phases.write_json(output_dir / "phases.json")
 
     # Write to output file.
     out_path = output_dir / "solution.json"
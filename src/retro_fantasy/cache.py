@@ -0,0 +1,240 @@
+"""On-disk cache of parsed season data.
+
+Parsing ``players_final.json`` and ``position_updates.csv`` and building the
+:class:`~retro_fantasy.data.Player` objects is repeated on every run. This
+module stores the *post-parse* season (players, per-round scores/prices and
+eligibility with DPP updates applied) in a compact ``.npz`` file and reloads it
+on later runs.
+
+Cache entries are keyed by a SHA-256 over:
+
+- the bytes of the players JSON and position updates CSV
+- the loader options that change the parsed result (``include_round0``,
+  ``position_code_map``, ``squad_id_filter``)
+- :data:`CACHE_FORMAT_VERSION`
+
+so any change to the inputs or options transparently produces a new entry.
+
+File layout (all plain NumPy arrays, loaded with ``allow_pickle=False``):
+
+- ``meta``: JSON header (format version and cache key)
+- ``player_ids``, ``first_names``, ``last_names``, ``squad_ids`` (-1 = missing),
+  ``original_masks``: one entry per player
+- ``round_indptr``: CSR-style offsets into the per-(player, round) arrays
+- ``round_numbers``, ``round_scores``, ``round_prices``, ``round_masks``
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, FrozenSet, Mapping
+
+import numpy as np
+
+from retro_fantasy.data import Player, PlayerRoundInfo, Position, mask_to_positions, positions_to_mask
+from retro_fantasy.instrumentation import instrumented
+from retro_fantasy.io import DEFAULT_POSITION_CODE_MAP, load_players_from_json
+
+
+logger = logging.getLogger(__name__)
+
+
+# Bump whenever the parsed representation or file layout changes.
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIRNAME = ".retro_fantasy_cache"
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def season_cache_key(
+    players_json_path: str | Path,
+    *,
+    position_updates_csv: str | Path | None = None,
+    position_code_map: Mapping[int, Position] = DEFAULT_POSITION_CODE_MAP,
+    include_round0: bool = False,
+    squad_id_filter: FrozenSet[int] | None = None,
+) -> str:
+    """Return the cache key for a given set of loader inputs and options."""
+
+    header = {
+        "format_version": CACHE_FORMAT_VERSION,
+        "players_json_sha256": _sha256_file(Path(players_json_path)),
+        "position_updates_csv_sha256": (
+            _sha256_file(Path(position_updates_csv)) if position_updates_csv is not None else None
+        ),
+        "include_round0": bool(include_round0),
+        "position_code_map": sorted((int(code), pos.value) for code, pos in position_code_map.items()),
+        "squad_id_filter": sorted(int(x) for x in squad_id_filter) if squad_id_filter is not None else None,
+    }
+    canonical = json.dumps(header, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@instrumented("cache.save")
+def save_players_cache(path: str | Path, players: Mapping[int, Player], *, key: str) -> None:
+    """Write ``players`` to ``path`` in the cache format.
+
+    The file is written to a temporary name and then atomically renamed, so a
+    crash mid-write never leaves a truncated cache entry behind.
+    """
+
+    path = Path(path)
+    ordered = list(players.values())
+
+    round_indptr = np.zeros(len(ordered) + 1, dtype=np.int64)
+    round_numbers: list[int] = []
+    round_scores: list[float] = []
+    round_prices: list[float] = []
+    round_masks: list[int] = []
+
+    for i, player in enumerate(ordered):
+        for r in sorted(player.by_round):
+            info = player.by_round[r]
+            round_numbers.append(r)
+            round_scores.append(info.score)
+            round_prices.append(info.price)
+            round_masks.append(positions_to_mask(info.eligible_positions))
+        round_indptr[i + 1] = len(round_numbers)
+
+    meta = {"format_version": CACHE_FORMAT_VERSION, "key": key}
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        np.savez(
+            f,
+            meta=np.array(json.dumps(meta)),
+            player_ids=np.array([p.player_id for p in ordered], dtype=np.int64),
+            first_names=np.array([p.first_name for p in ordered], dtype=np.str_),
+            last_names=np.array([p.last_name for p in ordered], dtype=np.str_),
+            squad_ids=np.array([-1 if p.squad_id is None else int(p.squad_id) for p in ordered], dtype=np.int64),
+            original_masks=np.array([positions_to_mask(p.original_positions) for p in ordered], dtype=np.uint8),
+            round_indptr=round_indptr,
+            round_numbers=np.array(round_numbers, dtype=np.int64),
+            round_scores=np.array(round_scores, dtype=np.float64),
+            round_prices=np.array(round_prices, dtype=np.float64),
+            round_masks=np.array(round_masks, dtype=np.uint8),
+        )
+    os.replace(tmp_path, path)
+
+
+@instrumented("cache.load")
+def load_players_cache(path: str | Path, *, key: str | None = None) -> Dict[int, Player]:
+    """Read players from a cache file written by :func:`save_players_cache`.
+
+    Raises
+    ------
+    ValueError
+        If the file has a different format version, or ``key`` is given and
+        does not match the stored key.
+    """
+
+    with np.load(Path(path), allow_pickle=False) as npz:
+        meta = json.loads(str(npz["meta"]))
+        if meta.get("format_version") != CACHE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported cache format version: {meta.get('format_version')!r}")
+        if key is not None and meta.get("key") != key:
+            raise ValueError("Cache key mismatch")
+
+        player_ids = npz["player_ids"].tolist()
+        first_names = npz["first_names"].tolist()
+        last_names = npz["last_names"].tolist()
+        squad_ids = npz["squad_ids"].tolist()
+        original_masks = npz["original_masks"].tolist()
+        round_indptr = npz["round_indptr"].tolist()
+        round_numbers = npz["round_numbers"].tolist()
+        round_scores = npz["round_scores"].tolist()
+        round_prices = npz["round_prices"].tolist()
+        round_masks = npz["round_masks"].tolist()
+
+    players: Dict[int, Player] = {}
+    for i, pid in enumerate(player_ids):
+        player = Player(
+            player_id=pid,
+            first_name=first_names[i],
+            last_name=last_names[i],
+            squad_id=None if squad_ids[i] < 0 else squad_ids[i],
+            original_positions=mask_to_positions(original_masks[i]),
+        )
+        for t in range(round_indptr[i], round_indptr[i + 1]):
+            r = round_numbers[t]
+            player.by_round[r] = PlayerRoundInfo(
+                round_number=r,
+                score=round_scores[t],
+                price=round_prices[t],
+                eligible_positions=mask_to_positions(round_masks[t]),
+            )
+        players[pid] = player
+
+    return players
+
+
+def load_players_cached(
+    players_json_path: str | Path,
+    *,
+    cache_dir: str | Path | None = None,
+    position_code_map: Mapping[int, Position] = DEFAULT_POSITION_CODE_MAP,
+    include_round0: bool = False,
+    position_updates_csv: str | Path | None = None,
+    squad_id_filter: FrozenSet[int] | None = None,
+) -> Dict[int, Player]:
+    """Cached drop-in for :func:`retro_fantasy.io.load_players_from_json`.
+
+    Parameters
+    ----------
+    cache_dir:
+        Directory holding cache entries. Defaults to
+        ``<players_json dir>/.retro_fantasy_cache``.
+
+    Notes
+    -----
+    An unreadable or stale cache entry is treated as a miss: the inputs are
+    parsed again and the entry is rewritten.
+    """
+
+    players_json_path = Path(players_json_path)
+    cache_dir = Path(cache_dir) if cache_dir is not None else players_json_path.parent / DEFAULT_CACHE_DIRNAME
+
+    key = season_cache_key(
+        players_json_path,
+        position_updates_csv=position_updates_csv,
+        position_code_map=position_code_map,
+        include_round0=include_round0,
+        squad_id_filter=squad_id_filter,
+    )
+    cache_path = cache_dir / f"players_{key[:32]}.npz"
+
+    if cache_path.exists():
+        try:
+            players = load_players_cache(cache_path, key=key)
+            logger.info("Loaded %d players from cache: %s", len(players), cache_path)
+            return players
+        except Exception as e:  # any unreadable entry is just a cache miss
+            logger.warning("Ignoring unreadable player cache %s (%s)", cache_path, e)
+
+    players = load_players_from_json(
+        players_json_path,
+        position_code_map=position_code_map,
+        include_round0=include_round0,
+        position_updates_csv=position_updates_csv,
+        squad_id_filter=squad_id_filter,
+    )
+
+    try:
+        save_players_cache(cache_path, players, key=key)
+    except OSError as e:
+        # Caching is an optimisation; a read-only location must not break loading.
+        logger.warning("Could not write player cache %s (%s)", cache_path, e)
+
+    return players
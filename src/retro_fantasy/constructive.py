@@ -0,0 +1,442 @@
+"""Greedy + dynamic-programming constructive heuristic.
+
+Builds a feasible season plan without a MILP solver, in seconds for the full
+season. The plan is a baseline to report against and a MIP start: pass its
+``summary`` as ``warm_start`` to :func:`retro_fantasy.main.solve_retro_fantasy`,
+or its ``warm_start`` to :func:`retro_fantasy.warm_start.apply_warm_start` /
+:func:`retro_fantasy.warm_start.warm_start_vector`.
+
+Valuation
+---------
+Decisions in round ``r`` look ahead ``horizon`` rounds (``r`` included). A
+player is worth
+
+- in an on-field slot: their scores over the lookahead plus the value of
+  their price change over it;
+- on the bench: the value of their price change alone (the bench never
+  scores).
+
+A price change is converted to points at the season's "magic number" (the
+median round-1 price per average point), once for every round left after the
+lookahead and scaled by ``cash_weight``: cash made now pays for upgrades later,
+and is worth nothing at the end of the season.
+
+Construction
+------------
+1. Round 1 starts from the cheapest squad that fits the positional structure
+   and repeatedly makes the single-slot upgrade with the largest value gain
+   per dollar that fits in the remaining salary cap.
+2. In each later round the candidate trades are (out, in) pairs where the
+   incoming player takes the outgoing player's slot. For each outgoing player
+   only the Pareto-optimal incoming candidates by (net cost, value gain) are
+   kept. A knapsack DP over the pairs then picks at most ``Round.max_trades``
+   of them, with distinct players, whose net cost fits in the bank and whose
+   total gain is largest (no trades if nothing gains).
+3. Every round, players are put on field greedily by round score (as long as
+   the rest of the squad can still fill the remaining slots), the
+   ``counted_onfield_players`` best on-field scores are counted and the best
+   of those is captain.
+
+Only players with a price in the trade round are traded, and only players
+with eligibility data for every remaining round are bought, so the squad
+always fits the positional structure.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from retro_fantasy.data import ModelInputData
+from retro_fantasy.instrumentation import instrumented
+from retro_fantasy.slots import Slot, assign_slots, fill_round_1_squad, match_slots, squad_slots
+from retro_fantasy.solution import SolutionSummary, build_solution_summary_from_values
+from retro_fantasy.warm_start import WarmStart
+
+
+logger = logging.getLogger(__name__)
+
+
+# Status reported in the summary of a constructive plan.
+HEURISTIC_STATUS = "Heuristic"
+
+_TOL = 1e-9
+
+# A candidate trade: (player out, player in, value gain, net cost).
+_Trade = Tuple[int, int, float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class ConstructiveConfig:
+    """Constructive heuristic settings.
+
+    Attributes
+    ----------
+    horizon:
+        Number of rounds (the current one included) over which players are
+        valued.
+    cash_weight:
+        Scale of the points value of a price change (0 ignores cash
+        generation).
+    candidates_per_out:
+        Maximum number of incoming candidates kept per outgoing player.
+    max_labels:
+        Maximum number of partial trade sets kept per trade count in the DP.
+    """
+
+    horizon: int = 6
+    cash_weight: float = 0.5
+    candidates_per_out: int = 6
+    max_labels: int = 64
+
+    def __post_init__(self) -> None:
+        if self.horizon < 1:
+            raise ValueError("ConstructiveConfig.horizon must be >= 1")
+        if self.cash_weight < 0:
+            raise ValueError("ConstructiveConfig.cash_weight must be >= 0")
+        if self.candidates_per_out < 1:
+            raise ValueError("ConstructiveConfig.candidates_per_out must be >= 1")
+        if self.max_labels < 1:
+            raise ValueError("ConstructiveConfig.max_labels must be >= 1")
+
+
+@dataclass(slots=True)
+class ConstructiveResult:
+    """Outcome of :func:`build_constructive_plan`.
+
+    ``warm_start`` assigns every decision variable of the plan; ``summary`` is
+    the same plan as a :class:`~retro_fantasy.solution.SolutionSummary` with
+    status :data:`HEURISTIC_STATUS`.
+    """
+
+    objective_value: float
+    warm_start: WarmStart
+    summary: SolutionSummary
+    seconds: float
+
+
+def planning_values(model_input_data: ModelInputData, config: ConstructiveConfig) -> tuple[np.ndarray, np.ndarray]:
+    """The heuristic's (on-field, bench) value of every (player, round), each with shape (P, R).
+
+    See "Valuation" above. Other heuristics can adjust these and pass them to
+    :func:`build_constructive_plan` as ``values`` to steer the plan.
+    """
+
+    scores = model_input_data.scores
+    prices = model_input_data.prices
+    has_prices = model_input_data.has_prices
+    num_players, num_rounds = scores.shape
+
+    end = np.minimum(np.arange(num_rounds) + config.horizon, num_rounds)
+    cumulative = np.concatenate([np.zeros((num_players, 1)), np.cumsum(scores, axis=1)], axis=1)
+    points = cumulative[:, end] - cumulative[:, :num_rounds]
+
+    last = end - 1
+    growth = np.where(has_prices & has_prices[:, last], prices[:, last] - prices, 0.0)
+
+    played = np.count_nonzero(scores > 0, axis=1)
+    average = scores.sum(axis=1) / np.maximum(played, 1)
+    priced = has_prices[:, 0] & (average > 0)
+    points_per_dollar = 0.0
+    if priced.any():
+        points_per_dollar = 1.0 / float(np.median(prices[priced, 0] / average[priced]))
+
+    cash = config.cash_weight * points_per_dollar * np.maximum(num_rounds - end, 0)
+    bench = growth * cash[None, :]
+    return points + bench, bench
+
+
+def _pareto(costs: np.ndarray, gains: np.ndarray) -> np.ndarray:
+    """Indices of the (cost, gain) points not dominated by a cheaper-or-equal point, cheapest first."""
+
+    order = np.lexsort((-gains, costs))
+    sorted_gains = gains[order]
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = sorted_gains[1:] > np.maximum.accumulate(sorted_gains)[:-1] + _TOL
+    return order[keep]
+
+
+def _spread(indices: np.ndarray, limit: int) -> np.ndarray:
+    """At most ``limit`` entries of ``indices``, evenly spaced and keeping both ends."""
+
+    if len(indices) <= limit:
+        return indices
+    return indices[np.unique(np.linspace(0, len(indices) - 1, limit).round().astype(np.int64))]
+
+
+class _Planner:
+    """Round-by-round state shared by the construction steps."""
+
+    def __init__(
+        self,
+        model_input_data: ModelInputData,
+        config: ConstructiveConfig,
+        values: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> None:
+        self.data = model_input_data
+        self.config = config
+        self.pi = model_input_data.player_index
+        self.ki = model_input_data.position_index
+        self.player_ids = np.asarray(model_input_data.player_ids)
+        self.prices = model_input_data.prices
+        self.has_prices = model_input_data.has_prices
+        self.eligible = model_input_data.eligible
+        # (on-field, bench) values; other heuristics may steer the plan with their own.
+        self.on_field_value, self.bench_value = values or planning_values(model_input_data, config)
+
+        # A player can be bought in round j only if they have eligibility data
+        # for every round from j on (so they can always fill some slot).
+        present = model_input_data.eligibility_masks != 0
+        holdable = np.logical_and.accumulate(present[:, ::-1], axis=1)[:, ::-1]
+        self.buyable = model_input_data.has_prices & holdable
+
+    def _slot_candidates(self, slot: Slot, j: int, in_squad: np.ndarray) -> np.ndarray:
+        mask = self.buyable[:, j] & ~in_squad
+        if slot[1] is not None:
+            mask &= self.eligible[:, self.ki[slot[1]], j]
+        return mask
+
+    def _slot_value(self, slot: Slot, j: int) -> np.ndarray:
+        return self.on_field_value[:, j] if slot[0] == "on_field" else self.bench_value[:, j]
+
+    def _in_squad(self, assignment: Dict[int, Slot]) -> np.ndarray:
+        mask = np.zeros(len(self.player_ids), dtype=bool)
+        mask[[self.pi[p] for p in assignment]] = True
+        return mask
+
+    def initial_squad(self) -> tuple[Dict[int, Slot], float]:
+        """Round-1 squad (player -> slot) and the bank left after buying it."""
+
+        data = self.data
+        r = data.round_numbers[0]
+        squad = fill_round_1_squad(data, [], {})
+        assignment = assign_slots(data, squad, r, {})
+        spend = float(sum(self.prices[self.pi[p], 0] for p in squad))
+        if assignment is None or spend > data.salary_cap:
+            raise ValueError("No squad fits the positional structure under the salary cap")
+
+        budget = data.salary_cap - spend
+        in_squad = self._in_squad(assignment)
+        tiny = _TOL * max(data.salary_cap, 1.0)
+        while True:
+            best: tuple[float, int, int, float] | None = None
+            for p, slot in assignment.items():
+                i = self.pi[p]
+                value = self._slot_value(slot, 0)
+                gains = value - value[i]
+                costs = self.prices[:, 0] - self.prices[i, 0]
+                mask = self._slot_candidates(slot, 0, in_squad) & (gains > _TOL) & (costs <= budget + _TOL)
+                if not mask.any():
+                    continue
+                ratios = np.where(mask, gains / np.maximum(costs, tiny), -np.inf)
+                c = int(np.argmax(ratios))
+                if best is None or ratios[c] > best[0]:
+                    best = (float(ratios[c]), p, c, float(costs[c]))
+            if best is None:
+                break
+            _, p_out, c, cost = best
+            assignment[int(self.player_ids[c])] = assignment.pop(p_out)
+            in_squad[self.pi[p_out]] = False
+            in_squad[c] = True
+            budget -= cost
+        return assignment, budget
+
+    def candidate_trades(self, assignment: Dict[int, Slot], j: int, bank: float, max_trades: int) -> List[_Trade]:
+        """Pareto-optimal (out, in) pairs per outgoing player, cheapest first."""
+
+        in_squad = self._in_squad(assignment)
+        prices = self.prices[:, j]
+
+        frontiers: list[tuple[int, np.ndarray, np.ndarray, np.ndarray]] = []
+        for p, slot in assignment.items():
+            i = self.pi[p]
+            if not self.has_prices[i, j]:
+                continue
+            candidates = np.flatnonzero(self._slot_candidates(slot, j, in_squad))
+            if not len(candidates):
+                continue
+            value = self._slot_value(slot, j)
+            gains = value[candidates] - value[i]
+            costs = prices[candidates] - prices[i]
+            # Only points beyond "no trade" (zero cost, zero gain) are useful.
+            front = _pareto(costs, gains)
+            front = front[(gains[front] > _TOL) | (costs[front] < -_TOL)]
+            if len(front):
+                frontiers.append((p, candidates[front], gains[front], costs[front]))
+
+        # A pair can cost at most the bank plus what the other trades release.
+        releases = sorted((max(0.0, -float(costs[0])) for _, _, _, costs in frontiers), reverse=True)
+        limit = bank + sum(releases[: max_trades - 1]) + _TOL
+
+        trades: List[_Trade] = []
+        for p, candidates, gains, costs in frontiers:
+            affordable = np.flatnonzero(costs <= limit)
+            for t in _spread(affordable, self.config.candidates_per_out).tolist():
+                trades.append((p, int(self.player_ids[candidates[t]]), float(gains[t]), float(costs[t])))
+        return trades
+
+    def choose_trades(self, trades: List[_Trade], bank: float, max_trades: int) -> List[_Trade]:
+        """Knapsack DP: the best set of at most ``max_trades`` disjoint trades whose net cost fits ``bank``."""
+
+        # labels[c]: partial trade sets of size c as (gain, cost, trades).
+        labels: list[list[tuple[float, float, tuple[_Trade, ...]]]] = [[(0.0, 0.0, ())]]
+        labels += [[] for _ in range(max_trades)]
+        for trade in trades:
+            p_out, p_in, gain, cost = trade
+            for c in range(max_trades - 1, -1, -1):
+                extended = [
+                    (g + gain, k + cost, chosen + (trade,))
+                    for g, k, chosen in labels[c]
+                    if all(o != p_out and n != p_in for o, n, _, _ in chosen)
+                ]
+                if extended:
+                    labels[c + 1] = self._prune(labels[c + 1] + extended)
+
+        best: tuple[float, float, tuple[_Trade, ...]] = (0.0, 0.0, ())
+        for level in labels[1:]:
+            for label in level:
+                if label[1] <= bank + _TOL and label[0] > best[0] + _TOL:
+                    best = label
+        return list(best[2])
+
+    def _prune(
+        self, labels: list[tuple[float, float, tuple[_Trade, ...]]]
+    ) -> list[tuple[float, float, tuple[_Trade, ...]]]:
+        gains = np.array([label[0] for label in labels])
+        costs = np.array([label[1] for label in labels])
+        keep = _spread(_pareto(costs, gains), self.config.max_labels)
+        return [labels[k] for k in keep.tolist()]
+
+    def lineup(self, assignment: Dict[int, Slot], r: int) -> Dict[int, Slot]:
+        """Re-place the squad for round ``r``: highest round scores on field first."""
+
+        data = self.data
+        j = data.round_index[r]
+        scores = data.scores[:, j]
+        open_on_field = {k: data.on_field_required(k) for k in data.positions}
+        remaining = squad_slots(data)
+        placed: Dict[int, Slot] = {}
+
+        for p in sorted(assignment, key=lambda p: (-scores[self.pi[p]], self.pi[p])):
+            if scores[self.pi[p]] <= 0 or not any(open_on_field.values()):
+                break
+            for k in data.positions:
+                if not open_on_field[k] or not self.eligible[self.pi[p], self.ki[k], j]:
+                    continue
+                slot: Slot = ("on_field", k)
+                trial = list(remaining)
+                trial.remove(slot)
+                rest = [q for q in assignment if q not in placed and q != p]
+                if match_slots(data, rest, r, assignment, slots=trial) is not None:
+                    placed[p] = slot
+                    remaining = trial
+                    open_on_field[k] -= 1
+                    break
+
+        rest = [q for q in assignment if q not in placed]
+        matched = match_slots(data, rest, r, assignment, slots=remaining)
+        if matched is None:  # cannot happen: every placement above was checked
+            raise RuntimeError(f"Round-{r} squad no longer fits the positional structure")
+        return {**placed, **matched}
+
+
+def _construct(model_input_data: ModelInputData, planner: _Planner) -> tuple[WarmStart, float]:
+    """Run the construction steps with ``planner``; returns the plan and its objective value."""
+
+    data = model_input_data
+    scores = data.scores
+    pi = data.player_index
+
+    ws = WarmStart()
+    objective_value = 0.0
+    assignment: Dict[int, Slot] = {}
+    bank = 0.0
+
+    for t, r in enumerate(data.round_numbers):
+        j = data.round_index[r]
+        if t == 0:
+            assignment, bank = planner.initial_squad()
+        else:
+            placed = assign_slots(data, list(assignment), r, assignment)
+            if placed is None:
+                raise ValueError(f"Round-{r} squad no longer fits the positional structure")
+            assignment = placed
+            max_trades = data.max_trades(r)
+            if max_trades > 0:
+                trades = planner.candidate_trades(assignment, j, bank, max_trades)
+                for p_out, p_in, _, cost in planner.choose_trades(trades, bank, max_trades):
+                    assignment[p_in] = assignment.pop(p_out)
+                    ws.traded_out[(p_out, r)] = 1.0
+                    ws.traded_in[(p_in, r)] = 1.0
+                    bank -= cost
+
+        assignment = planner.lineup(assignment, r)
+        ws.bank[r] = float(bank)
+
+        on_field = sorted(
+            (p for p, slot in assignment.items() if slot[0] == "on_field"),
+            key=lambda p: (-scores[pi[p], j], pi[p]),
+        )
+        counted = on_field[: data.counted_onfield_players(r)]
+        for p, (kind, k) in assignment.items():
+            ws.x_selected[(p, r)] = 1.0
+            if kind == "on_field":
+                ws.y_onfield[(p, k, r)] = 1.0
+            elif kind == "bench":
+                ws.y_bench[(p, k, r)] = 1.0
+            else:
+                ws.y_utility[(p, r)] = 1.0
+        for p in counted:
+            ws.scored[(p, r)] = 1.0
+            objective_value += float(scores[pi[p], j])
+        if counted:
+            ws.captain[(counted[0], r)] = 1.0
+            objective_value += float(scores[pi[counted[0]], j])
+
+    return ws, objective_value
+
+
+@instrumented("constructive.build_plan")
+def build_constructive_plan(
+    model_input_data: ModelInputData,
+    *,
+    config: ConstructiveConfig | None = None,
+    values: tuple[np.ndarray, np.ndarray] | None = None,
+) -> ConstructiveResult:
+    """Build a feasible season plan for ``model_input_data`` without a solver.
+
+    Parameters
+    ----------
+    values:
+        (on-field, bench) player values with shape (P, R) used instead of
+        :func:`planning_values`.
+
+    Raises
+    ------
+    ValueError
+        If no round-1 squad fits the positional structure under the salary cap,
+        or a held squad stops fitting it in a later round.
+    """
+
+    start = time.perf_counter()
+    config = config or ConstructiveConfig()
+    ws, objective_value = _construct(model_input_data, _Planner(model_input_data, config, values=values))
+
+    summary = build_solution_summary_from_values(
+        model_input_data=model_input_data,
+        values=ws,
+        status=HEURISTIC_STATUS,
+        objective_value=objective_value,
+    )
+    seconds = time.perf_counter() - start
+    logger.info(
+        "Constructive plan: objective=%s trades=%d time=%.2fs",
+        objective_value,
+        len(ws.traded_in),
+        seconds,
+    )
+    return ConstructiveResult(objective_value=objective_value, warm_start=ws, summary=summary, seconds=seconds)
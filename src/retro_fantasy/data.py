@@ -8,10 +8,15 @@ I/O, parsing, and dataset construction live in :mod:`retro_fantasy.io`.
 
 from __future__ import annotations
 
+from collections.abc import Mapping as MappingABC
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import cached_property
-from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Sequence
+from typing import Dict, FrozenSet, Iterable, Iterator, Mapping, Optional, Sequence
+
+import numpy as np
+
+from retro_fantasy.instrumentation import instrumented
 
 
 class Position(str, Enum):
@@ -23,6 +28,38 @@ class Position(str, Enum):
     FWD = "FWD"
 
 
+# Bit assigned to each position when a set of positions is stored as an
+# integer mask (e.g. in on-disk caches). Order follows the Position enum.
+POSITION_BITS: Mapping[Position, int] = {pos: 1 << i for i, pos in enumerate(Position)}
+
+# All 16 possible position sets, indexed by mask, so equal sets are shared.
+_POSITION_SETS_BY_MASK: tuple[FrozenSet[Position], ...] = tuple(
+    frozenset(pos for pos, bit in POSITION_BITS.items() if mask & bit) for mask in range(1 << len(POSITION_BITS))
+)
+
+
+def positions_to_mask(positions: Iterable[Position]) -> int:
+    """Encode a set of positions as an integer bitmask (see :data:`POSITION_BITS`)."""
+
+    mask = 0
+    for pos in positions:
+        mask |= POSITION_BITS[pos]
+    return mask
+
+
+def mask_to_positions(mask: int) -> FrozenSet[Position]:
+    """Decode a bitmask from :func:`positions_to_mask` into an (interned) frozenset."""
+
+    return _POSITION_SETS_BY_MASK[int(mask)]
+
+
+def expand_position_masks(masks: np.ndarray, positions: Sequence[Position]) -> np.ndarray:
+    """Expand (P, R) position masks into a (P, K, R) boolean array, K following ``positions``."""
+
+    bits = np.array([POSITION_BITS[k] for k in positions], dtype=np.uint8)
+    return (masks[:, None, :] & bits[None, :, None]) != 0
+
+
 @dataclass(frozen=True, slots=True)
 class Round:
     """Round-level parameters."""
@@ -91,6 +128,250 @@ class Player:
             raise KeyError(f"No data for player {self.player_id} in round {round_number}") from e
 
 
+class _PlayerRoundsView(MappingABC):
+    """Read-only ``round number -> PlayerRoundInfo`` view of one :class:`SeasonStore` row.
+
+    ``PlayerRoundInfo`` objects are created on access and not kept.
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: SeasonStore, row: int) -> None:
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, round_number: int) -> PlayerRoundInfo:
+        store, i = self._store, self._row
+        j = store.round_column.get(round_number)
+        if j is None or not store.has_data[i, j]:
+            raise KeyError(round_number)
+        return PlayerRoundInfo(
+            round_number=round_number,
+            score=float(store.scores[i, j]),
+            price=float(store.prices[i, j]),
+            eligible_positions=mask_to_positions(store.masks[i, j]),
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        store = self._store
+        return (store.round_numbers[j] for j in np.flatnonzero(store.has_data[self._row]).tolist())
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._store.has_data[self._row]))
+
+
+class PlayerView:
+    """Lightweight, read-only stand-in for :class:`Player` backed by a :class:`SeasonStore` row.
+
+    Supports the attributes and methods the optimiser uses on ``Player``
+    (``player_id``, names, ``squad_id``, ``original_positions``, ``by_round``,
+    ``name`` and ``get_round``).
+    """
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: SeasonStore, row: int) -> None:
+        self._store = store
+        self._row = row
+
+    @property
+    def player_id(self) -> int:
+        return self._store.player_ids[self._row]
+
+    @property
+    def first_name(self) -> str:
+        return self._store.first_names[self._row]
+
+    @property
+    def last_name(self) -> str:
+        return self._store.last_names[self._row]
+
+    @property
+    def squad_id(self) -> Optional[int]:
+        return self._store.squad_ids[self._row]
+
+    @property
+    def original_positions(self) -> FrozenSet[Position]:
+        return mask_to_positions(self._store.original_masks[self._row])
+
+    @property
+    def by_round(self) -> Mapping[int, PlayerRoundInfo]:
+        return _PlayerRoundsView(self._store, self._row)
+
+    @property
+    def name(self) -> str:
+        return f"{self.first_name} {self.last_name}".strip()
+
+    def get_round(self, round_number: int) -> PlayerRoundInfo:
+        try:
+            return self.by_round[round_number]
+        except KeyError as e:
+            raise KeyError(f"No data for player {self.player_id} in round {round_number}") from e
+
+    def __repr__(self) -> str:
+        return f"PlayerView(player_id={self.player_id}, name={self.name!r})"
+
+
+class SeasonStore:
+    """Columnar season data: one row per player, one column per round.
+
+    The per-round data that :class:`Player` keeps as a dict of
+    :class:`PlayerRoundInfo` objects lives here in contiguous arrays, with
+    eligibility as a :data:`POSITION_BITS` mask per (player, round). Position
+    sets are only materialised on access, from the interned table behind
+    :func:`mask_to_positions`.
+
+    Attributes
+    ----------
+    player_ids, first_names, last_names, squad_ids:
+        Per-player metadata, in row order.
+    round_numbers:
+        Sorted round numbers, in column order.
+    scores, prices:
+        float64 arrays of shape (players, rounds); 0 where there is no data.
+    has_data:
+        bool array of shape (players, rounds): the player has a
+        ``PlayerRoundInfo`` for that round.
+    masks:
+        uint8 eligibility masks of shape (players, rounds); 0 where there is no data.
+    original_masks:
+        uint8 mask of each player's original positions.
+    """
+
+    def __init__(
+        self,
+        *,
+        player_ids: Sequence[int],
+        first_names: Sequence[str],
+        last_names: Sequence[str],
+        squad_ids: Sequence[Optional[int]],
+        original_masks: np.ndarray,
+        round_numbers: Sequence[int],
+        scores: np.ndarray,
+        prices: np.ndarray,
+        has_data: np.ndarray,
+        masks: np.ndarray,
+    ) -> None:
+        n_p, n_r = len(player_ids), len(round_numbers)
+        for label, arr in (("scores", scores), ("prices", prices), ("has_data", has_data), ("masks", masks)):
+            if arr.shape != (n_p, n_r):
+                raise ValueError(f"SeasonStore.{label} must have shape {(n_p, n_r)}, got {arr.shape}")
+        if len(set(player_ids)) != n_p:
+            raise ValueError("SeasonStore.player_ids must be unique")
+        if list(round_numbers) != sorted(set(round_numbers)):
+            raise ValueError("SeasonStore.round_numbers must be sorted and unique")
+
+        self.player_ids: tuple[int, ...] = tuple(int(p) for p in player_ids)
+        self.first_names: tuple[str, ...] = tuple(first_names)
+        self.last_names: tuple[str, ...] = tuple(last_names)
+        self.squad_ids: tuple[Optional[int], ...] = tuple(squad_ids)
+        self.original_masks = np.asarray(original_masks, dtype=np.uint8)
+        self.round_numbers: tuple[int, ...] = tuple(int(r) for r in round_numbers)
+        self.scores = np.asarray(scores, dtype=np.float64)
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.has_data = np.asarray(has_data, dtype=bool)
+        self.masks = np.asarray(masks, dtype=np.uint8)
+
+        self.player_row: Dict[int, int] = {p: i for i, p in enumerate(self.player_ids)}
+        self.round_column: Dict[int, int] = {r: j for j, r in enumerate(self.round_numbers)}
+
+        for arr in (self.original_masks, self.scores, self.prices, self.has_data, self.masks):
+            arr.flags.writeable = False
+
+    @classmethod
+    def from_players(cls, players: Mapping[int, Player]) -> SeasonStore:
+        """Convert ``Player`` objects into a store (rows in ``players`` order)."""
+
+        ordered = list(players.values())
+        round_numbers = sorted({r for player in ordered for r in player.by_round})
+        column = {r: j for j, r in enumerate(round_numbers)}
+
+        shape = (len(ordered), len(round_numbers))
+        scores = np.zeros(shape, dtype=np.float64)
+        prices = np.zeros(shape, dtype=np.float64)
+        has_data = np.zeros(shape, dtype=bool)
+        masks = np.zeros(shape, dtype=np.uint8)
+        for i, player in enumerate(ordered):
+            for r, info in player.by_round.items():
+                j = column[r]
+                scores[i, j] = info.score
+                prices[i, j] = info.price
+                has_data[i, j] = True
+                masks[i, j] = positions_to_mask(info.eligible_positions)
+
+        return cls(
+            player_ids=[p.player_id for p in ordered],
+            first_names=[p.first_name for p in ordered],
+            last_names=[p.last_name for p in ordered],
+            squad_ids=[p.squad_id for p in ordered],
+            original_masks=np.array([positions_to_mask(p.original_positions) for p in ordered], dtype=np.uint8),
+            round_numbers=round_numbers,
+            scores=scores,
+            prices=prices,
+            has_data=has_data,
+            masks=masks,
+        )
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    @cached_property
+    def players(self) -> Dict[int, PlayerView]:
+        """Player ID -> :class:`PlayerView`, usable wherever a ``Dict[int, Player]`` is read."""
+
+        return {p: PlayerView(self, i) for i, p in enumerate(self.player_ids)}
+
+    def to_players(self) -> Dict[int, Player]:
+        """Materialise full :class:`Player` objects (e.g. for code that mutates them)."""
+
+        players: Dict[int, Player] = {}
+        for p, view in self.players.items():
+            player = Player(
+                player_id=p,
+                first_name=view.first_name,
+                last_name=view.last_name,
+                squad_id=view.squad_id,
+                original_positions=view.original_positions,
+            )
+            player.by_round.update(view.by_round.items())
+            players[p] = player
+        return players
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the per-(player, round) arrays."""
+
+        return sum(a.nbytes for a in (self.original_masks, self.scores, self.prices, self.has_data, self.masks))
+
+    def dense_parameters(
+        self,
+        player_ids: Sequence[int],
+        round_numbers: Sequence[int],
+        salary_cap: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(scores, prices, has_prices, eligibility_masks) for the given players and rounds.
+
+        Same layout and fallbacks as :meth:`ModelInputData._dense_parameters`:
+        missing data means score 0, price = salary cap, no price and original
+        positions (DEF if there are none).
+        """
+
+        rows = np.array([self.player_row[p] for p in player_ids], dtype=np.int64)
+        columns = np.array([self.round_column.get(r, -1) for r in round_numbers], dtype=np.int64)
+        present = columns >= 0
+        cols = np.where(present, columns, 0)
+
+        has_prices = self.has_data[rows[:, None], cols[None, :]] & present[None, :]
+        scores = np.where(has_prices, self.scores[rows[:, None], cols[None, :]], 0.0)
+        prices = np.where(has_prices, self.prices[rows[:, None], cols[None, :]], float(salary_cap))
+
+        fallback = self.original_masks[rows]
+        fallback = np.where(fallback == 0, POSITION_BITS[Position.DEF], fallback).astype(np.uint8)
+        masks = np.where(has_prices, self.masks[rows[:, None], cols[None, :]], fallback[:, None]).astype(np.uint8)
+
+        return scores, prices, has_prices, masks
+
+
 @dataclass(frozen=True, slots=True)
 class TeamStructureRules:
     """Season/global team structure rules."""
@@ -136,12 +417,37 @@ class ModelInputData:
     rounds: Dict[int, Round]
     team_rules: TeamStructureRules
 
+    # Optional columnar backing store. When set (and it holds every player),
+    # the dense parameter arrays are sliced from it instead of built per player.
+    season: Optional[SeasonStore] = None
+
     def __post_init__(self) -> None:
         if not self.players:
             raise ValueError("ModelInputData.players cannot be empty")
         if not self.rounds:
             raise ValueError("ModelInputData.rounds cannot be empty")
 
+    @classmethod
+    def from_season(
+        cls,
+        season: SeasonStore,
+        *,
+        rounds: Mapping[int, Round],
+        team_rules: TeamStructureRules,
+        player_ids: Iterable[int] | None = None,
+    ) -> ModelInputData:
+        """Build from a :class:`SeasonStore`; ``players`` holds :class:`PlayerView` objects.
+
+        Parameters
+        ----------
+        player_ids:
+            Restrict the model to these players (default: every player in the store).
+        """
+
+        views = season.players
+        players = dict(views) if player_ids is None else {p: views[p] for p in player_ids}
+        return cls(players=players, rounds=dict(rounds), team_rules=team_rules, season=season)  # type: ignore[arg-type]
+
     # --- Core index sets (memoised) ---
 
     @cached_property
@@ -168,6 +474,115 @@ class ModelInputData:
 
         return tuple(Position)
 
+    # --- Dense, index-aligned parameter arrays (memoised) ---
+    #
+    # Axis order follows player_ids (P), positions (K) and round_numbers (R).
+    # Use player_index / round_index to map IDs to array offsets.
+
+    @cached_property
+    def player_index(self) -> Mapping[int, int]:
+        """Player ID -> offset along the P axis of the dense arrays."""
+
+        return {p: i for i, p in enumerate(self.player_ids)}
+
+    @cached_property
+    def round_index(self) -> Mapping[int, int]:
+        """Round number -> offset along the R axis of the dense arrays."""
+
+        return {r: j for j, r in enumerate(self.round_numbers)}
+
+    @cached_property
+    def position_index(self) -> Mapping[Position, int]:
+        """Position -> offset along the K axis of :attr:`eligible`."""
+
+        return {k: i for i, k in enumerate(self.positions)}
+
+    @cached_property
+    @instrumented("data.dense_parameters")
+    def _dense_parameters(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Build (scores, prices, has_prices, eligibility_masks) in a single pass over ``Player.by_round``.
+
+        Missing (p,r) data uses the same fallbacks as the scalar accessors:
+        score 0, price = salary cap, no price, original positions.
+        """
+
+        if self.season is not None and all(p in self.season.player_row for p in self.player_ids):
+            dense = self.season.dense_parameters(self.player_ids, self.round_numbers, self.salary_cap)
+            for arr in dense:
+                arr.flags.writeable = False
+            return dense
+
+        n_p, n_r = len(self.player_ids), len(self.round_numbers)
+        round_index = self.round_index
+        # Position sets are mostly shared (interned) objects, so memoise their masks.
+        mask_of: Dict[FrozenSet[Position], int] = {}
+
+        scores = np.zeros((n_p, n_r), dtype=np.float64)
+        prices = np.full((n_p, n_r), float(self.salary_cap), dtype=np.float64)
+        has_prices = np.zeros((n_p, n_r), dtype=bool)
+        masks = np.zeros((n_p, n_r), dtype=np.uint8)
+
+        for i, p in enumerate(self.player_ids):
+            player = self.players[p]
+
+            masks[i, :] = positions_to_mask(player.original_positions) or POSITION_BITS[Position.DEF]
+
+            for r, info in player.by_round.items():
+                j = round_index.get(r)
+                if j is None:
+                    continue
+                scores[i, j] = info.score
+                prices[i, j] = info.price
+                has_prices[i, j] = True
+                mask = mask_of.get(info.eligible_positions)
+                if mask is None:
+                    mask = mask_of[info.eligible_positions] = positions_to_mask(info.eligible_positions)
+                masks[i, j] = mask
+
+        for arr in (scores, prices, has_prices, masks):
+            arr.flags.writeable = False
+
+        return scores, prices, has_prices, masks
+
+    @property
+    def scores(self) -> np.ndarray:
+        """Dense scores s[p,r] with shape (P, R)."""
+
+        return self._dense_parameters[0]
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Dense prices c[p,r] with shape (P, R)."""
+
+        return self._dense_parameters[1]
+
+    @property
+    def has_prices(self) -> np.ndarray:
+        """Dense boolean mask of explicit (p,r) prices with shape (P, R)."""
+
+        return self._dense_parameters[2]
+
+    @property
+    def eligibility_masks(self) -> np.ndarray:
+        """Dense eligibility as :data:`POSITION_BITS` masks, uint8 with shape (P, R)."""
+
+        return self._dense_parameters[3]
+
+    @cached_property
+    def eligible(self) -> np.ndarray:
+        """Dense eligibility e[p,k,r] with shape (P, K, R)."""
+
+        eligible = expand_position_masks(self.eligibility_masks, self.positions)
+        eligible.flags.writeable = False
+        return eligible
+
+    def eligible_player_rounds(self, position: Position) -> Sequence[tuple[int, int]]:
+        """All (p,r) pairs where player p is eligible for ``position`` in round r, in (p, r) order."""
+
+        ip, ir = np.nonzero(self.eligibility_masks & POSITION_BITS[position])
+        player_ids, round_numbers = self.player_ids, self.round_numbers
+        return tuple((player_ids[i], round_numbers[j]) for i, j in zip(ip.tolist(), ir.tolist()))
+
     # --- Common parameter lookups ---
 
     def score(self, player_id: int, round_number: int) -> float:
@@ -215,7 +630,16 @@ class ModelInputData:
     def is_eligible(self, player_id: int, position: Position, round_number: int) -> bool:
         """Binary eligibility e[p,k,r] as a bool."""
 
-        return position in self.eligible_positions(player_id, round_number)
+        try:
+            j = self.round_index[round_number]
+        except KeyError:
+            return position in self.eligible_positions(player_id, round_number)
+        return bool(self._eligibility_mask_rows[self.player_index[player_id]][j] & POSITION_BITS[position])
+
+    @cached_property
+    def _eligibility_mask_rows(self) -> list[list[int]]:
+        # Python-int copy of eligibility_masks: scalar lookups on a list beat numpy indexing.
+        return self.eligibility_masks.tolist()
 
     # --- Team structure / round-level rule accessors ---
 
@@ -278,11 +702,12 @@ class ModelInputData:
         Keys are (player_id, position, round_number).
         """
 
+        eligible = self.eligible.tolist()
         return {
-            (p, k, r): self.is_eligible(p, k, r)
-            for p in self.player_ids
-            for k in self.positions
-            for r in self.round_numbers
+            (p, k, r): eligible[i][kk][j]
+            for i, p in enumerate(self.player_ids)
+            for kk, k in enumerate(self.positions)
+            for j, r in enumerate(self.round_numbers)
         }
 
     @property
@@ -311,12 +736,13 @@ class ModelInputData:
     def idx_eligible_player_position_round(self) -> Sequence[tuple[int, Position, int]]:
         """All (p,k,r) triples where player p is eligible for position k in round r."""
 
-        # Using eligibility_map avoids repeated PlayerRoundInfo lookups.
-        # We iterate the existing full index but filter down to eligible only.
+        # np.nonzero walks the (P, K, R) array in C order, i.e. the same p, k, r
+        # nesting as idx_player_position_round, which fixes the variable order.
+        ip, ik, ir = np.nonzero(self.eligible)
+        player_ids, positions, round_numbers = self.player_ids, self.positions, self.round_numbers
         return tuple(
-            (p, k, r)
-            for (p, k, r) in self.idx_player_position_round
-            if self.eligibility_map[(p, k, r)]
+            (player_ids[i], positions[k], round_numbers[j])
+            for i, k, j in zip(ip.tolist(), ik.tolist(), ir.tolist())
         )
 
     def has_price(self, player_id: int, round_number: int) -> bool:
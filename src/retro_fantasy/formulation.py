@@ -12,9 +12,17 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, Tuple
 
+import numpy as np
 import pulp
 
 from retro_fantasy.data import ModelInputData, Position
+from retro_fantasy.instrumentation import span
+
+
+# Bump whenever a change to this module changes the formulated model (variables,
+# objective, constraints or their names), so that models cached on disk by
+# retro_fantasy.model_cache are rebuilt.
+FORMULATION_VERSION = 1
 
 
 # ============================================================================
@@ -67,18 +75,76 @@ class DecisionVariables:
     bank: Dict[int, pulp.LpVariable] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class FormulationOptions:
+    """Switches that select between equivalent variants of the formulation.
+
+    Attributes
+    ----------
+    lean:
+        Omit constraint families that are provably redundant (see
+        :func:`add_constraints`). The feasible set projected onto every decision
+        variable is unchanged, so the optimal objective and the extracted
+        solution are the same as with the full formulation; only the model is
+        smaller.
+    compact_names:
+        Name column ``j`` ``v<j>`` and row ``i`` ``c<i>`` instead of the
+        semantic names (e.g. ``y_onfield_123_MID_5``), which shrinks the model
+        files written for file-based solvers. The semantic names are kept in
+        :attr:`retro_fantasy.matrix.MatrixModel.name_index`. Only supported
+        with ``build_mode="matrix"``.
+    trade_flow:
+        Derive trades from squad changes with one flow row per ``(p, r)``,
+        ``in - out == x[p,r] - x[p,r-1]``, and make ``traded_in`` /
+        ``traded_out`` continuous in ``[0, 1]`` (see :func:`add_constraints`).
+        They still take 0/1 values whenever ``x_selected`` does, so the optimal
+        objective and the extracted solution are unchanged, with fewer binaries
+        and rows.
+    continuous_scoring:
+        Make ``scored`` and ``captain`` continuous in ``[0, 1]``. With the
+        on-field selection fixed, the scoring and captaincy rows (count
+        exactly ``N_r``, only on-field, one captain who is counted) describe
+        the "sum of the top ``N_r`` on-field scores plus the top one" LP
+        exactly, so the optimal objective is unchanged. Ties can leave the
+        optimal ``scored`` / ``captain`` values fractional, so
+        :func:`retro_fantasy.solution.build_solution_summary` recovers the
+        flags by ranking the on-field scores instead of reading them.
+    """
+
+    lean: bool = False
+    compact_names: bool = False
+    trade_flow: bool = False
+    continuous_scoring: bool = False
+
+
 # ============================================================================
 # Top-level orchestrator
 # ============================================================================
 
 
-def formulate_problem(model_input_data: ModelInputData) -> tuple[pulp.LpProblem, DecisionVariables]:
+BUILD_MODES = ("pulp", "matrix")
+
+
+def formulate_problem(
+    model_input_data: ModelInputData,
+    *,
+    build_mode: str = "pulp",
+    options: FormulationOptions | None = None,
+) -> tuple[pulp.LpProblem, DecisionVariables]:
     """Create the PuLP optimisation problem and its decision variables.
 
     Parameters
     ----------
     model_input_data:
         Fully constructed model input data (players, rounds, team rules).
+    build_mode:
+        ``"pulp"`` builds every expression with PuLP directly (the reference
+        implementation below). ``"matrix"`` builds the constraint matrix as
+        NumPy arrays via :mod:`retro_fantasy.matrix` and then adapts it to an
+        identical ``pulp.LpProblem``, which is much faster on large instances.
+    options:
+        Formulation variant switches. Defaults to :class:`FormulationOptions()`
+        (the full reference formulation).
 
     Returns
     -------
@@ -87,11 +153,25 @@ def formulate_problem(model_input_data: ModelInputData) -> tuple[pulp.LpProblem,
         incrementally as this module is implemented.
     """
 
+    if build_mode not in BUILD_MODES:
+        raise ValueError(f"Unknown build_mode {build_mode!r}. Expected one of {BUILD_MODES}.")
+
+    if options is not None and options.compact_names and build_mode != "matrix":
+        raise ValueError("FormulationOptions.compact_names requires build_mode='matrix'")
+
+    if build_mode == "matrix":
+        # Imported lazily: retro_fantasy.matrix depends on this module.
+        from retro_fantasy.matrix import build_matrix_model, matrix_model_to_pulp
+
+        return matrix_model_to_pulp(build_matrix_model(model_input_data, options=options))
+
     problem = pulp.LpProblem(name="retro_fantasy", sense=pulp.LpMaximize)
 
-    decision_variables = create_decision_variables(problem, model_input_data)
-    add_objective(problem, model_input_data, decision_variables)
-    add_constraints(problem, model_input_data, decision_variables)
+    with span("formulation.variables"):
+        decision_variables = create_decision_variables(problem, model_input_data, options=options)
+    with span("formulation.objective"):
+        add_objective(problem, model_input_data, decision_variables)
+    add_constraints(problem, model_input_data, decision_variables, options=options)
 
     return problem, decision_variables
 
@@ -101,17 +181,26 @@ def formulate_problem(model_input_data: ModelInputData) -> tuple[pulp.LpProblem,
 # ============================================================================
 
 
-def create_decision_variables(problem: pulp.LpProblem, model_input_data: ModelInputData) -> DecisionVariables:
+def create_decision_variables(
+    problem: pulp.LpProblem,
+    model_input_data: ModelInputData,
+    *,
+    options: FormulationOptions | None = None,
+) -> DecisionVariables:
     """Create and register all decision variables."""
 
+    options = options or FormulationOptions()
+
     x_selected = _create_squad_selection_decision_variables(problem, model_input_data)
 
     y_onfield, y_bench, y_utility = _create_positional_selection_decision_variables(problem, model_input_data)
 
-    captain = _create_captain_decision_variables(problem, model_input_data)
-    scored = _create_scored_decision_variables(problem, model_input_data)
+    captain = _create_captain_decision_variables(problem, model_input_data, continuous=options.continuous_scoring)
+    scored = _create_scored_decision_variables(problem, model_input_data, continuous=options.continuous_scoring)
 
-    traded_in, traded_out = _create_trade_indicator_decision_variables(problem, model_input_data)
+    traded_in, traded_out = _create_trade_indicator_decision_variables(
+        problem, model_input_data, continuous=options.trade_flow
+    )
 
     bank = _create_bank_balance_decision_variables(problem, model_input_data)
 
@@ -184,11 +273,17 @@ def _create_positional_selection_decision_variables(
 def _create_captain_decision_variables(
     problem: pulp.LpProblem,
     model_input_data: ModelInputData,
+    *,
+    continuous: bool = False,
 ) -> Dict[Tuple[int, int], pulp.LpVariable]:
-    """Create captain decision variables z[p, r]."""
+    """Create captain decision variables z[p, r].
 
+    With ``continuous`` they are continuous in [0, 1] (see ``FormulationOptions.continuous_scoring``).
+    """
+
+    cat = pulp.LpContinuous if continuous else pulp.LpBinary
     return {
-        (p, r): pulp.LpVariable(f"captain_{p}_{r}", lowBound=0, upBound=1, cat=pulp.LpBinary)
+        (p, r): pulp.LpVariable(f"captain_{p}_{r}", lowBound=0, upBound=1, cat=cat)
         for (p, r) in model_input_data.idx_player_round
     }
 
@@ -196,11 +291,17 @@ def _create_captain_decision_variables(
 def _create_scored_decision_variables(
     problem: pulp.LpProblem,
     model_input_data: ModelInputData,
+    *,
+    continuous: bool = False,
 ) -> Dict[Tuple[int, int], pulp.LpVariable]:
-    """Create scored decision variables y[p, r] (which players are counted)."""
+    """Create scored decision variables y[p, r] (which players are counted).
+
+    With ``continuous`` they are continuous in [0, 1] (see ``FormulationOptions.continuous_scoring``).
+    """
 
+    cat = pulp.LpContinuous if continuous else pulp.LpBinary
     return {
-        (p, r): pulp.LpVariable(f"scored_{p}_{r}", lowBound=0, upBound=1, cat=pulp.LpBinary)
+        (p, r): pulp.LpVariable(f"scored_{p}_{r}", lowBound=0, upBound=1, cat=cat)
         for (p, r) in model_input_data.idx_player_round
     }
 
@@ -208,6 +309,8 @@ def _create_scored_decision_variables(
 def _create_trade_indicator_decision_variables(
     problem: pulp.LpProblem,
     model_input_data: ModelInputData,
+    *,
+    continuous: bool = False,
 ) -> tuple[
     Dict[Tuple[int, int], pulp.LpVariable],
     Dict[Tuple[int, int], pulp.LpVariable],
@@ -215,15 +318,17 @@ def _create_trade_indicator_decision_variables(
     """Create trade indicator decision variables (traded_in, traded_out).
 
     These are only meaningful for rounds r > 1 (they represent changes from r-1 to r).
+    With ``continuous`` they are continuous in [0, 1] (trade-flow formulation).
     """
 
+    cat = pulp.LpContinuous if continuous else pulp.LpBinary
     traded_in = {
-        (p, r): pulp.LpVariable(f"traded_in_{p}_{r}", lowBound=0, upBound=1, cat=pulp.LpBinary)
+        (p, r): pulp.LpVariable(f"traded_in_{p}_{r}", lowBound=0, upBound=1, cat=cat)
         for (p, r) in model_input_data.idx_player_round_excluding_1
     }
 
     traded_out = {
-        (p, r): pulp.LpVariable(f"traded_out_{p}_{r}", lowBound=0, upBound=1, cat=pulp.LpBinary)
+        (p, r): pulp.LpVariable(f"traded_out_{p}_{r}", lowBound=0, upBound=1, cat=cat)
         for (p, r) in model_input_data.idx_player_round_excluding_1
     }
 
@@ -253,59 +358,39 @@ def add_objective(
 ) -> None:
     """Add the objective function to the problem.
 
-    This function assembles the objective expression in parts and sets it once
-    on the PuLP problem.
-    """
-
-    base_expr = _build_objective_base_scoring_expression(problem, model_input_data, decision_variables)
-    captain_expr = _build_objective_captain_bonus_expression(problem, model_input_data, decision_variables)
-
-    # Important: in PuLP, adding another objective typically overwrites the
-    # previous one. So we build a single combined expression and set it once.
-    problem += base_expr + captain_expr
-
-
-def _build_objective_base_scoring_expression(
-    problem: pulp.LpProblem,
-    model_input_data: ModelInputData,
-    decision_variables: DecisionVariables,
-) -> pulp.LpAffineExpression:
-    """Build the base scoring term of the objective.
-
     Represents:
-        sum_{r in R} sum_{p in P} s[p,r] * scored[p,r]
-    """
+        sum_{r in R} sum_{p in P} s[p,r] * (scored[p,r] + captain[p,r])
 
-    _ = problem
+    The captain term doubles the captain's counted score (assuming constraints
+    enforce captain implies scored).
 
-    terms: list[pulp.LpAffineExpression] = []
-    for (player_id, round_number), scored_var in decision_variables.scored.items():
-        terms.append(model_input_data.score(player_id, round_number) * scored_var)
+    The expression is assembled in a single pass over the dense score array:
+    every nonzero ``s[p,r]`` contributes one ``scored`` and one ``captain``
+    coefficient, and zero-score pairs are left out of the objective (as in
+    :func:`retro_fantasy.matrix.build_matrix_model`).
+    """
 
-    return pulp.lpSum(terms)
+    # Important: in PuLP, adding another objective typically overwrites the
+    # previous one. So we build a single combined expression and set it once.
+    problem += _build_objective_expression(model_input_data, decision_variables)
 
 
-def _build_objective_captain_bonus_expression(
-    problem: pulp.LpProblem,
+def _build_objective_expression(
     model_input_data: ModelInputData,
     decision_variables: DecisionVariables,
 ) -> pulp.LpAffineExpression:
-    """Build the captain bonus term of the objective.
-
-    Represents:
-        sum_{r in R} sum_{p in P} s[p,r] * captain[p,r]
-
-    Adding this term to the base scoring term doubles the captain's counted
-    score (assuming constraints later enforce captain implies scored).
-    """
-
-    _ = problem
+    """Build the scored + captain objective from the dense (P, R) score array."""
 
-    terms: list[pulp.LpAffineExpression] = []
-    for (player_id, round_number), captain_var in decision_variables.captain.items():
-        terms.append(model_input_data.score(player_id, round_number) * captain_var)
+    scores = model_input_data.scores.ravel()
+    nonzero = np.flatnonzero(scores)
+    coefficients = scores[nonzero].tolist()
+    # ``idx_player_round`` is player-major, the same layout as ``scores``.
+    keys = [model_input_data.idx_player_round[k] for k in nonzero.tolist()]
 
-    return pulp.lpSum(terms)
+    scored, captain = decision_variables.scored, decision_variables.captain
+    terms = [(scored[key], c) for key, c in zip(keys, coefficients)]
+    terms += [(captain[key], c) for key, c in zip(keys, coefficients)]
+    return pulp.LpAffineExpression(terms)
 
 
 # ============================================================================
@@ -317,11 +402,17 @@ def _add_linking_constraints(
     problem: pulp.LpProblem,
     model_input_data: ModelInputData,
     decision_variables: DecisionVariables,
+    options: FormulationOptions = FormulationOptions(),
 ) -> None:
-    """Linking Constraints section."""
+    """Linking Constraints section.
+
+    In lean mode the "at most one slot" rows are omitted: ``x[p,r] == slot_sum``
+    with binary ``x`` already implies ``slot_sum <= 1``.
+    """
 
     _add_linking_constraints_overall_selection_equals_positional_selection(problem, model_input_data, decision_variables)
-    _add_linking_constraints_at_most_one_slot_per_player_per_round(problem, model_input_data, decision_variables)
+    if not options.lean:
+        _add_linking_constraints_at_most_one_slot_per_player_per_round(problem, model_input_data, decision_variables)
 
 
 def _add_linking_constraints_overall_selection_equals_positional_selection(
@@ -372,27 +463,64 @@ def add_constraints(
     problem: pulp.LpProblem,
     model_input_data: ModelInputData,
     decision_variables: DecisionVariables,
+    *,
+    options: FormulationOptions | None = None,
 ) -> None:
     """Add all constraints to the problem.
 
     This is an orchestrator that delegates to one function per formulation
     constraint section, with further decomposition where appropriate.
+
+    Notes
+    -----
+    With ``options.lean`` the following provably redundant rows are dropped:
+
+    - ``link_at_most_one_slot``: implied by ``x == slot_sum`` with binary ``x``.
+    - the two ``traded_in`` upper-bound families and ``max_trades_in``: replaced
+      by one ``trade_balance_r`` row per round, ``sum_p in = sum_p out``. The
+      squad size is the same every round, so ``sum_p (x[p,r] - x[p,r-1]) = 0``;
+      with ``traded_out`` exact (its upper bounds are kept) the balance row and
+      the ``traded_in`` lower bounds force ``traded_in`` to be exact too, and
+      the trade-in limit equals the trade-out limit.
+    - ``no_trade_*_missing_price``: become variable upper bounds of 0.
+
+    With ``options.trade_flow`` (with or without ``lean``) the trade rows are:
+
+    - ``trade_flow_{p}_{r}``: ``in - out == x[p,r] - x[p,r-1]``, replacing both
+      lower-bound families and the ``traded_in`` upper bounds.
+    - the two ``traded_out`` upper-bound families, which with the flow row and
+      ``in, out >= 0`` force ``out = max(0, x[p,r-1] - x[p,r])`` and so
+      ``in = max(0, x[p,r] - x[p,r-1])``: trades are integral whenever ``x`` is,
+      so ``traded_in`` / ``traded_out`` need not be binary.
+
+    Summing the flow rows over players gives ``sum_p in = sum_p out``, so
+    ``max_trades_in`` (and ``trade_balance``) are dropped, and missing-price
+    bans become bounds as in lean mode.
     """
 
-    _add_initial_bank_balance_constraints(problem, model_input_data, decision_variables)
-    _add_bank_balance_recurrence_constraints(problem, model_input_data, decision_variables)
+    options = options or FormulationOptions()
+
+    with span("formulation.constraints.bank_balance"):
+        _add_initial_bank_balance_constraints(problem, model_input_data, decision_variables)
+        _add_bank_balance_recurrence_constraints(problem, model_input_data, decision_variables)
 
-    _add_trade_indicator_linking_constraints(problem, model_input_data, decision_variables)
+    with span("formulation.constraints.trade_indicator_linking"):
+        _add_trade_indicator_linking_constraints(problem, model_input_data, decision_variables, options)
 
-    _add_linking_constraints(problem, model_input_data, decision_variables)
+    with span("formulation.constraints.linking"):
+        _add_linking_constraints(problem, model_input_data, decision_variables, options)
 
-    _add_maximum_team_changes_per_round_constraints(problem, model_input_data, decision_variables)
+    with span("formulation.constraints.maximum_team_changes"):
+        _add_maximum_team_changes_per_round_constraints(problem, model_input_data, decision_variables, options)
 
-    _add_positional_structure_constraints(problem, model_input_data, decision_variables)
+    with span("formulation.constraints.positional_structure"):
+        _add_positional_structure_constraints(problem, model_input_data, decision_variables)
 
-    _add_scoring_selection_constraints(problem, model_input_data, decision_variables)
+    with span("formulation.constraints.scoring_selection"):
+        _add_scoring_selection_constraints(problem, model_input_data, decision_variables)
 
-    _add_captaincy_constraints(problem, model_input_data, decision_variables)
+    with span("formulation.constraints.captaincy"):
+        _add_captaincy_constraints(problem, model_input_data, decision_variables)
 
 
 def _add_initial_bank_balance_constraints(
@@ -409,8 +537,9 @@ def _add_initial_bank_balance_constraints(
         return
 
     r = 1
+    prices = model_input_data.prices[:, model_input_data.round_index[r]].tolist()
     total_spend = pulp.lpSum(
-        model_input_data.price(p, r) * decision_variables.x_selected[(p, r)] for p in model_input_data.player_ids
+        price * decision_variables.x_selected[(p, r)] for p, price in zip(model_input_data.player_ids, prices)
     )
 
     problem += (
@@ -437,11 +566,12 @@ def _add_bank_balance_recurrence_constraints(
     """
 
     for r in model_input_data.idx_round_excluding_1:
+        prices = model_input_data.prices[:, model_input_data.round_index[r]].tolist()
         sold_value = pulp.lpSum(
-            model_input_data.price(p, r) * decision_variables.traded_out[(p, r)] for p in model_input_data.player_ids
+            price * decision_variables.traded_out[(p, r)] for p, price in zip(model_input_data.player_ids, prices)
         )
         bought_cost = pulp.lpSum(
-            model_input_data.price(p, r) * decision_variables.traded_in[(p, r)] for p in model_input_data.player_ids
+            price * decision_variables.traded_in[(p, r)] for p, price in zip(model_input_data.player_ids, prices)
         )
 
         problem += (
@@ -453,16 +583,82 @@ def _add_trade_indicator_linking_constraints(
     problem: pulp.LpProblem,
     model_input_data: ModelInputData,
     decision_variables: DecisionVariables,
+    options: FormulationOptions = FormulationOptions(),
 ) -> None:
     """Trade Indicator Linking section."""
 
+    if options.trade_flow:
+        _add_trade_flow_constraints(problem, model_input_data, decision_variables)
+        _add_trade_indicator_linking_upper_bound_trade_out_constraints(problem, model_input_data, decision_variables)
+        _fix_no_trade_when_missing_price_bounds(model_input_data, decision_variables)
+        return
+
     _add_trade_indicator_linking_lower_bound_constraints(problem, model_input_data, decision_variables)
+
+    if options.lean:
+        _add_trade_balance_constraints(problem, model_input_data, decision_variables)
+        _add_trade_indicator_linking_upper_bound_trade_out_constraints(problem, model_input_data, decision_variables)
+
+        # Same rule as below, expressed as bounds rather than rows.
+        _fix_no_trade_when_missing_price_bounds(model_input_data, decision_variables)
+        return
+
     _add_trade_indicator_linking_upper_bound_constraints(problem, model_input_data, decision_variables)
 
     # If a player has no explicit price in round r, trading them in/out in round r is not allowed.
     _add_no_trade_when_missing_price_constraints(problem, model_input_data, decision_variables)
 
 
+def _missing_price_trade_keys(model_input_data: ModelInputData) -> list[Tuple[int, int]]:
+    """(p, r) pairs for r > 1 without an explicit price, in p-major order."""
+
+    later = model_input_data.idx_round_excluding_1
+    if not later:
+        return []
+
+    missing = ~model_input_data.has_prices[:, [model_input_data.round_index[r] for r in later]]
+    return [(model_input_data.player_ids[i], later[t]) for i, t in np.argwhere(missing).tolist()]
+
+
+def _fix_no_trade_when_missing_price_bounds(
+    model_input_data: ModelInputData,
+    decision_variables: DecisionVariables,
+) -> None:
+    """Lean variant of :func:`_add_no_trade_when_missing_price_constraints` (upper bounds of 0)."""
+
+    for key in _missing_price_trade_keys(model_input_data):
+        decision_variables.traded_in[key].upBound = 0
+        decision_variables.traded_out[key].upBound = 0
+
+
+def _add_trade_flow_constraints(
+    problem: pulp.LpProblem,
+    model_input_data: ModelInputData,
+    decision_variables: DecisionVariables,
+) -> None:
+    """Trade flow: traded_in[p,r] - traded_out[p,r] == x[p,r] - x[p,r-1] for r > 1."""
+
+    for p in model_input_data.player_ids:
+        for r in model_input_data.idx_round_excluding_1:
+            problem += (
+                decision_variables.traded_in[(p, r)] - decision_variables.traded_out[(p, r)]
+                == decision_variables.x_selected[(p, r)] - decision_variables.x_selected[(p, r - 1)]
+            ), f"trade_flow_{p}_{r}"
+
+
+def _add_trade_balance_constraints(
+    problem: pulp.LpProblem,
+    model_input_data: ModelInputData,
+    decision_variables: DecisionVariables,
+) -> None:
+    """Lean trade linking: sum_p traded_in[p,r] == sum_p traded_out[p,r] for r > 1."""
+
+    for r in model_input_data.idx_round_excluding_1:
+        trades_in = pulp.lpSum(decision_variables.traded_in[(p, r)] for p in model_input_data.player_ids)
+        trades_out = pulp.lpSum(decision_variables.traded_out[(p, r)] for p in model_input_data.player_ids)
+        problem += trades_in - trades_out == 0, f"trade_balance_{r}"
+
+
 def _add_no_trade_when_missing_price_constraints(
     problem: pulp.LpProblem,
     model_input_data: ModelInputData,
@@ -481,13 +677,9 @@ def _add_no_trade_when_missing_price_constraints(
     no explicit (p,r) price in the input data.
     """
 
-    for p in model_input_data.player_ids:
-        for r in model_input_data.idx_round_excluding_1:
-            if model_input_data.has_price(p, r):
-                continue
-
-            problem += decision_variables.traded_in[(p, r)] == 0, f"no_trade_in_missing_price_{p}_{r}"
-            problem += decision_variables.traded_out[(p, r)] == 0, f"no_trade_out_missing_price_{p}_{r}"
+    for p, r in _missing_price_trade_keys(model_input_data):
+        problem += decision_variables.traded_in[(p, r)] == 0, f"no_trade_in_missing_price_{p}_{r}"
+        problem += decision_variables.traded_out[(p, r)] == 0, f"no_trade_out_missing_price_{p}_{r}"
 
 
 def _add_trade_indicator_linking_lower_bound_constraints(
@@ -527,6 +719,16 @@ def _add_trade_indicator_linking_upper_bound_constraints(
     _add_trade_indicator_linking_upper_bound_trade_in_requires_not_previously_selected_constraints(
         problem, model_input_data, decision_variables
     )
+    _add_trade_indicator_linking_upper_bound_trade_out_constraints(problem, model_input_data, decision_variables)
+
+
+def _add_trade_indicator_linking_upper_bound_trade_out_constraints(
+    problem: pulp.LpProblem,
+    model_input_data: ModelInputData,
+    decision_variables: DecisionVariables,
+) -> None:
+    """Trade Indicator Linking upper bounds for traded_out (both directions)."""
+
     _add_trade_indicator_linking_upper_bound_trade_out_requires_previously_selected_constraints(
         problem, model_input_data, decision_variables
     )
@@ -595,10 +797,17 @@ def _add_maximum_team_changes_per_round_constraints(
     problem: pulp.LpProblem,
     model_input_data: ModelInputData,
     decision_variables: DecisionVariables,
+    options: FormulationOptions = FormulationOptions(),
 ) -> None:
-    """Maximum Team Changes Per Round constraints."""
+    """Maximum Team Changes Per Round constraints.
+
+    In lean mode ``trade_balance_r`` (and with ``trade_flow`` the flow rows) make
+    the trade-in limit identical to the trade-out limit, so only the latter is
+    added.
+    """
 
-    _add_maximum_team_changes_trade_in_limit_constraints(problem, model_input_data, decision_variables)
+    if not (options.lean or options.trade_flow):
+        _add_maximum_team_changes_trade_in_limit_constraints(problem, model_input_data, decision_variables)
     _add_maximum_team_changes_trade_out_limit_constraints(problem, model_input_data, decision_variables)
 
 
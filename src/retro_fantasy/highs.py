@@ -0,0 +1,277 @@
+"""In-memory HiGHS backend (via ``highspy``).
+
+PuLP's CBC and Gurobi command-line interfaces write the model to an MPS/LP file,
+spawn a solver process and parse a solution file back. For small and medium
+instances that file round-trip dominates latency.
+
+This backend passes a :class:`~retro_fantasy.matrix.MatrixModel` straight to
+HiGHS as arrays (no files, no subprocess) and returns the variable values as a
+NumPy vector aligned with the matrix model's columns.
+
+``highspy`` is an optional dependency::
+
+    pip install -e ".[highs]"
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Any, Callable
+
+import numpy as np
+import pulp
+
+from retro_fantasy.formulation import DecisionVariables
+from retro_fantasy.matrix import MatrixModel, set_pulp_variable_values
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class HighsIncumbent:
+    """An improving MIP solution reported during a HiGHS solve."""
+
+    objective_value: float
+    best_bound: float
+    mip_gap: float
+    running_time: float
+    values: np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class HighsSolveResult:
+    """Outcome of :func:`solve_matrix_model_with_highs`.
+
+    Notes
+    -----
+    ``status`` follows PuLP's status strings (see ``pulp.LpStatus``) so callers
+    can treat every backend the same way. As with PuLP's CBC interface, a solve
+    stopped by a limit with a feasible incumbent reports ``"Optimal"``; the raw
+    HiGHS model status (e.g. ``"Time limit reached"``) is kept in
+    ``model_status``.
+    """
+
+    status: str
+    model_status: str
+    objective_value: float
+    best_bound: float
+    mip_gap: float
+    runtime_seconds: float
+    values: np.ndarray
+
+
+IncumbentCallback = Callable[[HighsIncumbent], None]
+
+
+def _import_highspy() -> Any:
+    try:
+        import highspy
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "The HiGHS backend requires the optional 'highspy' package. "
+            "Install it with: pip install -e \".[highs]\""
+        ) from e
+    return highspy
+
+
+def _pulp_status(highspy: Any, model_status: Any, has_solution: bool) -> str:
+    """Map a HiGHS model status to a PuLP status string."""
+
+    status = highspy.HighsModelStatus
+    if model_status == status.kOptimal:
+        return "Optimal"
+    if model_status == status.kInfeasible:
+        return "Infeasible"
+    if model_status in (status.kUnbounded, status.kUnboundedOrInfeasible):
+        return "Unbounded"
+    if has_solution:
+        # Stopped on a limit (time, gap target, interrupt) with a feasible incumbent.
+        return "Optimal"
+    return "Not Solved"
+
+
+def build_highs_lp(matrix_model: MatrixModel) -> Any:
+    """Translate a :class:`MatrixModel` into a ``highspy.HighsLp`` (row-wise matrix)."""
+
+    highspy = _import_highspy()
+
+    indptr, indices, data = matrix_model.csr()
+
+    lp = highspy.HighsLp()
+    lp.num_col_ = matrix_model.num_cols
+    lp.num_row_ = matrix_model.num_rows
+    lp.sense_ = highspy.ObjSense.kMaximize if matrix_model.sense < 0 else highspy.ObjSense.kMinimize
+    lp.col_cost_ = matrix_model.objective
+    lp.col_lower_ = matrix_model.col_lower
+    lp.col_upper_ = matrix_model.col_upper
+    lp.row_lower_ = matrix_model.row_lower
+    lp.row_upper_ = matrix_model.row_upper
+    lp.integrality_ = [
+        highspy.HighsVarType.kInteger if is_int else highspy.HighsVarType.kContinuous
+        for is_int in matrix_model.integrality.tolist()
+    ]
+
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+    lp.a_matrix_.num_col_ = matrix_model.num_cols
+    lp.a_matrix_.num_row_ = matrix_model.num_rows
+    lp.a_matrix_.start_ = indptr.astype(np.int32)
+    lp.a_matrix_.index_ = indices.astype(np.int32)
+    lp.a_matrix_.value_ = data
+
+    return lp
+
+
+def create_highs(
+    matrix_model: MatrixModel,
+    *,
+    time_limit_seconds: float | None = None,
+    mip_gap: float | None = None,
+    threads: int | None = None,
+    enable_solver_output: bool = False,
+) -> Any:
+    """Return a ``highspy.Highs`` instance holding ``matrix_model`` and the given options.
+
+    The instance can be kept and re-run (see :func:`run_highs`) after editing
+    bounds in place, e.g. with ``Highs.changeRowBounds``.
+    """
+
+    highspy = _import_highspy()
+
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", bool(enable_solver_output))
+    if time_limit_seconds is not None:
+        h.setOptionValue("time_limit", float(time_limit_seconds))
+    if mip_gap is not None:
+        h.setOptionValue("mip_rel_gap", float(mip_gap))
+    if threads is not None:
+        h.setOptionValue("threads", int(threads))
+
+    h.passModel(build_highs_lp(matrix_model))
+    return h
+
+
+def run_highs(
+    h: Any,
+    matrix_model: MatrixModel,
+    *,
+    initial_values: np.ndarray | None = None,
+) -> HighsSolveResult:
+    """Run a ``Highs`` instance from :func:`create_highs` and collect the result.
+
+    ``matrix_model`` must be the model held by ``h``; it is only used for the
+    column count and integrality.
+    """
+
+    highspy = _import_highspy()
+
+    if initial_values is not None:
+        start = highspy.HighsSolution()
+        start.col_value = np.asarray(initial_values, dtype=np.float64).tolist()
+        h.setSolution(start)
+
+    h.run()
+
+    model_status = h.getModelStatus()
+    info = h.getInfo()
+    solution = h.getSolution()
+    has_solution = bool(solution.value_valid)
+
+    values = np.asarray(solution.col_value, dtype=np.float64) if has_solution else np.zeros(matrix_model.num_cols)
+    is_mip = bool(matrix_model.integrality.any())
+
+    status = _pulp_status(highspy, model_status, has_solution)
+    result = HighsSolveResult(
+        status=status,
+        model_status=h.modelStatusToString(model_status),
+        objective_value=float(info.objective_function_value) if has_solution else 0.0,
+        best_bound=float(info.mip_dual_bound) if is_mip else float(info.objective_function_value),
+        mip_gap=float(info.mip_gap) if is_mip else 0.0,
+        runtime_seconds=float(h.getRunTime()),
+        values=values,
+    )
+
+    logger.info(
+        "HiGHS finished: status=%s (%s) objective=%s bound=%s gap=%s time=%.3fs",
+        result.status,
+        result.model_status,
+        result.objective_value,
+        result.best_bound,
+        result.mip_gap,
+        result.runtime_seconds,
+    )
+    return result
+
+
+def solve_matrix_model_with_highs(
+    matrix_model: MatrixModel,
+    *,
+    time_limit_seconds: float | None = None,
+    mip_gap: float | None = None,
+    threads: int | None = None,
+    enable_solver_output: bool = False,
+    incumbent_callback: IncumbentCallback | None = None,
+    initial_values: np.ndarray | None = None,
+) -> HighsSolveResult:
+    """Solve ``matrix_model`` with HiGHS entirely in memory.
+
+    Parameters
+    ----------
+    time_limit_seconds:
+        Wall-clock limit passed to HiGHS (``time_limit``).
+    mip_gap:
+        Relative MIP gap at which to stop (``mip_rel_gap``).
+    threads:
+        Number of HiGHS worker threads (``threads``).
+    incumbent_callback:
+        Called with a :class:`HighsIncumbent` each time HiGHS finds an improving
+        MIP solution.
+    initial_values:
+        Column-aligned starting point passed to HiGHS as a MIP start.
+    """
+
+    h = create_highs(
+        matrix_model,
+        time_limit_seconds=time_limit_seconds,
+        mip_gap=mip_gap,
+        threads=threads,
+        enable_solver_output=enable_solver_output,
+    )
+
+    if incumbent_callback is not None:
+
+        def _on_improving_solution(event: Any) -> None:
+            out = event.data_out
+            incumbent_callback(
+                HighsIncumbent(
+                    objective_value=float(out.objective_function_value),
+                    best_bound=float(out.mip_dual_bound),
+                    mip_gap=float(out.mip_gap),
+                    running_time=float(out.running_time),
+                    values=np.array(out.mip_solution, dtype=np.float64, copy=True),
+                )
+            )
+
+        h.cbMipImprovingSolution.subscribe(_on_improving_solution)
+
+    return run_highs(h, matrix_model, initial_values=initial_values)
+
+
+def apply_highs_result_to_pulp(
+    problem: pulp.LpProblem,
+    decision_variables: DecisionVariables,
+    matrix_model: MatrixModel,
+    result: HighsSolveResult,
+) -> None:
+    """Write a HiGHS solution back onto the PuLP objects of :func:`matrix_model_to_pulp`.
+
+    This lets the rest of the pipeline (e.g.
+    :func:`retro_fantasy.solution.build_solution_summary`) consume a HiGHS solve
+    exactly as it would a CBC/Gurobi solve.
+    """
+
+    set_pulp_variable_values(matrix_model, decision_variables, result.values)
+
+    status_codes = {name: code for code, name in pulp.LpStatus.items()}
+    problem.status = status_codes.get(result.status, pulp.LpStatusNotSolved)
@@ -0,0 +1,246 @@
+"""Phase-level timing and memory instrumentation.
+
+Pipeline code marks its phases with :func:`span`::
+
+    with span("formulation.constraints.bank_balance"):
+        ...
+
+Spans cost one context-variable lookup unless a recorder is active, so they
+can stay in library code permanently. :func:`record_phases` activates a
+:class:`PhaseRecorder` for the duration of a block; every span entered inside
+it (on the same thread or task) is recorded with:
+
+- wall time (``time.perf_counter``) and process CPU time (``time.process_time``)
+- the change in resident set size and the process peak RSS at exit
+  (``/proc/self/statm`` and ``resource.getrusage``, where available)
+- with ``trace_memory=True``, the ``tracemalloc`` net allocation and the peak
+  allocation above the span's starting point
+
+Nested spans are recorded with their full path, e.g. ``"formulate/formulation.
+constraints.linking"``. Note that ``tracemalloc`` slows Python allocation down
+considerably, so it is off by default.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+import functools
+import json
+import os
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, TypeVar
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(slots=True)
+class PhaseRecord:
+    """Measurements for one completed span.
+
+    Memory fields are ``None`` where the platform (or ``trace_memory=False``)
+    does not provide them.
+    """
+
+    name: str
+    depth: int
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rss_delta_bytes: int | None = None
+    peak_rss_bytes: int | None = None
+    traced_delta_bytes: int | None = None
+    traced_peak_bytes: int | None = None
+
+
+@dataclass(slots=True)
+class PhaseRecorder:
+    """Collects :class:`PhaseRecord` entries in the order spans were entered."""
+
+    trace_memory: bool = False
+    phases: List[PhaseRecord] = field(default_factory=list)
+
+    def totals(self) -> Dict[str, float]:
+        """Total wall seconds per span name (spans entered repeatedly are summed)."""
+
+        totals: Dict[str, float] = {}
+        for phase in self.phases:
+            totals[phase.name] = totals.get(phase.name, 0.0) + phase.wall_seconds
+        return totals
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_memory": self.trace_memory,
+            "phases": [asdict(phase) for phase in self.phases],
+        }
+
+    def write_json(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_json_dict(), indent=2), encoding="utf-8")
+
+
+@dataclass(slots=True)
+class _OpenSpan:
+    record: PhaseRecord
+    traced_start: int = 0
+    traced_peak: int = 0
+
+
+_active_recorder: ContextVar[PhaseRecorder | None] = ContextVar("retro_fantasy_phase_recorder", default=None)
+_open_spans: ContextVar[tuple[_OpenSpan, ...]] = ContextVar("retro_fantasy_open_spans", default=())
+
+
+def _current_rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _peak_rss_bytes() -> int | None:
+    if resource is None:  # pragma: no cover
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+def active_recorder() -> PhaseRecorder | None:
+    """The recorder activated by the innermost :func:`record_phases`, if any."""
+
+    return _active_recorder.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Record the enclosed block as phase ``name`` (a no-op without an active recorder)."""
+
+    recorder = _active_recorder.get()
+    if recorder is None:
+        yield
+        return
+
+    parents = _open_spans.get()
+    path = "/".join([p.record.name for p in parents[-1:]] + [name])
+    opened = _OpenSpan(record=PhaseRecord(name=path, depth=len(parents)))
+    recorder.phases.append(opened.record)
+
+    tracing = recorder.trace_memory and tracemalloc.is_tracing()
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if parents:
+            # reset_peak() below would lose the parent's peak so far.
+            parents[-1].traced_peak = max(parents[-1].traced_peak, peak)
+        tracemalloc.reset_peak()
+        opened.traced_start = opened.traced_peak = current
+
+    token = _open_spans.set(parents + (opened,))
+    rss_start = _current_rss_bytes()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record = opened.record
+        record.wall_seconds = time.perf_counter() - wall_start
+        record.cpu_seconds = time.process_time() - cpu_start
+        rss_end = _current_rss_bytes()
+        if rss_start is not None and rss_end is not None:
+            record.rss_delta_bytes = rss_end - rss_start
+        record.peak_rss_bytes = _peak_rss_bytes()
+
+        if tracing and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            opened.traced_peak = max(opened.traced_peak, peak)
+            record.traced_delta_bytes = current - opened.traced_start
+            record.traced_peak_bytes = opened.traced_peak - opened.traced_start
+            if parents:
+                parents[-1].traced_peak = max(parents[-1].traced_peak, opened.traced_peak)
+
+        _open_spans.reset(token)
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """Decorator form of :func:`span`."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+@contextmanager
+def instrument_method(obj: Any, attribute: str, name: str) -> Iterator[None]:
+    """Temporarily record every call of ``obj.<attribute>`` as phase ``name``.
+
+    Used for phases inside third-party calls, e.g. the MPS file PuLP writes
+    before spawning the solver (``problem.writeMPS``).
+    """
+
+    shadowed = vars(obj).get(attribute)
+    setattr(obj, attribute, instrumented(name)(getattr(obj, attribute)))
+    try:
+        yield
+    finally:
+        if shadowed is None:
+            # Drop the instance attribute so the class method is visible again.
+            delattr(obj, attribute)
+        else:
+            setattr(obj, attribute, shadowed)
+
+
+@contextmanager
+def record_phases(*, trace_memory: bool = False) -> Iterator[PhaseRecorder]:
+    """Activate a new :class:`PhaseRecorder` for the enclosed block.
+
+    Parameters
+    ----------
+    trace_memory:
+        Also record ``tracemalloc`` allocation deltas. ``tracemalloc`` is
+        started for the block if it is not already running.
+    """
+
+    recorder = PhaseRecorder(trace_memory=trace_memory)
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    recorder_token = _active_recorder.set(recorder)
+    spans_token = _open_spans.set(())
+    try:
+        yield recorder
+    finally:
+        _open_spans.reset(spans_token)
+        _active_recorder.reset(recorder_token)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def ensure_recording(*, trace_memory: bool = False) -> Iterator[PhaseRecorder]:
+    """Yield the active recorder, or :func:`record_phases` into a new one if there is none.
+
+    Lets an entry point record its own phases while still contributing to a
+    caller's recorder (e.g. a script that also times writing the output).
+    """
+
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        yield recorder
+        return
+    with record_phases(trace_memory=trace_memory) as recorder:
+        yield recorder
@@ -11,13 +11,29 @@ to test and reuse.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 import csv
+from dataclasses import dataclass
 import difflib
 import json
 from pathlib import Path
-from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, cast
+import re
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Mapping, Optional, cast
 
-from retro_fantasy.data import Player, PlayerRoundInfo, Position, Round, TeamStructureRules
+import numpy as np
+
+from retro_fantasy.data import (
+    POSITION_BITS,
+    Player,
+    PlayerRoundInfo,
+    Position,
+    Round,
+    SeasonStore,
+    TeamStructureRules,
+    mask_to_positions,
+    positions_to_mask,
+)
+from retro_fantasy.instrumentation import span
 
 
 # Pragmatic default mapping for AFL Fantasy position codes found in the JSON.
@@ -95,6 +111,33 @@ def read_position_updates_csv(path: Path) -> Dict[str, list[tuple[int, Position]
     return updates
 
 
+def cumulative_update_masks(updates: Iterable[tuple[int, Position]]) -> tuple[list[int], list[int]]:
+    """Prefix-OR a player's position updates into per-effective-round masks.
+
+    Returns ``(effective_rounds, masks)``: sorted, distinct effective rounds
+    and, for each, the mask of every position added by then. Positions are
+    only ever added, so the mask in force in round ``r`` is
+    ``masks[bisect_right(effective_rounds, r) - 1]`` (none before the first).
+    """
+
+    effective_rounds: list[int] = []
+    masks: list[int] = []
+    mask = 0
+    for effective_round, position in sorted(updates, key=lambda u: u[0]):
+        mask |= POSITION_BITS[position]
+        if effective_rounds and effective_rounds[-1] == effective_round:
+            masks[-1] = mask
+        else:
+            effective_rounds.append(effective_round)
+            masks.append(mask)
+    return effective_rounds, masks
+
+
+def _added_mask(effective_rounds: list[int], masks: list[int], round_number: int) -> int:
+    i = bisect_right(effective_rounds, round_number)
+    return masks[i - 1] if i else 0
+
+
 def validate_update_names(
     *,
     update_names: Iterable[str],
@@ -138,116 +181,405 @@ def validate_update_names(
     )
 
 
-def load_players_from_json(
-    path: str | Path,
-    *,
-    position_code_map: Mapping[int, Position] = DEFAULT_POSITION_CODE_MAP,
-    include_round0: bool = False,
-    position_updates_csv: str | Path | None = None,
-    squad_id_filter: FrozenSet[int] | None = None,
-) -> Dict[int, Player]:
-    """Load players from ``players_final.json`` and apply round-based eligibility updates.
+# Characters read per chunk when streaming a JSON array.
+_STREAM_CHUNK_CHARS = 1 << 20
 
-    Parameters
-    ----------
-    squad_id_filter:
-        If provided, only players whose ``squad_id`` is in this set are loaded.
-        This is applied during the single pass over the JSON records, so excluded
-        players are never instantiated.
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_NUMBER_CHARS = re.compile(r"[0-9eE.+\-]*")
+
+
+def iter_json_array(path: str | Path, *, chunk_chars: int = _STREAM_CHUNK_CHARS) -> Iterator[Any]:
+    """Yield the elements of a file's top-level JSON array one at a time.
+
+    The file is read in chunks of ``chunk_chars`` characters and each element is
+    decoded as soon as it is complete, so memory use is bounded by the largest
+    element (plus one chunk) rather than the whole document.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a well-formed JSON array.
     """
 
-    path = Path(path)
-    raw: list[dict[str, Any]] = json.loads(path.read_text(encoding="utf-8"))
+    decoder = json.JSONDecoder()
+
+    with Path(path).open("r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def read_more() -> None:
+            nonlocal buf, pos, eof
+            chunk = f.read(chunk_chars)
+            if not chunk:
+                eof = True
+            # Drop the consumed prefix so the buffer only holds unread text.
+            buf = buf[pos:] + chunk
+            pos = 0
+
+        def skip_whitespace() -> None:
+            nonlocal pos
+            while True:
+                pos = _JSON_WHITESPACE.match(buf, pos).end()  # type: ignore[union-attr]
+                if pos < len(buf) or eof:
+                    return
+                read_more()
+
+        skip_whitespace()
+        if buf[pos : pos + 1] != "[":
+            raise ValueError(f"{path}: expected a top-level JSON array")
+        pos += 1
+
+        first = True
+        while True:
+            skip_whitespace()
+            if pos >= len(buf):
+                raise ValueError(f"{path}: unterminated JSON array")
+            if buf[pos] == "]":
+                return
+            if not first:
+                if buf[pos] != ",":
+                    raise ValueError(f"{path}: expected ',' or ']' at offset {pos} of the current chunk")
+                pos += 1
+                skip_whitespace()
+
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if eof:
+                        raise ValueError(f"{path}: invalid JSON array element: {e}") from e
+                    read_more()
+                    continue
+                # A number cut off by the end of the buffer (e.g. "-0." of "-0.5")
+                # decodes as a shorter number; wait until it is delimited.
+                if not eof and _JSON_NUMBER_CHARS.match(buf, end).end() == len(buf):  # type: ignore[union-attr]
+                    read_more()
+                    continue
+                break
+
+            yield value
+            pos = end
+            first = False
+
+
+def iter_player_records(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream ``players_final.json``, keeping only the fields the loader uses.
+
+    Each record is reduced to ``id``, names, ``squad_id``, ``original_positions``,
+    ``positions`` and ``stats.prices`` / ``stats.scores``. The other ``stats``
+    entries (``career_avg_vs``, ``ranks``, ``selections_info``, ...) are dropped
+    as soon as the record has been decoded.
+    """
 
-    position_updates: Dict[str, list[tuple[int, Position]]] = {}
-    if position_updates_csv is not None:
-        position_updates = read_position_updates_csv(Path(position_updates_csv))
+    for rec in iter_json_array(path):
+        stats = rec.get("stats", {}) or {}
+        yield {
+            "id": rec["id"],
+            "first_name": rec.get("first_name", ""),
+            "last_name": rec.get("last_name", ""),
+            "squad_id": rec.get("squad_id"),
+            "original_positions": rec.get("original_positions"),
+            "positions": rec.get("positions"),
+            "stats": {"prices": stats.get("prices"), "scores": stats.get("scores")},
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class _PlayerRecord:
+    """One player record after filtering, position fallbacks and eligibility updates.
+
+    ``rounds`` holds ``(round_number, score, price, eligibility_mask)`` per round
+    with data.
+    """
 
-    players: Dict[int, Player] = {}
+    player_id: int
+    first_name: str
+    last_name: str
+    squad_id: Optional[int]
+    base_mask: int
+    rounds: list[tuple[int, float, float, int]]
 
-    for rec in raw:
+    @property
+    def name(self) -> str:
+        return f"{self.first_name} {self.last_name}".strip()
+
+
+def _normalise_records(
+    records: Iterable[Mapping[str, Any]],
+    *,
+    position_code_map: Mapping[int, Position],
+    include_round0: bool,
+    position_updates: Mapping[str, list[tuple[int, Position]]],
+    squad_id_filter: FrozenSet[int] | None,
+) -> Iterator[_PlayerRecord]:
+    """Normalise the parsed JSON records shared by the ``Player`` and ``SeasonStore`` loaders."""
+
+    for rec in records:
         squad_id = rec.get("squad_id")
         if squad_id_filter is not None:
             if squad_id is None or int(squad_id) not in squad_id_filter:
                 continue
 
         pid = int(rec["id"])
-
-        original = parse_positions_from_codes(
-            rec.get("original_positions", []) or [],
-            code_map=position_code_map,
-        )
+        first_name = str(rec.get("first_name", ""))
+        last_name = str(rec.get("last_name", ""))
+        name = f"{first_name} {last_name}".strip()
 
         # Some records may have empty original_positions; fall back to 'positions' so
         # we never construct PlayerRoundInfo objects with an empty eligibility set.
-        base_positions = original
-        if not base_positions:
-            base_positions = parse_positions_from_codes(
-                rec.get("positions", []) or [],
-                code_map=position_code_map,
-            )
-
-        player = Player(
-            player_id=pid,
-            first_name=str(rec.get("first_name", "")),
-            last_name=str(rec.get("last_name", "")),
-            squad_id=squad_id,
-            original_positions=base_positions,
+        base_mask = positions_to_mask(
+            parse_positions_from_codes(rec.get("original_positions", []) or [], code_map=position_code_map)
         )
+        if not base_mask:
+            base_mask = positions_to_mask(
+                parse_positions_from_codes(rec.get("positions", []) or [], code_map=position_code_map)
+            )
 
         # Look up added positions by player name (as written in the CSVs).
-        player_updates = position_updates.get(player.name, [])
+        update_rounds, update_masks = cumulative_update_masks(position_updates.get(name, []))
 
         stats: Mapping[str, Any] = rec.get("stats", {}) or {}
         prices: Mapping[str, Any] = stats.get("prices", {}) or {}
         scores: Mapping[str, Any] = stats.get("scores", {}) or {}
 
-        all_round_keys = set(prices.keys()) | set(scores.keys())
-
-        for rk in all_round_keys:
+        rounds: list[tuple[int, float, float, int]] = []
+        for rk in set(prices.keys()) | set(scores.keys()):
             r = int(rk)
             if r == 0 and not include_round0:
                 continue
 
-            eligible_set: set[Position] = set(base_positions)
-            for effective_round, added_pos in player_updates:
-                if r >= effective_round:
-                    eligible_set.add(added_pos)
-
-            if not eligible_set:
+            mask = base_mask | _added_mask(update_rounds, update_masks, r)
+            if not mask:
                 raise ValueError(
-                    f"Player {player.name} (id={player.player_id}) has no eligible positions "
+                    f"Player {name} (id={pid}) has no eligible positions "
                     f"for round {r}. Check original_positions/positions in JSON and CSV updates."
                 )
 
-            price = float(prices.get(rk, 0.0) or 0.0)
-            score = float(scores.get(rk, 0.0) or 0.0)
+            rounds.append((r, float(scores.get(rk, 0.0) or 0.0), float(prices.get(rk, 0.0) or 0.0), mask))
+
+        yield _PlayerRecord(
+            player_id=pid,
+            first_name=first_name,
+            last_name=last_name,
+            squad_id=squad_id,
+            base_mask=base_mask,
+            rounds=rounds,
+        )
 
-            player.by_round[r] = PlayerRoundInfo(
-                round_number=r,
-                score=score,
-                price=price,
-                eligible_positions=frozenset(eligible_set),
-            )
 
-        players[pid] = player
+def _read_position_updates(position_updates_csv: str | Path | None) -> Dict[str, list[tuple[int, Position]]]:
+    if position_updates_csv is None:
+        return {}
+    with span("io.read_position_updates"):
+        return read_position_updates_csv(Path(position_updates_csv))
 
+
+def _validate_loaded_update_names(
+    json_names: Iterable[str],
+    *,
+    position_updates: Mapping[str, list[tuple[int, Position]]],
+    position_updates_csv: str | Path | None,
+    squad_id_filter: FrozenSet[int] | None,
+) -> None:
     # Validate position update CSV names.
     # If we're loading the full dataset, validate against all JSON names.
     # If we're loading a filtered subset (e.g. a couple of squads for a small model),
     # it's expected that the update CSV contains many names outside the subset, so
     # we intentionally skip this validation.
-    if position_updates_csv is not None and squad_id_filter is None:
-        json_names: set[str] = {p.name for p in players.values()}
-        validate_update_names(
-            update_names=position_updates.keys(),
-            json_names=json_names,
-            source_label="position_updates_csv",
+    if position_updates_csv is None or squad_id_filter is not None:
+        return
+    validate_update_names(
+        update_names=position_updates.keys(),
+        json_names=set(json_names),
+        source_label="position_updates_csv",
+    )
+
+
+def _build_players(
+    records: Iterable[Mapping[str, Any]],
+    *,
+    position_code_map: Mapping[int, Position],
+    include_round0: bool,
+    position_updates: Mapping[str, list[tuple[int, Position]]],
+    squad_id_filter: FrozenSet[int] | None,
+) -> Dict[int, Player]:
+    """Build :class:`Player` objects from the parsed JSON records."""
+
+    players: Dict[int, Player] = {}
+
+    for rec in _normalise_records(
+        records,
+        position_code_map=position_code_map,
+        include_round0=include_round0,
+        position_updates=position_updates,
+        squad_id_filter=squad_id_filter,
+    ):
+        player = Player(
+            player_id=rec.player_id,
+            first_name=rec.first_name,
+            last_name=rec.last_name,
+            squad_id=rec.squad_id,
+            original_positions=mask_to_positions(rec.base_mask),
         )
+        for r, score, price, mask in rec.rounds:
+            player.by_round[r] = PlayerRoundInfo(
+                round_number=r,
+                score=score,
+                price=price,
+                eligible_positions=mask_to_positions(mask),
+            )
+        players[rec.player_id] = player
 
     return players
 
 
+def load_players_from_json(
+    path: str | Path,
+    *,
+    position_code_map: Mapping[int, Position] = DEFAULT_POSITION_CODE_MAP,
+    include_round0: bool = False,
+    position_updates_csv: str | Path | None = None,
+    squad_id_filter: FrozenSet[int] | None = None,
+) -> Dict[int, Player]:
+    """Load players from ``players_final.json`` and apply round-based eligibility updates.
+
+    Parameters
+    ----------
+    squad_id_filter:
+        If provided, only players whose ``squad_id`` is in this set are loaded.
+        This is applied during the single pass over the JSON records, so excluded
+        players are never instantiated.
+
+    Notes
+    -----
+    The JSON is streamed record by record (see :func:`iter_player_records`), so
+    the unused parts of each record are never held for the whole file.
+    """
+
+    path = Path(path)
+    position_updates = _read_position_updates(position_updates_csv)
+
+    # Parsing and Player construction are interleaved, so they share one span.
+    with span("io.stream_players"):
+        players = _build_players(
+            iter_player_records(path),
+            position_code_map=position_code_map,
+            include_round0=include_round0,
+            position_updates=position_updates,
+            squad_id_filter=squad_id_filter,
+        )
+
+    _validate_loaded_update_names(
+        (p.name for p in players.values()),
+        position_updates=position_updates,
+        position_updates_csv=position_updates_csv,
+        squad_id_filter=squad_id_filter,
+    )
+
+    return players
+
+
+def load_season_from_json(
+    path: str | Path,
+    *,
+    position_code_map: Mapping[int, Position] = DEFAULT_POSITION_CODE_MAP,
+    include_round0: bool = False,
+    position_updates_csv: str | Path | None = None,
+    squad_id_filter: FrozenSet[int] | None = None,
+) -> SeasonStore:
+    """Columnar counterpart of :func:`load_players_from_json`.
+
+    Same parameters, fallbacks and validation, but the records go straight
+    into a :class:`~retro_fantasy.data.SeasonStore`: no ``Player`` or
+    ``PlayerRoundInfo`` objects are created, and eligibility is kept as a
+    position bitmask per (player, round).
+    """
+
+    path = Path(path)
+    position_updates = _read_position_updates(position_updates_csv)
+
+    player_ids: list[int] = []
+    first_names: list[str] = []
+    last_names: list[str] = []
+    squad_ids: list[Optional[int]] = []
+    original_masks: list[int] = []
+    # Flat (row, round, score, price, mask) triplets; pivoted into arrays at the end.
+    cell_rows: list[int] = []
+    cell_rounds: list[int] = []
+    cell_scores: list[float] = []
+    cell_prices: list[float] = []
+    cell_masks: list[int] = []
+
+    with span("io.stream_season"):
+        for rec in _normalise_records(
+            iter_player_records(path),
+            position_code_map=position_code_map,
+            include_round0=include_round0,
+            position_updates=position_updates,
+            squad_id_filter=squad_id_filter,
+        ):
+            row = len(player_ids)
+            player_ids.append(rec.player_id)
+            first_names.append(rec.first_name)
+            last_names.append(rec.last_name)
+            squad_ids.append(rec.squad_id)
+            original_masks.append(rec.base_mask)
+            for r, score, price, mask in rec.rounds:
+                cell_rows.append(row)
+                cell_rounds.append(r)
+                cell_scores.append(score)
+                cell_prices.append(price)
+                cell_masks.append(mask)
+
+    if len(set(player_ids)) != len(player_ids):
+        # Mirror the dict-based loader: a repeated id keeps its last record, in its first position.
+        last_row = {pid: i for i, pid in enumerate(player_ids)}
+        keep_rows = [last_row[pid] for pid in dict.fromkeys(player_ids)]
+        remap = {old: new for new, old in enumerate(keep_rows)}
+        keep_cells = [i for i, row in enumerate(cell_rows) if row in remap]
+        player_ids, first_names, last_names, squad_ids, original_masks = (
+            [values[i] for i in keep_rows]
+            for values in (player_ids, first_names, last_names, squad_ids, original_masks)
+        )
+        cell_rows = [remap[cell_rows[i]] for i in keep_cells]
+        cell_rounds, cell_scores, cell_prices, cell_masks = (
+            [values[i] for i in keep_cells] for values in (cell_rounds, cell_scores, cell_prices, cell_masks)
+        )
+
+    round_numbers, columns = np.unique(np.array(cell_rounds, dtype=np.int64), return_inverse=True)
+    rows = np.array(cell_rows, dtype=np.int64)
+    shape = (len(player_ids), len(round_numbers))
+    scores_arr = np.zeros(shape, dtype=np.float64)
+    prices_arr = np.zeros(shape, dtype=np.float64)
+    has_data = np.zeros(shape, dtype=bool)
+    masks = np.zeros(shape, dtype=np.uint8)
+    scores_arr[rows, columns] = cell_scores
+    prices_arr[rows, columns] = cell_prices
+    has_data[rows, columns] = True
+    masks[rows, columns] = cell_masks
+
+    _validate_loaded_update_names(
+        (f"{f} {l}".strip() for f, l in zip(first_names, last_names)),
+        position_updates=position_updates,
+        position_updates_csv=position_updates_csv,
+        squad_id_filter=squad_id_filter,
+    )
+
+    return SeasonStore(
+        player_ids=player_ids,
+        first_names=first_names,
+        last_names=last_names,
+        squad_ids=squad_ids,
+        original_masks=np.array(original_masks, dtype=np.uint8),
+        round_numbers=round_numbers.tolist(),
+        scores=scores_arr,
+        prices=prices_arr,
+        has_data=has_data,
+        masks=masks,
+    )
+
+
 def load_team_rules_from_json(path: str | Path) -> TeamStructureRules:
     """Load :class:`~retro_fantasy.data.TeamStructureRules` from JSON."""
 
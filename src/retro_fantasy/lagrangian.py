@@ -0,0 +1,441 @@
+"""Lagrangian relaxation bound and heuristic, decomposed by round.
+
+Rounds are only coupled by the bank and by the trade indicators. Writing the
+trade linking as the flow equalities
+
+    traded_in[p,r] - traded_out[p,r] = x[p,r] - x[p,r-1]        (r > 1)
+
+(implied by the linking rows of every formulation variant) and unrolling the
+bank recurrence turns ``bank[r] >= 0`` into one budget row per round:
+
+    sum_p ( c[p,r] x[p,r] + sum_{t<r} (c[p,t] - c[p,t+1]) x[p,t] ) <= salary_cap
+
+i.e. the squad's value at round-``r`` prices, less the price changes banked
+on earlier squads, fits the cap. Where a player has no price the model bans
+trading them, so ``x`` cannot change there and the last known price is used.
+
+Dualising the flow equalities (multipliers ``mu[p,r]``, free) and the budget
+rows (multipliers ``lambda[r] >= 0``, rows scaled by the salary cap) leaves,
+for given multipliers, independent per-round problems:
+
+- squad selection: fill every on-field, bench and utility slot with eligible
+  players whose ``x`` coefficient comes from the multipliers, plus the
+  counted scores and the captain bonus of the on-field players;
+- trades: at most ``max_trades`` traded in and out of the players with a price
+  that round, each worth ``-mu`` (in) or ``mu`` (out).
+
+The sum of their optima (plus ``sum_r lambda[r]``) bounds the season
+optimum from above. Counting exactly ``N`` on-field scores is bounded with the
+dual of the top-``N`` sum, ``N theta + sum_on max(0, s - theta)`` (and the same
+for the captain with ``N = 1``), which leaves a max-weight assignment of
+players to slot types. That is solved exactly by successive longest
+augmenting paths over the handful of slot types, in NumPy, for all rounds at
+once.
+
+Subgradient iterations with Polyak steps towards the best known plan update
+the multipliers. Every ``repair_every`` iterations the relaxed squads are
+turned into a feasible plan by the constructive heuristic
+(:mod:`retro_fantasy.constructive`), with players valued more in the rounds
+where the relaxation selects them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import time
+
+import numpy as np
+
+from retro_fantasy.constructive import ConstructiveConfig, ConstructiveResult, build_constructive_plan, planning_values
+from retro_fantasy.data import ModelInputData
+from retro_fantasy.instrumentation import instrumented
+from retro_fantasy.slots import Slot, squad_slots
+from retro_fantasy.solution import SolutionSummary
+from retro_fantasy.warm_start import WarmStart
+
+
+logger = logging.getLogger(__name__)
+
+
+_TOL = 1e-9
+
+
+@dataclass(frozen=True, slots=True)
+class LagrangianConfig:
+    """Lagrangian relaxation settings.
+
+    Attributes
+    ----------
+    max_iterations:
+        Maximum number of subgradient iterations.
+    step_scale:
+        Initial Polyak step factor (between 0 and 2).
+    patience:
+        Iterations without a better bound after which the step factor is
+        halved.
+    min_step_scale:
+        Stop once the step factor falls below this.
+    repair_every:
+        Build a feasible plan from the relaxed squads every this many
+        iterations (and after the last one).
+    guide_weight:
+        Points per lookahead round added to a player's value in the repair for
+        each round the relaxation selects them, as a multiple of the mean
+        positive score.
+    time_budget_seconds:
+        Stop iterating after this long (``None``: no limit).
+    constructive:
+        Settings of the constructive heuristic used for the first plan and
+        the repairs.
+    """
+
+    max_iterations: int = 300
+    step_scale: float = 1.0
+    patience: int = 15
+    min_step_scale: float = 1e-3
+    repair_every: int = 50
+    guide_weight: float = 0.5
+    time_budget_seconds: float | None = None
+    constructive: ConstructiveConfig = ConstructiveConfig()
+
+    def __post_init__(self) -> None:
+        if self.max_iterations < 1:
+            raise ValueError("LagrangianConfig.max_iterations must be >= 1")
+        if not 0 < self.step_scale <= 2:
+            raise ValueError("LagrangianConfig.step_scale must be in (0, 2]")
+        if self.patience < 1:
+            raise ValueError("LagrangianConfig.patience must be >= 1")
+        if self.repair_every < 1:
+            raise ValueError("LagrangianConfig.repair_every must be >= 1")
+        if self.guide_weight < 0:
+            raise ValueError("LagrangianConfig.guide_weight must be >= 0")
+
+
+@dataclass(slots=True)
+class LagrangianResult:
+    """Outcome of :func:`solve_lagrangian`.
+
+    ``upper_bound`` bounds the optimum of the full model. ``warm_start`` and
+    ``summary`` hold the best feasible plan found (objective
+    ``objective_value``), as in
+    :class:`~retro_fantasy.constructive.ConstructiveResult`.
+    """
+
+    upper_bound: float
+    objective_value: float
+    warm_start: WarmStart
+    summary: SolutionSummary
+    iterations: int
+    seconds: float
+    # (seconds since start, best bound, best objective) after each iteration.
+    trajectory: list[tuple[float, float, float]] = field(default_factory=list)
+
+    @property
+    def gap(self) -> float:
+        """Relative gap ``(bound - objective) / |bound|``."""
+
+        if self.upper_bound == 0:
+            return 0.0
+        return max(0.0, (self.upper_bound - self.objective_value) / abs(self.upper_bound))
+
+
+def _assign_slot_types(values: np.ndarray, caps: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Max-weight assignment of players to slot types, for a batch of rounds.
+
+    ``values[r, p, t]`` is the value of player ``p`` in a slot of type ``t``
+    (``-inf`` where not eligible) and ``caps[t]`` the number of such slots.
+    Every slot is filled and each player takes at most one. One slot is added
+    at a time along the best augmenting path: a free player enters some type,
+    then members shift from type to type until one with a free slot. Only the
+    best member per (from, to) pair matters, so paths live on the ``T`` types.
+
+    Returns the members' player indices and slot types, both ``(R, S)``.
+    """
+
+    num_rounds, _, num_types = values.shape
+    num_slots = int(caps.sum())
+    rows = np.arange(num_rounds)
+    type_ids = np.arange(num_types)
+
+    members = np.zeros((num_rounds, num_slots), dtype=np.int64)
+    types = np.zeros((num_rounds, num_slots), dtype=np.int64)
+    free = np.ones(values.shape[:2], dtype=bool)
+    counts = np.zeros((num_rounds, num_types), dtype=np.int64)
+
+    for u in range(num_slots):
+        free_values = np.where(free[:, :, None], values, -np.inf)
+        entry = free_values.argmax(axis=1)
+        dist = np.take_along_axis(free_values, entry[:, None, :], axis=1)[:, 0, :]
+        pred = np.full((num_rounds, num_types), -1, dtype=np.int64)
+
+        if u:
+            member_values = values[rows[:, None], members[:, :u]]
+            current = np.take_along_axis(member_values, types[:, :u, None], axis=2)
+            shifts = np.where(
+                (types[:, :u, None] == type_ids)[:, :, :, None],
+                (member_values - current)[:, :, None, :],
+                -np.inf,
+            )
+            mover = shifts.argmax(axis=1)
+            gain = np.take_along_axis(shifts, mover[:, None], axis=1)[:, 0]
+            for _ in range(num_types - 1):
+                via = dist[:, :, None] + gain
+                best_from = via.argmax(axis=1)
+                best = np.take_along_axis(via, best_from[:, None, :], axis=1)[:, 0, :]
+                better = best > dist + _TOL
+                if not better.any():
+                    break
+                dist = np.where(better, best, dist)
+                pred = np.where(better, best_from, pred)
+
+        end_dist = np.where(counts < caps, dist, -np.inf)
+        end = end_dist.argmax(axis=1)
+        if np.isneginf(end_dist[rows, end]).any():
+            raise ValueError("Not enough eligible players to fill every squad slot")
+
+        for r in range(num_rounds):
+            t = int(end[r])
+            counts[r, t] += 1
+            for _ in range(num_types):
+                t_from = int(pred[r, t])
+                if t_from < 0:
+                    break
+                types[r, mover[r, t_from, t]] = t
+                t = t_from
+            p = int(entry[r, t])
+            members[r, u] = p
+            types[r, u] = t
+            free[r, p] = False
+
+    return members, types
+
+
+class _Relaxation:
+    """The per-round subproblems of one season."""
+
+    def __init__(self, model_input_data: ModelInputData) -> None:
+        data = model_input_data
+        self.data = data
+        self.scores = data.scores
+        self.has_prices = data.has_prices
+        num_players, num_rounds = self.scores.shape
+
+        all_slots = squad_slots(data)
+        self.slot_types: list[Slot] = list(dict.fromkeys(all_slots))
+        self.caps = np.array([all_slots.count(slot) for slot in self.slot_types], dtype=np.int64)
+        self.on_field = np.array([kind == "on_field" for kind, _ in self.slot_types])
+
+        eligible = np.ones((num_rounds, num_players, len(self.slot_types)), dtype=bool)
+        for t, (_, k) in enumerate(self.slot_types):
+            if k is not None:
+                eligible[:, :, t] = data.eligible[:, data.position_index[k], :].T
+        self.eligible = eligible
+
+        self.counted = np.array([data.counted_onfield_players(r) for r in data.round_numbers], dtype=np.int64)
+        self.max_trades = np.array([data.max_trades(r) for r in data.round_numbers], dtype=np.int64)
+
+        # Budget rows: last known price where a player has none (they cannot be traded there).
+        prices = data.prices.copy()
+        for j in range(1, num_rounds):
+            prices[:, j] = np.where(data.has_prices[:, j], prices[:, j], prices[:, j - 1])
+        self.prices = prices / data.salary_cap
+        self.price_drops = self.prices[:, :-1] - self.prices[:, 1:]
+        # Without round 1 the first bank is free and there is no budget to dualise.
+        self.budgeted = data.round_numbers[0] == 1
+
+    def squad_values(self, w: np.ndarray, theta: np.ndarray, phi: np.ndarray) -> np.ndarray:
+        """(R, P, T) slot-type values for ``x`` coefficients ``w`` and counting duals ``theta``/``phi``."""
+
+        scores = self.scores.T
+        bonus = np.maximum(scores - theta[:, None], 0.0) + np.maximum(scores - phi[:, None], 0.0)
+        values = w.T[:, :, None] + np.where(self.on_field, bonus[:, :, None], 0.0)
+        return np.where(self.eligible, values, -np.inf)
+
+    def counting_duals(self, members: np.ndarray, types: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """``theta``/``phi`` that make the counting bounds exact for the given squads."""
+
+        rows = np.arange(len(members))[:, None]
+        member_scores = np.where(self.on_field[types], self.scores.T[rows, members], -np.inf)
+        ranked = -np.sort(-member_scores, axis=1)
+        return self._finite_duals(ranked[np.arange(len(members)), np.maximum(self.counted, 1) - 1], ranked[:, 0])
+
+    def _finite_duals(self, theta: np.ndarray, phi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Rounds that count no score get no bonus.
+        top = float(self.scores.max(initial=0.0))
+        counted = self.counted > 0
+        theta = np.where(counted & np.isfinite(theta), theta, top)
+        phi = np.where(counted & np.isfinite(phi), phi, top)
+        return theta, phi
+
+    def x_coefficients(self, lam: np.ndarray, mu: np.ndarray) -> np.ndarray:
+        """(P, R) coefficient of ``x[p,r]`` in the Lagrangian."""
+
+        later = np.concatenate([np.cumsum(lam[::-1])[::-1][1:], [0.0]])
+        w = -self.prices * lam[None, :]
+        w[:, :-1] -= self.price_drops * later[None, :-1]
+        w += mu
+        w[:, :-1] -= mu[:, 1:]
+        return w
+
+    def trades(self, mu: np.ndarray) -> tuple[np.ndarray, np.ndarray, float]:
+        """Best trades in/out per round for ``mu``: indicator arrays (P, R) and their value."""
+
+        traded_in = np.zeros(mu.shape, dtype=bool)
+        traded_out = np.zeros(mu.shape, dtype=bool)
+        value = 0.0
+        for j in range(1, mu.shape[1]):
+            limit = int(self.max_trades[j])
+            if limit <= 0:
+                continue
+            for indicator, gains in ((traded_in, -mu[:, j]), (traded_out, mu[:, j])):
+                gains = np.where(self.has_prices[:, j], gains, 0.0)
+                top = np.argsort(-gains, kind="stable")[:limit]
+                top = top[gains[top] > 0]
+                indicator[top, j] = True
+                value += float(gains[top].sum())
+        return traded_in, traded_out, value
+
+    def budget_slack(self, x: np.ndarray) -> np.ndarray:
+        """Scaled budget rows ``1 - spend / salary_cap`` per round for squads ``x`` (P, R)."""
+
+        current = (self.prices * x).sum(axis=0)
+        banked = np.concatenate([[0.0], np.cumsum((self.price_drops * x[:, :-1]).sum(axis=0))])
+        return 1.0 - current - banked
+
+
+def _repair(
+    model_input_data: ModelInputData,
+    config: LagrangianConfig,
+    selected: np.ndarray,
+    base_values: tuple[np.ndarray, np.ndarray],
+    weight: float,
+) -> ConstructiveResult:
+    """Constructive plan steered towards the relaxed squads ``selected`` (P, R)."""
+
+    horizon = config.constructive.horizon
+    num_players, num_rounds = selected.shape
+    end = np.minimum(np.arange(num_rounds) + horizon, num_rounds)
+    cumulative = np.concatenate([np.zeros((num_players, 1)), np.cumsum(selected, axis=1)], axis=1)
+    guide = weight * (cumulative[:, end] - cumulative[:, :num_rounds])
+
+    on_field, bench = base_values
+    values = (on_field + guide, bench + guide)
+    return build_constructive_plan(model_input_data, config=config.constructive, values=values)
+
+
+@instrumented("lagrangian.solve")
+def solve_lagrangian(
+    model_input_data: ModelInputData,
+    *,
+    config: LagrangianConfig | None = None,
+) -> LagrangianResult:
+    """Bound the season optimum by Lagrangian relaxation and build a feasible plan.
+
+    Raises
+    ------
+    ValueError
+        If no plan fits the rules (see
+        :func:`retro_fantasy.constructive.build_constructive_plan`).
+    """
+
+    start = time.perf_counter()
+    config = config or LagrangianConfig()
+    data = model_input_data
+    relaxation = _Relaxation(data)
+    num_players, num_rounds = data.scores.shape
+
+    base_values = planning_values(data, config.constructive)
+    best = build_constructive_plan(data, config=config.constructive, values=base_values)
+    positive = data.scores[data.scores > 0]
+    weight = config.guide_weight * (float(positive.mean()) if positive.size else 0.0)
+
+    # Start the counting duals from the constructive plan's counted players.
+    counted_scores = np.full(num_rounds, np.inf)
+    best_scores = np.full(num_rounds, np.inf)
+    for (p, r) in best.warm_start.scored:
+        j = data.round_index[r]
+        score = data.scores[data.player_index[p], j]
+        counted_scores[j] = min(counted_scores[j], score)
+        best_scores[j] = score if np.isinf(best_scores[j]) else max(best_scores[j], score)
+    theta, phi = relaxation._finite_duals(counted_scores, best_scores)
+
+    lam = np.zeros(num_rounds)
+    mu = np.zeros((num_players, num_rounds))
+    step_scale = config.step_scale
+    upper_bound = np.inf
+    since_improved = 0
+    trajectory: list[tuple[float, float, float]] = []
+    selected = np.zeros((num_players, num_rounds))
+
+    iteration = 0
+    for iteration in range(1, config.max_iterations + 1):
+        w = relaxation.x_coefficients(lam, mu)
+        values = relaxation.squad_values(w, theta, phi)
+        members, types = _assign_slot_types(values, relaxation.caps)
+        rows = np.arange(num_rounds)[:, None]
+        squad_value = values[rows, members, types].sum() + float((relaxation.counted * theta).sum() + phi.sum())
+        traded_in, traded_out, trade_value = relaxation.trades(mu)
+        bound = float(squad_value + trade_value + lam.sum())
+
+        if bound < upper_bound - _TOL:
+            upper_bound, since_improved = bound, 0
+        else:
+            since_improved += 1
+            if since_improved >= config.patience:
+                step_scale, since_improved = step_scale / 2, 0
+
+        selected = np.zeros((num_players, num_rounds))
+        selected[members.T, np.arange(num_rounds)[None, :]] = 1.0
+
+        if iteration % config.repair_every == 0:
+            repaired = _repair(data, config, selected, base_values, weight)
+            if repaired.objective_value > best.objective_value:
+                best = repaired
+
+        trajectory.append((time.perf_counter() - start, upper_bound, best.objective_value))
+
+        # Counting duals for the next iteration: exact for this iteration's squads.
+        theta, phi = relaxation.counting_duals(members, types)
+
+        flow = np.zeros((num_players, num_rounds))
+        flow[:, 1:] = selected[:, 1:] - selected[:, :-1] - traded_in[:, 1:] + traded_out[:, 1:]
+        slack = relaxation.budget_slack(selected) if relaxation.budgeted else np.zeros(num_rounds)
+        # Projected subgradient: lambda stays >= 0.
+        slack_step = np.where((lam <= 0) & (slack > 0), 0.0, slack)
+        norm = float((flow**2).sum() + (slack_step**2).sum())
+
+        if norm <= _TOL or upper_bound - best.objective_value <= _TOL * max(1.0, abs(upper_bound)):
+            break
+        if step_scale < config.min_step_scale:
+            break
+        if config.time_budget_seconds is not None and time.perf_counter() - start >= config.time_budget_seconds:
+            break
+
+        step = step_scale * (bound - best.objective_value) / norm
+        lam = np.maximum(lam - step * slack_step, 0.0)
+        mu = mu - step * flow
+
+    if iteration % config.repair_every:
+        repaired = _repair(data, config, selected, base_values, weight)
+        if repaired.objective_value > best.objective_value:
+            best = repaired
+
+    result = LagrangianResult(
+        upper_bound=upper_bound,
+        objective_value=best.objective_value,
+        warm_start=best.warm_start,
+        summary=best.summary,
+        iterations=iteration,
+        seconds=time.perf_counter() - start,
+        trajectory=trajectory,
+    )
+    logger.info(
+        "Lagrangian relaxation: bound=%s objective=%s gap=%.4f iterations=%d time=%.2fs",
+        result.upper_bound,
+        result.objective_value,
+        result.gap,
+        result.iterations,
+        result.seconds,
+    )
+    return result
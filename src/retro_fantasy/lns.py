@@ -0,0 +1,478 @@
+"""Large-neighbourhood search (LNS) around the season MILP.
+
+Starting from any feasible season plan (an *incumbent*), repeatedly:
+
+1. pick a neighbourhood and free its integer decisions,
+2. fix every other integer decision to the incumbent,
+3. re-solve that small sub-MILP with a short time limit, starting from the
+   incumbent,
+4. keep the result if it improves the objective.
+
+Neighbourhood kinds:
+
+- ``"rounds"``: every decision in a random window of consecutive rounds.
+- ``"position"``: every decision of the players who can play a random
+  position in some round (a position line).
+- ``"players"``: every decision of a random subset of players, half drawn
+  from the incumbent's squads so there is something to swap out.
+
+Bank columns are continuous and never fixed; they follow the freed trades.
+Because the incumbent stays feasible for every sub-MILP, a sub-solve can
+never make the plan worse.
+
+With ``max_workers > 1`` each iteration solves ``max_workers`` neighbourhoods
+of the same incumbent in worker processes and keeps the best improvement.
+The ``solve_matrix`` callable is sent to the workers, so it must be picklable
+(a module-level function or a :class:`SubSolver`).
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+import logging
+import time
+from typing import List, Optional
+
+import numpy as np
+import pulp
+
+from retro_fantasy.data import ModelInputData
+from retro_fantasy.formulation import DecisionVariables, FormulationOptions
+from retro_fantasy.matrix import (
+    MatrixModel,
+    MatrixSolveResult,
+    build_matrix_model,
+    column_players,
+    column_rounds,
+    matrix_model_to_pulp,
+    set_pulp_variable_values,
+)
+from retro_fantasy.rolling_horizon import MatrixSolver
+from retro_fantasy.solvers import build_matrix_solver
+
+
+logger = logging.getLogger(__name__)
+
+
+NEIGHBOURHOOD_KINDS = ("rounds", "position", "players")
+
+# Objective changes below this are treated as ties, not improvements.
+_IMPROVEMENT_TOL = 1e-6
+
+
+@dataclass(frozen=True, slots=True)
+class LnsConfig:
+    """LNS settings.
+
+    Attributes
+    ----------
+    time_budget_seconds:
+        Stop starting new iterations after this much wall time.
+    max_iterations:
+        Optional cap on the number of neighbourhoods solved.
+    kinds:
+        Neighbourhood kinds to cycle through (see module docstring).
+    round_window:
+        Number of consecutive rounds freed by a ``"rounds"`` neighbourhood.
+    num_players:
+        Number of players freed by a ``"players"`` neighbourhood.
+    max_workers:
+        Neighbourhoods solved concurrently per iteration. ``1`` solves in the
+        current process.
+    seed:
+        Seed for neighbourhood sampling.
+    """
+
+    time_budget_seconds: float = 300.0
+    max_iterations: int | None = None
+    kinds: tuple[str, ...] = NEIGHBOURHOOD_KINDS
+    round_window: int = 4
+    num_players: int = 40
+    max_workers: int = 1
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.kinds:
+            raise ValueError("LnsConfig.kinds cannot be empty")
+        unknown = sorted(set(self.kinds) - set(NEIGHBOURHOOD_KINDS))
+        if unknown:
+            raise ValueError(f"LnsConfig.kinds has unknown kinds {unknown}; expected some of {NEIGHBOURHOOD_KINDS}")
+        if self.round_window < 1:
+            raise ValueError("LnsConfig.round_window must be >= 1")
+        if self.num_players < 1:
+            raise ValueError("LnsConfig.num_players must be >= 1")
+        if self.max_workers < 1:
+            raise ValueError("LnsConfig.max_workers must be >= 1")
+
+
+@dataclass(frozen=True, slots=True)
+class SubSolver:
+    """Picklable sub-MILP solver for :func:`solve_lns` (see :func:`retro_fantasy.solvers.build_matrix_solver`)."""
+
+    solver: str
+    time_limit_seconds: int | None = 30
+    mip_gap: float | None = None
+    threads: int | None = 1
+
+    def __call__(self, matrix_model: MatrixModel, initial_values: np.ndarray | None) -> MatrixSolveResult:
+        solve = build_matrix_solver(
+            self.solver,
+            time_limit_seconds=self.time_limit_seconds,
+            enable_solver_output=False,
+            mip_gap=self.mip_gap,
+            threads=self.threads,
+        )
+        return solve(matrix_model, initial_values)
+
+
+@dataclass(frozen=True, slots=True)
+class Neighbourhood:
+    """A set of integer columns to free, with a readable description."""
+
+    kind: str
+    description: str
+    free_columns: np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class LnsStep:
+    """One solved neighbourhood.
+
+    ``improved`` marks the step whose solution became the new incumbent (at
+    most one per iteration when neighbourhoods are solved concurrently).
+    """
+
+    iteration: int
+    elapsed_seconds: float
+    neighbourhood: str
+    num_free_columns: int
+    status: str
+    objective_value: float
+    incumbent_objective_value: float
+    improved: bool
+    solve_seconds: float
+
+
+@dataclass(slots=True)
+class LnsResult:
+    """Outcome of :func:`solve_lns`.
+
+    ``problem`` and ``decision_variables`` hold the full model with the final
+    incumbent assigned to ``varValue``, so they can be passed straight to
+    :func:`retro_fantasy.solution.build_solution_summary`.
+    """
+
+    status: str
+    objective_value: float
+    initial_objective_value: float
+    values: np.ndarray
+    problem: pulp.LpProblem
+    decision_variables: DecisionVariables
+    matrix_model: MatrixModel
+    steps: list[LnsStep] = field(default_factory=list)
+
+    @property
+    def trajectory(self) -> list[tuple[float, float]]:
+        """``(elapsed seconds, incumbent objective)`` at the start and after each improvement."""
+
+        points = [(0.0, self.initial_objective_value)]
+        points.extend((s.elapsed_seconds, s.objective_value) for s in self.steps if s.improved)
+        return points
+
+
+# ============================================================================
+# Neighbourhoods
+# ============================================================================
+
+
+class NeighbourhoodSampler:
+    """Draws random neighbourhoods of a matrix model built from ``model_input_data``."""
+
+    def __init__(
+        self,
+        model_input_data: ModelInputData,
+        matrix_model: MatrixModel,
+        config: LnsConfig,
+    ) -> None:
+        self._data = model_input_data
+        self._config = config
+        self._rng = np.random.default_rng(config.seed)
+        self._next_kind = 0
+
+        self._integer = matrix_model.integrality.astype(bool)
+        self._col_rounds = column_rounds(matrix_model)
+        self._col_players = column_players(matrix_model)
+        self._x_slice = matrix_model.family_slice("x_selected")
+        self._x_players = self._col_players[self._x_slice]
+
+    def _free(self, mask: np.ndarray) -> np.ndarray:
+        return np.flatnonzero(mask & self._integer)
+
+    def rounds(self) -> Neighbourhood:
+        round_numbers = self._data.round_numbers
+        width = min(self._config.round_window, len(round_numbers))
+        start = int(self._rng.integers(0, len(round_numbers) - width + 1))
+        window = round_numbers[start : start + width]
+        return Neighbourhood(
+            kind="rounds",
+            description=f"rounds {window[0]}-{window[-1]}",
+            free_columns=self._free(np.isin(self._col_rounds, window)),
+        )
+
+    def position(self) -> Neighbourhood:
+        k = int(self._rng.integers(0, len(self._data.positions)))
+        line = np.asarray(self._data.player_ids)[self._data.eligible[:, k, :].any(axis=1)]
+        return Neighbourhood(
+            kind="position",
+            description=f"position {self._data.positions[k].value} ({len(line)} players)",
+            free_columns=self._free(np.isin(self._col_players, line)),
+        )
+
+    def players(self, incumbent: np.ndarray) -> Neighbourhood:
+        player_ids = np.asarray(self._data.player_ids)
+        in_squad = np.unique(self._x_players[incumbent[self._x_slice] > 0.5])
+        others = np.setdiff1d(player_ids, in_squad)
+
+        n = min(self._config.num_players, len(player_ids))
+        # Half squad members (who can be traded out), half candidates to bring
+        # in; whichever side runs short is topped up from the other.
+        n_other = min(len(others), n - min(len(in_squad), n // 2 or 1))
+        n_squad = min(len(in_squad), n - n_other)
+        chosen = np.concatenate(
+            [
+                self._rng.choice(in_squad, size=n_squad, replace=False),
+                self._rng.choice(others, size=n_other, replace=False),
+            ]
+        )
+        return Neighbourhood(
+            kind="players",
+            description=f"{len(chosen)} players",
+            free_columns=self._free(np.isin(self._col_players, chosen)),
+        )
+
+    def sample(self, incumbent: np.ndarray) -> Neighbourhood:
+        """Next neighbourhood, cycling through ``config.kinds``."""
+
+        kind = self._config.kinds[self._next_kind % len(self._config.kinds)]
+        self._next_kind += 1
+        if kind == "rounds":
+            return self.rounds()
+        if kind == "position":
+            return self.position()
+        return self.players(incumbent)
+
+
+# ============================================================================
+# Sub-MILPs
+# ============================================================================
+
+
+def is_feasible(matrix_model: MatrixModel, values: np.ndarray, *, tol: float = 1e-6) -> bool:
+    """Whether ``values`` satisfies every bound, row and integrality of ``matrix_model``."""
+
+    if values.shape != (matrix_model.num_cols,):
+        return False
+    if np.any(values < matrix_model.col_lower - tol) or np.any(values > matrix_model.col_upper + tol):
+        return False
+    ints = values[matrix_model.integrality]
+    if np.any(np.abs(ints - np.round(ints)) > tol):
+        return False
+    activity = np.bincount(
+        matrix_model.coo_rows,
+        weights=matrix_model.coo_vals * values[matrix_model.coo_cols],
+        minlength=matrix_model.num_rows,
+    )
+    return bool(
+        np.all(activity >= matrix_model.row_lower - tol) and np.all(activity <= matrix_model.row_upper + tol)
+    )
+
+
+def _fix_outside(matrix_model: MatrixModel, incumbent: np.ndarray, free_columns: np.ndarray) -> MatrixModel:
+    """A copy of ``matrix_model`` with every integer column outside ``free_columns`` fixed."""
+
+    fixed = matrix_model.integrality.astype(bool).copy()
+    fixed[free_columns] = False
+    col_lower = matrix_model.col_lower.copy()
+    col_upper = matrix_model.col_upper.copy()
+    values = np.round(incumbent[fixed])
+    col_lower[fixed] = values
+    col_upper[fixed] = values
+
+    return replace(matrix_model, col_lower=col_lower, col_upper=col_upper)
+
+
+def _solve_neighbourhood(
+    matrix_model: MatrixModel,
+    solve_matrix: MatrixSolver,
+    incumbent: np.ndarray,
+    free_columns: np.ndarray,
+) -> tuple[MatrixSolveResult, float]:
+    start = time.perf_counter()
+    result = solve_matrix(_fix_outside(matrix_model, incumbent, free_columns), incumbent)
+    return result, time.perf_counter() - start
+
+
+# Full model and sub-solver, set once per worker process by _init_worker.
+_WORKER_MODEL: Optional[MatrixModel] = None
+_WORKER_SOLVER: Optional[MatrixSolver] = None
+
+
+def _init_worker(matrix_model: MatrixModel, solve_matrix: MatrixSolver) -> None:
+    global _WORKER_MODEL, _WORKER_SOLVER
+    _WORKER_MODEL = matrix_model
+    _WORKER_SOLVER = solve_matrix
+
+
+def _solve_neighbourhood_task(incumbent: np.ndarray, free_columns: np.ndarray) -> tuple[MatrixSolveResult, float]:
+    assert _WORKER_MODEL is not None and _WORKER_SOLVER is not None
+    return _solve_neighbourhood(_WORKER_MODEL, _WORKER_SOLVER, incumbent, free_columns)
+
+
+# ============================================================================
+# Driver
+# ============================================================================
+
+
+def solve_lns(
+    model_input_data: ModelInputData,
+    *,
+    initial_values: np.ndarray,
+    solve_matrix: MatrixSolver,
+    config: LnsConfig | None = None,
+    options: FormulationOptions | None = None,
+) -> LnsResult:
+    """Improve a feasible plan by large-neighbourhood search.
+
+    Parameters
+    ----------
+    initial_values:
+        A feasible solution aligned with ``build_matrix_model(model_input_data,
+        options=options)`` (e.g. from the rolling horizon, relax-and-fix or a
+        repaired warm start).
+    solve_matrix:
+        Solves one sub-MILP from a MIP start; its time limit is the
+        per-neighbourhood limit. Must be picklable when
+        ``config.max_workers > 1``.
+
+    Raises
+    ------
+    ValueError
+        If ``initial_values`` is not feasible for the model.
+    """
+
+    config = config or LnsConfig()
+    matrix_model = build_matrix_model(model_input_data, options=options)
+
+    incumbent = np.asarray(initial_values, dtype=np.float64).copy()
+    if not is_feasible(matrix_model, incumbent):
+        raise ValueError("initial_values is not a feasible solution of the model")
+    incumbent_objective = float(matrix_model.objective @ incumbent)
+    initial_objective = incumbent_objective
+    # PuLP sense: -1 maximises, +1 minimises.
+    direction = -float(matrix_model.sense)
+
+    sampler = NeighbourhoodSampler(model_input_data, matrix_model, config)
+    steps: List[LnsStep] = []
+    started = time.perf_counter()
+
+    pool: ProcessPoolExecutor | None = None
+    if config.max_workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=config.max_workers,
+            initializer=_init_worker,
+            initargs=(matrix_model, solve_matrix),
+        )
+
+    try:
+        while time.perf_counter() - started < config.time_budget_seconds:
+            remaining = None if config.max_iterations is None else config.max_iterations - len(steps)
+            if remaining is not None and remaining <= 0:
+                break
+            batch = min(config.max_workers, remaining) if remaining is not None else config.max_workers
+            neighbourhoods = [sampler.sample(incumbent) for _ in range(batch)]
+
+            if pool is None:
+                outcomes = [
+                    _solve_neighbourhood(matrix_model, solve_matrix, incumbent, n.free_columns)
+                    for n in neighbourhoods
+                ]
+            else:
+                futures = [pool.submit(_solve_neighbourhood_task, incumbent, n.free_columns) for n in neighbourhoods]
+                outcomes = [f.result() for f in futures]
+
+            elapsed = time.perf_counter() - started
+            objectives = [float(matrix_model.objective @ result.values) for result, _ in outcomes]
+            improving = [
+                i
+                for i, (result, _) in enumerate(outcomes)
+                if result.status == "Optimal"
+                and direction * (objectives[i] - incumbent_objective) > _IMPROVEMENT_TOL
+                and is_feasible(matrix_model, result.values)
+            ]
+            accepted = max(improving, key=lambda i: direction * objectives[i]) if improving else None
+
+            for i, (n, (result, solve_seconds)) in enumerate(zip(neighbourhoods, outcomes)):
+                steps.append(
+                    LnsStep(
+                        iteration=len(steps),
+                        elapsed_seconds=elapsed,
+                        neighbourhood=f"{n.kind}: {n.description}",
+                        num_free_columns=int(n.free_columns.size),
+                        status=result.status,
+                        objective_value=objectives[i],
+                        incumbent_objective_value=incumbent_objective,
+                        improved=i == accepted,
+                        solve_seconds=solve_seconds,
+                    )
+                )
+                logger.info(
+                    "LNS %d [%s] free=%d status=%s objective=%s incumbent=%s%s (%.2fs)",
+                    steps[-1].iteration,
+                    steps[-1].neighbourhood,
+                    steps[-1].num_free_columns,
+                    result.status,
+                    objectives[i],
+                    incumbent_objective,
+                    " accepted" if i == accepted else "",
+                    solve_seconds,
+                )
+
+            if accepted is not None:
+                incumbent_objective = objectives[accepted]
+                incumbent = outcomes[accepted][0].values.copy()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    problem, decision_variables = matrix_model_to_pulp(matrix_model)
+    set_pulp_variable_values(matrix_model, decision_variables, incumbent)
+    problem.status = pulp.LpStatusOptimal
+
+    logger.info(
+        "LNS complete: objective=%s (initial %s) after %d neighbourhoods, %d improvements, %.1fs",
+        incumbent_objective,
+        initial_objective,
+        len(steps),
+        sum(s.improved for s in steps),
+        time.perf_counter() - started,
+    )
+    return LnsResult(
+        status="Optimal",
+        objective_value=incumbent_objective,
+        initial_objective_value=initial_objective,
+        values=incumbent,
+        problem=problem,
+        decision_variables=decision_variables,
+        matrix_model=matrix_model,
+        steps=steps,
+    )
+
+
+def solution_values(matrix_model: MatrixModel, decision_variables: DecisionVariables) -> np.ndarray:
+    """Column-aligned ``varValue`` vector (0 for unset variables), e.g. to seed :func:`solve_lns`."""
+
+    values: List[float] = []
+    for family in matrix_model.families:
+        values.extend(var.varValue or 0.0 for var in getattr(decision_variables, family).values())
+    return np.array(values, dtype=np.float64)
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Sequence
 
 import pulp
 
+from retro_fantasy.cache import load_players_cached
 from retro_fantasy.data import ModelInputData, Player, Position, Round, TeamStructureRules
-from retro_fantasy.formulation import DecisionVariables, formulate_problem
+from retro_fantasy.formulation import DecisionVariables, FormulationOptions, formulate_problem
+from retro_fantasy.instrumentation import PhaseRecorder, ensure_recording, instrument_method, span
 from retro_fantasy.io import load_players_from_json
+from retro_fantasy.matrix import MatrixModel, build_matrix_model, matrix_model_to_pulp
+from retro_fantasy.model_cache import formulate_problem_cached
+from retro_fantasy.relax_and_fix import RelaxAndFixConfig, RelaxAndFixResult, solve_relax_and_fix
+from retro_fantasy.rolling_horizon import RollingHorizonConfig, RollingHorizonResult, solve_rolling_horizon
+from retro_fantasy.solution import SolutionSummary
+from retro_fantasy.solvers import build_cbc_solver, build_gurobi_solver, build_matrix_solver, resolve_solver
+from retro_fantasy.warm_start import apply_warm_start, load_warm_start, warm_start_vector
+
+if TYPE_CHECKING:
+    from retro_fantasy.highs import IncumbentCallback
+    from retro_fantasy.lns import LnsConfig, LnsResult
 
 
 def configure_logging(*, level: int = logging.INFO) -> None:
@@ -37,11 +50,25 @@ def load_players(
     players_json_path: str | Path,
     position_updates_csv_path: str | Path,
     squad_id_filter: frozenset[int] | None = None,
+    use_cache: bool = True,
+    cache_dir: str | Path | None = None,
 ) -> Dict[int, Player]:
-    """Load player data for the optimiser."""
+    """Load player data for the optimiser.
+
+    By default the parsed season is cached on disk (see :mod:`retro_fantasy.cache`),
+    keyed by the input file contents, so repeated runs skip JSON/CSV parsing.
+    """
 
-    return load_players_from_json(
+    if not use_cache:
+        return load_players_from_json(
+            players_json_path,
+            position_updates_csv=position_updates_csv_path,
+            squad_id_filter=squad_id_filter,
+        )
+
+    return load_players_cached(
         players_json_path,
+        cache_dir=cache_dir,
         position_updates_csv=position_updates_csv_path,
         squad_id_filter=squad_id_filter,
     )
@@ -102,6 +129,22 @@ class SolveResult:
     problem: pulp.LpProblem
     model_input_data: ModelInputData
     decision_variables: DecisionVariables
+    matrix_model: MatrixModel | None = None
+
+    # Window timings, bound and gap when solved with solve_mode="rolling_horizon".
+    rolling_horizon: RollingHorizonResult | None = None
+
+    # Block timings, bound and gap when solved with solve_mode="relax_and_fix".
+    relax_and_fix: RelaxAndFixResult | None = None
+
+    # Improvement trajectory when solved with solve_mode="lns".
+    lns: LnsResult | None = None
+
+    # Per-phase wall/CPU time and memory (see retro_fantasy.instrumentation).
+    phases: PhaseRecorder | None = None
+
+
+SOLVE_MODES = ("full", "rolling_horizon", "relax_and_fix", "lns")
 
 
 def summarise_problem(problem: pulp.LpProblem, *, max_name_examples: int = 5) -> None:
@@ -160,71 +203,6 @@ def summarise_problem(problem: pulp.LpProblem, *, max_name_examples: int = 5) ->
         logger.info("  first_constraints=%s", c_names[:max_name_examples])
 
 
-def _build_cbc_solver(*, time_limit_seconds: int | None, enable_solver_output: bool) -> pulp.LpSolver:
-    """Create a CBC (COIN-OR) solver instance for PuLP."""
-
-    if time_limit_seconds is not None:
-        return pulp.PULP_CBC_CMD(msg=enable_solver_output, timeLimit=time_limit_seconds)
-
-    return pulp.PULP_CBC_CMD(msg=enable_solver_output)
-
-
-def _build_gurobi_solver(*, time_limit_seconds: int | None, enable_solver_output: bool) -> pulp.LpSolver:
-    """Create a Gurobi solver instance for PuLP.
-
-    Notes
-    -----
-    PuLP expects Gurobi to be installed and licensed on the machine.
-
-    - GUROBI_HOME typically indicates an installed Gurobi distribution.
-    - If Gurobi isn't actually usable (e.g. no license), PuLP will raise
-      when attempting to solve.
-
-    Logging / progress output
-    ------------------------
-    Gurobi's detailed progress (presolve summary, node log, MIP gap progress,
-    etc.) is controlled by the solver's own OutputFlag parameter.
-
-    PuLP's GUROBI_CMD maps `msg=True` to emitting solver output.
-
-    You can also provide additional Gurobi parameters in a JSON file at:
-
-      <repo_root>/data/gurobi_options.json
-
-    Example:
-
-      {"MIPGap": 0.02, "Presolve": 2}
-
-    These are passed through to GUROBI_CMD via its `options` parameter.
-    """
-
-    # In PuLP, the most common interface is GUROBI_CMD (shell wrapper).
-    # Keep parameters minimal and portable.
-    kwargs: dict[str, object] = {"msg": enable_solver_output}
-    if time_limit_seconds is not None:
-        # GUROBI_CMD uses `timeLimit` (seconds)
-        kwargs["timeLimit"] = time_limit_seconds
-
-    # Optional: extra gurobi options via JSON file in repo /data.
-    # This lets you tweak methods, MIPGap, etc. without editing code.
-    options_path = Path(__file__).resolve().parents[2] / "data" / "gurobi_options.json"
-    if options_path.exists():
-        try:
-            import json
-
-            parsed = json.loads(options_path.read_text(encoding="utf-8-sig"))
-            if not isinstance(parsed, dict):
-                raise TypeError("gurobi_options.json must contain a JSON object")
-
-            # PuLP GUROBI_CMD expects a list of (key, value) pairs.
-            # Use sorted order for stable command-line generation.
-            kwargs["options"] = sorted(parsed.items(), key=lambda kv: str(kv[0]))
-        except Exception as e:  # pragma: no cover
-            raise ValueError(f"Invalid {options_path}: {e}") from e
-
-    return pulp.GUROBI_CMD(**kwargs)
-
-
 def solve_retro_fantasy(
     *,
     players_json_path: str | Path,
@@ -236,6 +214,20 @@ def solve_retro_fantasy(
     solve: bool = True,
     enable_solver_output: bool = False,
     log_level: int | None = logging.INFO,
+    solver: str | None = None,
+    mip_gap: float | None = None,
+    threads: int | None = None,
+    incumbent_callback: IncumbentCallback | None = None,
+    prune_dominated: bool = False,
+    solve_mode: str = "full",
+    rolling_horizon: RollingHorizonConfig | None = None,
+    relax_and_fix: RelaxAndFixConfig | None = None,
+    lns: LnsConfig | None = None,
+    warm_start: SolutionSummary | str | Path | None = None,
+    model_cache_dir: str | Path | None = None,
+    formulation_options: FormulationOptions | None = None,
+    compact_names: bool = False,
+    trace_memory: bool = False,
 ) -> SolveResult:
     """Top-level entrypoint: load player data, formulate, and solve.
 
@@ -243,6 +235,57 @@ def solve_retro_fantasy(
     makes it easy to swap configurations (e.g. smaller problems) without code
     changes.
 
+    Parameters
+    ----------
+    solver:
+        ``"cbc"``, ``"gurobi"`` or ``"highs"``. ``None`` picks a default (see
+        :func:`retro_fantasy.solvers.resolve_solver`). ``"highs"`` solves in memory via ``highspy``
+        (see :mod:`retro_fantasy.highs`) instead of going through PuLP's
+        file-based solver interfaces.
+    mip_gap:
+        Relative MIP gap at which the solver may stop.
+    threads:
+        Number of solver threads.
+    incumbent_callback:
+        Called for every improving MIP solution. Only supported by ``"highs"``.
+    prune_dominated:
+        Run :func:`retro_fantasy.presolve.prune_dominated_players` before
+        formulating, removing players that can never be needed in an optimal
+        squad.
+    solve_mode:
+        ``"full"`` solves the whole season as one MILP. ``"rolling_horizon"``
+        solves overlapping windows of rounds (see
+        :mod:`retro_fantasy.rolling_horizon`), configured by ``rolling_horizon``.
+        ``"relax_and_fix"`` solves the full season with integrality enforced
+        block by block (see :mod:`retro_fantasy.relax_and_fix`), configured by
+        ``relax_and_fix``. ``"lns"`` improves a starting plan by
+        large-neighbourhood search (see :mod:`retro_fantasy.lns`), configured by
+        ``lns``; the plan comes from ``warm_start`` if given, else from a rolling
+        horizon solve (configured by ``rolling_horizon``). Time limit, MIP gap
+        and threads then apply to each window/block/neighbourhood solve.
+    warm_start:
+        A previous :class:`~retro_fantasy.solution.SolutionSummary` or the path
+        to its ``solution.json``. It is repaired to fit the current rules (see
+        :mod:`retro_fantasy.warm_start`) and passed to the solver as a MIP start.
+        Only supported with ``solve_mode="full"`` and ``solve_mode="lns"``.
+    model_cache_dir:
+        Directory of formulated models keyed by a hash of the model inputs (see
+        :mod:`retro_fantasy.model_cache`). On a hit the formulation is skipped.
+        Only supported with ``solve_mode="full"``.
+    formulation_options:
+        Formulation variant used by every ``solve_mode`` (see
+        :class:`~retro_fantasy.formulation.FormulationOptions`), e.g.
+        ``FormulationOptions(lean=True)`` to drop the provably redundant rows.
+        ``None`` builds the default formulation.
+    compact_names:
+        Name columns and rows ``v<j>`` / ``c<i>`` (see
+        :class:`~retro_fantasy.formulation.FormulationOptions`), which shrinks the
+        LP file written for Gurobi. Shorthand for setting ``compact_names`` on
+        ``formulation_options``.
+    trace_memory:
+        Record ``tracemalloc`` allocation deltas for each phase in
+        ``SolveResult.phases`` (slows the Python-side phases down noticeably).
+
     Notes
     -----
     Players may be missing score/price data for some rounds (e.g. added
@@ -250,15 +293,82 @@ def solve_retro_fantasy(
     salary cap (prohibitively expensive) via :class:`retro_fantasy.data.ModelInputData`.
     """
 
+    with ensure_recording(trace_memory=trace_memory) as phases:
+        result = _solve_retro_fantasy(
+            players_json_path=players_json_path,
+            position_updates_csv_path=position_updates_csv_path,
+            team_rules=team_rules,
+            rounds=rounds,
+            squad_id_filter=squad_id_filter,
+            time_limit_seconds=time_limit_seconds,
+            solve=solve,
+            enable_solver_output=enable_solver_output,
+            log_level=log_level,
+            solver=solver,
+            mip_gap=mip_gap,
+            threads=threads,
+            incumbent_callback=incumbent_callback,
+            prune_dominated=prune_dominated,
+            solve_mode=solve_mode,
+            rolling_horizon=rolling_horizon,
+            relax_and_fix=relax_and_fix,
+            lns=lns,
+            warm_start=warm_start,
+            model_cache_dir=model_cache_dir,
+            formulation_options=formulation_options,
+            compact_names=compact_names,
+        )
+    return replace(result, phases=phases)
+
+
+def _solve_retro_fantasy(
+    *,
+    players_json_path: str | Path,
+    position_updates_csv_path: str | Path,
+    team_rules: TeamStructureRules,
+    rounds: Mapping[int, Round],
+    squad_id_filter: frozenset[int] | None,
+    time_limit_seconds: int | None,
+    solve: bool,
+    enable_solver_output: bool,
+    log_level: int | None,
+    solver: str | None,
+    mip_gap: float | None,
+    threads: int | None,
+    incumbent_callback: IncumbentCallback | None,
+    prune_dominated: bool,
+    solve_mode: str,
+    rolling_horizon: RollingHorizonConfig | None,
+    relax_and_fix: RelaxAndFixConfig | None,
+    lns: LnsConfig | None,
+    warm_start: SolutionSummary | str | Path | None,
+    model_cache_dir: str | Path | None,
+    formulation_options: FormulationOptions | None,
+    compact_names: bool,
+) -> SolveResult:
     if log_level is not None:
         configure_logging(level=log_level)
 
+    if solve_mode not in SOLVE_MODES:
+        raise ValueError(f"Unknown solve_mode {solve_mode!r}; expected one of {SOLVE_MODES}")
+
+    if warm_start is not None and solve_mode not in ("full", "lns"):
+        raise ValueError("warm_start is only supported with solve_mode='full' or 'lns'")
+
+    if model_cache_dir is not None and solve_mode != "full":
+        raise ValueError("model_cache_dir is only supported with solve_mode='full'")
+
+    solver_name = resolve_solver(solver)
+    if incumbent_callback is not None and solver_name != "highs":
+        raise ValueError("incumbent_callback is only supported with solver='highs'")
+
     logger.info("Loading players from JSON: %s", players_json_path)
-    players = load_players(
-        players_json_path=players_json_path,
-        position_updates_csv_path=position_updates_csv_path,
-        squad_id_filter=squad_id_filter,
-    )
+    with span("load_players"):
+        players = load_players(
+            players_json_path=players_json_path,
+            position_updates_csv_path=position_updates_csv_path,
+            squad_id_filter=squad_id_filter,
+        )
     logger.info("Loaded %d players", len(players))
 
     logger.info("Using provided rounds: %d rounds (min=%d, max=%d)", len(rounds), min(rounds), max(rounds))
@@ -273,10 +383,115 @@ def solve_retro_fantasy(
     )
 
     logger.info("Building ModelInputData")
-    model_input_data = build_model_input_data(players=players, team_rules=team_rules, rounds=rounds)
+    with span("build_model_input_data"):
+        model_input_data = build_model_input_data(players=players, team_rules=team_rules, rounds=rounds)
+
+    if prune_dominated:
+        from retro_fantasy.presolve import prune_dominated_players
+
+        with span("presolve"):
+            model_input_data = prune_dominated_players(model_input_data).model_input_data
+
+    options = formulation_options or FormulationOptions()
+    if compact_names:
+        options = replace(options, compact_names=True)
+
+    if solve and solve_mode == "rolling_horizon":
+        config = rolling_horizon or RollingHorizonConfig()
+        logger.info(
+            "Solving with rolling horizon using %s (window=%d, overlap=%d, polish=%s)",
+            solver_name,
+            config.window,
+            config.overlap,
+            config.polish,
+        )
+        with span("rolling_horizon"):
+            rh_result = solve_rolling_horizon(
+                model_input_data,
+                solve_matrix=build_matrix_solver(
+                    solver_name,
+                    time_limit_seconds=time_limit_seconds,
+                    enable_solver_output=enable_solver_output,
+                    mip_gap=mip_gap,
+                    threads=threads,
+                ),
+                config=config,
+                options=options,
+            )
+        return SolveResult(
+            status=rh_result.status,
+            objective_value=rh_result.objective_value,
+            problem=rh_result.problem,
+            model_input_data=model_input_data,
+            decision_variables=rh_result.decision_variables,
+            matrix_model=rh_result.matrix_model,
+            rolling_horizon=rh_result,
+        )
 
-    logger.info("Formulating PuLP problem")
-    problem, decision_variables = formulate_problem(model_input_data)
+    if solve and solve_mode == "relax_and_fix":
+        rf_config = relax_and_fix or RelaxAndFixConfig()
+        logger.info(
+            "Solving with relax-and-fix using %s (block=%d, overlap=%d, fixed=%s)",
+            solver_name,
+            rf_config.block,
+            rf_config.overlap,
+            ",".join(rf_config.fixed_families),
+        )
+        with span("relax_and_fix"):
+            rf_result = solve_relax_and_fix(
+                model_input_data,
+                solve_matrix=build_matrix_solver(
+                    solver_name,
+                    time_limit_seconds=time_limit_seconds,
+                    enable_solver_output=enable_solver_output,
+                    mip_gap=mip_gap,
+                    threads=threads,
+                ),
+                config=rf_config,
+                options=options,
+            )
+        return SolveResult(
+            status=rf_result.status,
+            objective_value=rf_result.objective_value,
+            problem=rf_result.problem,
+            model_input_data=model_input_data,
+            decision_variables=rf_result.decision_variables,
+            matrix_model=rf_result.matrix_model,
+            relax_and_fix=rf_result,
+        )
+
+    if solve and solve_mode == "lns":
+        return _solve_lns(
+            model_input_data,
+            solver_name=solver_name,
+            time_limit_seconds=time_limit_seconds,
+            enable_solver_output=enable_solver_output,
+            mip_gap=mip_gap,
+            threads=threads,
+            rolling_horizon=rolling_horizon,
+            lns=lns,
+            warm_start=warm_start,
+            options=options,
+        )
+
+    matrix_model = None
+    with span("formulate"):
+        if model_cache_dir is not None:
+            logger.info("Formulating matrix model (cache: %s)", model_cache_dir)
+            problem, decision_variables, cached_matrix_model = formulate_problem_cached(
+                model_input_data, cache_dir=model_cache_dir, options=options
+            )
+            if solver_name == "highs":
+                matrix_model = cached_matrix_model
+        elif solver_name == "highs" or options.compact_names:
+            logger.info("Formulating matrix model (%s)", options)
+            built = build_matrix_model(model_input_data, options=options)
+            problem, decision_variables = matrix_model_to_pulp(built)
+            if solver_name == "highs":
+                matrix_model = built
+        else:
+            logger.info("Formulating PuLP problem (%s)", options)
+            problem, decision_variables = formulate_problem(model_input_data, options=options)
     logger.info("Problem built: variables=%d constraints=%d", len(problem.variables()), len(problem.constraints))
 
     summarise_problem(problem)
@@ -289,9 +504,53 @@ def solve_retro_fantasy(
             problem=problem,
             model_input_data=model_input_data,
             decision_variables=decision_variables,
+            matrix_model=matrix_model,
         )
 
-    use_gurobi = bool(os.environ.get("GUROBI_HOME"))
+    initial = None
+    if warm_start is not None:
+        with span("warm_start"):
+            initial = load_warm_start(model_input_data, warm_start)
+            if initial is None:
+                logger.warning("Warm start could not be repaired for the current rules; solving from scratch")
+            elif solver_name != "highs":
+                apply_warm_start(decision_variables, initial)
+
+    if solver_name == "highs":
+        from retro_fantasy.highs import apply_highs_result_to_pulp, solve_matrix_model_with_highs
+
+        logger.info(
+            "Solving with HiGHS (in-memory) (time_limit_seconds=%s, mip_gap=%s, threads=%s, solver_output=%s)",
+            time_limit_seconds,
+            mip_gap,
+            threads,
+            enable_solver_output,
+        )
+        with span("solve"):
+            highs_result = solve_matrix_model_with_highs(
+                matrix_model,
+                time_limit_seconds=time_limit_seconds,
+                mip_gap=mip_gap,
+                threads=threads,
+                enable_solver_output=enable_solver_output,
+                incumbent_callback=incumbent_callback,
+                initial_values=warm_start_vector(matrix_model, initial) if initial is not None else None,
+            )
+            apply_highs_result_to_pulp(problem, decision_variables, matrix_model, highs_result)
+        status = highs_result.status
+        obj = highs_result.objective_value
+        logger.info("Solve complete: status=%s objective=%s", status, obj)
+
+        return SolveResult(
+            status=status,
+            objective_value=obj,
+            problem=problem,
+            model_input_data=model_input_data,
+            decision_variables=decision_variables,
+            matrix_model=matrix_model,
+        )
+
+    use_gurobi = solver_name == "gurobi"
 
     # If the user has Gurobi installed and hasn't explicitly asked to silence
     # solver output, default to showing Gurobi's progress log. This is useful
@@ -301,20 +560,43 @@ def solve_retro_fantasy(
 
     if use_gurobi:
         logger.info(
-            "Solving with Gurobi (GUROBI_HOME is set) (time_limit_seconds=%s, solver_output=%s)",
+            "Solving with Gurobi (time_limit_seconds=%s, mip_gap=%s, threads=%s, solver_output=%s)",
             time_limit_seconds,
+            mip_gap,
+            threads,
             enable_solver_output,
         )
-        solver = _build_gurobi_solver(time_limit_seconds=time_limit_seconds, enable_solver_output=enable_solver_output)
+        pulp_solver = build_gurobi_solver(
+            time_limit_seconds=time_limit_seconds,
+            enable_solver_output=enable_solver_output,
+            mip_gap=mip_gap,
+            threads=threads,
+            warm_start=initial is not None,
+        )
     else:
         logger.info(
-            "Solving with CBC (GUROBI_HOME not set) (time_limit_seconds=%s, solver_output=%s)",
+            "Solving with CBC (time_limit_seconds=%s, mip_gap=%s, threads=%s, solver_output=%s)",
             time_limit_seconds,
+            mip_gap,
+            threads,
             enable_solver_output,
         )
-        solver = _build_cbc_solver(time_limit_seconds=time_limit_seconds, enable_solver_output=enable_solver_output)
+        pulp_solver = build_cbc_solver(
+            time_limit_seconds=time_limit_seconds,
+            enable_solver_output=enable_solver_output,
+            mip_gap=mip_gap,
+            threads=threads,
+            warm_start=initial is not None,
+        )
 
-    status_code = problem.solve(solver)
+    # PuLP writes the model file (MPS for CBC, LP for Gurobi) inside solve();
+    # record that separately from the solver run.
+    with (
+        span("solve"),
+        instrument_method(problem, "writeMPS", "solver.write_model"),
+        instrument_method(problem, "writeLP", "solver.write_model"),
+    ):
+        status_code = problem.solve(pulp_solver)
     status = pulp.LpStatus[status_code]
 
     obj = float(pulp.value(problem.objective) or 0.0)
@@ -327,3 +609,82 @@ def solve_retro_fantasy(
         model_input_data=model_input_data,
         decision_variables=decision_variables,
     )
+
+
+def _solve_lns(
+    model_input_data: ModelInputData,
+    *,
+    solver_name: str,
+    time_limit_seconds: int | None,
+    enable_solver_output: bool,
+    mip_gap: float | None,
+    threads: int | None,
+    rolling_horizon: RollingHorizonConfig | None,
+    lns: LnsConfig | None,
+    warm_start: SolutionSummary | str | Path | None,
+    options: FormulationOptions,
+) -> SolveResult:
+    from retro_fantasy.lns import LnsConfig, SubSolver, solution_values, solve_lns
+
+    config = lns or LnsConfig()
+
+    initial = None
+    if warm_start is not None:
+        with span("warm_start"):
+            repaired = load_warm_start(model_input_data, warm_start)
+            if repaired is None:
+                logger.warning("Warm start could not be repaired for the current rules; using a rolling horizon plan")
+            else:
+                initial = warm_start_vector(build_matrix_model(model_input_data, options=options), repaired)
+
+    if initial is None:
+        logger.info("Building a starting plan with the rolling horizon")
+        with span("rolling_horizon"):
+            rh_result = solve_rolling_horizon(
+                model_input_data,
+                solve_matrix=build_matrix_solver(
+                    solver_name,
+                    time_limit_seconds=time_limit_seconds,
+                    enable_solver_output=enable_solver_output,
+                    mip_gap=mip_gap,
+                    threads=threads,
+                ),
+                config=rolling_horizon or RollingHorizonConfig(compute_bound=False),
+                options=options,
+            )
+        if rh_result.status != "Optimal":
+            return SolveResult(
+                status=rh_result.status,
+                objective_value=0.0,
+                problem=rh_result.problem,
+                model_input_data=model_input_data,
+                decision_variables=rh_result.decision_variables,
+                matrix_model=rh_result.matrix_model,
+                rolling_horizon=rh_result,
+            )
+        initial = solution_values(rh_result.matrix_model, rh_result.decision_variables)
+
+    logger.info(
+        "Improving with LNS using %s (budget=%.0fs, workers=%d, kinds=%s)",
+        solver_name,
+        config.time_budget_seconds,
+        config.max_workers,
+        ",".join(config.kinds),
+    )
+    with span("lns"):
+        lns_result = solve_lns(
+            model_input_data,
+            initial_values=initial,
+            solve_matrix=SubSolver(solver_name, time_limit_seconds=time_limit_seconds, mip_gap=mip_gap, threads=threads),
+            config=config,
+            options=options,
+        )
+    return SolveResult(
+        status=lns_result.status,
+        objective_value=lns_result.objective_value,
+        problem=lns_result.problem,
+        model_input_data=model_input_data,
+        decision_variables=lns_result.decision_variables,
+        matrix_model=lns_result.matrix_model,
+        lns=lns_result,
+    )
@@ -0,0 +1,904 @@
+"""Array-backed builder for the MILP in :mod:`retro_fantasy.formulation`.
+
+The PuLP builder in :mod:`retro_fantasy.formulation` assembles every row as a
+``pulp.LpAffineExpression`` one term at a time. On a full season that Python
+loop dominates model build time.
+
+This module builds the *same* model directly as NumPy arrays:
+
+- a column layout (one contiguous block per decision variable family)
+- column bounds, integrality and the objective vector
+- the constraint matrix in COO form, plus row bounds and row names
+
+A thin adapter (:func:`matrix_model_to_pulp`) turns the arrays back into a
+``pulp.LpProblem`` plus :class:`~retro_fantasy.formulation.DecisionVariables`
+so the rest of the pipeline (solving, solution extraction) is unchanged.
+
+Row and column names, row order and coefficients match the PuLP builder
+exactly, so both build modes write identical solver files. With
+``FormulationOptions(compact_names=True)`` the names are replaced by ``v<j>`` /
+``c<i>`` and the semantic names move to a :class:`NameIndex`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Sequence, Tuple
+
+import numpy as np
+import pulp
+
+from retro_fantasy.data import ModelInputData, Position
+from retro_fantasy.formulation import DecisionVariables, FormulationOptions
+from retro_fantasy.instrumentation import instrumented
+
+
+# ============================================================================
+# Data structures
+# ============================================================================
+
+
+COMPACT_COLUMN_PREFIX = "v"
+COMPACT_ROW_PREFIX = "c"
+
+
+@dataclass(frozen=True, slots=True)
+class NameIndex:
+    """Semantic names behind the compact names of a :class:`MatrixModel`.
+
+    Column ``j`` is named ``v<j>`` and row ``i`` ``c<i>``; ``col_names[j]`` and
+    ``row_names[i]`` hold the names the model would otherwise use.
+    """
+
+    col_names: list[str]
+    row_names: list[str]
+
+    def semantic(self, compact_name: str) -> str:
+        """Semantic name of a compact column or row name.
+
+        Raises
+        ------
+        KeyError
+            If ``compact_name`` is not a compact name of this model.
+        """
+
+        prefix, index = compact_name[:1], compact_name[1:]
+        names = {COMPACT_COLUMN_PREFIX: self.col_names, COMPACT_ROW_PREFIX: self.row_names}.get(prefix)
+        if names is None or not index.isdigit() or int(index) >= len(names):
+            raise KeyError(compact_name)
+        return names[int(index)]
+
+
+@dataclass(slots=True)
+class MatrixModel:
+    """A MILP held as plain arrays.
+
+    Notes
+    -----
+    Rows are ``row_lower <= A @ x <= row_upper`` with ``A`` stored in COO form
+    (``coo_rows``, ``coo_cols``, ``coo_vals``). Equality rows have
+    ``row_lower == row_upper``; one-sided rows use +/- ``np.inf``.
+
+    ``families`` maps a decision variable family name (matching the
+    :class:`~retro_fantasy.formulation.DecisionVariables` field names) to its
+    ``(start, stop)`` column range, and ``family_keys`` holds the index keys for
+    each column of that family in order.
+
+    ``name_index`` is set when the model was built with compact names (see
+    :class:`~retro_fantasy.formulation.FormulationOptions`). Code that matches
+    rows or columns by name should use :attr:`semantic_col_names` and
+    :attr:`semantic_row_names`, which do not depend on the naming mode.
+    """
+
+    sense: int
+    objective: np.ndarray
+    col_lower: np.ndarray
+    col_upper: np.ndarray
+    integrality: np.ndarray
+    col_names: list[str]
+    row_lower: np.ndarray
+    row_upper: np.ndarray
+    row_names: list[str]
+    coo_rows: np.ndarray
+    coo_cols: np.ndarray
+    coo_vals: np.ndarray
+    families: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    family_keys: Dict[str, Sequence[Hashable]] = field(default_factory=dict)
+    name_index: NameIndex | None = None
+
+    @property
+    def num_cols(self) -> int:
+        return int(self.objective.shape[0])
+
+    @property
+    def num_rows(self) -> int:
+        return int(self.row_lower.shape[0])
+
+    @property
+    def num_nonzeros(self) -> int:
+        return int(self.coo_vals.shape[0])
+
+    def csr(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the constraint matrix in CSR form as ``(indptr, indices, data)``.
+
+        Entries keep their emission order within each row.
+        """
+
+        order = np.argsort(self.coo_rows, kind="stable")
+        counts = np.bincount(self.coo_rows, minlength=self.num_rows)
+        indptr = np.zeros(self.num_rows + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return indptr, self.coo_cols[order].astype(np.int64), self.coo_vals[order]
+
+    def family_slice(self, family: str) -> slice:
+        start, stop = self.families[family]
+        return slice(start, stop)
+
+    @property
+    def semantic_col_names(self) -> list[str]:
+        return self.name_index.col_names if self.name_index is not None else self.col_names
+
+    @property
+    def semantic_row_names(self) -> list[str]:
+        return self.name_index.row_names if self.name_index is not None else self.row_names
+
+    def column_key(self, j: int) -> tuple[str, Hashable]:
+        """``(family, key)`` of column ``j``, e.g. ``("y_onfield", (123, Position.MID, 5))``."""
+
+        for family, (start, stop) in self.families.items():
+            if start <= j < stop:
+                return family, self.family_keys[family][j - start]
+        raise IndexError(f"Column {j} out of range for {self.num_cols} columns")
+
+
+def column_rounds(matrix_model: MatrixModel) -> np.ndarray:
+    """Round number of every column (the last element of each family key)."""
+
+    rounds = np.empty(matrix_model.num_cols, dtype=np.int64)
+    for family, (start, stop) in matrix_model.families.items():
+        keys = matrix_model.family_keys[family]
+        rounds[start:stop] = [k[-1] if isinstance(k, tuple) else k for k in keys]
+    return rounds
+
+
+def column_players(matrix_model: MatrixModel) -> np.ndarray:
+    """Player ID of every column (``-1`` for per-round columns such as ``bank``)."""
+
+    players = np.full(matrix_model.num_cols, -1, dtype=np.int64)
+    for family, (start, stop) in matrix_model.families.items():
+        keys = matrix_model.family_keys[family]
+        if keys and isinstance(keys[0], tuple):
+            players[start:stop] = [k[0] for k in keys]
+    return players
+
+
+class _MatrixBuilder:
+    """Accumulates column blocks and row blocks before freezing into a :class:`MatrixModel`."""
+
+    def __init__(self) -> None:
+        self.num_cols = 0
+        self.num_rows = 0
+
+        self._col_names: list[str] = []
+        self._col_lower: list[np.ndarray] = []
+        self._col_upper: list[np.ndarray] = []
+        self._integrality: list[np.ndarray] = []
+        self._upper_overrides: list[tuple[np.ndarray, float]] = []
+        self.families: Dict[str, Tuple[int, int]] = {}
+        self.family_keys: Dict[str, Sequence[Hashable]] = {}
+
+        self._row_names: list[str] = []
+        self._row_lower: list[np.ndarray] = []
+        self._row_upper: list[np.ndarray] = []
+        self._coo_rows: list[np.ndarray] = []
+        self._coo_cols: list[np.ndarray] = []
+        self._coo_vals: list[np.ndarray] = []
+
+    def add_columns(
+        self,
+        family: str,
+        keys: Sequence[Hashable],
+        names: list[str],
+        *,
+        lower: float,
+        upper: float,
+        integer: bool,
+    ) -> np.ndarray:
+        """Add a block of columns and return their (global) column indices."""
+
+        n = len(keys)
+        start = self.num_cols
+        self.num_cols += n
+
+        self.families[family] = (start, self.num_cols)
+        self.family_keys[family] = keys
+        self._col_names.extend(names)
+        self._col_lower.append(np.full(n, lower, dtype=np.float64))
+        self._col_upper.append(np.full(n, upper, dtype=np.float64))
+        self._integrality.append(np.full(n, integer, dtype=bool))
+
+        return np.arange(start, self.num_cols, dtype=np.int64)
+
+    def set_column_upper(self, cols: np.ndarray, upper: float) -> None:
+        """Override the upper bound of already-added columns (applied in :meth:`build`)."""
+
+        self._upper_overrides.append((np.asarray(cols, dtype=np.int64), upper))
+
+    def add_rows(
+        self,
+        names: list[str],
+        *,
+        lower: np.ndarray | float,
+        upper: np.ndarray | float,
+        entries: Sequence[tuple[np.ndarray, np.ndarray, np.ndarray | float]],
+    ) -> None:
+        """Add a block of rows.
+
+        ``entries`` is a sequence of ``(local_row, col, coef)`` array triples, in
+        the order the PuLP builder would add the terms. ``local_row`` indexes into
+        ``names``. Zero coefficients are dropped, matching PuLP's behaviour when
+        multiplying a variable by zero.
+        """
+
+        n = len(names)
+        start = self.num_rows
+        self.num_rows += n
+
+        self._row_names.extend(names)
+        self._row_lower.append(np.broadcast_to(np.asarray(lower, dtype=np.float64), (n,)).copy())
+        self._row_upper.append(np.broadcast_to(np.asarray(upper, dtype=np.float64), (n,)).copy())
+
+        if not entries:
+            return
+
+        rows = np.concatenate([np.asarray(r, dtype=np.int64).ravel() for r, _, _ in entries])
+        cols = np.concatenate([np.asarray(c, dtype=np.int64).ravel() for _, c, _ in entries])
+        vals = np.concatenate(
+            [np.broadcast_to(np.asarray(v, dtype=np.float64), np.shape(r)).ravel() for r, _, v in entries]
+        )
+
+        keep = (cols >= 0) & (vals != 0.0)
+        rows, cols, vals = rows[keep], cols[keep], vals[keep]
+
+        # Group by row while keeping the per-row term order given by `entries`.
+        order = np.argsort(rows, kind="stable")
+        self._coo_rows.append(rows[order] + start)
+        self._coo_cols.append(cols[order])
+        self._coo_vals.append(vals[order])
+
+    def build(self, *, objective: np.ndarray, sense: int, compact_names: bool = False) -> MatrixModel:
+        def _cat(parts: list[np.ndarray], dtype: type) -> np.ndarray:
+            return np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype=dtype)
+
+        col_upper = _cat(self._col_upper, np.float64)
+        for cols, upper in self._upper_overrides:
+            col_upper[cols] = upper
+
+        col_names, row_names, name_index = self._col_names, self._row_names, None
+        if compact_names:
+            name_index = NameIndex(col_names=col_names, row_names=row_names)
+            col_names = [f"{COMPACT_COLUMN_PREFIX}{j}" for j in range(self.num_cols)]
+            row_names = [f"{COMPACT_ROW_PREFIX}{i}" for i in range(self.num_rows)]
+
+        return MatrixModel(
+            sense=sense,
+            objective=objective,
+            col_lower=_cat(self._col_lower, np.float64),
+            col_upper=col_upper,
+            integrality=_cat(self._integrality, bool),
+            col_names=col_names,
+            row_lower=_cat(self._row_lower, np.float64),
+            row_upper=_cat(self._row_upper, np.float64),
+            row_names=row_names,
+            coo_rows=_cat(self._coo_rows, np.int64),
+            coo_cols=_cat(self._coo_cols, np.int64),
+            coo_vals=_cat(self._coo_vals, np.float64),
+            families=self.families,
+            family_keys=self.family_keys,
+            name_index=name_index,
+        )
+
+
+@dataclass(slots=True)
+class _ColumnIndex:
+    """Global column indices for each decision variable family.
+
+    Positional families use ``-1`` where the variable does not exist (player not
+    eligible); :meth:`_MatrixBuilder.add_rows` drops those entries.
+    """
+
+    x_selected: np.ndarray  # [P, R]
+    y_onfield: np.ndarray  # [P, K, R]
+    y_bench: np.ndarray  # [P, K, R]
+    y_utility: np.ndarray  # [P, R]
+    captain: np.ndarray  # [P, R]
+    scored: np.ndarray  # [P, R]
+    traded_in: np.ndarray  # [P, R-1] (rounds excluding 1)
+    traded_out: np.ndarray  # [P, R-1]
+    bank: np.ndarray  # [R]
+
+
+# ============================================================================
+# Top-level orchestrator
+# ============================================================================
+
+
+@instrumented("matrix.build")
+def build_matrix_model(
+    model_input_data: ModelInputData,
+    *,
+    options: FormulationOptions | None = None,
+) -> MatrixModel:
+    """Build the full MILP from ``model_input_data`` as arrays.
+
+    Produces the same variables, rows (names and order) and coefficients as
+    :func:`retro_fantasy.formulation.formulate_problem` with the same ``options``.
+    """
+
+    options = options or FormulationOptions()
+    builder = _MatrixBuilder()
+
+    cols = _add_decision_variable_columns(builder, model_input_data, options)
+    objective = _build_objective_vector(builder, model_input_data, cols)
+    _add_constraint_rows(builder, model_input_data, cols, options)
+
+    return builder.build(objective=objective, sense=pulp.LpMaximize, compact_names=options.compact_names)
+
+
+# ============================================================================
+# Columns
+# ============================================================================
+
+
+def _add_decision_variable_columns(
+    builder: _MatrixBuilder,
+    model_input_data: ModelInputData,
+    options: FormulationOptions,
+) -> _ColumnIndex:
+    """Add every decision variable family as a contiguous column block.
+
+    Column order follows :func:`retro_fantasy.formulation.create_decision_variables`.
+    """
+
+    player_ids = model_input_data.player_ids
+    round_numbers = model_input_data.round_numbers
+    rounds_excluding_1 = model_input_data.rounds_excluding_1
+    positions = model_input_data.positions
+    n_p, n_r = len(player_ids), len(round_numbers)
+
+    def _binary_pr(family: str, rounds: Sequence[int], *, integer: bool = True) -> np.ndarray:
+        keys = [(p, r) for p in player_ids for r in rounds]
+        names = [f"{family}_{p}_{r}" for (p, r) in keys]
+        idx = builder.add_columns(family, keys, names, lower=0.0, upper=1.0, integer=integer)
+        return idx.reshape(n_p, len(rounds))
+
+    def _binary_pkr(family: str) -> np.ndarray:
+        ip, ik, ir = np.nonzero(model_input_data.eligible)
+        keys = [(player_ids[i], positions[k], round_numbers[j]) for i, k, j in zip(ip.tolist(), ik.tolist(), ir.tolist())]
+        names = [f"{family}_{p}_{k.value}_{r}" for (p, k, r) in keys]
+        idx = builder.add_columns(family, keys, names, lower=0.0, upper=1.0, integer=True)
+        out = np.full(model_input_data.eligible.shape, -1, dtype=np.int64)
+        out[ip, ik, ir] = idx
+        return out
+
+    x_selected = _binary_pr("x_selected", round_numbers)
+    y_onfield = _binary_pkr("y_onfield")
+    y_bench = _binary_pkr("y_bench")
+    y_utility = _binary_pr("y_utility", round_numbers)
+    # Continuous with continuous_scoring (exact once the on-field selection is integral).
+    captain = _binary_pr("captain", round_numbers, integer=not options.continuous_scoring)
+    scored = _binary_pr("scored", round_numbers, integer=not options.continuous_scoring)
+    # Continuous in the trade-flow formulation (integral whenever x_selected is).
+    traded_in = _binary_pr("traded_in", rounds_excluding_1, integer=not options.trade_flow)
+    traded_out = _binary_pr("traded_out", rounds_excluding_1, integer=not options.trade_flow)
+
+    bank = builder.add_columns(
+        "bank",
+        list(round_numbers),
+        [f"bank_{r}" for r in round_numbers],
+        lower=0.0,
+        upper=np.inf,
+        integer=False,
+    )
+
+    assert bank.shape == (n_r,)
+
+    return _ColumnIndex(
+        x_selected=x_selected,
+        y_onfield=y_onfield,
+        y_bench=y_bench,
+        y_utility=y_utility,
+        captain=captain,
+        scored=scored,
+        traded_in=traded_in,
+        traded_out=traded_out,
+        bank=bank,
+    )
+
+
+# ============================================================================
+# Objective
+# ============================================================================
+
+
+def _build_objective_vector(builder: _MatrixBuilder, model_input_data: ModelInputData, cols: _ColumnIndex) -> np.ndarray:
+    """Objective: sum s[p,r] * (scored[p,r] + captain[p,r])."""
+
+    objective = np.zeros(builder.num_cols, dtype=np.float64)
+    objective[cols.scored.ravel()] = model_input_data.scores.ravel()
+    objective[cols.captain.ravel()] = model_input_data.scores.ravel()
+    return objective
+
+
+# ============================================================================
+# Constraints
+# ============================================================================
+
+
+def _pr_names(prefix: str, player_ids: Sequence[int], rounds: Sequence[int]) -> list[str]:
+    return [f"{prefix}_{p}_{r}" for p in player_ids for r in rounds]
+
+
+def _local_rows(shape: tuple[int, ...]) -> np.ndarray:
+    return np.arange(int(np.prod(shape)), dtype=np.int64).reshape(shape)
+
+
+def _add_constraint_rows(
+    builder: _MatrixBuilder,
+    model_input_data: ModelInputData,
+    cols: _ColumnIndex,
+    options: FormulationOptions,
+) -> None:
+    """Add all constraint rows in the same order as :func:`retro_fantasy.formulation.add_constraints`."""
+
+    _add_bank_rows(builder, model_input_data, cols)
+    _add_trade_indicator_linking_rows(builder, model_input_data, cols, options)
+    _add_linking_rows(builder, model_input_data, cols, options)
+    _add_maximum_team_changes_rows(builder, model_input_data, cols, options)
+    _add_positional_structure_rows(builder, model_input_data, cols)
+    _add_scoring_selection_rows(builder, model_input_data, cols)
+    _add_captaincy_rows(builder, model_input_data, cols)
+
+
+def _add_bank_rows(
+    builder: _MatrixBuilder,
+    model_input_data: ModelInputData,
+    cols: _ColumnIndex,
+) -> None:
+    """Initial bank balance and bank balance recurrence rows."""
+
+    round_numbers = model_input_data.round_numbers
+
+    if 1 in round_numbers:
+        j = model_input_data.round_index[1]
+        zeros = np.zeros(len(model_input_data.player_ids), dtype=np.int64)
+        builder.add_rows(
+            ["bank_initial_round_1"],
+            lower=model_input_data.salary_cap,
+            upper=model_input_data.salary_cap,
+            entries=[
+                (np.zeros(1, dtype=np.int64), cols.bank[j : j + 1], 1.0),
+                (zeros, cols.x_selected[:, j], model_input_data.prices[:, j]),
+            ],
+        )
+
+    later = model_input_data.rounds_excluding_1
+    if not later:
+        return
+
+    # Column offset of each r in R\{1} within the full round axis, and of r-1.
+    j_r = np.array([model_input_data.round_index[r] for r in later], dtype=np.int64)
+    j_prev = np.array([model_input_data.round_index[r - 1] for r in later], dtype=np.int64)
+
+    n_p = len(model_input_data.player_ids)
+    rows = _local_rows((len(later),))
+    rows_pt = np.broadcast_to(rows, (n_p, len(later)))
+    builder.add_rows(
+        [f"bank_recurrence_{r}" for r in later],
+        lower=0.0,
+        upper=0.0,
+        entries=[
+            (rows, cols.bank[j_r], 1.0),
+            (rows, cols.bank[j_prev], -1.0),
+            (rows_pt.T, cols.traded_out.T, -model_input_data.prices[:, j_r].T),
+            (rows_pt.T, cols.traded_in.T, model_input_data.prices[:, j_r].T),
+        ],
+    )
+
+
+def _add_trade_indicator_linking_rows(
+    builder: _MatrixBuilder,
+    model_input_data: ModelInputData,
+    cols: _ColumnIndex,
+    options: FormulationOptions,
+) -> None:
+    """Trade indicator lower/upper bounds and missing-price trade bans.
+
+    In lean mode the traded_in upper bounds become one balance row per round and
+    the missing-price bans become column upper bounds. With ``trade_flow`` one
+    flow row per (p,r) replaces the lower bounds, traded_in upper bounds and
+    balance rows.
+    """
+
+    player_ids = model_input_data.player_ids
+    later = model_input_data.rounds_excluding_1
+    if not later:
+        return
+
+    j_r = np.array([model_input_data.round_index[r] for r in later], dtype=np.int64)
+    j_prev = np.array([model_input_data.round_index[r - 1] for r in later], dtype=np.int64)
+    x_r = cols.x_selected[:, j_r]
+    x_prev = cols.x_selected[:, j_prev]
+    t_in, t_out = cols.traded_in, cols.traded_out
+    n_p, n_t = t_in.shape
+    rows = _local_rows((n_p, n_t))
+
+    upper_bound_families = [
+        ("trade_link_ub_in_requires_selected", t_in, x_r, -1.0, 0.0),
+        ("trade_link_ub_in_requires_not_prev", t_in, x_prev, 1.0, 1.0),
+        ("trade_link_ub_out_requires_prev", t_out, x_prev, -1.0, 0.0),
+        ("trade_link_ub_out_requires_not_selected", t_out, x_r, 1.0, 1.0),
+    ]
+
+    def _add_upper_bound_rows(families: list[tuple[str, np.ndarray, np.ndarray, float, float]]) -> None:
+        for prefix, trade, x, coef, rhs in families:
+            builder.add_rows(
+                _pr_names(prefix, player_ids, later),
+                lower=-np.inf,
+                upper=rhs,
+                entries=[(rows, trade, 1.0), (rows, x, coef)],
+            )
+
+    ip, it = np.nonzero(~model_input_data.has_prices[:, j_r])
+
+    if options.trade_flow:
+        builder.add_rows(
+            _pr_names("trade_flow", player_ids, later),
+            lower=0.0,
+            upper=0.0,
+            entries=[(rows, t_in, 1.0), (rows, t_out, -1.0), (rows, x_r, -1.0), (rows, x_prev, 1.0)],
+        )
+        _add_upper_bound_rows(upper_bound_families[2:])
+        builder.set_column_upper(t_in[ip, it], 0.0)
+        builder.set_column_upper(t_out[ip, it], 0.0)
+        return
+
+    # Lower bounds, interleaved per (p,r): in then out.
+    names: list[str] = []
+    for p in player_ids:
+        for r in later:
+            names.append(f"trade_link_lb_in_{p}_{r}")
+            names.append(f"trade_link_lb_out_{p}_{r}")
+    rows_in = 2 * _local_rows((n_p, n_t))
+    rows_out = rows_in + 1
+    builder.add_rows(
+        names,
+        lower=0.0,
+        upper=np.inf,
+        entries=[
+            (rows_in, t_in, 1.0),
+            (rows_in, x_r, -1.0),
+            (rows_in, x_prev, 1.0),
+            (rows_out, t_out, 1.0),
+            (rows_out, x_prev, -1.0),
+            (rows_out, x_r, 1.0),
+        ],
+    )
+
+    if options.lean:
+        rows_pt = np.broadcast_to(_local_rows((n_t,)), (n_p, n_t))
+        builder.add_rows(
+            [f"trade_balance_{r}" for r in later],
+            lower=0.0,
+            upper=0.0,
+            entries=[(rows_pt.T, t_in.T, 1.0), (rows_pt.T, t_out.T, -1.0)],
+        )
+        upper_bound_families = upper_bound_families[2:]
+
+    _add_upper_bound_rows(upper_bound_families)
+
+    if options.lean:
+        builder.set_column_upper(t_in[ip, it], 0.0)
+        builder.set_column_upper(t_out[ip, it], 0.0)
+        return
+
+    # Missing prices: in == 0 and out == 0, interleaved per (p,r).
+    names = []
+    for i, t in zip(ip.tolist(), it.tolist()):
+        p, r = player_ids[i], later[t]
+        names.append(f"no_trade_in_missing_price_{p}_{r}")
+        names.append(f"no_trade_out_missing_price_{p}_{r}")
+    k = np.arange(ip.shape[0], dtype=np.int64)
+    builder.add_rows(
+        names,
+        lower=0.0,
+        upper=0.0,
+        entries=[(2 * k, t_in[ip, it], 1.0), (2 * k + 1, t_out[ip, it], 1.0)],
+    )
+
+
+def _slot_sum_entries(rows: np.ndarray, cols: _ColumnIndex, coef: float) -> list[tuple[np.ndarray, np.ndarray, float]]:
+    """Terms of sum_k (y_onfield[p,k,r] + y_bench[p,k,r]) + y_utility[p,r] for each (p,r) row."""
+
+    entries: list[tuple[np.ndarray, np.ndarray, float]] = []
+    for kk in range(cols.y_onfield.shape[1]):
+        entries.append((rows, cols.y_onfield[:, kk, :], coef))
+        entries.append((rows, cols.y_bench[:, kk, :], coef))
+    entries.append((rows, cols.y_utility, coef))
+    return entries
+
+
+def _add_linking_rows(
+    builder: _MatrixBuilder,
+    model_input_data: ModelInputData,
+    cols: _ColumnIndex,
+    options: FormulationOptions,
+) -> None:
+    """x[p,r] == slot_sum[p,r] and (unless lean) slot_sum[p,r] <= 1."""
+
+    player_ids = model_input_data.player_ids
+    round_numbers = model_input_data.round_numbers
+    rows = _local_rows(cols.x_selected.shape)
+
+    builder.add_rows(
+        _pr_names("link_x_equals_positions", player_ids, round_numbers),
+        lower=0.0,
+        upper=0.0,
+        entries=[(rows, cols.x_selected, 1.0), *_slot_sum_entries(rows, cols, -1.0)],
+    )
+    if options.lean:
+        return
+
+    builder.add_rows(
+        _pr_names("link_at_most_one_slot", player_ids, round_numbers),
+        lower=-np.inf,
+        upper=1.0,
+        entries=_slot_sum_entries(rows, cols, 1.0),
+    )
+
+
+def _add_maximum_team_changes_rows(
+    builder: _MatrixBuilder,
+    model_input_data: ModelInputData,
+    cols: _ColumnIndex,
+    options: FormulationOptions,
+) -> None:
+    """sum_p traded_in[p,r] <= T_r (unless lean) and sum_p traded_out[p,r] <= T_r for r > 1."""
+
+    later = model_input_data.rounds_excluding_1
+    if not later:
+        return
+
+    max_trades = np.array([model_input_data.max_trades(r) for r in later], dtype=np.float64)
+    rows_pt = np.broadcast_to(_local_rows((len(later),)), cols.traded_in.shape)
+
+    families = [("max_trades_in", cols.traded_in), ("max_trades_out", cols.traded_out)]
+    if options.lean or options.trade_flow:
+        families = families[1:]
+
+    for prefix, trade in families:
+        builder.add_rows(
+            [f"{prefix}_{r}" for r in later],
+            lower=-np.inf,
+            upper=max_trades,
+            entries=[(rows_pt.T, trade.T, 1.0)],
+        )
+
+
+def _add_positional_structure_rows(builder: _MatrixBuilder, model_input_data: ModelInputData, cols: _ColumnIndex) -> None:
+    """Exact on-field, bench and utility counts per (k,r)."""
+
+    round_numbers = model_input_data.round_numbers
+    positions: Sequence[Position] = model_input_data.positions
+    n_p, n_k, n_r = cols.y_onfield.shape
+
+    # Rows are ordered r-major then k, matching the PuLP builder loops.
+    rows_rk = _local_rows((n_r, n_k))
+    rows_prk = np.broadcast_to(rows_rk, (n_p, n_r, n_k))
+
+    for prefix, family, required_of in (
+        ("pos_onfield_count", cols.y_onfield, model_input_data.on_field_required),
+        ("pos_bench_count", cols.y_bench, model_input_data.bench_required),
+    ):
+        required = np.array([required_of(k) for _r in round_numbers for k in positions], dtype=np.float64)
+        builder.add_rows(
+            [f"{prefix}_{k.value}_{r}" for r in round_numbers for k in positions],
+            lower=required,
+            upper=required,
+            entries=[(rows_prk.transpose(1, 2, 0), family.transpose(2, 1, 0), 1.0)],
+        )
+
+    rows_pr = np.broadcast_to(_local_rows((n_r,)), (n_p, n_r))
+    builder.add_rows(
+        [f"pos_utility_count_{r}" for r in round_numbers],
+        lower=float(model_input_data.utility_bench_count),
+        upper=float(model_input_data.utility_bench_count),
+        entries=[(rows_pr.T, cols.y_utility.T, 1.0)],
+    )
+
+
+def _add_scoring_selection_rows(builder: _MatrixBuilder, model_input_data: ModelInputData, cols: _ColumnIndex) -> None:
+    """sum_p scored[p,r] == N_r and scored[p,r] <= sum_k y_onfield[p,k,r]."""
+
+    player_ids = model_input_data.player_ids
+    round_numbers = model_input_data.round_numbers
+    n_p, n_r = cols.scored.shape
+
+    counted = np.array([model_input_data.counted_onfield_players(r) for r in round_numbers], dtype=np.float64)
+    rows_pr = np.broadcast_to(_local_rows((n_r,)), (n_p, n_r))
+    builder.add_rows(
+        [f"score_count_{r}" for r in round_numbers],
+        lower=counted,
+        upper=counted,
+        entries=[(rows_pr.T, cols.scored.T, 1.0)],
+    )
+
+    rows = _local_rows((n_p, n_r))
+    builder.add_rows(
+        _pr_names("score_only_if_onfield", player_ids, round_numbers),
+        lower=-np.inf,
+        upper=0.0,
+        entries=[(rows, cols.scored, 1.0)]
+        + [(rows, cols.y_onfield[:, kk, :], -1.0) for kk in range(cols.y_onfield.shape[1])],
+    )
+
+
+def _add_captaincy_rows(builder: _MatrixBuilder, model_input_data: ModelInputData, cols: _ColumnIndex) -> None:
+    """Exactly one captain per round, and captain[p,r] <= scored[p,r]."""
+
+    player_ids = model_input_data.player_ids
+    round_numbers = model_input_data.round_numbers
+    n_p, n_r = cols.captain.shape
+
+    rows_pr = np.broadcast_to(_local_rows((n_r,)), (n_p, n_r))
+    builder.add_rows(
+        [f"captain_exactly_one_{r}" for r in round_numbers],
+        lower=1.0,
+        upper=1.0,
+        entries=[(rows_pr.T, cols.captain.T, 1.0)],
+    )
+
+    rows = _local_rows((n_p, n_r))
+    builder.add_rows(
+        _pr_names("captain_requires_scored", player_ids, round_numbers),
+        lower=-np.inf,
+        upper=0.0,
+        entries=[(rows, cols.captain, 1.0), (rows, cols.scored, -1.0)],
+    )
+
+
+# ============================================================================
+# PuLP adapter
+# ============================================================================
+
+
+@instrumented("matrix.to_pulp")
+def matrix_model_to_pulp(
+    matrix_model: MatrixModel,
+    *,
+    name: str = "retro_fantasy",
+) -> tuple[pulp.LpProblem, DecisionVariables]:
+    """Materialise a :class:`MatrixModel` as a ``pulp.LpProblem``.
+
+    Expressions are created directly from ``(variable, coefficient)`` pairs, which
+    avoids the repeated expression merging done by ``pulp.lpSum``.
+    """
+
+    problem = pulp.LpProblem(name=name, sense=matrix_model.sense)
+
+    variables: list[pulp.LpVariable] = []
+    for j, col_name in enumerate(matrix_model.col_names):
+        upper = float(matrix_model.col_upper[j])
+        variables.append(
+            pulp.LpVariable(
+                col_name,
+                lowBound=float(matrix_model.col_lower[j]),
+                upBound=None if np.isinf(upper) else upper,
+                cat=pulp.LpInteger if matrix_model.integrality[j] else pulp.LpContinuous,
+            )
+        )
+
+    decision_variables = DecisionVariables()
+    for family, (start, stop) in matrix_model.families.items():
+        setattr(
+            decision_variables,
+            family,
+            dict(zip(matrix_model.family_keys[family], variables[start:stop])),
+        )
+
+    nz = np.flatnonzero(matrix_model.objective)
+    problem += pulp.LpAffineExpression([(variables[j], float(matrix_model.objective[j])) for j in nz.tolist()])
+
+    indptr, indices, data = matrix_model.csr()
+    indices_list = indices.tolist()
+    data_list = data.tolist()
+    indptr_list = indptr.tolist()
+    row_lower = matrix_model.row_lower.tolist()
+    row_upper = matrix_model.row_upper.tolist()
+
+    for i, row_name in enumerate(matrix_model.row_names):
+        a, b = indptr_list[i], indptr_list[i + 1]
+        expr = pulp.LpAffineExpression([(variables[j], v) for j, v in zip(indices_list[a:b], data_list[a:b])])
+
+        lo, up = row_lower[i], row_upper[i]
+        if lo == up:
+            sense, rhs = pulp.LpConstraintEQ, lo
+        elif lo == -np.inf:
+            sense, rhs = pulp.LpConstraintLE, up
+        else:
+            sense, rhs = pulp.LpConstraintGE, lo
+
+        problem.addConstraint(pulp.LpConstraint(expr, sense=sense, name=row_name, rhs=rhs))
+
+    return problem, decision_variables
+
+
+def pulp_variables_by_column(
+    matrix_model: MatrixModel,
+    decision_variables: DecisionVariables,
+) -> list[pulp.LpVariable]:
+    """Return the variables created by :func:`matrix_model_to_pulp` in column order."""
+
+    variables: list[pulp.LpVariable] = []
+    for family in matrix_model.families:
+        variables.extend(getattr(decision_variables, family).values())
+    return variables
+
+
+def set_pulp_variable_values(
+    matrix_model: MatrixModel,
+    decision_variables: DecisionVariables,
+    values: np.ndarray,
+) -> None:
+    """Assign a column-aligned solution vector to the variables' ``varValue``."""
+
+    for var, value in zip(pulp_variables_by_column(matrix_model, decision_variables), values.tolist()):
+        var.varValue = value
+
+
+# ============================================================================
+# Solving through PuLP
+# ============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class MatrixSolveResult:
+    """A solver-independent solution of a :class:`MatrixModel`.
+
+    ``values`` is aligned with the model's columns. ``best_bound`` is ``None``
+    when the solver does not report a dual bound (e.g. PuLP's CBC interface).
+    """
+
+    status: str
+    objective_value: float
+    values: np.ndarray
+    best_bound: float | None = None
+
+
+def solve_matrix_model_with_pulp(
+    matrix_model: MatrixModel,
+    solver: pulp.LpSolver,
+    *,
+    initial_values: np.ndarray | None = None,
+) -> MatrixSolveResult:
+    """Solve ``matrix_model`` with a PuLP solver.
+
+    ``initial_values`` are set as the variables' initial values; they are only
+    used as a MIP start if ``solver`` was created with ``warmStart=True``.
+    """
+
+    problem, decision_variables = matrix_model_to_pulp(matrix_model)
+    variables = pulp_variables_by_column(matrix_model, decision_variables)
+
+    if initial_values is not None:
+        for var, value in zip(variables, initial_values.tolist()):
+            var.setInitialValue(value)
+
+    status = pulp.LpStatus[problem.solve(solver)]
+    values = np.array([v.varValue if v.varValue is not None else 0.0 for v in variables], dtype=np.float64)
+
+    return MatrixSolveResult(
+        status=status,
+        objective_value=float(pulp.value(problem.objective) or 0.0),
+        values=values,
+    )
@@ -0,0 +1,280 @@
+"""On-disk cache of formulated models.
+
+Formulating the full season is repeated for every run, even when the inputs are
+unchanged: perf repeats, re-runs after a crash, or solving one model with
+several solvers. This module stores the formulated model and reloads it on
+later runs without calling the formulation code.
+
+Each entry is a pair of files sharing the key prefix:
+
+- ``model_<key>.npz``: the :class:`~retro_fantasy.matrix.MatrixModel` arrays
+  (bounds, integrality, objective and constraint matrix), ``col_names`` and
+  ``row_names`` in column/row order (so a name's index is its column/row), and
+  for every :class:`~retro_fantasy.formulation.DecisionVariables` family its
+  keys as an integer array (``<family>_keys``; positions are stored as their
+  index in :class:`~retro_fantasy.data.Position`). Models built with compact
+  names also store the semantic names (``semantic_col_names``,
+  ``semantic_row_names``). A JSON header holds the format version, key,
+  objective sense and family column ranges.
+- ``model_<key>.mps``: the same problem as written by
+  :meth:`pulp.LpProblem.writeMPS`, for solvers and tools outside this package.
+
+Loading only reads the ``.npz``. Parsing the MPS back through PuLP is several
+times slower than formulating from scratch. Turning the cached arrays into a
+``pulp.LpProblem`` still costs :func:`~retro_fantasy.matrix.matrix_model_to_pulp`,
+but the formulation code is not touched.
+
+Entries are keyed by a SHA-256 over everything the formulation depends on: the
+dense per-(player, round) parameters of the
+:class:`~retro_fantasy.data.ModelInputData`, its rounds and team rules, the
+:class:`~retro_fantasy.formulation.FormulationOptions` and
+:data:`~retro_fantasy.formulation.FORMULATION_VERSION`. Player names, and
+anything else that does not reach the model, are not part of the key.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Hashable, Sequence
+
+import numpy as np
+import pulp
+
+from retro_fantasy.data import ModelInputData, Position
+from retro_fantasy.formulation import FORMULATION_VERSION, DecisionVariables, FormulationOptions
+from retro_fantasy.instrumentation import instrumented
+from retro_fantasy.matrix import MatrixModel, NameIndex, build_matrix_model, matrix_model_to_pulp
+
+
+logger = logging.getLogger(__name__)
+
+
+# Bump whenever the file layout changes.
+MODEL_CACHE_FORMAT_VERSION = 1
+
+_POSITIONS = list(Position)
+_POSITION_CODES = {pos: i for i, pos in enumerate(_POSITIONS)}
+
+_ARRAY_FIELDS = (
+    "objective",
+    "col_lower",
+    "col_upper",
+    "integrality",
+    "row_lower",
+    "row_upper",
+    "coo_rows",
+    "coo_cols",
+    "coo_vals",
+)
+
+
+def model_cache_key(model_input_data: ModelInputData, *, options: FormulationOptions | None = None) -> str:
+    """Return the cache key of the model formulated from ``model_input_data``."""
+
+    options = options or FormulationOptions()
+    rules = model_input_data.team_rules
+    header = {
+        "format_version": MODEL_CACHE_FORMAT_VERSION,
+        "formulation_version": FORMULATION_VERSION,
+        "options": asdict(options),
+        "rounds": [
+            [r.number, r.max_trades, r.counted_onfield_players]
+            for r in (model_input_data.rounds[n] for n in model_input_data.round_numbers)
+        ],
+        "team_rules": {
+            "on_field_required": sorted((p.value, int(n)) for p, n in rules.on_field_required.items()),
+            "bench_required": sorted((p.value, int(n)) for p, n in rules.bench_required.items()),
+            "salary_cap": float(rules.salary_cap),
+            "utility_bench_count": int(rules.utility_bench_count),
+        },
+    }
+
+    digest = hashlib.sha256(json.dumps(header, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    for array in (
+        np.asarray(model_input_data.player_ids, dtype=np.int64),
+        np.asarray(model_input_data.round_numbers, dtype=np.int64),
+        model_input_data.scores.astype(np.float64),
+        model_input_data.prices.astype(np.float64),
+        model_input_data.has_prices.astype(np.bool_),
+        model_input_data.eligibility_masks.astype(np.uint8),
+    ):
+        digest.update(str(array.shape).encode("ascii"))
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def _encode_keys(keys: Sequence[Hashable]) -> tuple[np.ndarray, list[int], bool]:
+    """Keys as an (n, k) int64 array, the key slots holding a :class:`Position`, and whether keys are scalars."""
+
+    if not keys:
+        return np.zeros((0, 0), dtype=np.int64), [], False
+    scalar = not isinstance(keys[0], tuple)
+    tuples = [(k,) for k in keys] if scalar else keys
+    position_slots = [i for i, part in enumerate(tuples[0]) if isinstance(part, Position)]
+    rows = [[_POSITION_CODES[part] if isinstance(part, Position) else int(part) for part in key] for key in tuples]
+    return np.array(rows, dtype=np.int64), position_slots, scalar
+
+
+def _decode_keys(array: np.ndarray, position_slots: list[int], scalar: bool) -> list[Hashable]:
+    rows = array.tolist()
+    if scalar:
+        return [row[0] for row in rows]
+    for slot in position_slots:
+        for row in rows:
+            row[slot] = _POSITIONS[row[slot]]
+    return [tuple(row) for row in rows]
+
+
+@instrumented("model_cache.save")
+def save_model_cache(
+    path: str | Path,
+    matrix_model: MatrixModel,
+    *,
+    key: str,
+    problem: pulp.LpProblem | None = None,
+) -> None:
+    """Write ``matrix_model`` to ``<path>.npz`` (and ``problem`` to ``<path>.mps``).
+
+    Files are written to temporary names and then atomically renamed, the
+    ``.npz`` last: an entry whose ``.npz`` exists is complete.
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    suffix = f".{os.getpid()}.tmp"
+
+    if problem is not None:
+        mps_path = path.with_suffix(".mps")
+        tmp_mps = mps_path.with_name(mps_path.name + suffix)
+        problem.writeMPS(str(tmp_mps), with_objsense=True)
+        os.replace(tmp_mps, mps_path)
+
+    arrays = {name: getattr(matrix_model, name) for name in _ARRAY_FIELDS}
+    families = {}
+    for family, (start, stop) in matrix_model.families.items():
+        keys, position_slots, scalar = _encode_keys(matrix_model.family_keys[family])
+        arrays[f"{family}_keys"] = keys
+        families[family] = {"start": start, "stop": stop, "position_slots": position_slots, "scalar": scalar}
+
+    if matrix_model.name_index is not None:
+        arrays["semantic_col_names"] = np.array(matrix_model.name_index.col_names, dtype=np.str_)
+        arrays["semantic_row_names"] = np.array(matrix_model.name_index.row_names, dtype=np.str_)
+
+    meta = {
+        "format_version": MODEL_CACHE_FORMAT_VERSION,
+        "key": key,
+        "sense": matrix_model.sense,
+        "families": families,
+        "compact_names": matrix_model.name_index is not None,
+    }
+
+    npz_path = path.with_suffix(".npz")
+    tmp_npz = npz_path.with_name(npz_path.name + suffix)
+    with tmp_npz.open("wb") as f:
+        np.savez(
+            f,
+            meta=np.array(json.dumps(meta)),
+            col_names=np.array(matrix_model.col_names, dtype=np.str_),
+            row_names=np.array(matrix_model.row_names, dtype=np.str_),
+            **arrays,
+        )
+    os.replace(tmp_npz, npz_path)
+
+
+@instrumented("model_cache.load")
+def load_model_cache(path: str | Path, *, key: str | None = None) -> MatrixModel:
+    """Read the model written by :func:`save_model_cache` to ``<path>.npz``.
+
+    Raises
+    ------
+    ValueError
+        If the entry has a different format version, or ``key`` is given and
+        does not match the stored key.
+    """
+
+    with np.load(Path(path).with_suffix(".npz"), allow_pickle=False) as npz:
+        meta = json.loads(str(npz["meta"]))
+        if meta.get("format_version") != MODEL_CACHE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported model cache format version: {meta.get('format_version')!r}")
+        if key is not None and meta.get("key") != key:
+            raise ValueError("Model cache key mismatch")
+
+        arrays = {name: npz[name] for name in _ARRAY_FIELDS}
+        col_names = npz["col_names"].tolist()
+        row_names = npz["row_names"].tolist()
+        families = {}
+        family_keys = {}
+        for family, info in meta["families"].items():
+            families[family] = (info["start"], info["stop"])
+            family_keys[family] = _decode_keys(npz[f"{family}_keys"], info["position_slots"], info["scalar"])
+        name_index = None
+        if meta.get("compact_names"):
+            name_index = NameIndex(
+                col_names=npz["semantic_col_names"].tolist(),
+                row_names=npz["semantic_row_names"].tolist(),
+            )
+
+    return MatrixModel(
+        sense=meta["sense"],
+        col_names=col_names,
+        row_names=row_names,
+        families=families,
+        family_keys=family_keys,
+        name_index=name_index,
+        **arrays,
+    )
+
+
+def formulate_problem_cached(
+    model_input_data: ModelInputData,
+    *,
+    cache_dir: str | Path,
+    options: FormulationOptions | None = None,
+    write_mps: bool = True,
+) -> tuple[pulp.LpProblem, DecisionVariables, MatrixModel]:
+    """Cached counterpart of ``formulate_problem(..., build_mode="matrix")``.
+
+    Returns the problem, its decision variables and the matrix model they were
+    materialised from (see :func:`retro_fantasy.matrix.matrix_model_to_pulp`).
+
+    Parameters
+    ----------
+    write_mps:
+        Also write the ``.mps`` file when the entry is created.
+
+    Notes
+    -----
+    An unreadable or stale cache entry is treated as a miss: the model is
+    formulated again and the entry is rewritten.
+    """
+
+    key = model_cache_key(model_input_data, options=options)
+    cache_path = Path(cache_dir) / f"model_{key[:32]}"
+
+    matrix_model = None
+    if cache_path.with_suffix(".npz").exists():
+        try:
+            matrix_model = load_model_cache(cache_path, key=key)
+            logger.info("Loaded formulated model from cache: %s", cache_path.with_suffix(".npz"))
+        except Exception as e:  # any unreadable entry is just a cache miss
+            logger.warning("Ignoring unreadable model cache %s (%s)", cache_path, e)
+
+    if matrix_model is not None:
+        problem, decision_variables = matrix_model_to_pulp(matrix_model)
+        return problem, decision_variables, matrix_model
+
+    matrix_model = build_matrix_model(model_input_data, options=options)
+    problem, decision_variables = matrix_model_to_pulp(matrix_model)
+
+    try:
+        save_model_cache(cache_path, matrix_model, key=key, problem=problem if write_mps else None)
+    except OSError as e:
+        # Caching is an optimisation; a read-only location must not break solving.
+        logger.warning("Could not write model cache %s (%s)", cache_path, e)
+
+    return problem, decision_variables, matrix_model
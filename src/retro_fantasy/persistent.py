@@ -0,0 +1,271 @@
+"""Persistent model for what-if re-solves on round parameters.
+
+Most what-if questions only touch ``rounds.json`` or the salary cap: a bye
+round counting the best 20 instead of 18, an extra trade in some round, a
+different cap. In the formulation those numbers only appear as right-hand
+sides:
+
+- ``score_count_{r}``: ``counted_onfield_players`` of round ``r``
+- ``max_trades_in_{r}`` / ``max_trades_out_{r}``: ``max_trades`` of round ``r``
+- ``bank_initial_round_1``: the salary cap (lowering it only; see
+  :meth:`PersistentModel.update_salary_cap`)
+
+:class:`PersistentModel` builds the model once and applies such changes by
+editing those row bounds in place, then re-solves with the previous solution
+as a MIP start. With HiGHS the ``highspy.Highs`` instance itself is kept; with
+CBC/Gurobi the ``pulp.LpProblem`` is kept and only re-written for the solver.
+
+Usage::
+
+    model = PersistentModel(model_input_data, solver="highs")
+    base = model.solve()
+    model.update_rounds({12: replace(rounds[12], counted_onfield_players=20)})
+    what_if = model.solve()  # starts from ``base``
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import logging
+from typing import Any, Dict, List, Mapping
+
+import numpy as np
+import pulp
+
+from retro_fantasy.data import ModelInputData, Round
+from retro_fantasy.formulation import DecisionVariables, FormulationOptions
+from retro_fantasy.matrix import (
+    MatrixSolveResult,
+    build_matrix_model,
+    matrix_model_to_pulp,
+    pulp_variables_by_column,
+    set_pulp_variable_values,
+)
+from retro_fantasy.solvers import build_cbc_solver, build_gurobi_solver, resolve_solver
+
+
+logger = logging.getLogger(__name__)
+
+
+class PersistentModel:
+    """A built model whose round parameters and salary cap can be changed in place.
+
+    Parameters
+    ----------
+    solver:
+        ``"cbc"``, ``"gurobi"`` or ``"highs"`` (default: see
+        :func:`retro_fantasy.solvers.resolve_solver`).
+    options:
+        Formulation options, fixed for the life of the model.
+
+    Notes
+    -----
+    Only right-hand sides are editable. Prices of players with no data in a
+    round fall back to the salary cap (see :meth:`ModelInputData.price`); in
+    the constraint coefficients they keep the cap the model was built with.
+    That keeps such players unaffordable only while the cap is at most the
+    build-time cap, so :meth:`update_salary_cap` refuses to raise it further.
+    """
+
+    def __init__(
+        self,
+        model_input_data: ModelInputData,
+        *,
+        solver: str | None = None,
+        options: FormulationOptions | None = None,
+        time_limit_seconds: int | None = None,
+        mip_gap: float | None = None,
+        threads: int | None = None,
+        enable_solver_output: bool = False,
+    ) -> None:
+        self.solver_name = resolve_solver(solver)
+        self.options = options or FormulationOptions()
+        self.time_limit_seconds = time_limit_seconds
+        self.mip_gap = mip_gap
+        self.threads = threads
+        self.enable_solver_output = enable_solver_output
+
+        self._model_input_data = model_input_data
+        # Missing-price fallback coefficients are baked in at this cap.
+        self._build_salary_cap = model_input_data.salary_cap
+        self.matrix_model = build_matrix_model(model_input_data, options=self.options)
+        self._row_position: Dict[str, int] = {
+            name: i for i, name in enumerate(self.matrix_model.semantic_row_names)
+        }
+
+        # Solver-side copies of the model, created on first use.
+        self._problem: pulp.LpProblem | None = None
+        self._decision_variables: DecisionVariables | None = None
+        self._highs: Any = None
+
+        self.last_result: MatrixSolveResult | None = None
+
+    # --- Model state ---
+
+    @property
+    def model_input_data(self) -> ModelInputData:
+        """The input data with every update applied so far."""
+
+        return self._model_input_data
+
+    def _ensure_pulp(self) -> tuple[pulp.LpProblem, DecisionVariables]:
+        if self._problem is None or self._decision_variables is None:
+            self._problem, self._decision_variables = matrix_model_to_pulp(self.matrix_model)
+            if self.last_result is not None:
+                set_pulp_variable_values(self.matrix_model, self._decision_variables, self.last_result.values)
+        return self._problem, self._decision_variables
+
+    @property
+    def problem(self) -> pulp.LpProblem:
+        """PuLP view of the model, holding the latest solution (e.g. for ``build_solution_summary``)."""
+
+        return self._ensure_pulp()[0]
+
+    @property
+    def decision_variables(self) -> DecisionVariables:
+        return self._ensure_pulp()[1]
+
+    # --- RHS updates ---
+
+    def _set_rhs(self, row_name: str, value: float) -> bool:
+        """Set the finite bound(s) of ``row_name`` to ``value``. Returns ``False`` if unchanged."""
+
+        i = self._row_position[row_name]
+        mm = self.matrix_model
+        lower, upper = float(mm.row_lower[i]), float(mm.row_upper[i])
+        new_lower = lower if np.isinf(lower) else float(value)
+        new_upper = upper if np.isinf(upper) else float(value)
+        if (new_lower, new_upper) == (lower, upper):
+            return False
+
+        mm.row_lower[i] = new_lower
+        mm.row_upper[i] = new_upper
+        if self._problem is not None:
+            self._problem.constraints[mm.row_names[i]].changeRHS(float(value))
+        if self._highs is not None:
+            self._highs.changeRowBounds(i, new_lower, new_upper)
+        return True
+
+    def update_rounds(self, rounds: Mapping[int, Round]) -> List[str]:
+        """Apply new ``max_trades`` / ``counted_onfield_players`` for some rounds.
+
+        Returns the names of the rows whose right-hand side changed.
+
+        Raises
+        ------
+        ValueError
+            If a round is not part of the model (adding or removing rounds
+            changes the columns, so needs a new model).
+        """
+
+        current = self._model_input_data.rounds
+        unknown = sorted(set(rounds) - set(current))
+        if unknown:
+            raise ValueError(f"Rounds {unknown} are not part of the model; build a new model to add rounds")
+
+        changed: List[str] = []
+        for r, rnd in sorted(rounds.items()):
+            if rnd.number != r:
+                raise ValueError(f"Round keyed {r} has number {rnd.number}")
+            if self._set_rhs(f"score_count_{r}", rnd.counted_onfield_players):
+                changed.append(f"score_count_{r}")
+            for name in (f"max_trades_in_{r}", f"max_trades_out_{r}"):
+                # Round 1 has no trade rows, and lean models have no max_trades_in rows.
+                if name in self._row_position and self._set_rhs(name, rnd.max_trades):
+                    changed.append(name)
+
+        self._model_input_data = replace(self._model_input_data, rounds={**current, **rounds})
+        logger.info("Updated %d right-hand sides: %s", len(changed), ", ".join(changed) or "none")
+        return changed
+
+    def update_salary_cap(self, salary_cap: float) -> List[str]:
+        """Change the salary cap (the ``bank_initial_round_1`` right-hand side).
+
+        Raises
+        ------
+        ValueError
+            If ``salary_cap`` is above the cap the model was built with: the
+            missing-price fallback coefficients would then be affordable, so a
+            new model is needed.
+        """
+
+        if salary_cap > self._build_salary_cap:
+            raise ValueError(
+                f"Salary cap {salary_cap} is above the build-time cap {self._build_salary_cap}; "
+                "build a new model to raise the cap"
+            )
+
+        changed: List[str] = []
+        if "bank_initial_round_1" in self._row_position and self._set_rhs("bank_initial_round_1", salary_cap):
+            changed.append("bank_initial_round_1")
+
+        team_rules = replace(self._model_input_data.team_rules, salary_cap=float(salary_cap))
+        self._model_input_data = replace(self._model_input_data, team_rules=team_rules)
+        return changed
+
+    # --- Solving ---
+
+    def solve(self, *, initial_values: np.ndarray | None = None) -> MatrixSolveResult:
+        """Solve the current model.
+
+        ``initial_values`` defaults to the previous solution, if there is one.
+        The result is also written onto :attr:`decision_variables` once the
+        PuLP view exists.
+        """
+
+        if initial_values is None and self.last_result is not None:
+            initial_values = self.last_result.values
+
+        if self.solver_name == "highs":
+            result = self._solve_highs(initial_values)
+        else:
+            result = self._solve_pulp(initial_values)
+
+        self.last_result = result
+        if self._decision_variables is not None:
+            set_pulp_variable_values(self.matrix_model, self._decision_variables, result.values)
+        return result
+
+    def _solve_highs(self, initial_values: np.ndarray | None) -> MatrixSolveResult:
+        from retro_fantasy.highs import create_highs, run_highs
+
+        if self._highs is None:
+            self._highs = create_highs(
+                self.matrix_model,
+                time_limit_seconds=self.time_limit_seconds,
+                mip_gap=self.mip_gap,
+                threads=self.threads,
+                enable_solver_output=self.enable_solver_output,
+            )
+        result = run_highs(self._highs, self.matrix_model, initial_values=initial_values)
+        return MatrixSolveResult(
+            status=result.status,
+            objective_value=result.objective_value,
+            values=result.values,
+            best_bound=result.best_bound,
+        )
+
+    def _solve_pulp(self, initial_values: np.ndarray | None) -> MatrixSolveResult:
+        problem, decision_variables = self._ensure_pulp()
+        variables = pulp_variables_by_column(self.matrix_model, decision_variables)
+
+        if initial_values is not None:
+            for var, value in zip(variables, initial_values.tolist()):
+                var.setInitialValue(value)
+
+        build = build_gurobi_solver if self.solver_name == "gurobi" else build_cbc_solver
+        solver = build(
+            time_limit_seconds=self.time_limit_seconds,
+            enable_solver_output=self.enable_solver_output,
+            mip_gap=self.mip_gap,
+            threads=self.threads,
+            warm_start=initial_values is not None,
+        )
+        status = pulp.LpStatus[problem.solve(solver)]
+        values = np.array([v.varValue if v.varValue is not None else 0.0 for v in variables], dtype=np.float64)
+
+        return MatrixSolveResult(
+            status=status,
+            objective_value=float(pulp.value(problem.objective) or 0.0),
+            values=values,
+        )
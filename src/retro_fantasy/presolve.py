@@ -0,0 +1,180 @@
+"""Presolve passes over :class:`~retro_fantasy.data.ModelInputData`.
+
+These run *before* :func:`retro_fantasy.formulation.formulate_problem` and shrink
+the input without changing the optimal objective. Removing a player removes
+every variable family indexed by that player, so this is the most effective
+way to reduce the size of full-season models.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Dict, Tuple
+
+import numpy as np
+
+from retro_fantasy.data import ModelInputData
+
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bound on elements per intermediate (chunk, P, R) array.
+_DOMINANCE_CHUNK_ELEMENTS = 4_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class DominancePresolveResult:
+    """Outcome of :func:`prune_dominated_players`.
+
+    Attributes
+    ----------
+    model_input_data:
+        Input data restricted to the players that were kept.
+    removed:
+        Removed player ID -> IDs of the players that dominate it.
+    min_dominators:
+        Number of dominators a player needed to be removed.
+    """
+
+    model_input_data: ModelInputData
+    removed: Dict[int, Tuple[int, ...]]
+    min_dominators: int
+
+
+def safe_min_dominators(model_input_data: ModelInputData) -> int:
+    """Smallest dominator count for which removing a dominated player is always safe.
+
+    Notes
+    -----
+    If ``q`` dominates ``p`` (see :func:`dominance_matrix`) and ``q`` is not in
+    the squad while ``p`` is held, holding ``q`` instead of ``p`` is feasible and
+    no worse. Over one holding period the squad contains at most
+    ``squad_size - 1`` other players plus one per trade, so with
+    ``squad_size + sum_r max_trades[r]`` dominators at least one is always free.
+    """
+
+    total_trades = sum(model_input_data.max_trades(r) for r in model_input_data.rounds_excluding_1)
+    return model_input_data.team_rules.squad_size + total_trades
+
+
+def dominance_matrix(model_input_data: ModelInputData) -> np.ndarray:
+    """Return ``D`` with ``D[i, j] = True`` if player ``j`` dominates player ``i``.
+
+    Indices follow :attr:`ModelInputData.player_ids`. Player ``q`` dominates
+    ``p`` when, in every round:
+
+    - ``q`` is eligible for every position ``p`` is eligible for
+    - ``score[q] >= score[p]``
+    - ``price[q] <= price[p]``
+    - ``q`` has an explicit price whenever ``p`` does (so ``q`` can be traded
+      whenever ``p`` can)
+
+    and ``price[q] - price[p]`` never decreases from one round to the next, so
+    buying ``q`` instead of ``p`` and later selling it never leaves less in the
+    bank. Players that are identical on all of the above only dominate players
+    with a larger ID, so dominance is a strict order.
+    """
+
+    scores = model_input_data.scores
+    prices = model_input_data.prices
+    has_prices = model_input_data.has_prices
+    masks = model_input_data.eligibility_masks
+
+    n_p, n_r = masks.shape
+
+    dominated_by = np.zeros((n_p, n_p), dtype=bool)
+    ids = np.arange(n_p)
+    chunk = max(1, _DOMINANCE_CHUNK_ELEMENTS // max(1, n_p * n_r))
+
+    for start in range(0, n_p, chunk):
+        rows = slice(start, min(start + chunk, n_p))
+
+        s_p, s_q = scores[rows, None, :], scores[None, :, :]
+        c_p, c_q = prices[rows, None, :], prices[None, :, :]
+        h_p, h_q = has_prices[rows, None, :], has_prices[None, :, :]
+        m_p, m_q = masks[rows, None, :], masks[None, :, :]
+
+        price_gap = c_q - c_p
+        dominates = (
+            ((m_q & m_p) == m_p).all(axis=-1)
+            & (s_q >= s_p).all(axis=-1)
+            & (price_gap <= 0).all(axis=-1)
+            & (np.diff(price_gap, axis=-1) >= 0).all(axis=-1)
+            & (h_q | ~h_p).all(axis=-1)
+        )
+
+        identical = (
+            (m_q == m_p).all(axis=-1)
+            & (s_q == s_p).all(axis=-1)
+            & (price_gap == 0).all(axis=-1)
+            & (h_q == h_p).all(axis=-1)
+        )
+        dominates &= ~identical | (ids[None, :] < ids[rows, None])
+
+        dominated_by[rows] = dominates
+
+    return dominated_by
+
+
+def prune_dominated_players(
+    model_input_data: ModelInputData,
+    *,
+    min_dominators: int | None = None,
+) -> DominancePresolveResult:
+    """Drop players that are dominated by at least ``min_dominators`` others.
+
+    Parameters
+    ----------
+    min_dominators:
+        Defaults to :func:`safe_min_dominators`, which never changes the optimal
+        objective. Smaller values prune more aggressively but are a heuristic.
+
+    Notes
+    -----
+    Dominance is transitive, so all qualifying players can be removed at once:
+    any optimal solution using a removed player can be rewritten, one holding
+    period at a time, to use strictly dominating players until none of the
+    removed players is held.
+    """
+
+    if min_dominators is None:
+        min_dominators = safe_min_dominators(model_input_data)
+    if min_dominators < 1:
+        raise ValueError("min_dominators must be >= 1")
+
+    player_ids = model_input_data.player_ids
+    dominated_by = dominance_matrix(model_input_data)
+    counts = dominated_by.sum(axis=1)
+
+    removed: Dict[int, Tuple[int, ...]] = {}
+    for i in np.flatnonzero(counts >= min_dominators).tolist():
+        removed[player_ids[i]] = tuple(player_ids[j] for j in np.flatnonzero(dominated_by[i]).tolist())
+
+    kept = {p: player for p, player in model_input_data.players.items() if p not in removed}
+    if not kept:  # pragma: no cover - impossible: the top of the dominance order is never removed
+        raise ValueError("Dominance presolve removed every player")
+
+    logger.info(
+        "Dominance presolve removed %d of %d players (each dominated by >= %d players)",
+        len(removed),
+        len(player_ids),
+        min_dominators,
+    )
+    for p, dominators in removed.items():
+        logger.debug(
+            "  removed %s (%d): dominated by %d players, e.g. %s",
+            model_input_data.players[p].name,
+            p,
+            len(dominators),
+            list(dominators[:5]),
+        )
+
+    reduced = ModelInputData(
+        players=kept,
+        rounds=dict(model_input_data.rounds),
+        team_rules=model_input_data.team_rules,
+        season=model_input_data.season,
+    )
+    return DominancePresolveResult(model_input_data=reduced, removed=removed, min_dominators=min_dominators)
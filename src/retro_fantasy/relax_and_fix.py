@@ -0,0 +1,255 @@
+"""Relax-and-fix heuristic for full-season solves.
+
+Unlike the rolling horizon (:mod:`retro_fantasy.rolling_horizon`), every
+iteration solves the *full* season, so later rounds still steer early
+decisions:
+
+1. Enforce integrality only for the rounds up to the end of the current
+   block; every later round is LP-relaxed.
+2. Fix the block's squad and trade decisions (``x_selected``, ``traded_in``,
+   ``traded_out`` by default) at their solved values.
+3. Move the integral window forward by ``block - overlap`` rounds.
+
+On the last block every round is integral, so its solution is a feasible
+season plan. Fixing a squad never makes later rounds infeasible: keeping the
+squad unchanged is always allowed.
+
+The full model's LP relaxation provides a bound (and so a gap). When the
+solver reports a MIP bound for the first block, that bound is used as well: the
+first block is itself a relaxation of the full model, and a tighter one than
+the LP.
+
+Models are built once with :func:`retro_fantasy.matrix.build_matrix_model`,
+whose columns use the same variable families as
+:func:`retro_fantasy.formulation.formulate_problem`. Each block only changes
+integrality and column bounds.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields, replace
+import logging
+import time
+from typing import Sequence
+
+import numpy as np
+import pulp
+
+from retro_fantasy.data import ModelInputData
+from retro_fantasy.formulation import DecisionVariables, FormulationOptions
+from retro_fantasy.matrix import (
+    MatrixModel,
+    build_matrix_model,
+    column_rounds,
+    matrix_model_to_pulp,
+    set_pulp_variable_values,
+)
+from retro_fantasy.rolling_horizon import MatrixSolver, rolling_horizon_windows
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_FIXED_FAMILIES = ("x_selected", "traded_in", "traded_out")
+
+
+@dataclass(frozen=True, slots=True)
+class RelaxAndFixConfig:
+    """Relax-and-fix settings.
+
+    Attributes
+    ----------
+    block:
+        Number of rounds that become integral in each iteration.
+    overlap:
+        Number of integral rounds left unfixed for the next iteration. Each
+        iteration fixes ``block - overlap`` rounds.
+    fixed_families:
+        Decision variable families fixed once their round is committed. The
+        other binaries of committed rounds (slots, scoring, captaincy) stay
+        integral but free.
+    compute_bound:
+        Solve the full model's LP relaxation to report a gap.
+    """
+
+    block: int = 4
+    overlap: int = 0
+    fixed_families: tuple[str, ...] = DEFAULT_FIXED_FAMILIES
+    compute_bound: bool = True
+
+    def __post_init__(self) -> None:
+        if self.block < 1:
+            raise ValueError("RelaxAndFixConfig.block must be >= 1")
+        if not 0 <= self.overlap < self.block:
+            raise ValueError("RelaxAndFixConfig.overlap must be >= 0 and < block")
+        known = {f.name for f in fields(DecisionVariables)}
+        unknown = sorted(set(self.fixed_families) - known)
+        if unknown:
+            raise ValueError(f"RelaxAndFixConfig.fixed_families has unknown families {unknown}")
+
+
+@dataclass(frozen=True, slots=True)
+class BlockReport:
+    """Timings and outcome of one relax-and-fix iteration."""
+
+    first_round: int
+    last_integral_round: int
+    committed_through: int
+    status: str
+    objective_value: float
+    num_integer_columns: int
+    solve_seconds: float
+
+
+@dataclass(slots=True)
+class RelaxAndFixResult:
+    """Outcome of :func:`solve_relax_and_fix`.
+
+    ``problem`` and ``decision_variables`` hold the full model with the final
+    solution assigned to ``varValue``, so they can be passed straight to
+    :func:`retro_fantasy.solution.build_solution_summary`.
+    """
+
+    status: str
+    objective_value: float
+    best_bound: float | None
+    problem: pulp.LpProblem
+    decision_variables: DecisionVariables
+    matrix_model: MatrixModel
+    blocks: list[BlockReport] = field(default_factory=list)
+    bound_seconds: float = 0.0
+
+    @property
+    def gap(self) -> float | None:
+        """Relative gap ``(bound - objective) / |bound|`` (``None`` without a bound)."""
+
+        if self.best_bound is None:
+            return None
+        if self.best_bound == 0:
+            return 0.0
+        return max(0.0, (self.best_bound - self.objective_value) / abs(self.best_bound))
+
+
+def _family_columns(matrix_model: MatrixModel, families: Sequence[str]) -> np.ndarray:
+    mask = np.zeros(matrix_model.num_cols, dtype=bool)
+    for family in families:
+        if family in matrix_model.families:
+            mask[matrix_model.family_slice(family)] = True
+    return mask
+
+
+def solve_relax_and_fix(
+    model_input_data: ModelInputData,
+    *,
+    solve_matrix: MatrixSolver,
+    config: RelaxAndFixConfig | None = None,
+    options: FormulationOptions | None = None,
+) -> RelaxAndFixResult:
+    """Solve ``model_input_data`` with relax-and-fix over blocks of rounds.
+
+    Parameters
+    ----------
+    solve_matrix:
+        Solves one matrix model (a block or the LP relaxation). This keeps the
+        heuristic independent of the solver backend.
+    """
+
+    config = config or RelaxAndFixConfig()
+    round_numbers = model_input_data.round_numbers
+
+    full_mm = build_matrix_model(model_input_data, options=options)
+    col_rounds = column_rounds(full_mm)
+    fixable = _family_columns(full_mm, config.fixed_families) & full_mm.integrality
+    col_lower = full_mm.col_lower.copy()
+    col_upper = full_mm.col_upper.copy()
+
+    reports: list[BlockReport] = []
+    bounds: list[float] = []
+    status = "Optimal"
+    final_values: np.ndarray | None = None
+    final_objective = 0.0
+
+    for start, commit_stop, stop in rolling_horizon_windows(
+        len(round_numbers), window=config.block, overlap=config.overlap
+    ):
+        integrality = full_mm.integrality & (col_rounds <= round_numbers[stop - 1])
+        block_mm = replace(full_mm, integrality=integrality, col_lower=col_lower.copy(), col_upper=col_upper.copy())
+
+        solve_start = time.perf_counter()
+        result = solve_matrix(block_mm, None)
+        solve_seconds = time.perf_counter() - solve_start
+
+        reports.append(
+            BlockReport(
+                first_round=round_numbers[start],
+                last_integral_round=round_numbers[stop - 1],
+                committed_through=round_numbers[commit_stop - 1],
+                status=result.status,
+                objective_value=result.objective_value,
+                num_integer_columns=int(np.count_nonzero(integrality)),
+                solve_seconds=solve_seconds,
+            )
+        )
+        logger.info(
+            "Relax-and-fix block rounds %d-%d integral (fix through %d): status=%s objective=%s "
+            "integer_columns=%d solve=%.3fs",
+            reports[-1].first_round,
+            reports[-1].last_integral_round,
+            reports[-1].committed_through,
+            result.status,
+            result.objective_value,
+            reports[-1].num_integer_columns,
+            solve_seconds,
+        )
+
+        if result.status != "Optimal":
+            status = result.status
+            break
+
+        # Nothing is fixed yet in the first block, which only relaxes later
+        # rounds of the full model: its MIP bound bounds the full model too.
+        if start == 0 and result.best_bound is not None:
+            bounds.append(result.best_bound)
+
+        commit = fixable & np.isin(col_rounds, round_numbers[start:commit_stop])
+        values = np.round(result.values[commit])
+        col_lower[commit] = values
+        col_upper[commit] = values
+
+        final_values = result.values
+        final_objective = result.objective_value
+
+    problem, decision_variables = matrix_model_to_pulp(full_mm)
+    rf_result = RelaxAndFixResult(
+        status=status,
+        objective_value=0.0,
+        best_bound=None,
+        problem=problem,
+        decision_variables=decision_variables,
+        matrix_model=full_mm,
+        blocks=reports,
+    )
+    if status != "Optimal" or final_values is None:
+        problem.status = pulp.LpStatusNotSolved
+        return rf_result
+
+    if config.compute_bound:
+        bound_start = time.perf_counter()
+        lp = solve_matrix(replace(full_mm, integrality=np.zeros_like(full_mm.integrality)), None)
+        rf_result.bound_seconds = time.perf_counter() - bound_start
+        if lp.status == "Optimal":
+            bounds.append(lp.objective_value)
+
+    rf_result.objective_value = final_objective
+    rf_result.best_bound = min(bounds) if bounds else None
+    set_pulp_variable_values(full_mm, decision_variables, final_values)
+    problem.status = pulp.LpStatusOptimal
+
+    logger.info(
+        "Relax-and-fix complete: objective=%s best_bound=%s gap=%s blocks=%d",
+        rf_result.objective_value,
+        rf_result.best_bound,
+        rf_result.gap,
+        len(reports),
+    )
+    return rf_result
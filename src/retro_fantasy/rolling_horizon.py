@@ -0,0 +1,346 @@
+"""Rolling-horizon heuristic for full-season solves.
+
+Instead of solving all rounds at once, solve a sequence of overlapping windows:
+
+1. Solve a model of the window's rounds only. After the first window, the
+   last committed round is carried in as the model's round 1, with its squad
+   fixed and its bank balance pinned, so the squad and bank carry forward
+   exactly and every window model has ``window + 1`` rounds at most.
+2. Commit the first ``window - overlap`` rounds of the window (or all remaining
+   rounds on the last window) and slide forward.
+
+The stitched solution is feasible for the full model. Optionally it seeds a
+final full-model "polish" solve as a MIP start. The LP relaxation of the full
+model provides a bound, so the result reports a gap.
+
+Models are built with :func:`retro_fantasy.matrix.build_matrix_model`, so
+fixing decisions is just a matter of editing column bounds. The formulation
+treats round 1 as the initial purchase, so window rounds are renumbered from 1
+(see :func:`window_input_data`).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+import logging
+import time
+from typing import Callable, Dict, Hashable, Sequence
+
+import numpy as np
+import pulp
+
+from retro_fantasy.data import ModelInputData, Player
+from retro_fantasy.formulation import DecisionVariables, FormulationOptions
+from retro_fantasy.matrix import (
+    MatrixModel,
+    MatrixSolveResult,
+    build_matrix_model,
+    column_players,
+    column_rounds,
+    matrix_model_to_pulp,
+    set_pulp_variable_values,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# Solve a matrix model, optionally from a MIP start (column-aligned values).
+MatrixSolver = Callable[[MatrixModel, "np.ndarray | None"], MatrixSolveResult]
+
+
+@dataclass(frozen=True, slots=True)
+class RollingHorizonConfig:
+    """Rolling-horizon settings.
+
+    Attributes
+    ----------
+    window:
+        Number of rounds optimised in each window.
+    overlap:
+        Number of rounds shared by consecutive windows. Each window commits
+        ``window - overlap`` rounds.
+    polish:
+        Finish with a full-model solve seeded by the stitched solution.
+    compute_bound:
+        Solve the full model's LP relaxation to report a gap.
+    """
+
+    window: int = 6
+    overlap: int = 2
+    polish: bool = False
+    compute_bound: bool = True
+
+    def __post_init__(self) -> None:
+        if self.window < 1:
+            raise ValueError("RollingHorizonConfig.window must be >= 1")
+        if not 0 <= self.overlap < self.window:
+            raise ValueError("RollingHorizonConfig.overlap must be >= 0 and < window")
+
+
+@dataclass(frozen=True, slots=True)
+class WindowReport:
+    """Timings, size and outcome of one rolling-horizon window.
+
+    ``objective_value`` covers the window's own rounds (the carried-in round
+    scores nothing). ``num_columns`` / ``num_rows`` are the window model's
+    size, which stays bounded by the window length.
+    """
+
+    first_round: int
+    last_round: int
+    committed_through: int
+    status: str
+    objective_value: float
+    build_seconds: float
+    solve_seconds: float
+    num_columns: int = 0
+    num_rows: int = 0
+
+
+@dataclass(slots=True)
+class RollingHorizonResult:
+    """Outcome of :func:`solve_rolling_horizon`.
+
+    ``problem`` and ``decision_variables`` hold the full model with the final
+    solution assigned to ``varValue``, so they can be passed straight to
+    :func:`retro_fantasy.solution.build_solution_summary`.
+    """
+
+    status: str
+    objective_value: float
+    best_bound: float | None
+    problem: pulp.LpProblem
+    decision_variables: DecisionVariables
+    matrix_model: MatrixModel
+    windows: list[WindowReport] = field(default_factory=list)
+    stitched_objective_value: float = 0.0
+    bound_seconds: float = 0.0
+    polish_seconds: float = 0.0
+
+    @property
+    def gap(self) -> float | None:
+        """Relative gap ``(bound - objective) / |bound|`` (``None`` without a bound)."""
+
+        if self.best_bound is None:
+            return None
+        if self.best_bound == 0:
+            return 0.0
+        return max(0.0, (self.best_bound - self.objective_value) / abs(self.best_bound))
+
+
+def rolling_horizon_windows(num_rounds: int, *, window: int, overlap: int) -> list[tuple[int, int, int]]:
+    """Return ``(start, commit_stop, stop)`` round offsets for each window.
+
+    Offsets index the sorted round list. A window optimises ``[start, stop)``
+    and commits ``[start, commit_stop)``; the last window commits everything.
+    """
+
+    step = window - overlap
+    windows: list[tuple[int, int, int]] = []
+    start = 0
+    while start < num_rounds:
+        stop = min(start + window, num_rounds)
+        commit_stop = stop if stop == num_rounds else start + step
+        windows.append((start, commit_stop, stop))
+        start = commit_stop
+    return windows
+
+
+def window_input_data(model_input_data: ModelInputData, round_numbers: Sequence[int]) -> ModelInputData:
+    """Restrict ``model_input_data`` to ``round_numbers``, renumbered ``1, 2, ...``.
+
+    Rounds must be consecutive. The first one becomes round 1 (the initial
+    purchase), so a window can start mid-season.
+    """
+
+    new_number = {r: i for i, r in enumerate(round_numbers, start=1)}
+    players: Dict[int, Player] = {}
+    for p, player in model_input_data.players.items():
+        renumbered = Player(
+            player_id=p,
+            first_name=player.first_name,
+            last_name=player.last_name,
+            squad_id=player.squad_id,
+            original_positions=player.original_positions,
+        )
+        for r, info in player.by_round.items():
+            if r in new_number:
+                renumbered.by_round[new_number[r]] = replace(info, round_number=new_number[r])
+        players[p] = renumbered
+
+    return ModelInputData(
+        players=players,
+        rounds={new_number[r]: replace(model_input_data.rounds[r], number=new_number[r]) for r in round_numbers},
+        team_rules=model_input_data.team_rules,
+    )
+
+
+def _column_keys(matrix_model: MatrixModel, round_offset: int = 0) -> list[tuple[str, Hashable]]:
+    """``(family, key)`` of every column, with rounds shifted by ``round_offset``."""
+
+    keys: list[tuple[str, Hashable]] = []
+    for family in matrix_model.families:
+        for k in matrix_model.family_keys[family]:
+            keys.append((family, (*k[:-1], k[-1] + round_offset) if isinstance(k, tuple) else k + round_offset))
+    return keys
+
+
+def solve_rolling_horizon(
+    model_input_data: ModelInputData,
+    *,
+    solve_matrix: MatrixSolver,
+    config: RollingHorizonConfig | None = None,
+    options: FormulationOptions | None = None,
+) -> RollingHorizonResult:
+    """Solve ``model_input_data`` window by window.
+
+    Parameters
+    ----------
+    solve_matrix:
+        Solves one matrix model (window, LP relaxation or polish). This keeps
+        the heuristic independent of the solver backend.
+    """
+
+    config = config or RollingHorizonConfig()
+    round_numbers = model_input_data.round_numbers
+
+    # Committed integer decisions by (family, key), with season round numbers.
+    committed: Dict[tuple[str, Hashable], float] = {}
+    # Squad and bank after the last committed round.
+    carried_squad: list[int] = []
+    carried_bank = 0.0
+    reports: list[WindowReport] = []
+    status = "Optimal"
+
+    for start, commit_stop, stop in rolling_horizon_windows(
+        len(round_numbers), window=config.window, overlap=config.overlap
+    ):
+        build_start = time.perf_counter()
+        # Carry the last committed round in as the window model's round 1.
+        first = max(start - 1, 0)
+        window_data = window_input_data(model_input_data, round_numbers[first:stop])
+        mm = build_matrix_model(window_data, options=options)
+        offset = round_numbers[first] - 1
+        col_rounds = column_rounds(mm) + offset
+
+        if start > 0:
+            # Fix the carried-in squad and pin its bank: the round-1 row reads
+            # bank + sum(price * x) == cap, so move its right-hand side.
+            x_cols = np.arange(*mm.families["x_selected"])
+            x_cols = x_cols[col_rounds[x_cols] == round_numbers[first]]
+            x_players = column_players(mm)[x_cols]
+            carried = np.isin(x_players, carried_squad).astype(np.float64)
+            mm.col_lower[x_cols] = carried
+            mm.col_upper[x_cols] = carried
+            prices = window_data.prices[[window_data.player_index[p] for p in x_players.tolist()], 0]
+            row = mm.semantic_row_names.index("bank_initial_round_1")
+            mm.row_lower[row] = mm.row_upper[row] = carried_bank + float(prices @ carried)
+            mm.objective[col_rounds == round_numbers[first]] = 0.0
+        build_seconds = time.perf_counter() - build_start
+
+        solve_start = time.perf_counter()
+        result = solve_matrix(mm, None)
+        solve_seconds = time.perf_counter() - solve_start
+
+        reports.append(
+            WindowReport(
+                first_round=round_numbers[start],
+                last_round=round_numbers[stop - 1],
+                committed_through=round_numbers[commit_stop - 1],
+                status=result.status,
+                objective_value=result.objective_value,
+                build_seconds=build_seconds,
+                solve_seconds=solve_seconds,
+                num_columns=mm.num_cols,
+                num_rows=mm.num_rows,
+            )
+        )
+        logger.info(
+            "Rolling horizon window rounds %d-%d (commit through %d): status=%s objective=%s build=%.3fs solve=%.3fs",
+            reports[-1].first_round,
+            reports[-1].last_round,
+            reports[-1].committed_through,
+            result.status,
+            result.objective_value,
+            build_seconds,
+            solve_seconds,
+        )
+
+        if result.status != "Optimal":
+            status = result.status
+            break
+
+        keys = _column_keys(mm, offset)
+        commit_rounds = list(round_numbers[start:commit_stop])
+        for j in np.flatnonzero(np.isin(col_rounds, commit_rounds) & mm.integrality).tolist():
+            committed[keys[j]] = float(round(result.values[j]))
+
+        last = round_numbers[commit_stop - 1]
+        carried_squad = [p for p in window_data.player_ids if committed[("x_selected", (p, last))] > 0.5]
+        bank = result.values[mm.family_slice("bank")][window_data.round_index[last - offset]]
+        carried_bank = max(0.0, float(bank))
+
+    full_mm = build_matrix_model(model_input_data, options=options)
+    problem, decision_variables = matrix_model_to_pulp(full_mm)
+
+    rh_result = RollingHorizonResult(
+        status=status,
+        objective_value=0.0,
+        best_bound=None,
+        problem=problem,
+        decision_variables=decision_variables,
+        matrix_model=full_mm,
+        windows=reports,
+    )
+    if status != "Optimal":
+        problem.status = pulp.LpStatusNotSolved
+        return rh_result
+
+    # Stitched solution: fix all integer columns and let the solver fill in the
+    # (continuous, fully determined) bank columns.
+    stitched_mm = replace(full_mm, col_lower=full_mm.col_lower.copy(), col_upper=full_mm.col_upper.copy())
+    integer_cols = np.flatnonzero(full_mm.integrality)
+    full_keys = _column_keys(full_mm)
+    stitched_values = np.array([committed[full_keys[j]] for j in integer_cols.tolist()], dtype=np.float64)
+    stitched_mm.col_lower[integer_cols] = stitched_values
+    stitched_mm.col_upper[integer_cols] = stitched_values
+    stitched = solve_matrix(stitched_mm, None)
+    if stitched.status != "Optimal":  # pragma: no cover - windows only commit feasible decisions
+        raise RuntimeError(f"Stitched rolling-horizon solution is not feasible: {stitched.status}")
+
+    rh_result.stitched_objective_value = stitched.objective_value
+    final = stitched
+
+    bounds: list[float] = []
+    if config.compute_bound:
+        bound_start = time.perf_counter()
+        relaxed = replace(full_mm, integrality=np.zeros_like(full_mm.integrality))
+        lp = solve_matrix(relaxed, None)
+        rh_result.bound_seconds = time.perf_counter() - bound_start
+        if lp.status == "Optimal":
+            bounds.append(lp.objective_value)
+
+    if config.polish:
+        polish_start = time.perf_counter()
+        polished = solve_matrix(full_mm, stitched.values)
+        rh_result.polish_seconds = time.perf_counter() - polish_start
+        if polished.best_bound is not None:
+            bounds.append(polished.best_bound)
+        if polished.status == "Optimal" and polished.objective_value >= final.objective_value:
+            final = polished
+
+    rh_result.objective_value = final.objective_value
+    rh_result.best_bound = min(bounds) if bounds else None
+    set_pulp_variable_values(full_mm, decision_variables, final.values)
+    problem.status = pulp.LpStatusOptimal
+
+    logger.info(
+        "Rolling horizon complete: objective=%s (stitched=%s) best_bound=%s gap=%s windows=%d",
+        rh_result.objective_value,
+        rh_result.stitched_objective_value,
+        rh_result.best_bound,
+        rh_result.gap,
+        len(reports),
+    )
+    return rh_result
@@ -0,0 +1,126 @@
+"""Squad slots and slot matching shared by the warm start and the heuristics.
+
+A squad has one slot per required on-field and bench position plus the utility
+bench slots (see :func:`squad_slots`). A player fills a positional slot in
+round ``r`` if they are eligible for that position in ``r``; anyone fills a
+utility slot. :func:`match_slots` places players by bipartite matching.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from retro_fantasy.data import ModelInputData, Position
+
+
+# A squad slot: ("on_field" | "bench", position) or ("utility_bench", None).
+Slot = Tuple[str, Optional[Position]]
+
+
+def squad_slots(model_input_data: ModelInputData) -> list[Slot]:
+    """Every slot of the squad: on-field by position, bench by position, then utility bench."""
+
+    slots: list[Slot] = []
+    for k in model_input_data.positions:
+        slots.extend([("on_field", k)] * model_input_data.on_field_required(k))
+    for k in model_input_data.positions:
+        slots.extend([("bench", k)] * model_input_data.bench_required(k))
+    slots.extend([("utility_bench", None)] * model_input_data.utility_bench_count)
+    return slots
+
+
+def match_slots(
+    model_input_data: ModelInputData,
+    players: list[int],
+    r: int,
+    preferred: Dict[int, Slot],
+    *,
+    slots: list[Slot] | None = None,
+) -> Dict[int, Slot] | None:
+    """Give each player a distinct slot they can fill in round ``r`` (bipartite matching).
+
+    Still-valid ``preferred`` slots are kept where possible. ``slots`` defaults
+    to every squad slot. Returns ``None`` if some player cannot be placed.
+    """
+
+    slots = squad_slots(model_input_data) if slots is None else slots
+    eligible = model_input_data.eligible
+    pi, j, ki = model_input_data.player_index, model_input_data.round_index[r], model_input_data.position_index
+
+    def can_fill(p: int, slot: Slot) -> bool:
+        return slot[1] is None or bool(eligible[pi[p], ki[slot[1]], j])
+
+    slot_owner: list[int | None] = [None] * len(slots)
+    for p in players:
+        want = preferred.get(p)
+        if want is None or not can_fill(p, want):
+            continue
+        for s, slot in enumerate(slots):
+            if slot == want and slot_owner[s] is None:
+                slot_owner[s] = p
+                break
+
+    def augment(p: int, seen: set[int]) -> bool:
+        for s, slot in enumerate(slots):
+            if s in seen or not can_fill(p, slot):
+                continue
+            seen.add(s)
+            owner = slot_owner[s]
+            if owner is None or augment(owner, seen):
+                slot_owner[s] = p
+                return True
+        return False
+
+    placed = {p for p in slot_owner if p is not None}
+    for p in players:
+        if p not in placed and not augment(p, set()):
+            return None
+
+    return {p: slots[s] for s, p in enumerate(slot_owner) if p is not None}
+
+
+def assign_slots(
+    model_input_data: ModelInputData,
+    squad: list[int],
+    r: int,
+    preferred: Dict[int, Slot],
+) -> Dict[int, Slot] | None:
+    """Place a full squad in round ``r`` (see :func:`match_slots`).
+
+    Returns ``None`` if the squad has the wrong size or does not fit the
+    positional structure.
+    """
+
+    if len(squad) != len(squad_slots(model_input_data)):
+        return None
+    return match_slots(model_input_data, squad, r, preferred)
+
+
+def fill_round_1_squad(model_input_data: ModelInputData, squad: list[int], preferred: Dict[int, Slot]) -> list[int]:
+    """A full first-round squad built around ``squad``.
+
+    The players of ``squad`` that still fit are kept, in order, and the open
+    slots are filled with the cheapest eligible players that have a price.
+    The result can exceed the salary cap; callers check it.
+    """
+
+    r = model_input_data.round_numbers[0]
+    target = len(squad_slots(model_input_data))
+
+    kept: list[int] = []
+    for p in squad:
+        if len(kept) < target and match_slots(model_input_data, kept + [p], r, preferred) is not None:
+            kept.append(p)
+
+    j = model_input_data.round_index[r]
+    for i in np.argsort(model_input_data.prices[:, j], kind="stable").tolist():
+        if len(kept) >= target:
+            break
+        p = model_input_data.player_ids[i]
+        if p in kept or not model_input_data.has_prices[i, j]:
+            continue
+        if match_slots(model_input_data, kept + [p], r, preferred) is not None:
+            kept.append(p)
+    return kept
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import json
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 import pulp
 
 from retro_fantasy.data import ModelInputData, Position
 from retro_fantasy.formulation import DecisionVariables
+from retro_fantasy.instrumentation import instrumented
 
 
 @dataclass(frozen=True, slots=True)
@@ -67,31 +69,154 @@ def _var_value(v: pulp.LpVariable) -> float:
     return float(val) if val is not None else 0.0
 
 
-def _is_selected(v: pulp.LpVariable, *, tol: float = 1e-6) -> bool:
-    return _var_value(v) >= 1.0 - tol
+def _selected_keys(variables: Mapping[Any, pulp.LpVariable], *, tol: float = 1e-6) -> List[Any]:
+    """Keys of the variables at (or within ``tol`` of) 1, in one pass over the family."""
 
+    threshold = 1.0 - tol
+    return [key for key, v in variables.items() if v.varValue is not None and v.varValue >= threshold]
 
+
+def _players_by_round(keys: List[tuple[int, int]], player_index: Mapping[int, int]) -> Dict[int, List[int]]:
+    """Group selected ``(player, round)`` keys by round, players in ``player_ids`` order."""
+
+    grouped: Dict[int, List[int]] = {}
+    for p, r in keys:
+        grouped.setdefault(r, []).append(p)
+    for players in grouped.values():
+        players.sort(key=player_index.__getitem__)
+    return grouped
+
+
+def _positions_by_round(
+    keys: List[tuple[int, Position, int]],
+    position_index: Mapping[Position, int],
+) -> Dict[int, Dict[int, Position]]:
+    """Selected ``(player, position, round)`` keys as round -> player -> first position."""
+
+    grouped: Dict[int, Dict[int, Position]] = {}
+    for p, k, r in keys:
+        chosen = grouped.setdefault(r, {})
+        if p not in chosen or position_index[k] < position_index[chosen[p]]:
+            chosen[p] = k
+    return grouped
+
+
+@instrumented("solution.build_summary")
 def build_solution_summary(
     *,
     model_input_data: ModelInputData,
     decision_variables: DecisionVariables,
     problem: pulp.LpProblem,
 ) -> SolutionSummary:
-    """Build a JSON-serialisable, round-centric summary of the solved model."""
+    """Build a JSON-serialisable, round-centric summary of the solved model.
+
+    Notes
+    -----
+    Each variable family is scanned once for its selected entries; the rest of
+    the summary only touches those. Players are visited in ``player_ids`` order
+    throughout, so sums and listings are the same as a per-player scan.
+
+    If ``scored`` / ``captain`` are continuous
+    (``FormulationOptions.continuous_scoring``) their values may be fractional
+    on ties, so the counted players and the captain are recovered from the
+    on-field selection instead: the ``counted_onfield_players(r)`` highest
+    on-field scores are counted and the highest is captain (ties broken by
+    player id, as in :mod:`retro_fantasy.warm_start`).
+    """
+
+    first_scored = next(iter(decision_variables.scored.values()), None)
+    return _build_summary(
+        model_input_data,
+        status=pulp.LpStatus[problem.status],
+        objective_value=float(pulp.value(problem.objective) or 0.0),
+        selected_keys=lambda family: _selected_keys(getattr(decision_variables, family)),
+        bank={r: _var_value(v) for r, v in decision_variables.bank.items()},
+        rank_scoring=first_scored is not None and first_scored.cat == pulp.LpContinuous,
+    )
+
+
+@instrumented("solution.build_summary")
+def build_solution_summary_from_values(
+    *,
+    model_input_data: ModelInputData,
+    values: Any,
+    status: str,
+    objective_value: float,
+) -> SolutionSummary:
+    """:func:`build_solution_summary` for values that do not come from a solved PuLP problem.
 
-    decision_vars = decision_variables
+    ``values`` has one ``{key: value}`` mapping per
+    :class:`~retro_fantasy.formulation.DecisionVariables` family, keyed the same
+    way (e.g. a :class:`retro_fantasy.warm_start.WarmStart`); absent keys are 0.
+    """
 
-    status = pulp.LpStatus[problem.status]
-    objective_value = float(pulp.value(problem.objective) or 0.0)
+    return _build_summary(
+        model_input_data,
+        status=status,
+        objective_value=objective_value,
+        selected_keys=lambda family: _selected_value_keys(getattr(values, family)),
+        bank=values.bank,
+    )
+
+
+def _selected_value_keys(values: Mapping[Any, float], *, tol: float = 1e-6) -> List[Any]:
+    threshold = 1.0 - tol
+    return [key for key, v in values.items() if v >= threshold]
+
+
+def _ranked_scoring(
+    model_input_data: ModelInputData,
+    onfield: Mapping[int, Mapping[int, Position]],
+    scores: List[List[float]],
+) -> tuple[Dict[int, List[int]], Dict[int, List[int]]]:
+    """Counted players and captain per round: the best on-field scores (``scored``, ``captains``)."""
+
+    pi, ri = model_input_data.player_index, model_input_data.round_index
+    scored: Dict[int, List[int]] = {}
+    captains: Dict[int, List[int]] = {}
+    for r, players in onfield.items():
+        j = ri[r]
+        ranked = sorted(players, key=lambda p: (-scores[pi[p]][j], p))
+        counted = ranked[: model_input_data.counted_onfield_players(r)]
+        scored[r] = sorted(counted, key=pi.__getitem__)
+        captains[r] = counted[:1]
+    return scored, captains
+
+
+def _build_summary(
+    model_input_data: ModelInputData,
+    *,
+    status: str,
+    objective_value: float,
+    selected_keys: Callable[[str], List[Any]],
+    bank: Mapping[int, float],
+    rank_scoring: bool = False,
+) -> SolutionSummary:
+    # Dense (P, R) parameter arrays as nested lists: cheap scalar indexing below.
+    prices = model_input_data.prices.tolist()
+    scores = model_input_data.scores.tolist()
+    pi, ri = model_input_data.player_index, model_input_data.round_index
+    ki = model_input_data.position_index
+
+    selected = _players_by_round(selected_keys("x_selected"), pi)
+    traded_in = _players_by_round(selected_keys("traded_in"), pi)
+    traded_out = _players_by_round(selected_keys("traded_out"), pi)
+    utility = _players_by_round(selected_keys("y_utility"), pi)
+    onfield = _positions_by_round(selected_keys("y_onfield"), ki)
+    bench = _positions_by_round(selected_keys("y_bench"), ki)
+    if rank_scoring:
+        scored, captains = _ranked_scoring(model_input_data, onfield, scores)
+    else:
+        captains = _players_by_round(selected_keys("captain"), pi)
+        scored = _players_by_round(selected_keys("scored"), pi)
 
     # Track acquisition price for profit/loss reporting.
     # - If selected in the starting team, acquisition is their round-1 price.
     # - If traded in later, acquisition is their trade-in round price.
     acquisition_price_by_player: Dict[int, float] = {}
 
-    for p in model_input_data.player_ids:
-        if _is_selected(decision_vars.x_selected.get((p, 1), 0)):
-            acquisition_price_by_player[p] = float(model_input_data.price(p, 1))
+    for p in selected.get(1, []):
+        acquisition_price_by_player[p] = prices[pi[p]][ri[1]]
 
     # Pre-build trades by round for easy attachment.
     trades_by_round: Dict[int, RoundTradeSummary] = {}
@@ -102,38 +227,36 @@ def build_solution_summary(
         # First, handle traded in so that trade-outs in the same round can reference
         # the player as "acquired" (even though it would be invalid to in+out same round,
         # we keep this order defensive).
-        for p in model_input_data.player_ids:
-            if _is_selected(decision_vars.traded_in[(p, r)]):
-                pl = model_input_data.players[p]
-                trade_price = float(model_input_data.price(p, r))
-                acquisition_price_by_player[p] = trade_price
-                ins.append(
-                    TradeEntry(
-                        player_id=p,
-                        player_name=pl.name,
-                        price=trade_price,
-                        acquisition_price=trade_price,
-                        price_change=0.0,
-                    )
+        for p in traded_in.get(r, []):
+            pl = model_input_data.players[p]
+            trade_price = prices[pi[p]][ri[r]]
+            acquisition_price_by_player[p] = trade_price
+            ins.append(
+                TradeEntry(
+                    player_id=p,
+                    player_name=pl.name,
+                    price=trade_price,
+                    acquisition_price=trade_price,
+                    price_change=0.0,
                 )
+            )
 
-        for p in model_input_data.player_ids:
-            if _is_selected(decision_vars.traded_out[(p, r)]):
-                pl = model_input_data.players[p]
-                trade_price = float(model_input_data.price(p, r))
-                acq = float(acquisition_price_by_player.get(p, trade_price))
-                outs.append(
-                    TradeEntry(
-                        player_id=p,
-                        player_name=pl.name,
-                        price=trade_price,
-                        acquisition_price=acq,
-                        price_change=trade_price - acq,
-                    )
+        for p in traded_out.get(r, []):
+            pl = model_input_data.players[p]
+            trade_price = prices[pi[p]][ri[r]]
+            acq = float(acquisition_price_by_player.get(p, trade_price))
+            outs.append(
+                TradeEntry(
+                    player_id=p,
+                    player_name=pl.name,
+                    price=trade_price,
+                    acquisition_price=acq,
+                    price_change=trade_price - acq,
                 )
-                # Once traded out, remove acquisition tracking. If traded back in later,
-                # it'll be set again by traded_in.
-                acquisition_price_by_player.pop(p, None)
+            )
+            # Once traded out, remove acquisition tracking. If traded back in later,
+            # it'll be set again by traded_in.
+            acquisition_price_by_player.pop(p, None)
 
         trades_by_round[r] = RoundTradeSummary(round_number=r, traded_in=ins, traded_out=outs)
 
@@ -146,32 +269,31 @@ def build_solution_summary(
     slot_order: dict[str, int] = {"on_field": 0, "bench": 1, "utility_bench": 2}
 
     for r in model_input_data.idx_round:
+        j = ri[r]
+
         # Captain and scoring.
         captain_player_id: int | None = None
         captain_player_name = ""
         captain_bonus = 0.0
 
-        for p in model_input_data.player_ids:
-            if _is_selected(decision_vars.captain[(p, r)]):
-                captain_player_id = p
-                captain_player_name = model_input_data.players[p].name
-                captain_bonus = float(model_input_data.score(p, r))
-                break
+        round_captains = captains.get(r, [])
+        if round_captains:
+            captain_player_id = round_captains[0]
+            captain_player_name = model_input_data.players[captain_player_id].name
+            captain_bonus = scores[pi[captain_player_id]][j]
 
         scored_player_ids: set[int] = set()
         total_team_points = 0.0
-        for p in model_input_data.player_ids:
-            if _is_selected(decision_vars.scored[(p, r)]):
-                scored_player_ids.add(p)
-                total_team_points += float(model_input_data.score(p, r))
+        for p in scored.get(r, []):
+            scored_player_ids.add(p)
+            total_team_points += scores[pi[p]][j]
         total_team_points += captain_bonus
 
         # Bank + team value diagnostics
-        bank_balance = float(_var_value(decision_vars.bank[r])) if (decision_vars.bank and r in decision_vars.bank) else 0.0
+        bank_balance = float(bank.get(r, 0.0))
         team_value = 0.0
-        for p in model_input_data.player_ids:
-            if _is_selected(decision_vars.x_selected.get((p, r), 0)):
-                team_value += float(model_input_data.price(p, r))
+        for p in selected.get(r, []):
+            team_value += prices[pi[p]][j]
         total_value = team_value + bank_balance
 
         summary = RoundSummary(
@@ -183,30 +305,19 @@ def build_solution_summary(
             total_value=total_value,
         )
 
-        # Team listing for the round: everyone selected in any slot.
-        team_entries: List[TeamEntry] = []
-        for p in model_input_data.player_ids:
-            slot: Optional[str] = None
-            pos: Optional[Position] = None
-
-            for k in model_input_data.positions:
-                if _is_selected(decision_vars.y_onfield.get((p, k, r), 0)):
-                    slot = "on_field"
-                    pos = k
-                    break
-            if slot is None:
-                for k in model_input_data.positions:
-                    if _is_selected(decision_vars.y_bench.get((p, k, r), 0)):
-                        slot = "bench"
-                        pos = k
-                        break
-            if slot is None and _is_selected(decision_vars.y_utility[(p, r)]):
-                slot = "utility_bench"
-                pos = None
-
-            if slot is None:
-                continue
+        # Team listing for the round: everyone selected in any slot, with
+        # on-field taking precedence over bench over utility bench.
+        slots: Dict[int, tuple[str, Optional[Position]]] = {}
+        for p in utility.get(r, []):
+            slots[p] = ("utility_bench", None)
+        for p, k in bench.get(r, {}).items():
+            slots[p] = ("bench", k)
+        for p, k in onfield.get(r, {}).items():
+            slots[p] = ("on_field", k)
 
+        team_entries: List[TeamEntry] = []
+        for p in sorted(slots, key=pi.__getitem__):
+            slot, pos = slots[p]
             player = model_input_data.players[p]
             team_entries.append(
                 TeamEntry(
@@ -214,8 +325,8 @@ def build_solution_summary(
                     player_name=player.name,
                     slot=slot,
                     position=pos.value if pos else None,
-                    price=float(model_input_data.price(p, r)),
-                    score=float(model_input_data.score(p, r)),
+                    price=prices[pi[p]][j],
+                    score=scores[pi[p]][j],
                     scored=p in scored_player_ids,
                     captain=(captain_player_id == p),
                 )
@@ -241,3 +352,69 @@ def solution_summary_to_json_dict(summary: SolutionSummary) -> Dict[str, Any]:
 
 def dumps_solution_summary_pretty(summary: SolutionSummary) -> str:
     return json.dumps(solution_summary_to_json_dict(summary), indent=2, sort_keys=False)
+
+
+def solution_summary_from_json_dict(payload: Mapping[str, Any]) -> SolutionSummary:
+    """Inverse of :func:`solution_summary_to_json_dict`.
+
+    Accepts the parsed contents of a ``solution.json`` file, where round numbers
+    have become string keys.
+    """
+
+    def _trade(e: Mapping[str, Any]) -> TradeEntry:
+        return TradeEntry(
+            player_id=int(e["player_id"]),
+            player_name=str(e["player_name"]),
+            price=float(e["price"]),
+            acquisition_price=float(e["acquisition_price"]),
+            price_change=float(e["price_change"]),
+        )
+
+    rounds: Dict[int, RoundDetail] = {}
+    for key, raw in payload.get("rounds", {}).items():
+        s = raw["summary"]
+        t = raw.get("trades")
+        rounds[int(key)] = RoundDetail(
+            summary=RoundSummary(
+                round_number=int(s["round_number"]),
+                total_team_points=float(s["total_team_points"]),
+                captain_player_name=str(s["captain_player_name"]),
+                bank_balance=float(s["bank_balance"]),
+                team_value=float(s["team_value"]),
+                total_value=float(s["total_value"]),
+            ),
+            trades=(
+                RoundTradeSummary(
+                    round_number=int(t["round_number"]),
+                    traded_in=[_trade(e) for e in t["traded_in"]],
+                    traded_out=[_trade(e) for e in t["traded_out"]],
+                )
+                if t is not None
+                else None
+            ),
+            team=[
+                TeamEntry(
+                    player_id=int(e["player_id"]),
+                    player_name=str(e["player_name"]),
+                    slot=str(e["slot"]),
+                    position=e.get("position"),
+                    price=float(e["price"]),
+                    score=float(e["score"]),
+                    scored=bool(e["scored"]),
+                    captain=bool(e["captain"]),
+                )
+                for e in raw["team"]
+            ],
+        )
+
+    return SolutionSummary(
+        status=str(payload.get("status", "")),
+        objective_value=float(payload.get("objective_value", 0.0)),
+        rounds=rounds,
+    )
+
+
+def load_solution_summary(path: str | Path) -> SolutionSummary:
+    """Load a ``solution.json`` written by :func:`dumps_solution_summary_pretty`."""
+
+    return solution_summary_from_json_dict(json.loads(Path(path).read_text(encoding="utf-8-sig")))
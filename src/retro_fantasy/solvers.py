@@ -0,0 +1,176 @@
+"""PuLP and matrix-model solver factories shared by the solve modes.
+
+:func:`resolve_solver` picks the backend (``"cbc"``, ``"gurobi"`` or
+``"highs"``); :func:`build_cbc_solver` / :func:`build_gurobi_solver` create
+PuLP solvers and :func:`build_matrix_solver` a callable solving a
+:class:`~retro_fantasy.matrix.MatrixModel` with any backend.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pulp
+
+from retro_fantasy.matrix import MatrixModel, MatrixSolveResult, solve_matrix_model_with_pulp
+from retro_fantasy.rolling_horizon import MatrixSolver
+
+
+SOLVERS = ("cbc", "gurobi", "highs")
+
+
+def build_cbc_solver(
+    *,
+    time_limit_seconds: int | None,
+    enable_solver_output: bool,
+    mip_gap: float | None = None,
+    threads: int | None = None,
+    warm_start: bool = False,
+) -> pulp.LpSolver:
+    """Create a CBC (COIN-OR) solver instance for PuLP."""
+
+    kwargs: dict[str, object] = {"msg": enable_solver_output}
+    if time_limit_seconds is not None:
+        kwargs["timeLimit"] = time_limit_seconds
+    if mip_gap is not None:
+        kwargs["gapRel"] = mip_gap
+    if threads is not None:
+        kwargs["threads"] = threads
+    if warm_start:
+        kwargs["warmStart"] = True
+
+    return pulp.PULP_CBC_CMD(**kwargs)
+
+
+def build_gurobi_solver(
+    *,
+    time_limit_seconds: int | None,
+    enable_solver_output: bool,
+    mip_gap: float | None = None,
+    threads: int | None = None,
+    warm_start: bool = False,
+) -> pulp.LpSolver:
+    """Create a Gurobi solver instance for PuLP.
+
+    Notes
+    -----
+    PuLP expects Gurobi to be installed and licensed on the machine.
+
+    - GUROBI_HOME typically indicates an installed Gurobi distribution.
+    - If Gurobi isn't actually usable (e.g. no license), PuLP will raise
+      when attempting to solve.
+
+    Logging / progress output
+    ------------------------
+    Gurobi's detailed progress (presolve summary, node log, MIP gap progress,
+    etc.) is controlled by the solver's own OutputFlag parameter.
+
+    PuLP's GUROBI_CMD maps `msg=True` to emitting solver output.
+
+    You can also provide additional Gurobi parameters in a JSON file at:
+
+      <repo_root>/data/gurobi_options.json
+
+    Example:
+
+      {"MIPGap": 0.02, "Presolve": 2}
+
+    These are passed through to GUROBI_CMD via its `options` parameter.
+    """
+
+    # In PuLP, the most common interface is GUROBI_CMD (shell wrapper).
+    # Keep parameters minimal and portable.
+    kwargs: dict[str, object] = {"msg": enable_solver_output}
+    if time_limit_seconds is not None:
+        # GUROBI_CMD uses `timeLimit` (seconds)
+        kwargs["timeLimit"] = time_limit_seconds
+    if mip_gap is not None:
+        kwargs["gapRel"] = mip_gap
+    if threads is not None:
+        kwargs["threads"] = threads
+    if warm_start:
+        kwargs["warmStart"] = True
+
+    # Optional: extra gurobi options via JSON file in repo /data.
+    # This lets you tweak methods, MIPGap, etc. without editing code.
+    options_path = Path(__file__).resolve().parents[2] / "data" / "gurobi_options.json"
+    if options_path.exists():
+        try:
+            import json
+
+            parsed = json.loads(options_path.read_text(encoding="utf-8-sig"))
+            if not isinstance(parsed, dict):
+                raise TypeError("gurobi_options.json must contain a JSON object")
+
+            # PuLP GUROBI_CMD expects a list of (key, value) pairs.
+            # Use sorted order for stable command-line generation.
+            kwargs["options"] = sorted(parsed.items(), key=lambda kv: str(kv[0]))
+        except Exception as e:  # pragma: no cover
+            raise ValueError(f"Invalid {options_path}: {e}") from e
+
+    return pulp.GUROBI_CMD(**kwargs)
+
+
+def resolve_solver(solver: str | None) -> str:
+    """Pick the solver backend.
+
+    Resolution order: the ``solver`` argument, the ``RETRO_FANTASY_SOLVER``
+    environment variable, then Gurobi if ``GUROBI_HOME`` is set, else CBC.
+    """
+
+    if solver is None:
+        solver = os.environ.get("RETRO_FANTASY_SOLVER") or None
+    if solver is None:
+        return "gurobi" if os.environ.get("GUROBI_HOME") else "cbc"
+
+    solver = solver.lower()
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver {solver!r}; expected one of {SOLVERS}")
+    return solver
+
+
+def build_matrix_solver(
+    solver_name: str,
+    *,
+    time_limit_seconds: int | None,
+    enable_solver_output: bool,
+    mip_gap: float | None = None,
+    threads: int | None = None,
+) -> MatrixSolver:
+    """Return a callable solving a :class:`~retro_fantasy.matrix.MatrixModel` with ``solver_name``.
+
+    The callable accepts an optional column-aligned MIP start.
+    """
+
+    def _solve(matrix_model: MatrixModel, initial_values: np.ndarray | None) -> MatrixSolveResult:
+        if solver_name == "highs":
+            from retro_fantasy.highs import solve_matrix_model_with_highs
+
+            result = solve_matrix_model_with_highs(
+                matrix_model,
+                time_limit_seconds=time_limit_seconds,
+                mip_gap=mip_gap,
+                threads=threads,
+                enable_solver_output=enable_solver_output,
+                initial_values=initial_values,
+            )
+            return MatrixSolveResult(
+                status=result.status,
+                objective_value=result.objective_value,
+                values=result.values,
+                best_bound=result.best_bound,
+            )
+
+        build = build_gurobi_solver if solver_name == "gurobi" else build_cbc_solver
+        pulp_solver = build(
+            time_limit_seconds=time_limit_seconds,
+            enable_solver_output=enable_solver_output,
+            mip_gap=mip_gap,
+            threads=threads,
+            warm_start=initial_values is not None,
+        )
+        return solve_matrix_model_with_pulp(matrix_model, pulp_solver, initial_values=initial_values)
+
+    return _solve
@@ -0,0 +1,421 @@
+"""Parallel what-if sweeps over rule variants.
+
+A sweep solves the same season under several rule variants ("what if the
+salary cap were $X", "what if bye rounds counted the best 20"). The season
+data is loaded and parsed once in the parent process and handed to each
+worker process once (via the pool initializer). Each task then only carries
+its :class:`SweepVariant`.
+
+Each worker builds the model with :func:`retro_fantasy.matrix.build_matrix_model`
+and solves it with the configured backend, limited to ``threads_per_worker``
+solver threads so that ``max_workers * threads_per_worker`` stays within the
+machine. Results come back as one :class:`SweepResult` per variant and can be
+written as a CSV summary table.
+
+Command line::
+
+    python -m retro_fantasy.sweep data/sweep.json --workers 4 --threads-per-worker 2
+
+where ``sweep.json`` maps override names to lists of values, e.g.::
+
+    {"salary_cap": [17000000, 17500000, 18000000],
+     "bye_round_counted_onfield_players": [null, 20]}
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from dataclasses import asdict, dataclass, fields, replace
+import itertools
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+import pulp
+
+from retro_fantasy.data import ModelInputData, Player, Round, SeasonStore, TeamStructureRules
+from retro_fantasy.formulation import FormulationOptions
+from retro_fantasy.io import load_rounds_from_json, load_team_rules_from_json
+from retro_fantasy.main import configure_logging, load_players
+from retro_fantasy.matrix import build_matrix_model, matrix_model_to_pulp, set_pulp_variable_values
+from retro_fantasy.solution import build_solution_summary, dumps_solution_summary_pretty
+from retro_fantasy.solvers import build_matrix_solver, resolve_solver
+
+
+logger = logging.getLogger(__name__)
+
+
+# Per-round override: one value for every round, or round number -> value.
+RoundOverride = int | Mapping[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class SweepVariant:
+    """Rule overrides for one sweep cell. ``None`` keeps the base value.
+
+    Attributes
+    ----------
+    salary_cap, utility_bench_count:
+        Override the matching :class:`~retro_fantasy.data.TeamStructureRules` field.
+    max_trades, counted_onfield_players:
+        Override the matching :class:`~retro_fantasy.data.Round` field, for every
+        round (int) or per round (mapping).
+    bye_round_counted_onfield_players:
+        Override ``counted_onfield_players`` only in rounds that count fewer
+        players than the season maximum (the bye rounds). Applied after
+        ``counted_onfield_players``.
+    """
+
+    name: str
+    salary_cap: float | None = None
+    utility_bench_count: int | None = None
+    max_trades: RoundOverride | None = None
+    counted_onfield_players: RoundOverride | None = None
+    bye_round_counted_onfield_players: int | None = None
+
+    def apply(
+        self,
+        team_rules: TeamStructureRules,
+        rounds: Mapping[int, Round],
+    ) -> tuple[TeamStructureRules, Dict[int, Round]]:
+        """Return ``(team_rules, rounds)`` with this variant's overrides applied."""
+
+        if self.salary_cap is not None:
+            team_rules = replace(team_rules, salary_cap=float(self.salary_cap))
+        if self.utility_bench_count is not None:
+            team_rules = replace(team_rules, utility_bench_count=int(self.utility_bench_count))
+
+        def override(value: RoundOverride | None, r: int, base: int) -> int:
+            if value is None:
+                return base
+            if isinstance(value, Mapping):
+                return int(value.get(r, base))
+            return int(value)
+
+        new_rounds: Dict[int, Round] = {}
+        for r, rnd in rounds.items():
+            new_rounds[r] = replace(
+                rnd,
+                max_trades=override(self.max_trades, r, rnd.max_trades),
+                counted_onfield_players=override(self.counted_onfield_players, r, rnd.counted_onfield_players),
+            )
+
+        if self.bye_round_counted_onfield_players is not None and rounds:
+            full = max(rnd.counted_onfield_players for rnd in rounds.values())
+            for r, rnd in rounds.items():
+                if rnd.counted_onfield_players < full:
+                    new_rounds[r] = replace(
+                        new_rounds[r], counted_onfield_players=int(self.bye_round_counted_onfield_players)
+                    )
+
+        return team_rules, new_rounds
+
+
+_OVERRIDE_NAMES = tuple(f.name for f in fields(SweepVariant) if f.name != "name")
+
+
+def sweep_grid(**axes: Sequence[Any]) -> List[SweepVariant]:
+    """Cartesian product of override values, e.g. ``sweep_grid(salary_cap=[...], max_trades=[2, 3])``.
+
+    Variant names list the non-``None`` overrides, e.g. ``"salary_cap=18000000,max_trades=3"``.
+    """
+
+    unknown = sorted(set(axes) - set(_OVERRIDE_NAMES))
+    if unknown:
+        raise ValueError(f"Unknown sweep overrides {unknown}; expected a subset of {_OVERRIDE_NAMES}")
+
+    names = list(axes)
+    variants: List[SweepVariant] = []
+    for values in itertools.product(*(axes[n] for n in names)):
+        overrides = dict(zip(names, values))
+        label = ",".join(f"{n}={_format_override(v)}" for n, v in overrides.items() if v is not None)
+        variants.append(SweepVariant(name=label or "base", **overrides))
+    return variants
+
+
+def _format_override(value: Any) -> str:
+    if isinstance(value, Mapping):
+        return "{" + ";".join(f"{r}:{v}" for r, v in sorted(value.items())) + "}"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+@dataclass(frozen=True, slots=True)
+class SweepConfig:
+    """Solver settings shared by every variant of a sweep."""
+
+    solver: str | None = None
+    time_limit_seconds: int | None = None
+    mip_gap: float | None = None
+    threads_per_worker: int | None = 1
+    options: FormulationOptions = FormulationOptions()
+    output_dir: Path | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    """Outcome of one variant. ``error`` is set (and ``status`` is ``"Error"``) if the solve raised."""
+
+    name: str
+    status: str
+    objective_value: float
+    build_seconds: float
+    solve_seconds: float
+    solution_path: str | None = None
+    error: str | None = None
+
+
+# Season data, set once per worker process by _init_worker.
+_WORKER_PLAYERS: Dict[int, Player] | SeasonStore = {}
+
+
+def _init_worker(players: Dict[int, Player] | SeasonStore) -> None:
+    global _WORKER_PLAYERS
+    _WORKER_PLAYERS = players
+
+
+def _solution_filename(name: str) -> str:
+    return "solution_" + (re.sub(r"[^A-Za-z0-9_.=-]+", "_", name) or "base") + ".json"
+
+
+def solve_variant(
+    players: Mapping[int, Player] | SeasonStore,
+    team_rules: TeamStructureRules,
+    rounds: Mapping[int, Round],
+    variant: SweepVariant,
+    config: SweepConfig,
+) -> SweepResult:
+    """Formulate and solve one variant in the current process."""
+
+    variant_rules, variant_rounds = variant.apply(team_rules, rounds)
+    if isinstance(players, SeasonStore):
+        model_input_data = ModelInputData.from_season(players, rounds=variant_rounds, team_rules=variant_rules)
+    else:
+        model_input_data = ModelInputData(players=dict(players), rounds=variant_rounds, team_rules=variant_rules)
+
+    build_start = time.perf_counter()
+    matrix_model = build_matrix_model(model_input_data, options=config.options)
+    build_seconds = time.perf_counter() - build_start
+
+    solve_matrix = build_matrix_solver(
+        resolve_solver(config.solver),
+        time_limit_seconds=config.time_limit_seconds,
+        enable_solver_output=False,
+        mip_gap=config.mip_gap,
+        threads=config.threads_per_worker,
+    )
+    solve_start = time.perf_counter()
+    result = solve_matrix(matrix_model, None)
+    solve_seconds = time.perf_counter() - solve_start
+
+    solution_path = None
+    if result.status == "Optimal" and config.output_dir is not None:
+        problem, decision_variables = matrix_model_to_pulp(matrix_model)
+        set_pulp_variable_values(matrix_model, decision_variables, result.values)
+        problem.status = pulp.LpStatusOptimal
+        summary = build_solution_summary(
+            model_input_data=model_input_data,
+            decision_variables=decision_variables,
+            problem=problem,
+        )
+        path = Path(config.output_dir) / _solution_filename(variant.name)
+        path.write_text(dumps_solution_summary_pretty(summary), encoding="utf-8")
+        solution_path = str(path)
+
+    return SweepResult(
+        name=variant.name,
+        status=result.status,
+        objective_value=result.objective_value,
+        build_seconds=build_seconds,
+        solve_seconds=solve_seconds,
+        solution_path=solution_path,
+    )
+
+
+def _solve_variant_task(
+    team_rules: TeamStructureRules,
+    rounds: Mapping[int, Round],
+    variant: SweepVariant,
+    config: SweepConfig,
+) -> SweepResult:
+    try:
+        return solve_variant(_WORKER_PLAYERS, team_rules, rounds, variant, config)
+    except Exception as e:  # one failing variant must not abort the sweep
+        logger.exception("Sweep variant %s failed", variant.name)
+        return SweepResult(
+            name=variant.name,
+            status="Error",
+            objective_value=0.0,
+            build_seconds=0.0,
+            solve_seconds=0.0,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+
+def run_sweep(
+    *,
+    players: Mapping[int, Player] | SeasonStore,
+    team_rules: TeamStructureRules,
+    rounds: Mapping[int, Round],
+    variants: Iterable[SweepVariant],
+    config: SweepConfig | None = None,
+    max_workers: int | None = None,
+) -> List[SweepResult]:
+    """Solve every variant across a process pool; results follow ``variants`` order.
+
+    Parameters
+    ----------
+    players:
+        Season data, sent to each worker once. A :class:`SeasonStore` is a
+        handful of arrays, so it pickles far faster than ``Player`` objects.
+    max_workers:
+        Number of worker processes. Defaults to ``os.cpu_count() //
+        threads_per_worker``. ``1`` still uses a worker process, so the
+        parent's memory stays flat.
+    """
+
+    config = config or SweepConfig()
+    variants = list(variants)
+    if not variants:
+        return []
+    if len({v.name for v in variants}) != len(variants):
+        raise ValueError("Sweep variant names must be unique")
+
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // max(1, config.threads_per_worker or 1))
+    max_workers = min(max_workers, len(variants))
+
+    if config.output_dir is not None:
+        Path(config.output_dir).mkdir(parents=True, exist_ok=True)
+
+    logger.info(
+        "Sweeping %d variants on %d workers (threads per worker=%s)",
+        len(variants),
+        max_workers,
+        config.threads_per_worker,
+    )
+    # Shipped to each worker once; variants only carry their rule overrides.
+    worker_players = players if isinstance(players, SeasonStore) else dict(players)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(worker_players,),
+    ) as pool:
+        futures = [pool.submit(_solve_variant_task, team_rules, dict(rounds), v, config) for v in variants]
+        results = [f.result() for f in futures]
+
+    for r in results:
+        logger.info(
+            "  %s: status=%s objective=%s build=%.3fs solve=%.3fs",
+            r.name,
+            r.status,
+            r.objective_value,
+            r.build_seconds,
+            r.solve_seconds,
+        )
+    return results
+
+
+def write_sweep_summary_csv(path: str | Path, results: Sequence[SweepResult]) -> None:
+    """Write one row per variant."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=[fl.name for fl in fields(SweepResult)])
+        writer.writeheader()
+        for r in results:
+            writer.writerow(asdict(r))
+
+
+def format_sweep_table(results: Sequence[SweepResult]) -> str:
+    """Fixed-width text table of the results (best objective first)."""
+
+    header = ("variant", "status", "objective", "build_s", "solve_s")
+    rows = [
+        (r.name, r.status, f"{r.objective_value:.1f}", f"{r.build_seconds:.2f}", f"{r.solve_seconds:.2f}")
+        for r in sorted(results, key=lambda r: -r.objective_value)
+    ]
+    widths = [max(len(str(row[i])) for row in [header, *rows]) for i in range(len(header))]
+    lines = ["  ".join(str(cell).ljust(w) for cell, w in zip(row, widths)) for row in [header, *rows]]
+    return "\n".join(lines)
+
+
+def _parse_grid(raw: Mapping[str, Any]) -> Dict[str, List[Any]]:
+    """JSON grid -> sweep_grid axes (per-round mappings get int round keys)."""
+
+    axes: Dict[str, List[Any]] = {}
+    for name, values in raw.items():
+        if not isinstance(values, list):
+            values = [values]
+        axes[name] = [
+            {int(r): int(v) for r, v in value.items()} if isinstance(value, Mapping) else value for value in values
+        ]
+    return axes
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+
+    parser = argparse.ArgumentParser(description="Solve a grid of rule variants in parallel.")
+    parser.add_argument("grid", type=Path, help="JSON object: override name -> list of values")
+    parser.add_argument("--data-dir", type=Path, default=repo_root / "data")
+    parser.add_argument("--out", type=Path, default=repo_root / "output" / "sweep")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--threads-per-worker", type=int, default=1)
+    parser.add_argument("--solver", default=None)
+    parser.add_argument("--time-limit", type=int, default=None)
+    parser.add_argument("--mip-gap", type=float, default=None)
+    parser.add_argument("--lean", action="store_true")
+    parser.add_argument("--trade-flow", action="store_true")
+    parser.add_argument("--continuous-scoring", action="store_true")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+
+    data_dir: Path = args.data_dir
+    data_filter_path = data_dir / "data_filter.json"
+    raw_filter = json.loads(data_filter_path.read_text(encoding="utf-8-sig")) if data_filter_path.exists() else {}
+    num_rounds = raw_filter.get("num_rounds")
+    squad_ids = [int(x) for x in (raw_filter.get("squad_ids") or [])]
+
+    players = load_players(
+        players_json_path=data_dir / "players_final.json",
+        position_updates_csv_path=data_dir / "position_updates.csv",
+        squad_id_filter=frozenset(squad_ids) if squad_ids else None,
+    )
+    team_rules = load_team_rules_from_json(data_dir / "team_rules.json")
+    rounds = load_rounds_from_json(data_dir / "rounds.json", num_rounds=int(num_rounds) if num_rounds else None)
+
+    variants = sweep_grid(**_parse_grid(json.loads(args.grid.read_text(encoding="utf-8-sig"))))
+    results = run_sweep(
+        players=SeasonStore.from_players(players),
+        team_rules=team_rules,
+        rounds=rounds,
+        variants=variants,
+        config=SweepConfig(
+            solver=args.solver,
+            time_limit_seconds=args.time_limit,
+            mip_gap=args.mip_gap,
+            threads_per_worker=args.threads_per_worker,
+            options=FormulationOptions(
+                lean=args.lean, trade_flow=args.trade_flow, continuous_scoring=args.continuous_scoring
+            ),
+            output_dir=args.out,
+        ),
+        max_workers=args.workers,
+    )
+
+    write_sweep_summary_csv(args.out / "sweep_summary.csv", results)
+    print(format_sweep_table(results))
+
+
+if __name__ == "__main__":
+    main()
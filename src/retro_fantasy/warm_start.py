@@ -0,0 +1,283 @@
+"""MIP warm starts from a previous solution.
+
+A previous run's :class:`~retro_fantasy.solution.SolutionSummary` (or its
+``solution.json``) is usually close to optimal for a slightly different
+configuration. This module turns it into a complete, feasible assignment of
+every decision variable under the *current* :class:`ModelInputData`, which the
+solver can then use as a MIP start.
+
+Repair rules
+------------
+The prior squads are replayed round by round:
+
+- Players no longer in the input are dropped. In round 1, any gaps are filled
+  with the cheapest eligible players; if the squad then exceeds the salary cap
+  the warm start is abandoned.
+- In later rounds the prior plan's own trades (its squad this round against
+  its squad the round before) are replayed on the current squad, one
+  (out, in) pair at a time. A pair is made only if both players have a price
+  that round, the bank stays non-negative, the round's trade limit is not
+  exceeded and the squad still fits the positional structure; the other
+  pairs are skipped and the round is recorded as repaired. Current players
+  the prior plan no longer holds (e.g. round-1 fill-ins) can be traded out in
+  place of prior players missing from the input, so one difference does not
+  stop every later trade. Eligibility only grows during a season, so the
+  held squad normally still fits; if it does not, the warm start is
+  abandoned.
+- Rounds beyond the prior solution keep the last squad.
+
+Slots keep their prior assignment where still valid; the rest are filled by
+bipartite matching. The ``counted_onfield_players`` highest on-field scores are
+counted and the best of those is captain.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from retro_fantasy.data import ModelInputData, Position
+from retro_fantasy.formulation import DecisionVariables
+from retro_fantasy.matrix import MatrixModel
+from retro_fantasy.slots import Slot, assign_slots, fill_round_1_squad
+from retro_fantasy.solution import SolutionSummary, load_solution_summary
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class WarmStart:
+    """Initial values keyed like :class:`~retro_fantasy.formulation.DecisionVariables`.
+
+    Keys that are absent have an initial value of 0.
+    """
+
+    x_selected: Dict[Tuple[int, int], float] = field(default_factory=dict)
+    y_onfield: Dict[Tuple[int, Position, int], float] = field(default_factory=dict)
+    y_bench: Dict[Tuple[int, Position, int], float] = field(default_factory=dict)
+    y_utility: Dict[Tuple[int, int], float] = field(default_factory=dict)
+    captain: Dict[Tuple[int, int], float] = field(default_factory=dict)
+    scored: Dict[Tuple[int, int], float] = field(default_factory=dict)
+    traded_in: Dict[Tuple[int, int], float] = field(default_factory=dict)
+    traded_out: Dict[Tuple[int, int], float] = field(default_factory=dict)
+    bank: Dict[int, float] = field(default_factory=dict)
+
+    # Rounds where the prior squad could not be used as-is.
+    repaired_rounds: List[int] = field(default_factory=list)
+
+
+def _prior_trades(
+    squad: list[int],
+    prior: tuple[list[int], Dict[int, Slot]] | None,
+    previous: tuple[list[int], Dict[int, Slot]] | None,
+) -> tuple[list[int], list[int]]:
+    """The prior plan's trades into a round, as they apply to the current ``squad``: (ins, outs).
+
+    Ins are the players the prior plan brought in (in its squad this round but
+    not the round before) that ``squad`` does not hold yet. Outs are the
+    players it let go that ``squad`` still holds, then any other ``squad``
+    players the prior plan does not hold this round (e.g. round-1 fill-ins for
+    players missing from the input).
+    """
+
+    if prior is None or previous is None:
+        return [], []
+    held = set(squad)
+    now, before = set(prior[0]), set(previous[0])
+    ins = [p for p in prior[0] if p not in before and p not in held]
+    outs = [p for p in previous[0] if p not in now and p in held]
+    outs += [p for p in squad if p not in now and p not in outs]
+    return ins, outs
+
+
+def _replay_trades(
+    model_input_data: ModelInputData,
+    squad: list[int],
+    bank: float,
+    r: int,
+    ins: list[int],
+    outs: list[int],
+    preferred: Dict[int, Slot],
+) -> tuple[list[int], float, list[tuple[int, int]]]:
+    """Make the round-``r`` trades ``ins`` / ``outs`` that the current rules allow, one pair at a time.
+
+    Each incoming player is paired with the first outgoing player such that
+    both have a round-``r`` price, the bank stays non-negative and the squad
+    still fits the positional structure; at most ``max_trades(r)`` pairs are
+    made. Passes repeat while they make progress, so a trade that releases
+    cash can unlock one that was unaffordable before it.
+
+    Returns the new squad, the new bank and the (out, in) pairs made.
+    """
+
+    j = model_input_data.round_index[r]
+    pi = model_input_data.player_index
+    prices, has_prices = model_input_data.prices, model_input_data.has_prices
+    limit = model_input_data.max_trades(r)
+
+    pending = [p for p in ins if has_prices[pi[p], j]]
+    available = [p for p in outs if has_prices[pi[p], j]]
+    made: list[tuple[int, int]] = []
+    progress = True
+    while pending and progress and len(made) < limit:
+        progress = False
+        for p_in in list(pending):
+            if len(made) >= limit:
+                break
+            for p_out in available:
+                new_bank = bank + prices[pi[p_out], j] - prices[pi[p_in], j]
+                if new_bank < 0:
+                    continue
+                trial = [p_in if p == p_out else p for p in squad]
+                if assign_slots(model_input_data, trial, r, preferred) is None:
+                    continue
+                squad, bank = trial, float(new_bank)
+                made.append((p_out, p_in))
+                available.remove(p_out)
+                pending.remove(p_in)
+                progress = True
+                break
+    return squad, bank, made
+
+
+def build_warm_start(model_input_data: ModelInputData, summary: SolutionSummary) -> WarmStart | None:
+    """Map ``summary`` onto the current model, repairing it where needed.
+
+    Returns ``None`` if no feasible starting squad can be derived (e.g. the
+    repaired round-1 squad exceeds the salary cap).
+    """
+
+    known = set(model_input_data.players)
+    rounds = model_input_data.round_numbers
+    pi, ri = model_input_data.player_index, model_input_data.round_index
+    prices = model_input_data.prices
+    scores = model_input_data.scores
+
+    def prior_squad(r: int) -> tuple[list[int], Dict[int, Slot]] | None:
+        detail = summary.rounds.get(r)
+        if detail is None:
+            return None
+        squad = [e.player_id for e in detail.team if e.player_id in known]
+        preferred: Dict[int, Slot] = {
+            e.player_id: (e.slot, Position(e.position) if e.position else None)
+            for e in detail.team
+            if e.player_id in known
+        }
+        return squad, preferred
+
+    def prior_ids(r: int) -> set[int]:
+        detail = summary.rounds.get(r)
+        return {e.player_id for e in detail.team} if detail is not None else set()
+
+    ws = WarmStart()
+    squad: list[int] = []
+    slots: Dict[int, Slot] = {}
+    bank = 0.0
+
+    previous_prior: tuple[list[int], Dict[int, Slot]] | None = None
+    for t, r in enumerate(rounds):
+        j = ri[r]
+        prior = prior_squad(r)
+
+        if t == 0:
+            proposed, preferred = prior if prior is not None else ([], {})
+            assignment = assign_slots(model_input_data, proposed, r, preferred)
+            if assignment is None:
+                ws.repaired_rounds.append(r)
+                proposed = fill_round_1_squad(model_input_data, proposed, preferred)
+                assignment = assign_slots(model_input_data, proposed, r, preferred)
+            spend = sum(prices[pi[p], j] for p in proposed)
+            if assignment is None or spend > model_input_data.salary_cap:
+                logger.warning("Warm start abandoned: no feasible round-%d squad under the current rules", r)
+                return None
+            squad, slots = proposed, assignment
+            bank = model_input_data.salary_cap - spend
+        else:
+            preferred = prior[1] if prior is not None else {}
+            ins, outs = _prior_trades(squad, prior, previous_prior)
+            squad, bank, made = _replay_trades(model_input_data, squad, bank, r, ins, outs, preferred)
+            for p_out, p_in in made:
+                ws.traded_out[(p_out, r)] = 1.0
+                ws.traded_in[(p_in, r)] = 1.0
+            # Prior trades that brought in players missing from the input are skipped too.
+            unknown_ins = False
+            if prior is not None and previous_prior is not None:
+                unknown_ins = any(p not in known for p in prior_ids(r) - prior_ids(rounds[t - 1]))
+            if len(made) < len(ins) or unknown_ins:
+                ws.repaired_rounds.append(r)
+
+            assignment = assign_slots(model_input_data, squad, r, {**slots, **preferred})
+            if assignment is None:
+                logger.warning("Warm start abandoned: round-%d squad no longer fits the positional structure", r)
+                return None
+            slots = assignment
+
+        ws.bank[r] = float(bank)
+
+        counted = model_input_data.counted_onfield_players(r)
+        onfield = sorted(
+            (p for p, slot in slots.items() if slot[0] == "on_field"),
+            key=lambda p: (-scores[pi[p], j], p),
+        )
+        for p, (kind, k) in slots.items():
+            ws.x_selected[(p, r)] = 1.0
+            if kind == "on_field":
+                ws.y_onfield[(p, k, r)] = 1.0
+            elif kind == "bench":
+                ws.y_bench[(p, k, r)] = 1.0
+            else:
+                ws.y_utility[(p, r)] = 1.0
+        for p in onfield[:counted]:
+            ws.scored[(p, r)] = 1.0
+        if counted and onfield:
+            ws.captain[(onfield[0], r)] = 1.0
+        previous_prior = prior
+
+    if ws.repaired_rounds:
+        logger.info("Warm start repaired rounds: %s", ws.repaired_rounds)
+    return ws
+
+
+def load_warm_start(
+    model_input_data: ModelInputData,
+    source: SolutionSummary | str | Path,
+) -> WarmStart | None:
+    """:func:`build_warm_start` from a summary or a ``solution.json`` path."""
+
+    summary = source if isinstance(source, SolutionSummary) else load_solution_summary(source)
+    return build_warm_start(model_input_data, summary)
+
+
+def apply_warm_start(decision_variables: DecisionVariables, warm_start: WarmStart) -> None:
+    """Set every variable's initial value (use with a solver created with ``warmStart=True``)."""
+
+    for family in (
+        "x_selected",
+        "y_onfield",
+        "y_bench",
+        "y_utility",
+        "captain",
+        "scored",
+        "traded_in",
+        "traded_out",
+        "bank",
+    ):
+        values = getattr(warm_start, family)
+        for key, var in getattr(decision_variables, family).items():
+            var.setInitialValue(values.get(key, 0.0))
+
+
+def warm_start_vector(matrix_model: MatrixModel, warm_start: WarmStart) -> np.ndarray:
+    """Column-aligned initial values for ``matrix_model``."""
+
+    values = np.zeros(matrix_model.num_cols, dtype=np.float64)
+    for family, (start, _stop) in matrix_model.families.items():
+        family_values = getattr(warm_start, family)
+        for j, key in enumerate(matrix_model.family_keys[family], start=start):
+            values[j] = family_values.get(key, 0.0)
+    return values
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
+import numpy as np
+import pulp
 import pytest
 
+from retro_fantasy.data import ModelInputData, Player, PlayerRoundInfo, Position, Round, TeamStructureRules
+from retro_fantasy.formulation import formulate_problem
+from retro_fantasy.io import DEFAULT_POSITION_CODE_MAP
+from retro_fantasy.matrix import MatrixModel, MatrixSolveResult, solve_matrix_model_with_pulp
+
 
 # Ensure repo root is importable (for helper modules like scripts/*).
 _REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -52,3 +60,129 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
     for item in items:
         if "perf" in item.keywords:
             item.add_marker(skip_perf)
+
+
+# ============================================================================
+# Shared test helpers (import with ``from conftest import ...``)
+# ============================================================================
+
+
+def make_input_data() -> ModelInputData:
+    # Small but structurally rich instance:
+    # - 3 rounds (so trade/bank recurrence rows exist)
+    # - a DPP player gaining MID from round 2
+    # - a player with no round-3 data (missing price -> trade bans, fallback price)
+    # - a zero-price/zero-score entry (PuLP drops zero coefficients)
+    rules = TeamStructureRules(
+        on_field_required={Position.DEF: 1, Position.MID: 1, Position.RUC: 0, Position.FWD: 0},
+        bench_required={Position.DEF: 1, Position.MID: 0, Position.RUC: 0, Position.FWD: 0},
+        salary_cap=100.0,
+        utility_bench_count=1,
+    )
+    rounds = {
+        1: Round(number=1, max_trades=0, counted_onfield_players=2),
+        2: Round(number=2, max_trades=1, counted_onfield_players=1),
+        3: Round(number=3, max_trades=2, counted_onfield_players=2),
+    }
+
+    def _player(pid: int, data: dict[int, tuple[float, float, frozenset[Position]]]) -> Player:
+        player = Player(player_id=pid, first_name=f"P{pid}", last_name="X", original_positions=frozenset({Position.DEF}))
+        for r, (score, price, eligible) in data.items():
+            player.by_round[r] = PlayerRoundInfo(round_number=r, score=score, price=price, eligible_positions=eligible)
+        return player
+
+    d = frozenset({Position.DEF})
+    m = frozenset({Position.MID})
+    dm = frozenset({Position.DEF, Position.MID})
+
+    players = {
+        1: _player(1, {1: (10.0, 20.0, d), 2: (12.0, 22.0, dm), 3: (8.0, 25.0, dm)}),
+        2: _player(2, {1: (5.0, 10.0, m), 2: (0.0, 0.0, m), 3: (9.0, 12.0, m)}),
+        3: _player(3, {1: (7.0, 15.0, d), 2: (6.0, 14.0, d)}),
+        4: _player(4, {1: (3.0, 5.0, m), 2: (4.0, 6.0, m), 3: (11.0, 9.0, m)}),
+        5: _player(5, {1: (1.0, 2.0, d), 2: (2.0, 3.0, d), 3: (1.0, 3.0, d)}),
+    }
+    return ModelInputData(players=players, rounds=rounds, team_rules=rules)
+
+
+def make_random_input_data(*, seed: int = 7, num_players: int = 30, num_rounds: int = 6) -> ModelInputData:
+    """A season with rising/falling prices, DPP players and a bye round."""
+
+    rng = np.random.default_rng(seed)
+    rules = TeamStructureRules(
+        on_field_required={Position.DEF: 2, Position.MID: 3, Position.RUC: 1, Position.FWD: 2},
+        bench_required={Position.DEF: 1, Position.MID: 1, Position.RUC: 0, Position.FWD: 1},
+        salary_cap=1_000.0,
+        utility_bench_count=1,
+    )
+    rounds = {
+        r: Round(number=r, max_trades=2 if r > 1 else 0, counted_onfield_players=6 if r == 4 else 8)
+        for r in range(1, num_rounds + 1)
+    }
+    positions = list(Position)
+    players = {}
+    for pid in range(1, num_players + 1):
+        eligible = frozenset(positions[k] for k in rng.choice(len(positions), size=rng.integers(1, 3), replace=False))
+        ability = rng.uniform(20, 110)
+        price = max(5.0, ability * 1.1 + rng.normal(0, 15))
+        player = Player(player_id=pid, first_name=f"P{pid}", last_name="X")
+        for r in range(1, num_rounds + 1):
+            score = 0.0 if (r == 4 and pid % 3 == 0) else max(0.0, ability + rng.normal(0, 20))
+            player.by_round[r] = PlayerRoundInfo(round_number=r, score=score, price=price, eligible_positions=eligible)
+            price = max(5.0, 0.7 * price + 0.3 * 1.1 * score)
+        players[pid] = player
+    return ModelInputData(players=players, rounds=rounds, team_rules=rules)
+
+
+def write_season_files(directory: Path, data: ModelInputData) -> tuple[Path, Path]:
+    """Write ``data``'s players as ``players_final.json`` plus an empty position update CSV.
+
+    Positions are taken from each player's first round, so players must not
+    gain positions mid-season.
+    """
+
+    codes = {position: code for code, position in DEFAULT_POSITION_CODE_MAP.items()}
+    records = []
+    for pid, player in data.players.items():
+        first = player.by_round[min(player.by_round)]
+        records.append(
+            {
+                "id": pid,
+                "first_name": player.first_name,
+                "last_name": player.last_name,
+                "squad_id": 1,
+                "original_positions": sorted(codes[p] for p in first.eligible_positions),
+                "stats": {
+                    "prices": {str(r): info.price for r, info in player.by_round.items()},
+                    "scores": {str(r): info.score for r, info in player.by_round.items()},
+                },
+            }
+        )
+
+    players_json = directory / "players_final.json"
+    players_json.write_text(json.dumps(records), encoding="utf-8")
+    updates_csv = directory / "position_updates.csv"
+    updates_csv.write_text("player,initial_position,add_position,round\n", encoding="utf-8")
+    return players_json, updates_csv
+
+
+def constraint_signature(problem: pulp.LpProblem) -> list[tuple[str, int, float, dict[str, float]]]:
+    return [
+        (name, c.sense, c.constant, {v.name: coef for v, coef in c.items()})
+        for name, c in problem.constraints.items()
+    ]
+
+
+def cbc_matrix_solver(matrix_model: MatrixModel, initial_values: np.ndarray | None) -> MatrixSolveResult:
+    """Quiet CBC ``MatrixSolver`` for the decomposition tests, using the MIP start if given."""
+
+    solver = pulp.PULP_CBC_CMD(msg=False, warmStart=initial_values is not None)
+    return solve_matrix_model_with_pulp(matrix_model, solver, initial_values=initial_values)
+
+
+def cbc_optimum(data: ModelInputData) -> float:
+    """Optimal objective of the full formulation, solved with CBC."""
+
+    problem, _ = formulate_problem(data)
+    assert pulp.LpStatus[problem.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    return float(pulp.value(problem.objective))
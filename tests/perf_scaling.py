@@ -0,0 +1,290 @@
+"""Scaling benchmark over a (number of squads) x (number of rounds) grid.
+
+Each grid cell restricts the production data to the first ``n`` squads (by
+``squad_id``) and the first ``r`` rounds, then runs the same measurement as the
+single-scenario perf test (:func:`perf_utils.run_solve_and_measure`): build
+time, solve time, problem size and objective.
+
+A power law ``seconds ~ coefficient * num_variables ** exponent`` is fitted to
+the build and solve times; local exponents between neighbouring cells show
+where the model goes superlinear.
+
+Run the grid directly (writes ``scaling.json`` and, if matplotlib is installed,
+``scaling.png``)::
+
+    python tests/perf_scaling.py --squads 2 4 6 --rounds 2 3 4 --out output/perf
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from perf_utils import PerfScenario, compute_median_result, run_solve_and_measure
+from retro_fantasy.formulation import FormulationOptions
+
+
+DEFAULT_SQUAD_COUNTS = (2, 4, 6)
+DEFAULT_ROUND_COUNTS = (2, 3, 4)
+
+# Metrics fitted against problem size (number of variables).
+SCALING_METRICS = ("build_seconds", "solve_seconds", "num_constraints")
+
+
+@dataclass(frozen=True, slots=True)
+class ScalingCellResult:
+    num_squads: int
+    num_rounds: int
+    squad_ids: tuple[int, ...]
+    status: str
+    objective_value: float
+    solution_fingerprint: str
+    num_variables: int
+    num_constraints: int
+    build_seconds: float
+    solve_seconds: float
+    solver: str
+
+
+@dataclass(frozen=True, slots=True)
+class PowerLawFit:
+    """``y ~ coefficient * x ** exponent`` (least squares in log-log space)."""
+
+    coefficient: float
+    exponent: float
+
+    def predict(self, x: float) -> float:
+        return self.coefficient * x**self.exponent
+
+
+def squad_ids_in(players_json_path: Path) -> list[int]:
+    raw = json.loads(players_json_path.read_text(encoding="utf-8"))
+    return sorted({int(rec["squad_id"]) for rec in raw if rec.get("squad_id") is not None})
+
+
+def run_scaling_cell(
+    *,
+    data_dir: Path,
+    squad_ids: Sequence[int],
+    num_rounds: int,
+    work_dir: Path,
+    repeats: int = 1,
+    build_mode: str = "pulp",
+    options: FormulationOptions = FormulationOptions(),
+    time_limit_seconds: int | None = None,
+) -> ScalingCellResult:
+    """Measure one grid cell (median over ``repeats`` runs)."""
+
+    name = f"scaling_{len(squad_ids)}_squads_{num_rounds}_rounds"
+    data_filter_path = work_dir / f"{name}.json"
+    data_filter_path.write_text(
+        json.dumps({"num_rounds": num_rounds, "squad_ids": list(squad_ids)}), encoding="utf-8"
+    )
+
+    scenario = PerfScenario(
+        name=name,
+        players_json_path=data_dir / "players_final.json",
+        position_updates_csv_path=data_dir / "position_updates.csv",
+        team_rules_json_path=data_dir / "team_rules.json",
+        rounds_json_path=data_dir / "rounds.json",
+        data_filter_json_path=data_filter_path,
+        repeats=repeats,
+        build_mode=build_mode,
+        options=options,
+    )
+    result = compute_median_result(
+        run_solve_and_measure(scenario, time_limit_seconds=time_limit_seconds) for _ in range(repeats)
+    )
+
+    return ScalingCellResult(
+        num_squads=len(squad_ids),
+        num_rounds=num_rounds,
+        squad_ids=tuple(squad_ids),
+        status=result.status,
+        objective_value=result.objective_value,
+        solution_fingerprint=result.solution_fingerprint,
+        num_variables=result.problem_metrics.num_variables,
+        num_constraints=result.problem_metrics.num_constraints,
+        build_seconds=result.build_seconds,
+        solve_seconds=result.phase_seconds.get("solve", result.solve_seconds),
+        solver=result.solver,
+    )
+
+
+def run_scaling_grid(
+    *,
+    data_dir: Path,
+    squad_counts: Iterable[int] = DEFAULT_SQUAD_COUNTS,
+    round_counts: Iterable[int] = DEFAULT_ROUND_COUNTS,
+    repeats: int = 1,
+    build_mode: str = "pulp",
+    options: FormulationOptions = FormulationOptions(),
+    time_limit_seconds: int | None = None,
+) -> list[ScalingCellResult]:
+    """Measure every (squad count, round count) cell, smallest first.
+
+    The first ``n`` squads by ``squad_id`` are used, so cells are nested and
+    reproducible.
+    """
+
+    all_squads = squad_ids_in(data_dir / "players_final.json")
+    results: list[ScalingCellResult] = []
+    with tempfile.TemporaryDirectory(prefix="retro_fantasy_scaling_") as tmp:
+        for num_squads in sorted(set(squad_counts)):
+            if num_squads > len(all_squads):
+                raise ValueError(f"Requested {num_squads} squads but the data only has {len(all_squads)}")
+            for num_rounds in sorted(set(round_counts)):
+                results.append(
+                    run_scaling_cell(
+                        data_dir=data_dir,
+                        squad_ids=all_squads[:num_squads],
+                        num_rounds=num_rounds,
+                        work_dir=Path(tmp),
+                        repeats=repeats,
+                        build_mode=build_mode,
+                        options=options,
+                        time_limit_seconds=time_limit_seconds,
+                    )
+                )
+    return results
+
+
+def fit_power_law(x: Sequence[float], y: Sequence[float]) -> PowerLawFit:
+    """Fit ``y ~ a * x**b`` over the points where both are positive."""
+
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    keep = (xs > 0) & (ys > 0)
+    if len(np.unique(xs[keep])) < 2:
+        raise ValueError("Need at least two distinct positive x values to fit a power law")
+    exponent, log_coefficient = np.polyfit(np.log(xs[keep]), np.log(ys[keep]), 1)
+    return PowerLawFit(coefficient=float(math.exp(log_coefficient)), exponent=float(exponent))
+
+
+def local_exponents(results: Sequence[ScalingCellResult], metric: str) -> list[dict[str, Any]]:
+    """Log-log slope of ``metric`` vs ``num_variables`` between size-neighbouring cells.
+
+    Slopes well above 1 mark where the metric grows superlinearly.
+    """
+
+    ordered = sorted(results, key=lambda c: c.num_variables)
+    slopes: list[dict[str, Any]] = []
+    for a, b in zip(ordered, ordered[1:]):
+        ya, yb = getattr(a, metric), getattr(b, metric)
+        if a.num_variables == b.num_variables or ya <= 0 or yb <= 0:
+            continue
+        slopes.append(
+            {
+                "from": (a.num_squads, a.num_rounds),
+                "to": (b.num_squads, b.num_rounds),
+                "exponent": math.log(yb / ya) / math.log(b.num_variables / a.num_variables),
+            }
+        )
+    return slopes
+
+
+def scaling_report(results: Sequence[ScalingCellResult]) -> dict[str, Any]:
+    """JSON-serialisable grid results with power-law fits per metric."""
+
+    sizes = [c.num_variables for c in results]
+    fits: dict[str, Any] = {}
+    for metric in SCALING_METRICS:
+        try:
+            fits[metric] = asdict(fit_power_law(sizes, [getattr(c, metric) for c in results]))
+        except ValueError:
+            fits[metric] = None
+        fits[metric + "_local_exponents"] = local_exponents(results, metric)
+
+    return {"cells": [asdict(c) for c in results], "fits_vs_num_variables": fits}
+
+
+def plot_scaling(results: Sequence[ScalingCellResult], path: Path) -> bool:
+    """Write a log-log plot of build/solve seconds vs variables. Returns ``False`` without matplotlib."""
+
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+
+    fig, axes = plt.subplots(1, 2, figsize=(11, 4.5))
+    sizes = np.array(sorted({c.num_variables for c in results}), dtype=np.float64)
+    for ax, metric in zip(axes, ("build_seconds", "solve_seconds")):
+        for num_squads in sorted({c.num_squads for c in results}):
+            cells = sorted((c for c in results if c.num_squads == num_squads), key=lambda c: c.num_variables)
+            ax.plot(
+                [c.num_variables for c in cells],
+                [getattr(c, metric) for c in cells],
+                marker="o",
+                label=f"{num_squads} squads",
+            )
+        try:
+            fit = fit_power_law([c.num_variables for c in results], [getattr(c, metric) for c in results])
+            ax.plot(sizes, fit.predict(sizes), "k--", label=f"fit: exponent {fit.exponent:.2f}")
+        except ValueError:
+            pass
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("variables")
+        ax.set_ylabel(metric.replace("_", " "))
+        ax.legend()
+
+    fig.tight_layout()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+    return True
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--squads", type=int, nargs="+", default=list(DEFAULT_SQUAD_COUNTS))
+    parser.add_argument("--rounds", type=int, nargs="+", default=list(DEFAULT_ROUND_COUNTS))
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--build-mode", default="pulp")
+    parser.add_argument("--lean", action="store_true")
+    parser.add_argument("--time-limit", type=int, default=None)
+    parser.add_argument("--out", type=Path, default=repo_root / "output" / "perf")
+    args = parser.parse_args(argv)
+
+    results = run_scaling_grid(
+        data_dir=repo_root / "data",
+        squad_counts=args.squads,
+        round_counts=args.rounds,
+        repeats=args.repeats,
+        build_mode=args.build_mode,
+        options=FormulationOptions(lean=args.lean),
+        time_limit_seconds=args.time_limit,
+    )
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    report = scaling_report(results)
+    (args.out / "scaling.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+    plotted = plot_scaling(results, args.out / "scaling.png")
+
+    for c in results:
+        print(
+            f"{c.num_squads:>3} squads {c.num_rounds:>3} rounds: vars={c.num_variables:>7} "
+            f"cons={c.num_constraints:>7} build={c.build_seconds:8.3f}s solve={c.solve_seconds:8.3f}s "
+            f"status={c.status} objective={c.objective_value}"
+        )
+    for metric in SCALING_METRICS:
+        fit = report["fits_vs_num_variables"][metric]
+        if fit is not None:
+            print(f"{metric}: ~ vars^{fit['exponent']:.2f}")
+    print(f"Wrote {args.out / 'scaling.json'}" + (f" and {args.out / 'scaling.png'}" if plotted else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import json
 import os
 import platform
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import median
@@ -13,9 +13,11 @@ from typing import Any, Iterable, Mapping
 
 import pulp
 
-from retro_fantasy.formulation import formulate_problem
-from retro_fantasy.io import load_players_from_json, load_rounds_from_json, load_team_rules_from_json
-from retro_fantasy.main import build_model_input_data
+from retro_fantasy.data import ModelInputData
+from retro_fantasy.formulation import FormulationOptions, formulate_problem
+from retro_fantasy.instrumentation import instrument_method, record_phases, span
+from retro_fantasy.io import load_rounds_from_json, load_team_rules_from_json
+from retro_fantasy.main import build_model_input_data, load_players
 from retro_fantasy.solution import build_solution_summary, solution_summary_to_json_dict
 
 
@@ -32,6 +34,12 @@ class PerfScenario:
     # Median makes results much less noisy than a single run.
     repeats: int = 3
 
+    # Model build mode passed to formulate_problem ("pulp" or "matrix").
+    build_mode: str = "pulp"
+
+    # Formulation variant switches passed to formulate_problem.
+    options: FormulationOptions = FormulationOptions()
+
 
 @dataclass(frozen=True, slots=True)
 class ProblemMetrics:
@@ -55,6 +63,12 @@ class PerfBaseline:
     median_solve_seconds: float
     problem_metrics: ProblemMetrics
 
+    # Older baselines predate build timing; 0.0 means "not recorded".
+    median_build_seconds: float = 0.0
+
+    # Median wall seconds per instrumented phase (empty in older baselines).
+    median_phase_seconds: dict[str, float] = field(default_factory=dict)
+
 
 @dataclass(frozen=True, slots=True)
 class PerfRunResult:
@@ -65,6 +79,12 @@ class PerfRunResult:
     problem_metrics: ProblemMetrics
     solver: str
 
+    # Wall time spent in formulate_problem only (a subset of solve_seconds).
+    build_seconds: float = 0.0
+
+    # Wall seconds per instrumented phase (see retro_fantasy.instrumentation).
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+
 
 def _collect_problem_metrics(problem: pulp.LpProblem) -> ProblemMetrics:
     vars_list = problem.variables()
@@ -120,14 +140,7 @@ def _build_perf_solver(*, time_limit_seconds: int | None, enable_solver_output:
     return pulp.PULP_CBC_CMD(msg=enable_solver_output), "CBC (via PuLP)"
 
 
-def run_solve_and_measure(
-    scenario: PerfScenario,
-    *,
-    time_limit_seconds: int | None = None,
-    enable_solver_output: bool = False,
-) -> PerfRunResult:
-    start = time.perf_counter()
-
+def _load_scenario_model_input_data(scenario: PerfScenario) -> ModelInputData:
     data_filter = json.loads(scenario.data_filter_json_path.read_text(encoding="utf-8-sig"))
 
     num_rounds = data_filter.get("num_rounds")
@@ -137,34 +150,80 @@ def run_solve_and_measure(
     team_rules = load_team_rules_from_json(scenario.team_rules_json_path)
     rounds = load_rounds_from_json(scenario.rounds_json_path, num_rounds=int(num_rounds) if num_rounds else None)
 
-    players = load_players_from_json(
-        scenario.players_json_path,
-        position_updates_csv=scenario.position_updates_csv_path,
+    # Uses the on-disk parsed-season cache, so repeats don't re-parse the JSON.
+    players = load_players(
+        players_json_path=scenario.players_json_path,
+        position_updates_csv_path=scenario.position_updates_csv_path,
         squad_id_filter=squad_id_filter,
     )
-    model_input_data = build_model_input_data(players=players, team_rules=team_rules, rounds=rounds)
+    return build_model_input_data(players=players, team_rules=team_rules, rounds=rounds)
 
-    problem, decision_variables = formulate_problem(model_input_data)
-    problem_metrics = _collect_problem_metrics(problem)
 
-    solver, solver_name = _build_perf_solver(
-        time_limit_seconds=time_limit_seconds,
-        enable_solver_output=enable_solver_output,
-    )
+def run_build_and_measure(scenario: PerfScenario) -> tuple[ProblemMetrics, float]:
+    """Formulate (but do not solve) the scenario; return problem metrics and median build seconds.
+
+    Input loading happens once and is excluded from the timing.
+    """
 
-    status_code = problem.solve(solver)
-    status = pulp.LpStatus[status_code]
-    objective_value = float(pulp.value(problem.objective) or 0.0)
+    model_input_data = _load_scenario_model_input_data(scenario)
 
-    if status == "Optimal":
-        summary = build_solution_summary(
-            model_input_data=model_input_data,
-            decision_variables=decision_variables,
-            problem=problem,
+    timings: list[float] = []
+    metrics: ProblemMetrics | None = None
+    for _ in range(scenario.repeats):
+        start = time.perf_counter()
+        problem, _decision_variables = formulate_problem(
+            model_input_data, build_mode=scenario.build_mode, options=scenario.options
         )
-        payload = solution_summary_to_json_dict(summary)
-    else:
-        payload = {"status": status, "objective_value": objective_value}
+        timings.append(time.perf_counter() - start)
+        metrics = _collect_problem_metrics(problem)
+
+    assert metrics is not None
+    return metrics, float(median(timings))
+
+
+def run_solve_and_measure(
+    scenario: PerfScenario,
+    *,
+    time_limit_seconds: int | None = None,
+    enable_solver_output: bool = False,
+) -> PerfRunResult:
+    start = time.perf_counter()
+
+    with record_phases() as phases:
+        with span("load_input"):
+            model_input_data = _load_scenario_model_input_data(scenario)
+
+        build_start = time.perf_counter()
+        with span("formulate"):
+            problem, decision_variables = formulate_problem(
+                model_input_data, build_mode=scenario.build_mode, options=scenario.options
+            )
+        build_seconds = time.perf_counter() - build_start
+        problem_metrics = _collect_problem_metrics(problem)
+
+        solver, solver_name = _build_perf_solver(
+            time_limit_seconds=time_limit_seconds,
+            enable_solver_output=enable_solver_output,
+        )
+
+        with (
+            span("solve"),
+            instrument_method(problem, "writeMPS", "solver.write_model"),
+            instrument_method(problem, "writeLP", "solver.write_model"),
+        ):
+            status_code = problem.solve(solver)
+        status = pulp.LpStatus[status_code]
+        objective_value = float(pulp.value(problem.objective) or 0.0)
+
+        if status == "Optimal":
+            summary = build_solution_summary(
+                model_input_data=model_input_data,
+                decision_variables=decision_variables,
+                problem=problem,
+            )
+            payload = solution_summary_to_json_dict(summary)
+        else:
+            payload = {"status": status, "objective_value": objective_value}
 
     end = time.perf_counter()
 
@@ -177,9 +236,19 @@ def run_solve_and_measure(
         solve_seconds=end - start,
         problem_metrics=problem_metrics,
         solver=solver_name,
+        build_seconds=build_seconds,
+        phase_seconds=phases.totals(),
     )
 
 
+def _median_phase_seconds(results: list[PerfRunResult]) -> dict[str, float]:
+    """Median per phase, over the phases recorded in every run."""
+
+    common = set.intersection(*(set(r.phase_seconds) for r in results))
+    names = [name for name in results[0].phase_seconds if name in common]
+    return {name: float(median([r.phase_seconds[name] for r in results])) for name in names}
+
+
 def fingerprint_solution_payload(payload: Mapping[str, Any]) -> str:
     """Create a stable hash of the (JSON-serialisable) solution payload."""
 
@@ -227,6 +296,8 @@ def compute_median_result(results: Iterable[PerfRunResult]) -> PerfRunResult:
         solve_seconds=float(median([r.solve_seconds for r in results])),
         problem_metrics=results[0].problem_metrics,
         solver=results[0].solver,
+        build_seconds=float(median([r.build_seconds for r in results])),
+        phase_seconds=_median_phase_seconds(results),
     )
 
 
@@ -285,6 +356,8 @@ def make_baseline(scenario: PerfScenario, median_result: PerfRunResult) -> PerfB
             "rounds_json_path": str(scenario.rounds_json_path),
             "data_filter_json_path": str(scenario.data_filter_json_path),
             "repeats": scenario.repeats,
+            "build_mode": scenario.build_mode,
+            "options": asdict(scenario.options),
         },
         created_utc=datetime.now(timezone.utc).isoformat(),
         python=platform.python_version(),
@@ -296,4 +369,6 @@ def make_baseline(scenario: PerfScenario, median_result: PerfRunResult) -> PerfB
         solution_fingerprint=median_result.solution_fingerprint,
         median_solve_seconds=median_result.solve_seconds,
         problem_metrics=median_result.problem_metrics,
+        median_build_seconds=median_result.build_seconds,
+        median_phase_seconds=median_result.phase_seconds,
     )
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pulp
+import pytest
+
+from retro_fantasy.constructive import HEURISTIC_STATUS, ConstructiveConfig, build_constructive_plan
+from retro_fantasy.formulation import formulate_problem
+from retro_fantasy.lns import is_feasible
+from retro_fantasy.matrix import build_matrix_model
+from retro_fantasy.solution import build_solution_summary
+from retro_fantasy.warm_start import apply_warm_start, build_warm_start, warm_start_vector
+
+from conftest import cbc_optimum, make_input_data, make_random_input_data
+
+
+@pytest.mark.parametrize("make_data", [make_input_data, make_random_input_data])
+def test_constructive_plan_is_feasible_for_the_full_model(make_data) -> None:
+    data = make_data()
+    result = build_constructive_plan(data)
+
+    mm = build_matrix_model(data)
+    values = warm_start_vector(mm, result.warm_start)
+    assert is_feasible(mm, values)
+    assert float(mm.objective @ values) == pytest.approx(result.objective_value)
+    assert result.objective_value <= cbc_optimum(data) + 1e-6
+
+
+def test_constructive_plan_trades_within_limits_and_bank() -> None:
+    data = make_random_input_data()
+    ws = build_constructive_plan(data).warm_start
+
+    assert ws.traded_in, "expected the heuristic to trade on a season with moving prices"
+    for r in data.round_numbers[1:]:
+        ins = [p for (p, rr) in ws.traded_in if rr == r]
+        outs = [p for (p, rr) in ws.traded_out if rr == r]
+        assert len(ins) == len(outs) <= data.max_trades(r)
+        assert ws.bank[r] >= -1e-9
+
+
+def test_constructive_summary_is_a_reproducible_warm_start() -> None:
+    data = make_random_input_data()
+    result = build_constructive_plan(data)
+    summary = result.summary
+
+    assert summary.status == HEURISTIC_STATUS
+    assert summary.objective_value == pytest.approx(result.objective_value)
+    assert sum(d.summary.total_team_points for d in summary.rounds.values()) == pytest.approx(result.objective_value)
+
+    # Replaying the summary needs no repairs and gives back the same plan.
+    replayed = build_warm_start(data, summary)
+    assert replayed is not None and replayed.repaired_rounds == []
+    assert replayed.x_selected == result.warm_start.x_selected
+    assert replayed.bank == pytest.approx(result.warm_start.bank)
+
+    # Same summary as one built from a PuLP problem holding the plan.
+    problem, dvs = formulate_problem(data)
+    apply_warm_start(dvs, result.warm_start)
+    problem.status = pulp.LpStatusOptimal
+    from_problem = build_solution_summary(model_input_data=data, decision_variables=dvs, problem=problem)
+    assert from_problem.objective_value == pytest.approx(summary.objective_value)
+    assert replace(from_problem, status=HEURISTIC_STATUS, objective_value=summary.objective_value) == summary
+
+
+def test_constructive_plan_rejects_unaffordable_structure() -> None:
+    data = make_input_data()
+    data = replace(data, team_rules=replace(data.team_rules, salary_cap=1.0))
+    with pytest.raises(ValueError, match="salary cap"):
+        build_constructive_plan(data)
+
+
+def test_constructive_config_validation() -> None:
+    with pytest.raises(ValueError):
+        ConstructiveConfig(horizon=0)
+    with pytest.raises(ValueError):
+        ConstructiveConfig(cash_weight=-1.0)
+    with pytest.raises(ValueError):
+        ConstructiveConfig(candidates_per_out=0)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pulp
+import pytest
+
+from retro_fantasy.formulation import FormulationOptions, formulate_problem
+from retro_fantasy.matrix import build_matrix_model
+from retro_fantasy.solution import build_solution_summary
+
+from conftest import constraint_signature, make_input_data, make_random_input_data
+
+
+CONTINUOUS = FormulationOptions(continuous_scoring=True)
+LEAN_FLOW_CONTINUOUS = FormulationOptions(lean=True, trade_flow=True, continuous_scoring=True)
+
+
+@pytest.mark.parametrize("options", [CONTINUOUS, LEAN_FLOW_CONTINUOUS])
+def test_continuous_scoring_matrix_build_mode_matches_pulp_build_mode(options: FormulationOptions) -> None:
+    data = make_input_data()
+
+    problem_pulp, _ = formulate_problem(data, build_mode="pulp", options=options)
+    problem_matrix, _ = formulate_problem(data, build_mode="matrix", options=options)
+
+    assert constraint_signature(problem_matrix) == constraint_signature(problem_pulp)
+    assert [(v.name, v.lowBound, v.upBound, v.cat) for v in problem_matrix.variables()] == [
+        (v.name, v.lowBound, v.upBound, v.cat) for v in problem_pulp.variables()
+    ]
+
+
+def test_continuous_scoring_drops_two_binaries_per_player_round() -> None:
+    data = make_input_data()
+    full = build_matrix_model(data)
+    continuous = build_matrix_model(data, options=CONTINUOUS)
+
+    n_pr = len(data.player_ids) * len(data.round_numbers)
+    assert int(continuous.integrality.sum()) == int(full.integrality.sum()) - 2 * n_pr
+    assert continuous.num_rows == full.num_rows
+
+    _, dvs = formulate_problem(data, options=CONTINUOUS)
+    assert dvs.scored[(1, 1)].cat == pulp.LpContinuous
+    assert dvs.captain[(1, 1)].cat == pulp.LpContinuous
+    assert dvs.y_onfield[next(iter(dvs.y_onfield))].cat != pulp.LpContinuous
+
+
+@pytest.mark.parametrize("make_data", [make_input_data, make_random_input_data])
+def test_continuous_scoring_solves_to_same_objective_and_summary_points(make_data) -> None:
+    data = make_data()
+
+    full, _ = formulate_problem(data)
+    continuous, continuous_dvs = formulate_problem(data, options=CONTINUOUS)
+
+    assert pulp.LpStatus[full.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.LpStatus[continuous.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.value(continuous.objective) == pytest.approx(pulp.value(full.objective))
+
+    summary = build_solution_summary(model_input_data=data, decision_variables=continuous_dvs, problem=continuous)
+    total = sum(detail.summary.total_team_points for detail in summary.rounds.values())
+    assert total == pytest.approx(summary.objective_value)
+    for r, detail in summary.rounds.items():
+        assert sum(e.scored for e in detail.team) == data.counted_onfield_players(r)
+        assert sum(e.captain for e in detail.team) == 1
+
+
+def test_summary_ranks_fractional_scoring_values() -> None:
+    data = make_input_data()
+    problem, dvs = formulate_problem(data, options=CONTINUOUS)
+    assert pulp.LpStatus[problem.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    before = build_solution_summary(model_input_data=data, decision_variables=dvs, problem=problem)
+
+    # A tied optimum may split the flags; the summary must not read them.
+    for var in (*dvs.scored.values(), *dvs.captain.values()):
+        var.varValue = 0.5
+
+    after = build_solution_summary(model_input_data=data, decision_variables=dvs, problem=problem)
+    assert after == before
+    for r, detail in after.rounds.items():
+        on_field = sorted((e.score for e in detail.team if e.slot == "on_field"), reverse=True)
+        counted = on_field[: data.counted_onfield_players(r)]
+        assert detail.summary.total_team_points == pytest.approx(sum(counted) + counted[0])
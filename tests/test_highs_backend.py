@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import numpy as np
+import pulp
+import pytest
+
+from retro_fantasy.matrix import build_matrix_model, matrix_model_to_pulp
+from retro_fantasy.solution import build_solution_summary
+
+from conftest import make_input_data
+
+highspy = pytest.importorskip("highspy")
+
+from retro_fantasy.highs import (  # noqa: E402
+    HighsIncumbent,
+    apply_highs_result_to_pulp,
+    solve_matrix_model_with_highs,
+)
+
+
+def test_highs_backend_matches_cbc_objective() -> None:
+    data = make_input_data()
+    mm = build_matrix_model(data)
+
+    result = solve_matrix_model_with_highs(mm, mip_gap=0.0, threads=1)
+
+    problem, _ = matrix_model_to_pulp(mm)
+    assert pulp.LpStatus[problem.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+
+    assert result.status == "Optimal"
+    assert result.model_status == "Optimal"
+    assert result.values.shape == (mm.num_cols,)
+    assert result.objective_value == pytest.approx(pulp.value(problem.objective))
+    assert float(mm.objective @ result.values) == pytest.approx(result.objective_value)
+
+
+def test_highs_solution_feeds_solution_summary() -> None:
+    data = make_input_data()
+    mm = build_matrix_model(data)
+    problem, dvs = matrix_model_to_pulp(mm)
+
+    result = solve_matrix_model_with_highs(mm)
+    apply_highs_result_to_pulp(problem, dvs, mm, result)
+
+    summary = build_solution_summary(model_input_data=data, decision_variables=dvs, problem=problem)
+    assert summary.status == "Optimal"
+    assert summary.objective_value == pytest.approx(result.objective_value)
+
+
+def test_highs_incumbent_callback_receives_solution_vectors() -> None:
+    data = make_input_data()
+    mm = build_matrix_model(data)
+
+    incumbents: list[HighsIncumbent] = []
+    result = solve_matrix_model_with_highs(mm, incumbent_callback=incumbents.append)
+
+    # The final solution may come from presolve alone; when HiGHS reports
+    # incumbents they must be full-length and no better than the optimum.
+    for inc in incumbents:
+        assert inc.values.shape == (mm.num_cols,)
+        assert inc.objective_value <= result.objective_value + 1e-6
+    if incumbents:
+        assert np.isclose(incumbents[-1].objective_value, result.objective_value)
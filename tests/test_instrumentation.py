@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+
+import pulp
+
+from retro_fantasy.formulation import formulate_problem
+from retro_fantasy.instrumentation import (
+    active_recorder,
+    ensure_recording,
+    instrument_method,
+    record_phases,
+    span,
+)
+from retro_fantasy.solution import build_solution_summary
+
+from conftest import make_input_data
+
+
+def test_span_is_a_no_op_without_recorder() -> None:
+    assert active_recorder() is None
+    with span("anything"):
+        pass
+    assert active_recorder() is None
+
+
+def test_nested_spans_record_paths_depths_and_totals() -> None:
+    with record_phases() as phases:
+        with span("outer"):
+            with span("inner"):
+                pass
+            with span("inner"):
+                pass
+
+    assert [(p.name, p.depth) for p in phases.phases] == [
+        ("outer", 0),
+        ("outer/inner", 1),
+        ("outer/inner", 1),
+    ]
+    outer, first, second = phases.phases
+    assert outer.wall_seconds >= first.wall_seconds + second.wall_seconds
+    assert outer.cpu_seconds >= 0.0
+    assert phases.totals()["outer/inner"] == first.wall_seconds + second.wall_seconds
+    assert active_recorder() is None
+
+
+def test_trace_memory_records_allocations_in_span_and_parent() -> None:
+    with record_phases(trace_memory=True) as phases:
+        with span("outer"):
+            with span("allocate"):
+                block = bytearray(4_000_000)
+            del block
+
+    outer, inner = phases.phases
+    assert inner.traced_delta_bytes is not None and inner.traced_delta_bytes >= 4_000_000
+    assert inner.traced_peak_bytes is not None and inner.traced_peak_bytes >= 4_000_000
+    # The child's peak counts towards the parent even though it was freed.
+    assert outer.traced_peak_bytes is not None and outer.traced_peak_bytes >= 4_000_000
+    assert outer.traced_delta_bytes is not None and outer.traced_delta_bytes < 4_000_000
+
+
+def test_ensure_recording_reuses_active_recorder() -> None:
+    with record_phases() as outer:
+        with ensure_recording() as inner:
+            with span("phase"):
+                pass
+    assert inner is outer
+    assert [p.name for p in outer.phases] == ["phase"]
+
+
+def test_instrument_method_records_calls_and_restores_method() -> None:
+    class Writer:
+        def write(self) -> str:
+            return "written"
+
+    writer = Writer()
+    with record_phases() as phases:
+        with instrument_method(writer, "write", "write_model"):
+            assert writer.write() == "written"
+
+    assert "write" not in vars(writer)
+    assert [p.name for p in phases.phases] == ["write_model"]
+
+
+def test_pipeline_phases_are_recorded_and_serialisable(tmp_path) -> None:
+    data = make_input_data()
+
+    with record_phases() as phases:
+        problem, dvs = formulate_problem(data)
+        with span("solve"), instrument_method(problem, "writeMPS", "solver.write_model"):
+            problem.solve(pulp.PULP_CBC_CMD(msg=False))
+        build_solution_summary(model_input_data=data, decision_variables=dvs, problem=problem)
+
+    names = set(phases.totals())
+    # Dense parameters are built lazily by whichever phase first needs them.
+    assert any(name.endswith("data.dense_parameters") for name in names)
+    assert {
+        "formulation.variables",
+        "formulation.objective",
+        "formulation.constraints.bank_balance",
+        "formulation.constraints.captaincy",
+        "solve",
+        "solve/solver.write_model",
+        "solution.build_summary",
+    } <= names
+
+    out = tmp_path / "phases.json"
+    phases.write_json(out)
+    payload = json.loads(out.read_text(encoding="utf-8"))
+    assert [p["name"] for p in payload["phases"]] == [p.name for p in phases.phases]
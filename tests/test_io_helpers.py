@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import pytest
 
-from retro_fantasy.data import Position
+from retro_fantasy.data import POSITION_BITS, Position
 from retro_fantasy.io import (
+    cumulative_update_masks,
     parse_position_str,
     parse_positions_from_codes,
     validate_update_names,
@@ -27,6 +28,16 @@ def test_parse_positions_from_codes_default_map() -> None:
         parse_positions_from_codes([999])
 
 
+def test_cumulative_update_masks_prefix_or_by_effective_round() -> None:
+    mid, ruc, fwd = POSITION_BITS[Position.MID], POSITION_BITS[Position.RUC], POSITION_BITS[Position.FWD]
+
+    rounds, masks = cumulative_update_masks([(9, Position.FWD), (4, Position.MID), (9, Position.RUC)])
+
+    assert rounds == [4, 9]
+    assert masks == [mid, mid | ruc | fwd]
+    assert cumulative_update_masks([]) == ([], [])
+
+
 def test_validate_update_names_does_not_raise_when_all_names_present() -> None:
     validate_update_names(
         update_names={"A B"},
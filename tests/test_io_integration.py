@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from retro_fantasy.data import Position
-from retro_fantasy.io import load_players_from_json, read_position_updates_csv
+from retro_fantasy.io import iter_json_array, iter_player_records, load_players_from_json, read_position_updates_csv
 
 
 def _write_text(path: Path, text: str) -> None:
@@ -89,3 +89,54 @@ def test_load_players_from_json_raises_on_unmatched_update_names(tmp_path: Path)
         load_players_from_json(json_path, position_updates_csv=updates_csv)
 
     assert "NOT PRESENT" in str(ei.value)
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 3, 64, 1 << 20])
+def test_iter_json_array_matches_json_loads_for_any_chunk_size(tmp_path: Path, chunk_chars: int) -> None:
+    payload = [{"id": 1, "stats": {"prices": {"1": 100}}}, 12345, -0.5e3, "a,]b", [], {}, None, True]
+    path = tmp_path / "array.json"
+    path.write_text("  \n" + json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+
+    assert list(iter_json_array(path, chunk_chars=chunk_chars)) == payload
+
+
+@pytest.mark.parametrize("text", ["", "{}", "[1, 2", "[1 2]", "[1,]", "[{\"a\": }]"])
+def test_iter_json_array_rejects_malformed_input(tmp_path: Path, text: str) -> None:
+    path = tmp_path / "bad.json"
+    path.write_text(text, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(iter_json_array(path, chunk_chars=2))
+
+
+def test_iter_player_records_keeps_only_loader_fields(tmp_path: Path) -> None:
+    path = tmp_path / "players.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "id": 7,
+                    "first_name": "A",
+                    "last_name": "B",
+                    "squad_id": 10,
+                    "original_positions": [1],
+                    "positions": [1, 2],
+                    "slug": "a-b",
+                    "stats": {"prices": {"1": 5}, "scores": {"1": 9}, "ranks": {"1": 3}},
+                }
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    assert list(iter_player_records(path)) == [
+        {
+            "id": 7,
+            "first_name": "A",
+            "last_name": "B",
+            "squad_id": 10,
+            "original_positions": [1],
+            "positions": [1, 2],
+            "stats": {"prices": {"1": 5}, "scores": {"1": 9}},
+        }
+    ]
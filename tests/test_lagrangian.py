@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+from retro_fantasy.constructive import HEURISTIC_STATUS, build_constructive_plan
+from retro_fantasy.lagrangian import LagrangianConfig, _assign_slot_types, solve_lagrangian
+from retro_fantasy.lns import is_feasible
+from retro_fantasy.matrix import build_matrix_model
+from retro_fantasy.warm_start import warm_start_vector
+
+from conftest import cbc_optimum, make_input_data, make_random_input_data
+
+
+@pytest.mark.parametrize("make_data", [make_input_data, make_random_input_data])
+def test_lagrangian_bounds_the_optimum_and_returns_a_feasible_plan(make_data) -> None:
+    data = make_data()
+    result = solve_lagrangian(data)
+    optimum = cbc_optimum(data)
+
+    assert result.upper_bound >= optimum - 1e-6
+    assert result.objective_value <= optimum + 1e-6
+    assert result.gap >= 0.0
+
+    mm = build_matrix_model(data)
+    values = warm_start_vector(mm, result.warm_start)
+    assert is_feasible(mm, values)
+    assert float(mm.objective @ values) == pytest.approx(result.objective_value)
+    assert result.summary.status == HEURISTIC_STATUS
+    assert result.summary.objective_value == pytest.approx(result.objective_value)
+
+
+def test_lagrangian_is_no_worse_than_the_constructive_plan() -> None:
+    data = make_random_input_data()
+    result = solve_lagrangian(data, config=LagrangianConfig(max_iterations=40, repair_every=20))
+
+    assert result.objective_value >= build_constructive_plan(data).objective_value - 1e-6
+    assert 1 <= result.iterations <= 40
+    assert len(result.trajectory) == result.iterations
+    bounds = [bound for _, bound, _ in result.trajectory]
+    assert bounds == sorted(bounds, reverse=True)
+
+
+def test_assign_slot_types_matches_brute_force() -> None:
+    rng = np.random.default_rng(3)
+    caps = np.array([2, 1, 1])
+    values = rng.normal(size=(5, 6, 3))
+    values[rng.random(values.shape) < 0.25] = -np.inf
+
+    members, types = _assign_slot_types(values, caps)
+
+    slots = [t for t, cap in enumerate(caps) for _ in range(cap)]
+    for r in range(values.shape[0]):
+        best = max(
+            sum(values[r, p, t] for p, t in zip(players, slots))
+            for players in itertools.permutations(range(values.shape[1]), len(slots))
+        )
+        assert len(set(members[r])) == len(slots)
+        assert np.bincount(types[r], minlength=len(caps)).tolist() == caps.tolist()
+        assert values[r, members[r], types[r]].sum() == pytest.approx(best)
+
+
+def test_lagrangian_config_validation() -> None:
+    with pytest.raises(ValueError):
+        LagrangianConfig(max_iterations=0)
+    with pytest.raises(ValueError):
+        LagrangianConfig(step_scale=3.0)
+    with pytest.raises(ValueError):
+        LagrangianConfig(repair_every=0)
+    with pytest.raises(ValueError):
+        LagrangianConfig(guide_weight=-1.0)
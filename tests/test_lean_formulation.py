@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pulp
+
+from retro_fantasy.formulation import FormulationOptions, formulate_problem
+
+from conftest import constraint_signature, make_input_data
+
+
+LEAN = FormulationOptions(lean=True)
+
+
+def test_lean_formulation_matrix_build_mode_matches_pulp_build_mode() -> None:
+    data = make_input_data()
+
+    problem_pulp, _ = formulate_problem(data, build_mode="pulp", options=LEAN)
+    problem_matrix, _ = formulate_problem(data, build_mode="matrix", options=LEAN)
+
+    assert constraint_signature(problem_matrix) == constraint_signature(problem_pulp)
+    assert [(v.name, v.lowBound, v.upBound, v.cat) for v in problem_matrix.variables()] == [
+        (v.name, v.lowBound, v.upBound, v.cat) for v in problem_pulp.variables()
+    ]
+
+
+def test_lean_formulation_drops_redundant_rows() -> None:
+    data = make_input_data()
+
+    full, _ = formulate_problem(data)
+    lean, dvs = formulate_problem(data, options=LEAN)
+
+    assert len(lean.constraints) < len(full.constraints)
+    assert not any(name.startswith("link_at_most_one_slot_") for name in lean.constraints)
+    assert not any(name.startswith("max_trades_in_") for name in lean.constraints)
+    assert not any(name.startswith("no_trade_") for name in lean.constraints)
+    assert {"trade_balance_2", "trade_balance_3"} <= set(lean.constraints)
+
+    # Player 3 has no round-3 price: trades are banned by bounds instead of rows.
+    assert dvs.traded_in[(3, 3)].upBound == 0
+    assert dvs.traded_out[(3, 3)].upBound == 0
+
+
+def test_lean_formulation_solves_to_same_objective_and_satisfies_full_model() -> None:
+    data = make_input_data()
+
+    full, _ = formulate_problem(data)
+    lean, lean_dvs = formulate_problem(data, options=LEAN)
+
+    assert pulp.LpStatus[full.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.LpStatus[lean.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.value(lean.objective) == pulp.value(full.objective)
+
+    # The lean optimum is feasible for every row of the full model, i.e. the
+    # dropped rows really are implied (in particular trade indicators are exact).
+    lean_values = {v.name: v.varValue for v in lean.variables()}
+    for v in full.variables():
+        v.varValue = lean_values[v.name]
+    violated = [name for name, c in full.constraints.items() if not c.valid(eps=1e-6)]
+    assert violated == []
+
+    for (p, r), var in lean_dvs.traded_in.items():
+        moved_in = round(lean_dvs.x_selected[(p, r)].varValue) - round(lean_dvs.x_selected[(p, r - 1)].varValue)
+        assert round(var.varValue) == max(0, moved_in)
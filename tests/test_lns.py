@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+import pulp
+import pytest
+
+from retro_fantasy.lns import LnsConfig, NeighbourhoodSampler, is_feasible, solution_values, solve_lns
+from retro_fantasy.matrix import build_matrix_model, column_rounds
+from retro_fantasy.rolling_horizon import RollingHorizonConfig, solve_rolling_horizon
+
+from conftest import cbc_matrix_solver, cbc_optimum, make_input_data
+
+
+def _rolling_horizon_start() -> np.ndarray:
+    rh = solve_rolling_horizon(
+        make_input_data(),
+        solve_matrix=cbc_matrix_solver,
+        config=RollingHorizonConfig(window=1, overlap=0, compute_bound=False),
+    )
+    return solution_values(rh.matrix_model, rh.decision_variables)
+
+
+def test_neighbourhoods_free_only_their_integer_columns() -> None:
+    data = make_input_data()
+    mm = build_matrix_model(data)
+    sampler = NeighbourhoodSampler(data, mm, LnsConfig(round_window=2, num_players=2))
+    col_rounds = column_rounds(mm)
+
+    rounds = sampler.rounds()
+    assert mm.integrality[rounds.free_columns].all()
+    freed_rounds = sorted(set(col_rounds[rounds.free_columns].tolist()))
+    assert len(freed_rounds) == 2 and freed_rounds[1] == freed_rounds[0] + 1
+
+    players = sampler.players(_rolling_horizon_start())
+    x_keys = mm.family_keys["x_selected"]
+    start, _ = mm.families["x_selected"]
+    freed_players = {x_keys[j - start][0] for j in players.free_columns.tolist() if start <= j < start + len(x_keys)}
+    assert len(freed_players) == 2
+
+    assert sampler.position().free_columns.size > 0
+
+
+def test_is_feasible_checks_rows_bounds_and_integrality() -> None:
+    mm = build_matrix_model(make_input_data())
+    start = _rolling_horizon_start()
+    assert is_feasible(mm, start)
+
+    broken = start.copy()
+    broken[mm.family_slice("captain")] = 0.0
+    assert not is_feasible(mm, broken)
+
+    with pytest.raises(ValueError, match="not a feasible"):
+        solve_lns(make_input_data(), initial_values=broken, solve_matrix=cbc_matrix_solver)
+
+
+def test_lns_improves_monotonically_and_reaches_optimum() -> None:
+    start = _rolling_horizon_start()
+    optimum = cbc_optimum(make_input_data())
+
+    result = solve_lns(
+        make_input_data(),
+        initial_values=start,
+        solve_matrix=cbc_matrix_solver,
+        config=LnsConfig(max_iterations=6, kinds=("players", "rounds"), round_window=3, num_players=3),
+    )
+
+    assert len(result.steps) == 6
+    assert result.objective_value == pytest.approx(optimum)
+    objectives = [objective for _, objective in result.trajectory]
+    assert objectives == sorted(objectives)
+    assert is_feasible(result.matrix_model, result.values)
+
+    violated = [name for name, c in result.problem.constraints.items() if not c.valid(eps=1e-6)]
+    assert violated == []
+    assert pulp.value(result.problem.objective) == pytest.approx(result.objective_value)
+
+
+def test_lns_solves_neighbourhoods_in_worker_processes() -> None:
+    result = solve_lns(
+        make_input_data(),
+        initial_values=_rolling_horizon_start(),
+        solve_matrix=cbc_matrix_solver,
+        config=LnsConfig(max_iterations=4, max_workers=2, kinds=("rounds",), round_window=3),
+    )
+
+    assert len(result.steps) == 4
+    assert sum(s.improved for s in result.steps) <= 2
+    assert result.objective_value == pytest.approx(cbc_optimum(make_input_data()))
+
+
+def test_lns_config_validation() -> None:
+    with pytest.raises(ValueError, match="unknown kinds"):
+        LnsConfig(kinds=("rounds", "squads"))
+    with pytest.raises(ValueError):
+        LnsConfig(max_workers=0)
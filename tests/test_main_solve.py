@@ -1,10 +1,33 @@
 from __future__ import annotations
 
+import re
+from pathlib import Path
+
 import pulp
+import pytest
 
 from retro_fantasy.data import Player, PlayerRoundInfo, Position, TeamStructureRules
-from retro_fantasy.formulation import formulate_problem
-from retro_fantasy.main import build_default_rounds, build_model_input_data
+from retro_fantasy.formulation import FormulationOptions, formulate_problem
+from retro_fantasy.lns import LnsConfig
+from retro_fantasy.main import build_default_rounds, build_model_input_data, solve_retro_fantasy
+from retro_fantasy.rolling_horizon import RollingHorizonConfig
+from retro_fantasy.solution import build_solution_summary
+
+from conftest import make_random_input_data, write_season_files
+
+
+def _solve_season(tmp_path: Path, **kwargs):
+    data = make_random_input_data(num_players=20, num_rounds=4)
+    players_json, updates_csv = write_season_files(tmp_path, data)
+    return solve_retro_fantasy(
+        players_json_path=players_json,
+        position_updates_csv_path=updates_csv,
+        team_rules=data.team_rules,
+        rounds=data.rounds,
+        solver="cbc",
+        log_level=None,
+        **kwargs,
+    )
 
 
 def test_formulate_and_solve_end_to_end_from_model_input_data() -> None:
@@ -39,3 +62,68 @@ def test_build_default_rounds_assigns_three_trades_to_bye_rounds() -> None:
     assert rounds[1].max_trades == 2
     assert rounds[12].max_trades == 3
     assert rounds[17].max_trades == 2
+
+
+@pytest.mark.parametrize("solve_mode", ["rolling_horizon", "relax_and_fix", "lns"])
+def test_compact_names_apply_to_heuristic_modes(tmp_path: Path, solve_mode: str) -> None:
+    full = _solve_season(tmp_path)
+    result = _solve_season(
+        tmp_path,
+        solve_mode=solve_mode,
+        rolling_horizon=RollingHorizonConfig(window=2, overlap=1),
+        lns=LnsConfig(time_budget_seconds=30.0, max_iterations=2, round_window=2, num_players=5),
+        compact_names=True,
+    )
+
+    assert result.status == "Optimal"
+    assert result.objective_value <= full.objective_value + 1e-6
+    assert all(re.fullmatch(r"v\d+", v.name) for v in result.problem.variables())
+
+
+def test_model_cache_is_rejected_for_heuristic_modes(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="model_cache_dir"):
+        _solve_season(tmp_path, solve_mode="rolling_horizon", model_cache_dir=tmp_path / "models")
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        FormulationOptions(lean=True),
+        FormulationOptions(trade_flow=True),
+        FormulationOptions(lean=True, trade_flow=True),
+    ],
+)
+def test_formulation_options_reach_the_full_solve(tmp_path: Path, options: FormulationOptions) -> None:
+    default = _solve_season(tmp_path)
+    result = _solve_season(tmp_path, formulation_options=options)
+
+    assert result.status == "Optimal"
+    assert result.objective_value == pytest.approx(default.objective_value)
+    assert len(result.problem.constraints) < len(default.problem.constraints)
+
+
+def test_continuous_scoring_solve_recovers_counted_players_and_captain(tmp_path: Path) -> None:
+    default = _solve_season(tmp_path)
+    result = _solve_season(tmp_path, formulation_options=FormulationOptions(continuous_scoring=True))
+    assert result.status == "Optimal"
+    assert result.objective_value == pytest.approx(default.objective_value)
+
+    dvs = result.decision_variables
+    assert dvs.scored[next(iter(dvs.scored))].cat == pulp.LpContinuous
+    data = result.model_input_data
+    summary = build_solution_summary(model_input_data=data, decision_variables=dvs, problem=result.problem)
+    total = sum(detail.summary.total_team_points for detail in summary.rounds.values())
+    assert total == pytest.approx(result.objective_value)
+
+    # A tied optimum may split the flags; the summary ranks on-field scores instead.
+    for var in (*dvs.scored.values(), *dvs.captain.values()):
+        var.varValue = 0.5
+    after = build_solution_summary(model_input_data=data, decision_variables=dvs, problem=result.problem)
+    assert after.rounds == summary.rounds
+    for r, detail in after.rounds.items():
+        counted = [e for e in detail.team if e.scored]
+        captains = [e for e in detail.team if e.captain]
+        assert len(counted) == data.counted_onfield_players(r)
+        assert all(e.slot == "on_field" for e in counted)
+        assert len(captains) == 1 and captains[0].scored
+        assert captains[0].score == max(e.score for e in counted)
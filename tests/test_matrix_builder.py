@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import numpy as np
+import pulp
+import pytest
+
+from retro_fantasy.data import Position
+from retro_fantasy.formulation import FormulationOptions, formulate_problem
+from retro_fantasy.matrix import build_matrix_model, column_players, column_rounds
+
+from conftest import constraint_signature, make_input_data
+
+
+def test_matrix_build_mode_matches_pulp_build_mode_exactly() -> None:
+    data = make_input_data()
+
+    problem_pulp, dvs_pulp = formulate_problem(data, build_mode="pulp")
+    problem_matrix, dvs_matrix = formulate_problem(data, build_mode="matrix")
+
+    # Same constraints: names, order, senses, constants and coefficients.
+    assert constraint_signature(problem_matrix) == constraint_signature(problem_pulp)
+
+    # Same variables (names, bounds and categories).
+    def _var_signature(problem: pulp.LpProblem) -> list[tuple[str, object, object, str]]:
+        return [(v.name, v.lowBound, v.upBound, v.cat) for v in problem.variables()]
+
+    assert _var_signature(problem_matrix) == _var_signature(problem_pulp)
+
+    # Same objective.
+    assert {v.name: c for v, c in problem_matrix.objective.items()} == {
+        v.name: c for v, c in problem_pulp.objective.items()
+    }
+
+    # Same decision variable keys per family.
+    for family in ("x_selected", "y_onfield", "y_bench", "y_utility", "captain", "scored", "traded_in", "traded_out", "bank"):
+        assert list(getattr(dvs_matrix, family)) == list(getattr(dvs_pulp, family))
+
+
+def test_matrix_build_mode_solves_to_same_objective() -> None:
+    data = make_input_data()
+
+    problem_pulp, _ = formulate_problem(data, build_mode="pulp")
+    problem_matrix, _ = formulate_problem(data, build_mode="matrix")
+
+    assert pulp.LpStatus[problem_pulp.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.LpStatus[problem_matrix.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.value(problem_matrix.objective) == pulp.value(problem_pulp.objective)
+
+
+def test_matrix_model_arrays_are_consistent() -> None:
+    data = make_input_data()
+    mm = build_matrix_model(data)
+
+    assert mm.col_lower.shape == mm.col_upper.shape == mm.integrality.shape == (mm.num_cols,)
+    assert len(mm.col_names) == mm.num_cols
+    assert mm.row_lower.shape == mm.row_upper.shape == (mm.num_rows,)
+    assert len(mm.row_names) == mm.num_rows
+
+    indptr, indices, values = mm.csr()
+    assert indptr.shape == (mm.num_rows + 1,)
+    assert indptr[-1] == mm.num_nonzeros == indices.shape[0] == values.shape[0]
+
+    # Only the bank columns are continuous.
+    start, stop = mm.families["bank"]
+    assert not mm.integrality[start:stop].any()
+    assert mm.integrality[:start].all()
+    assert np.isinf(mm.col_upper[start:stop]).all()
+
+
+def test_compact_names_keep_the_model_and_map_back_to_semantic_names() -> None:
+    data = make_input_data()
+    mm = build_matrix_model(data)
+    compact = build_matrix_model(data, options=FormulationOptions(compact_names=True))
+
+    assert mm.name_index is None and mm.semantic_col_names is mm.col_names
+    assert compact.col_names == [f"v{j}" for j in range(mm.num_cols)]
+    assert compact.row_names == [f"c{i}" for i in range(mm.num_rows)]
+    assert compact.semantic_col_names == mm.col_names
+    assert compact.semantic_row_names == mm.row_names
+    for name in ("objective", "col_lower", "col_upper", "row_lower", "row_upper", "coo_rows", "coo_cols", "coo_vals"):
+        assert np.array_equal(getattr(compact, name), getattr(mm, name))
+
+    j = mm.col_names.index("y_onfield_2_MID_3")
+    assert compact.name_index.semantic(f"v{j}") == "y_onfield_2_MID_3"
+    assert compact.column_key(j) == ("y_onfield", (2, Position.MID, 3))
+    assert compact.name_index.semantic(f"c{mm.row_names.index('score_count_2')}") == "score_count_2"
+    with pytest.raises(KeyError):
+        compact.name_index.semantic(f"v{mm.num_cols}")
+
+    problem, _ = formulate_problem(data, build_mode="matrix", options=FormulationOptions(compact_names=True))
+    reference, _ = formulate_problem(data)
+    assert pulp.LpStatus[problem.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.LpStatus[reference.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.value(problem.objective) == pulp.value(reference.objective)
+
+    with pytest.raises(ValueError, match="compact_names"):
+        formulate_problem(data, options=FormulationOptions(compact_names=True))
+
+
+def test_column_round_and_player_maps_follow_the_family_keys() -> None:
+    mm = build_matrix_model(make_input_data())
+
+    rounds = column_rounds(mm)
+    players = column_players(mm)
+
+    for j in range(mm.num_cols):
+        family, key = mm.column_key(j)
+        if family == "bank":
+            assert (rounds[j], players[j]) == (key, -1)
+        else:
+            assert (rounds[j], players[j]) == (key[-1], key[0])
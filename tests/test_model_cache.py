@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pulp
+import pytest
+
+from retro_fantasy import model_cache
+from retro_fantasy.formulation import FormulationOptions, formulate_problem
+from retro_fantasy.matrix import build_matrix_model
+from retro_fantasy.model_cache import formulate_problem_cached, load_model_cache, model_cache_key, save_model_cache
+
+from conftest import make_input_data
+
+
+def test_model_cache_round_trips_matrix_model_and_keys(tmp_path: Path) -> None:
+    mm = build_matrix_model(make_input_data())
+    save_model_cache(tmp_path / "model", mm, key="k")
+
+    loaded = load_model_cache(tmp_path / "model", key="k")
+
+    assert loaded.sense == mm.sense
+    for name in ("objective", "col_lower", "col_upper", "integrality", "row_lower", "row_upper", "coo_vals"):
+        assert np.array_equal(getattr(loaded, name), getattr(mm, name))
+    assert loaded.col_names == mm.col_names
+    assert loaded.row_names == mm.row_names
+    assert loaded.families == mm.families
+    assert {f: list(k) for f, k in loaded.family_keys.items()} == {f: list(k) for f, k in mm.family_keys.items()}
+
+    with pytest.raises(ValueError, match="key mismatch"):
+        load_model_cache(tmp_path / "model", key="other")
+
+
+def test_cache_hit_skips_formulation(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = make_input_data()
+    cold_problem, cold_dvs, _ = formulate_problem_cached(data, cache_dir=tmp_path)
+    assert sorted(p.suffix for p in tmp_path.iterdir()) == [".mps", ".npz"]
+
+    def _fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("cache hit should not formulate the model")
+
+    monkeypatch.setattr(model_cache, "build_matrix_model", _fail)
+    warm_problem, warm_dvs, _ = formulate_problem_cached(data, cache_dir=tmp_path)
+
+    assert list(warm_dvs.y_onfield) == list(cold_dvs.y_onfield)
+    assert list(warm_dvs.bank) == list(cold_dvs.bank)
+    assert set(warm_problem.constraints) == set(cold_problem.constraints)
+
+    reference, _ = formulate_problem(data)
+    reference.solve(pulp.PULP_CBC_CMD(msg=False))
+    assert pulp.LpStatus[warm_problem.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.value(warm_problem.objective) == pytest.approx(pulp.value(reference.objective))
+
+
+def test_mps_artifact_solves_to_the_same_optimum(tmp_path: Path) -> None:
+    data = make_input_data()
+    problem, _, _ = formulate_problem_cached(data, cache_dir=tmp_path)
+    problem.solve(pulp.PULP_CBC_CMD(msg=False))
+
+    (mps_path,) = tmp_path.glob("*.mps")
+    _, from_mps = pulp.LpProblem.fromMPS(str(mps_path), sense=pulp.LpMaximize)
+    assert pulp.LpStatus[from_mps.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.value(from_mps.objective) == pytest.approx(pulp.value(problem.objective))
+
+
+def test_model_cache_key_tracks_model_inputs() -> None:
+    data = make_input_data()
+    key = model_cache_key(data)
+
+    assert model_cache_key(make_input_data()) == key
+    assert model_cache_key(data, options=FormulationOptions(lean=True)) != key
+    assert model_cache_key(replace(data, team_rules=replace(data.team_rules, salary_cap=40.0))) != key
+    assert model_cache_key(replace(data, rounds={**data.rounds, 2: replace(data.rounds[2], max_trades=0)})) != key
+
+
+def test_model_cache_keeps_semantic_names_of_compact_models(tmp_path: Path) -> None:
+    mm = build_matrix_model(make_input_data(), options=FormulationOptions(compact_names=True))
+    save_model_cache(tmp_path / "model", mm, key="k")
+
+    loaded = load_model_cache(tmp_path / "model")
+    assert loaded.col_names == mm.col_names
+    assert loaded.name_index == mm.name_index
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 from retro_fantasy.data import ModelInputData, Player, PlayerRoundInfo, Position, Round, TeamStructureRules
 
 
@@ -220,3 +222,52 @@ def test_model_input_data_score_and_price_missing_round_returns_defaults() -> No
     assert data.score(1, 2) == 0.0
     assert data.price(1, 2) == 999.0
     assert data.eligible_positions(1, 2) == frozenset({Position.DEF})
+
+
+def test_model_input_data_dense_arrays_match_scalar_accessors() -> None:
+    rules = TeamStructureRules(
+        on_field_required={p: 0 for p in Position.__members__.values()},
+        bench_required={p: 0 for p in Position.__members__.values()},
+        salary_cap=500.0,
+        utility_bench_count=1,
+    )
+    rounds = {r: Round(number=r, max_trades=2, counted_onfield_players=22) for r in (1, 2, 3)}
+
+    p1 = Player(player_id=7, first_name="A", last_name="X", original_positions=frozenset({Position.FWD}))
+    p1.by_round[1] = PlayerRoundInfo(round_number=1, score=10.0, price=100.0, eligible_positions=frozenset({Position.FWD}))
+    p1.by_round[3] = PlayerRoundInfo(
+        round_number=3, score=12.0, price=110.0, eligible_positions=frozenset({Position.FWD, Position.MID})
+    )
+    # Round 0 data is outside R and must be ignored.
+    p1.by_round[0] = PlayerRoundInfo(round_number=0, score=99.0, price=1.0, eligible_positions=frozenset({Position.RUC}))
+
+    p2 = Player(player_id=3, first_name="B", last_name="Y")
+    p2.by_round[2] = PlayerRoundInfo(round_number=2, score=4.0, price=50.0, eligible_positions=frozenset({Position.DEF}))
+
+    data = ModelInputData(players={7: p1, 3: p2}, rounds=rounds, team_rules=rules)
+
+    assert dict(data.player_index) == {3: 0, 7: 1}
+    assert dict(data.round_index) == {1: 0, 2: 1, 3: 2}
+
+    assert data.scores.shape == data.prices.shape == data.has_prices.shape == (2, 3)
+    assert data.eligible.shape == (2, 4, 3)
+
+    for p in data.player_ids:
+        i = data.player_index[p]
+        for r in data.round_numbers:
+            j = data.round_index[r]
+            assert data.scores[i, j] == data.score(p, r)
+            assert data.prices[i, j] == data.price(p, r)
+            assert bool(data.has_prices[i, j]) is data.has_price(p, r)
+            for k in data.positions:
+                assert bool(data.eligible[i, data.position_index[k], j]) is data.is_eligible(p, k, r)
+
+    assert data.eligibility_masks.dtype == np.uint8
+    for k in data.positions:
+        assert data.eligible_player_rounds(k) == tuple(
+            (p, r) for p in data.player_ids for r in data.round_numbers if data.is_eligible(p, k, r)
+        )
+
+    # Arrays are cached and read-only.
+    assert data.scores is data.scores
+    assert not data.prices.flags.writeable
@@ -3,7 +3,9 @@ from __future__ import annotations
 import pulp
 
 from retro_fantasy.data import ModelInputData, Player, PlayerRoundInfo, Position, Round, TeamStructureRules
-from retro_fantasy.formulation import add_objective, create_decision_variables
+from retro_fantasy.formulation import add_objective, create_decision_variables, formulate_problem
+
+from conftest import make_input_data
 
 
 def _zero_counts_by_position() -> dict[Position, int]:
@@ -75,3 +77,18 @@ def test_objective_doubles_when_player_is_both_scored_and_captain() -> None:
     dvs.captain[(1, 1)].varValue = 1
 
     assert pulp.value(problem.objective) == 20.0
+
+
+def test_objective_skips_zero_scores_and_matches_matrix_build_mode() -> None:
+    data = make_input_data()
+    problem_pulp, dvs = formulate_problem(data, build_mode="pulp")
+    problem_matrix, _ = formulate_problem(data, build_mode="matrix")
+
+    pulp_objective = {v.name: c for v, c in problem_pulp.objective.items()}
+    assert pulp_objective == {v.name: c for v, c in problem_matrix.objective.items()}
+
+    for i, p in enumerate(data.player_ids):
+        for j, r in enumerate(data.round_numbers):
+            score = float(data.scores[i, j])
+            for var in (dvs.scored[(p, r)], dvs.captain[(p, r)]):
+                assert pulp_objective.get(var.name) == (score if score else None)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from perf_scaling import (
+    ScalingCellResult,
+    fit_power_law,
+    local_exponents,
+    run_scaling_grid,
+    scaling_report,
+)
+from perf_utils import _solver_key
+
+
+# Time is gated on cells whose baseline solve takes at least this fraction of the
+# slowest cell's, so the largest cells are always gated whatever the machine speed.
+_GATED_SOLVE_FRACTION = 0.25
+
+
+def _cell(num_squads: int, num_rounds: int, num_variables: int, solve_seconds: float) -> ScalingCellResult:
+    return ScalingCellResult(
+        num_squads=num_squads,
+        num_rounds=num_rounds,
+        squad_ids=tuple(range(num_squads)),
+        status="Optimal",
+        objective_value=0.0,
+        solution_fingerprint="",
+        num_variables=num_variables,
+        num_constraints=num_variables,
+        build_seconds=0.001 * num_variables,
+        solve_seconds=solve_seconds,
+        solver="CBC (via PuLP)",
+    )
+
+
+def test_fit_power_law_recovers_exponent() -> None:
+    x = [100.0, 200.0, 400.0, 800.0]
+    fit = fit_power_law(x, [3.0 * v**1.5 for v in x])
+
+    assert fit.exponent == pytest.approx(1.5)
+    assert fit.coefficient == pytest.approx(3.0)
+    assert fit.predict(1600.0) == pytest.approx(3.0 * 1600.0**1.5)
+
+    with pytest.raises(ValueError):
+        fit_power_law([100.0, 100.0], [1.0, 2.0])
+
+
+def test_local_exponents_flag_superlinear_growth() -> None:
+    cells = [_cell(2, 2, 1000, 1.0), _cell(2, 3, 2000, 2.0), _cell(4, 3, 4000, 16.0)]
+
+    slopes = local_exponents(cells, "solve_seconds")
+
+    assert [s["exponent"] for s in slopes] == pytest.approx([1.0, 3.0])
+    assert slopes[1]["from"] == (2, 3) and slopes[1]["to"] == (4, 3)
+
+    report = scaling_report(cells)
+    assert report["fits_vs_num_variables"]["build_seconds"]["exponent"] == pytest.approx(1.0)
+    json.dumps(report)
+
+
+@pytest.mark.perf
+def test_scaling_grid_regression(pytestconfig: pytest.Config) -> None:
+    """Opt-in perf test: sweep squads x rounds and compare every cell against a baseline.
+
+    Correctness (status, objective, fingerprint, problem size) is checked on
+    every cell; time is only gated on the slowest cells, where it is not noise.
+    """
+
+    repo_root = Path(__file__).resolve().parents[1]
+    cells = run_scaling_grid(data_dir=repo_root / "data")
+    report = scaling_report(cells)
+
+    baseline_path = repo_root / "tests" / "perf_baselines" / f"scaling_grid.{_solver_key(cells[0].solver)}.json"
+    if pytestconfig.getoption("--update-perf-baseline") or not baseline_path.exists():
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+        fits = report["fits_vs_num_variables"]
+        pytest.skip(
+            f"Scaling baseline written to {baseline_path} "
+            f"(build ~ vars^{fits['build_seconds']['exponent']:.2f}, "
+            f"solve ~ vars^{fits['solve_seconds']['exponent']:.2f})"
+        )
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    baseline_cells = {(c["num_squads"], c["num_rounds"]): c for c in baseline["cells"]}
+    max_ratio = float(pytestconfig.getoption("--perf-max-regression-ratio"))
+    min_gated_seconds = _GATED_SOLVE_FRACTION * max(c["solve_seconds"] for c in baseline["cells"])
+
+    for cell in cells:
+        expected = baseline_cells[(cell.num_squads, cell.num_rounds)]
+        observed = asdict(cell)
+        observed["squad_ids"] = list(cell.squad_ids)
+        for key in ("status", "solution_fingerprint", "num_variables", "num_constraints", "squad_ids"):
+            assert observed[key] == expected[key], (cell.num_squads, cell.num_rounds, key)
+        assert cell.objective_value == pytest.approx(expected["objective_value"], abs=1e-6)
+
+        if expected["solve_seconds"] >= min_gated_seconds:
+            assert cell.solve_seconds <= expected["solve_seconds"] * max_ratio, (cell.num_squads, cell.num_rounds)
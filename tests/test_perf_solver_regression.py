@@ -4,12 +4,15 @@ from pathlib import Path
 
 import pytest
 
+from retro_fantasy.formulation import FormulationOptions
+
 from perf_utils import (
     PerfScenario,
     baseline_path_for,
     compute_median_result,
     load_baseline,
     make_baseline,
+    run_build_and_measure,
     run_solve_and_measure,
     write_baseline,
 )
@@ -91,3 +94,63 @@ def test_filtered_production_scenario_no_objective_degradation_and_no_large_slow
     # Performance guardrail: no large regressions (ratio-based).
     max_ratio = float(pytestconfig.getoption("--perf-max-regression-ratio"))
     assert median_result.solve_seconds <= baseline.median_solve_seconds * max_ratio
+
+
+@pytest.mark.perf
+def test_full_season_matrix_build_mode_matches_pulp_build_mode_and_is_faster() -> None:
+    """Opt-in perf test: build the full-season model with both build modes.
+
+    The matrix builder must produce an identically sized problem, and should be
+    faster than building expressions term-by-term with PuLP.
+    """
+
+    repo_root = Path(__file__).resolve().parents[1]
+    data_dir = repo_root / "data"
+
+    def _scenario(build_mode: str) -> PerfScenario:
+        return PerfScenario(
+            name=f"full_season_build_{build_mode}",
+            players_json_path=data_dir / "players_final.json",
+            position_updates_csv_path=data_dir / "position_updates.csv",
+            team_rules_json_path=data_dir / "team_rules.json",
+            rounds_json_path=data_dir / "rounds.json",
+            # No filtering: the full season is where build time matters.
+            data_filter_json_path=repo_root / "tests" / "perf_baselines" / "no_filter.json",
+            repeats=1,
+            build_mode=build_mode,
+        )
+
+    pulp_metrics, pulp_seconds = run_build_and_measure(_scenario("pulp"))
+    matrix_metrics, matrix_seconds = run_build_and_measure(_scenario("matrix"))
+
+    assert matrix_metrics == pulp_metrics
+    assert matrix_seconds < pulp_seconds
+
+
+@pytest.mark.perf
+def test_filtered_production_scenario_lean_formulation_matches_full_formulation() -> None:
+    """Opt-in perf test: the lean formulation is smaller but solves to the same solution."""
+
+    repo_root = Path(__file__).resolve().parents[1]
+    data_dir = repo_root / "data"
+
+    def _scenario(lean: bool) -> PerfScenario:
+        return PerfScenario(
+            name=f"filtered_production_lean_{lean}",
+            players_json_path=data_dir / "players_final.json",
+            position_updates_csv_path=data_dir / "position_updates.csv",
+            team_rules_json_path=data_dir / "team_rules.json",
+            rounds_json_path=data_dir / "rounds.json",
+            data_filter_json_path=data_dir / "data_filter.json",
+            repeats=1,
+            build_mode="matrix",
+            options=FormulationOptions(lean=lean),
+        )
+
+    full = run_solve_and_measure(_scenario(False))
+    lean = run_solve_and_measure(_scenario(True))
+
+    assert full.status == lean.status == "Optimal"
+    assert lean.objective_value == pytest.approx(full.objective_value, abs=1e-6)
+    assert lean.solution_fingerprint == full.solution_fingerprint
+    assert lean.problem_metrics.num_constraints < full.problem_metrics.num_constraints
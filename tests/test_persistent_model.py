@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from retro_fantasy.data import ModelInputData, Round
+from retro_fantasy.formulation import FormulationOptions
+from retro_fantasy.matrix import build_matrix_model
+from retro_fantasy.persistent import PersistentModel
+from retro_fantasy.solution import build_solution_summary
+from retro_fantasy.solvers import build_matrix_solver
+
+from conftest import make_input_data
+
+
+def _fresh_objective(data: ModelInputData, solver: str) -> float:
+    solve = build_matrix_solver(solver, time_limit_seconds=None, enable_solver_output=False)
+    result = solve(build_matrix_model(data), None)
+    assert result.status == "Optimal"
+    return result.objective_value
+
+
+def _what_if_rounds(data: ModelInputData) -> dict[int, Round]:
+    return {
+        2: replace(data.rounds[2], counted_onfield_players=2, max_trades=2),
+        3: replace(data.rounds[3], max_trades=0),
+    }
+
+
+@pytest.mark.parametrize("solver", ["cbc", "highs"])
+def test_rhs_updates_match_a_fresh_build(solver: str) -> None:
+    if solver == "highs":
+        pytest.importorskip("highspy")
+
+    data = make_input_data()
+    model = PersistentModel(data, solver=solver)
+    base = model.solve()
+    assert base.status == "Optimal"
+    assert base.objective_value == pytest.approx(_fresh_objective(data, solver))
+
+    changed = model.update_rounds(_what_if_rounds(data))
+    assert changed == ["score_count_2", "max_trades_in_2", "max_trades_out_2", "max_trades_in_3", "max_trades_out_3"]
+    assert model.model_input_data.rounds[2].counted_onfield_players == 2
+
+    what_if = model.solve()
+    expected = ModelInputData(players=data.players, rounds={**data.rounds, **_what_if_rounds(data)}, team_rules=data.team_rules)
+    assert what_if.status == "Optimal"
+    assert what_if.objective_value == pytest.approx(_fresh_objective(expected, solver))
+
+    assert model.update_salary_cap(40.0) == ["bank_initial_round_1"]
+    capped = model.solve()
+    expected = replace(expected, team_rules=replace(data.team_rules, salary_cap=40.0))
+    assert capped.objective_value == pytest.approx(_fresh_objective(expected, solver))
+
+
+def test_salary_cap_cannot_rise_above_the_build_time_cap() -> None:
+    data = make_input_data()
+    model = PersistentModel(data, solver="cbc")
+
+    assert model.update_salary_cap(40.0) == ["bank_initial_round_1"]
+    # Back up to the build-time cap is fine; above it, the baked-in fallback
+    # price of an unpriced player would become affordable.
+    assert model.update_salary_cap(100.0) == ["bank_initial_round_1"]
+    with pytest.raises(ValueError, match="build a new model"):
+        model.update_salary_cap(150.0)
+    assert model.model_input_data.salary_cap == 100.0
+
+
+def test_solution_summary_reflects_updated_rounds() -> None:
+    data = make_input_data()
+    model = PersistentModel(data, solver="cbc")
+    model.solve()
+    model.update_rounds({2: replace(data.rounds[2], counted_onfield_players=2)})
+    result = model.solve()
+
+    summary = build_solution_summary(
+        model_input_data=model.model_input_data,
+        decision_variables=model.decision_variables,
+        problem=model.problem,
+    )
+    assert sum(1 for e in summary.rounds[2].team if e.scored) == 2
+    assert sum(d.summary.total_team_points for d in summary.rounds.values()) == pytest.approx(result.objective_value)
+
+
+def test_unchanged_or_unknown_rounds() -> None:
+    data = make_input_data()
+    model = PersistentModel(data, solver="cbc")
+
+    assert model.update_rounds({1: data.rounds[1]}) == []
+    with pytest.raises(ValueError, match="not part of the model"):
+        model.update_rounds({4: Round(number=4, max_trades=2, counted_onfield_players=2)})
+
+
+def test_rhs_updates_with_compact_names() -> None:
+    data = make_input_data()
+    model = PersistentModel(data, solver="cbc", options=FormulationOptions(compact_names=True))
+    model.solve()
+
+    assert model.update_rounds({2: replace(data.rounds[2], counted_onfield_players=2)}) == ["score_count_2"]
+    mm = model.matrix_model
+    assert model.problem.constraints[mm.row_names[mm.semantic_row_names.index("score_count_2")]].constant == -2
+    expected = ModelInputData(
+        players=data.players,
+        rounds={**data.rounds, 2: replace(data.rounds[2], counted_onfield_players=2)},
+        team_rules=data.team_rules,
+    )
+    assert model.solve().objective_value == pytest.approx(_fresh_objective(expected, "cbc"))
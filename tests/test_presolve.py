@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from retro_fantasy.data import ModelInputData, Player, PlayerRoundInfo, Position, Round, TeamStructureRules
+from retro_fantasy.presolve import dominance_matrix, prune_dominated_players, safe_min_dominators
+
+from conftest import cbc_optimum
+
+
+D = frozenset({Position.DEF})
+DM = frozenset({Position.DEF, Position.MID})
+
+
+def _player(pid: int, data: dict[int, tuple[float, float, frozenset[Position]]]) -> Player:
+    player = Player(player_id=pid, first_name=f"P{pid}", last_name="X", original_positions=frozenset({Position.DEF}))
+    for r, (score, price, eligible) in data.items():
+        player.by_round[r] = PlayerRoundInfo(round_number=r, score=score, price=price, eligible_positions=eligible)
+    return player
+
+
+def _make_input_data(players: dict[int, Player]) -> ModelInputData:
+    # One on-field DEF, no bench; one trade allowed in round 2.
+    rules = TeamStructureRules(
+        on_field_required={Position.DEF: 1, Position.MID: 0, Position.RUC: 0, Position.FWD: 0},
+        bench_required={Position.DEF: 0, Position.MID: 0, Position.RUC: 0, Position.FWD: 0},
+        salary_cap=100.0,
+        utility_bench_count=0,
+    )
+    rounds = {
+        1: Round(number=1, max_trades=0, counted_onfield_players=1),
+        2: Round(number=2, max_trades=1, counted_onfield_players=1),
+    }
+    return ModelInputData(players=players, rounds=rounds, team_rules=rules)
+
+
+def test_dominance_matrix_checks_scores_prices_growth_and_eligibility() -> None:
+    data = _make_input_data(
+        {
+            1: _player(1, {1: (10.0, 20.0, DM), 2: (10.0, 25.0, DM)}),
+            # Dominated by 1: lower scores, dearer, narrower eligibility.
+            2: _player(2, {1: (8.0, 30.0, D), 2: (9.0, 30.0, D)}),
+            # Cheaper and better than 1 but its price grows less than 1's, so
+            # selling it later could leave less in the bank: no dominance.
+            3: _player(3, {1: (11.0, 10.0, DM), 2: (11.0, 10.0, DM)}),
+            # Identical to 1: only the lower ID dominates.
+            4: _player(4, {1: (10.0, 20.0, DM), 2: (10.0, 25.0, DM)}),
+        }
+    )
+
+    dominated_by = dominance_matrix(data)
+    ids = list(data.player_ids)
+
+    def dominates(q: int, p: int) -> bool:
+        return bool(dominated_by[ids.index(p), ids.index(q)])
+
+    assert dominates(1, 2)
+    assert not dominates(2, 1)
+    assert not dominates(3, 1)
+    assert dominates(3, 2)
+    assert dominates(1, 4)
+    assert not dominates(4, 1)
+    assert not dominated_by.diagonal().any()
+
+
+def test_safe_min_dominators_counts_squad_and_trades() -> None:
+    data = _make_input_data({1: _player(1, {1: (1.0, 1.0, D), 2: (1.0, 1.0, D)})})
+    assert safe_min_dominators(data) == 1 + 1
+
+
+def test_prune_dominated_players_keeps_optimal_objective() -> None:
+    data = _make_input_data(
+        {
+            1: _player(1, {1: (10.0, 20.0, D), 2: (12.0, 20.0, D)}),
+            2: _player(2, {1: (9.0, 15.0, D), 2: (14.0, 15.0, D)}),
+            # Dominated by 1, 2 and 4.
+            3: _player(3, {1: (5.0, 30.0, D), 2: (6.0, 30.0, D)}),
+            # Dominated by 1 only: kept (one dominator is below the safe threshold).
+            4: _player(4, {1: (10.0, 25.0, D), 2: (11.0, 25.0, D)}),
+        }
+    )
+
+    result = prune_dominated_players(data)
+
+    assert result.min_dominators == 2
+    assert result.removed == {3: (1, 2, 4)}
+    assert result.model_input_data.player_ids == (1, 2, 4)
+    assert cbc_optimum(result.model_input_data) == cbc_optimum(data)
+
+
+def test_prune_dominated_players_rejects_non_positive_threshold() -> None:
+    data = _make_input_data({1: _player(1, {1: (1.0, 1.0, D), 2: (1.0, 1.0, D)})})
+    with pytest.raises(ValueError):
+        prune_dominated_players(data, min_dominators=0)
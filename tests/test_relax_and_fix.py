@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import numpy as np
+import pulp
+import pytest
+
+from retro_fantasy.matrix import MatrixModel, MatrixSolveResult
+from retro_fantasy.relax_and_fix import RelaxAndFixConfig, solve_relax_and_fix
+
+from conftest import cbc_matrix_solver, cbc_optimum, make_input_data
+
+
+def test_relax_and_fix_config_validation() -> None:
+    with pytest.raises(ValueError):
+        RelaxAndFixConfig(block=2, overlap=2)
+    with pytest.raises(ValueError, match="unknown families"):
+        RelaxAndFixConfig(fixed_families=("x_selected", "not_a_family"))
+
+
+def test_relax_and_fix_solution_is_feasible_and_bounded() -> None:
+    data = make_input_data()
+    optimum = cbc_optimum(make_input_data())
+
+    seen: list[MatrixModel] = []
+
+    def _recording_cbc(matrix_model: MatrixModel, initial_values: np.ndarray | None) -> MatrixSolveResult:
+        seen.append(matrix_model)
+        return cbc_matrix_solver(matrix_model, initial_values)
+
+    result = solve_relax_and_fix(data, solve_matrix=_recording_cbc, config=RelaxAndFixConfig(block=1))
+
+    assert result.status == "Optimal"
+    assert [(b.first_round, b.last_integral_round, b.committed_through) for b in result.blocks] == [
+        (1, 1, 1),
+        (2, 2, 2),
+        (3, 3, 3),
+    ]
+    # Integrality grows block by block; the last block is the full MILP.
+    counts = [b.num_integer_columns for b in result.blocks]
+    assert counts == sorted(counts) and counts[-1] == int(result.matrix_model.integrality.sum())
+    # Later blocks start with the committed squad fixed.
+    x = seen[1].family_slice("x_selected")
+    round_1 = [j for j, key in enumerate(seen[1].family_keys["x_selected"]) if key[1] == 1]
+    assert np.array_equal(seen[1].col_lower[x][round_1], seen[1].col_upper[x][round_1])
+
+    assert result.objective_value <= optimum + 1e-6
+    assert result.best_bound is not None and result.best_bound >= optimum - 1e-6
+    assert result.gap is not None and result.gap >= 0.0
+
+    violated = [name for name, c in result.problem.constraints.items() if not c.valid(eps=1e-6)]
+    assert violated == []
+    assert pulp.value(result.problem.objective) == pytest.approx(result.objective_value)
+
+
+def test_single_block_is_the_exact_solve() -> None:
+    result = solve_relax_and_fix(make_input_data(), solve_matrix=cbc_matrix_solver, config=RelaxAndFixConfig(block=5))
+
+    assert len(result.blocks) == 1
+    assert result.objective_value == pytest.approx(cbc_optimum(make_input_data()))
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import pulp
+import pytest
+
+from retro_fantasy.formulation import FormulationOptions
+from retro_fantasy.matrix import build_matrix_model
+from retro_fantasy.rolling_horizon import (
+    RollingHorizonConfig,
+    rolling_horizon_windows,
+    solve_rolling_horizon,
+    window_input_data,
+)
+
+from conftest import cbc_matrix_solver, cbc_optimum, make_input_data, make_random_input_data
+
+
+def test_rolling_horizon_windows_overlap_and_cover_all_rounds() -> None:
+    assert rolling_horizon_windows(7, window=3, overlap=1) == [(0, 2, 3), (2, 4, 5), (4, 7, 7)]
+    assert rolling_horizon_windows(3, window=5, overlap=2) == [(0, 3, 3)]
+    assert rolling_horizon_windows(3, window=1, overlap=0) == [(0, 1, 1), (1, 2, 2), (2, 3, 3)]
+
+
+def test_rolling_horizon_config_validates_overlap() -> None:
+    with pytest.raises(ValueError):
+        RollingHorizonConfig(window=2, overlap=2)
+
+
+def test_rolling_horizon_solution_is_feasible_and_bounded() -> None:
+    data = make_input_data()
+    optimum = cbc_optimum(make_input_data())
+
+    result = solve_rolling_horizon(
+        data,
+        solve_matrix=cbc_matrix_solver,
+        config=RollingHorizonConfig(window=1, overlap=0),
+    )
+
+    assert result.status == "Optimal"
+    assert [(w.first_round, w.last_round, w.committed_through) for w in result.windows] == [(1, 1, 1), (2, 2, 2), (3, 3, 3)]
+    assert result.objective_value <= optimum + 1e-6
+    assert result.best_bound is not None and result.best_bound >= optimum - 1e-6
+    assert result.gap is not None and result.gap >= 0.0
+
+    # The stitched solution satisfies every row of the full model.
+    violated = [name for name, c in result.problem.constraints.items() if not c.valid(eps=1e-6)]
+    assert violated == []
+    assert pulp.value(result.problem.objective) == pytest.approx(result.objective_value)
+
+
+def test_rolling_horizon_polish_reaches_full_optimum() -> None:
+    data = make_input_data()
+
+    result = solve_rolling_horizon(
+        data,
+        solve_matrix=cbc_matrix_solver,
+        config=RollingHorizonConfig(window=2, overlap=1, polish=True),
+    )
+
+    assert result.status == "Optimal"
+    assert result.objective_value >= result.stitched_objective_value
+    assert result.objective_value == pytest.approx(cbc_optimum(make_input_data()))
+
+
+def test_rolling_horizon_with_compact_names() -> None:
+    config = RollingHorizonConfig(window=2, overlap=1, compute_bound=False)
+    default = solve_rolling_horizon(make_input_data(), solve_matrix=cbc_matrix_solver, config=config)
+    compact = solve_rolling_horizon(
+        make_input_data(), solve_matrix=cbc_matrix_solver, config=config, options=FormulationOptions(compact_names=True)
+    )
+
+    assert compact.status == "Optimal"
+    assert compact.objective_value == pytest.approx(default.objective_value)
+
+
+def test_window_input_data_renumbers_rounds_from_one() -> None:
+    data = make_random_input_data(num_rounds=6)
+
+    window = window_input_data(data, [3, 4, 5])
+
+    assert window.round_numbers == (1, 2, 3)
+    assert [window.rounds[r].counted_onfield_players for r in (1, 2, 3)] == [
+        data.rounds[r].counted_onfield_players for r in (3, 4, 5)
+    ]
+    assert (window.scores == data.scores[:, 2:5]).all()
+    assert (window.prices == data.prices[:, 2:5]).all()
+
+
+def test_rolling_horizon_window_models_stay_window_sized() -> None:
+    data = make_random_input_data(num_rounds=8)
+
+    result = solve_rolling_horizon(
+        data, solve_matrix=cbc_matrix_solver, config=RollingHorizonConfig(window=3, overlap=1, compute_bound=False)
+    )
+
+    assert result.status == "Optimal"
+    assert [(w.first_round, w.last_round) for w in result.windows] == [(1, 3), (3, 5), (5, 7), (7, 8)]
+    # Later windows carry one committed round in; none grows towards the full season.
+    carried_in = build_matrix_model(window_input_data(data, [1, 2, 3, 4]))
+    assert all(w.num_columns <= carried_in.num_cols for w in result.windows)
+    assert all(w.num_rows <= carried_in.num_rows for w in result.windows)
+
+    violated = [name for name, c in result.problem.constraints.items() if not c.valid(eps=1e-6)]
+    assert violated == []
+    assert pulp.value(result.problem.objective) == pytest.approx(result.objective_value)
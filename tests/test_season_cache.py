@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from retro_fantasy import cache as season_cache
+from retro_fantasy.cache import load_players_cached, season_cache_key
+from retro_fantasy.data import Player, Position
+from retro_fantasy.io import load_players_from_json
+from retro_fantasy.main import load_players
+
+
+def _write_inputs(tmp_path: Path) -> tuple[Path, Path]:
+    players_json = [
+        {
+            "id": 1,
+            "first_name": "A",
+            "last_name": "B",
+            "squad_id": 10,
+            "original_positions": [4],
+            "stats": {"prices": {"0": 90, "1": 100, "2": 120}, "scores": {"0": 5, "1": 10, "2": 12}},
+        },
+        {
+            "id": 2,
+            "first_name": "C",
+            "last_name": "D",
+            "squad_id": None,
+            "original_positions": [],
+            "positions": [1, 2],
+            "stats": {"prices": {"1": 50}, "scores": {"1": 3}},
+        },
+    ]
+    json_path = tmp_path / "players_final.json"
+    json_path.write_text(json.dumps(players_json), encoding="utf-8")
+
+    csv_path = tmp_path / "position_updates.csv"
+    csv_path.write_text("player,initial_position,add_position,round\nA B,FWD,MID,2\n", encoding="utf-8")
+    return json_path, csv_path
+
+
+def _as_comparable(players: dict[int, Player]) -> dict[int, tuple]:
+    return {
+        pid: (
+            p.first_name,
+            p.last_name,
+            p.squad_id,
+            p.original_positions,
+            {r: (i.score, i.price, i.eligible_positions) for r, i in p.by_round.items()},
+        )
+        for pid, p in players.items()
+    }
+
+
+def test_load_players_cached_round_trips_parsed_players(tmp_path: Path) -> None:
+    json_path, csv_path = _write_inputs(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    expected = load_players_from_json(json_path, position_updates_csv=csv_path)
+
+    cold = load_players_cached(json_path, position_updates_csv=csv_path, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+
+    warm = load_players_cached(json_path, position_updates_csv=csv_path, cache_dir=cache_dir)
+
+    assert _as_comparable(cold) == _as_comparable(expected)
+    assert _as_comparable(warm) == _as_comparable(expected)
+    assert warm[1].get_round(2).eligible_positions == frozenset({Position.FWD, Position.MID})
+    assert warm[2].squad_id is None
+
+
+def test_load_players_cached_hit_skips_parsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    json_path, csv_path = _write_inputs(tmp_path)
+
+    load_players(players_json_path=json_path, position_updates_csv_path=csv_path)
+    assert (tmp_path / ".retro_fantasy_cache").is_dir()
+
+    def _fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("cache hit should not re-parse the JSON")
+
+    monkeypatch.setattr(season_cache, "load_players_from_json", _fail)
+    players = load_players(players_json_path=json_path, position_updates_csv_path=csv_path)
+    assert set(players) == {1, 2}
+
+
+def test_season_cache_key_changes_with_inputs_and_options(tmp_path: Path) -> None:
+    json_path, csv_path = _write_inputs(tmp_path)
+
+    base = season_cache_key(json_path, position_updates_csv=csv_path)
+    assert season_cache_key(json_path, position_updates_csv=csv_path) == base
+    assert season_cache_key(json_path, position_updates_csv=csv_path, include_round0=True) != base
+    assert season_cache_key(json_path, position_updates_csv=None) != base
+    assert season_cache_key(json_path, position_updates_csv=csv_path, squad_id_filter=frozenset({10})) != base
+    assert (
+        season_cache_key(
+            json_path,
+            position_updates_csv=csv_path,
+            position_code_map={1: Position.DEF, 2: Position.MID, 3: Position.RUC, 4: Position.DEF},
+        )
+        != base
+    )
+
+    csv_path.write_text("player,initial_position,add_position,round\nA B,FWD,DEF,2\n", encoding="utf-8")
+    assert season_cache_key(json_path, position_updates_csv=csv_path) != base
+
+
+def test_load_players_cached_recovers_from_corrupt_entry(tmp_path: Path) -> None:
+    json_path, csv_path = _write_inputs(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    load_players_cached(json_path, position_updates_csv=csv_path, cache_dir=cache_dir)
+    (entry,) = cache_dir.glob("*.npz")
+    entry.write_bytes(b"not an npz file")
+
+    players = load_players_cached(json_path, position_updates_csv=csv_path, cache_dir=cache_dir)
+    assert set(players) == {1, 2}
+
+    # The entry was rewritten and is readable again.
+    assert _as_comparable(season_cache.load_players_cache(entry)) == _as_comparable(players)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from retro_fantasy.data import ModelInputData, Position, Round, SeasonStore
+from retro_fantasy.io import load_players_from_json, load_rounds_from_json, load_season_from_json, load_team_rules_from_json
+from retro_fantasy.presolve import prune_dominated_players
+
+from conftest import make_input_data
+
+
+def _assert_same_dense(a: ModelInputData, b: ModelInputData) -> None:
+    assert a.player_ids == b.player_ids
+    for x, y in zip(a._dense_parameters, b._dense_parameters):
+        assert x.dtype == y.dtype
+        assert np.array_equal(x, y)
+
+
+def test_from_players_round_trips_and_views_behave_like_players() -> None:
+    data = make_input_data()
+    store = SeasonStore.from_players(data.players)
+
+    assert store.to_players() == data.players
+    for p, player in data.players.items():
+        view = store.players[p]
+        assert (view.player_id, view.name, view.squad_id) == (player.player_id, player.name, player.squad_id)
+        assert view.original_positions == player.original_positions
+        assert dict(view.by_round) == player.by_round
+        for r in player.by_round:
+            assert view.get_round(r) == player.get_round(r)
+        with pytest.raises(KeyError):
+            view.get_round(999)
+
+    # Eligibility sets come from the interned table, not rebuilt per access.
+    view = store.players[data.player_ids[0]]
+    assert view.get_round(1).eligible_positions is view.get_round(1).eligible_positions
+
+
+def test_season_backed_model_matches_player_backed_model() -> None:
+    data = make_input_data()
+    store = SeasonStore.from_players(data.players)
+    from_season = ModelInputData.from_season(store, rounds=data.rounds, team_rules=data.team_rules)
+
+    _assert_same_dense(data, from_season)
+    assert from_season.price(data.player_ids[0], 1) == data.price(data.player_ids[0], 1)
+
+    # Rounds the store knows nothing about fall back like missing Player data.
+    rounds = dict(data.rounds)
+    extra = max(rounds) + 1
+    rounds[extra] = Round(number=extra, max_trades=2, counted_onfield_players=22)
+    _assert_same_dense(
+        ModelInputData(players=data.players, rounds=rounds, team_rules=data.team_rules),
+        ModelInputData.from_season(store, rounds=rounds, team_rules=data.team_rules),
+    )
+
+
+def test_presolve_keeps_season_backing() -> None:
+    data = make_input_data()
+    store = SeasonStore.from_players(data.players)
+    reduced = prune_dominated_players(
+        ModelInputData.from_season(store, rounds=data.rounds, team_rules=data.team_rules)
+    ).model_input_data
+
+    assert reduced.season is store
+    _assert_same_dense(
+        ModelInputData(
+            players={p: data.players[p] for p in reduced.player_ids},
+            rounds=data.rounds,
+            team_rules=data.team_rules,
+        ),
+        reduced,
+    )
+
+
+def test_store_rejects_misshapen_arrays() -> None:
+    with pytest.raises(ValueError, match="shape"):
+        SeasonStore(
+            player_ids=[1],
+            first_names=["A"],
+            last_names=["B"],
+            squad_ids=[10],
+            original_masks=np.zeros(1, dtype=np.uint8),
+            round_numbers=[1, 2],
+            scores=np.zeros((1, 1)),
+            prices=np.zeros((1, 2)),
+            has_data=np.zeros((1, 2), dtype=bool),
+            masks=np.zeros((1, 2), dtype=np.uint8),
+        )
+
+
+def test_load_season_matches_player_loader(tmp_path: Path) -> None:
+    records = [
+        {
+            "id": 1,
+            "first_name": "Ann",
+            "last_name": "Able",
+            "squad_id": 10,
+            "original_positions": [],
+            "positions": [2],
+            "stats": {"prices": {"0": 5.0, "1": 100.0, "2": 110.0}, "scores": {"1": 50.0, "3": 60.0}},
+        },
+        {
+            "id": 2,
+            "first_name": "Bob",
+            "last_name": "Baker",
+            "squad_id": 20,
+            "original_positions": [1],
+            "stats": {"prices": {"1": 90.0}, "scores": {"1": 40.0}},
+        },
+    ]
+    players_path = tmp_path / "players.json"
+    players_path.write_text(json.dumps(records), encoding="utf-8")
+    updates_path = tmp_path / "updates.csv"
+    updates_path.write_text("player,initial_position,add_position,round\nBob Baker,DEF,FWD,2\n", encoding="utf-8")
+
+    for kwargs in (
+        {},
+        {"include_round0": True},
+        {"position_updates_csv": updates_path},
+        {"squad_id_filter": frozenset({20})},
+    ):
+        players = load_players_from_json(players_path, **kwargs)
+        store = load_season_from_json(players_path, **kwargs)
+        assert store.to_players() == players, kwargs
+
+    store = load_season_from_json(players_path, position_updates_csv=updates_path)
+    assert store.players[2].original_positions == frozenset({Position.DEF})
+
+
+def test_full_season_store_matches_player_loader() -> None:
+    data_dir = Path(__file__).resolve().parents[1] / "data"
+    players = load_players_from_json(
+        data_dir / "players_final.json", position_updates_csv=data_dir / "position_updates.csv"
+    )
+    store = load_season_from_json(data_dir / "players_final.json", position_updates_csv=data_dir / "position_updates.csv")
+    rounds = load_rounds_from_json(data_dir / "rounds.json")
+    team_rules = load_team_rules_from_json(data_dir / "team_rules.json")
+
+    _assert_same_dense(
+        ModelInputData(players=players, rounds=rounds, team_rules=team_rules),
+        ModelInputData.from_season(store, rounds=rounds, team_rules=team_rules),
+    )
+    assert len(pickle.dumps(store)) < len(pickle.dumps(players))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pulp
+
+from retro_fantasy.formulation import formulate_problem
+from retro_fantasy.solution import build_solution_summary
+
+from conftest import make_input_data
+
+
+def _solved():
+    data = make_input_data()
+    problem, dvs = formulate_problem(data)
+    assert pulp.LpStatus[problem.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    return data, problem, dvs
+
+
+def test_summary_matches_selected_variables() -> None:
+    data, problem, dvs = _solved()
+    summary = build_solution_summary(model_input_data=data, decision_variables=dvs, problem=problem)
+
+    for r in data.round_numbers:
+        detail = summary.rounds[r]
+        selected = [p for p in data.player_ids if dvs.x_selected[(p, r)].varValue > 0.5]
+        assert sorted(e.player_id for e in detail.team) == sorted(selected)
+        assert detail.summary.team_value == sum(data.price(p, r) for p in selected)
+
+        scored = [p for p in data.player_ids if dvs.scored[(p, r)].varValue > 0.5]
+        assert {e.player_id for e in detail.team if e.scored} == set(scored)
+        captain = next(p for p in data.player_ids if dvs.captain[(p, r)].varValue > 0.5)
+        assert [e.player_id for e in detail.team if e.captain] == [captain]
+        assert detail.summary.total_team_points == sum(data.score(p, r) for p in scored) + data.score(captain, r)
+
+    for r in data.rounds_excluding_1:
+        trades = summary.rounds[r].trades
+        assert [t.player_id for t in trades.traded_in] == [
+            p for p in data.player_ids if dvs.traded_in[(p, r)].varValue > 0.5
+        ]
+        assert [t.player_id for t in trades.traded_out] == [
+            p for p in data.player_ids if dvs.traded_out[(p, r)].varValue > 0.5
+        ]
+
+
+def test_summary_uses_tolerance_and_slot_precedence() -> None:
+    data, problem, dvs = _solved()
+    r = data.round_numbers[0]
+
+    on_field = next(key for key, v in dvs.y_onfield.items() if key[2] == r and v.varValue > 0.5)
+    p = on_field[0]
+    # Near-integral values count as selected; a spurious bench flag loses to on-field.
+    dvs.y_onfield[on_field].varValue = 1.0 - 1e-7
+    bench_key = next(key for key in dvs.y_bench if key[0] == p and key[2] == r)
+    dvs.y_bench[bench_key].varValue = 1.0
+
+    summary = build_solution_summary(model_input_data=data, decision_variables=dvs, problem=problem)
+    entry = next(e for e in summary.rounds[r].team if e.player_id == p)
+    assert entry.slot == "on_field"
+    assert entry.position == on_field[1].value
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import csv
+
+import pytest
+
+from retro_fantasy.data import ModelInputData, Round
+from retro_fantasy.sweep import (
+    SweepConfig,
+    SweepVariant,
+    format_sweep_table,
+    run_sweep,
+    sweep_grid,
+    write_sweep_summary_csv,
+)
+
+from conftest import cbc_optimum, make_input_data
+
+
+def test_variant_apply_overrides_rules_and_rounds() -> None:
+    data = make_input_data()
+    rounds = {1: Round(1, 2, 22), 2: Round(2, 2, 18), 3: Round(3, 2, 22)}
+
+    rules, new_rounds = SweepVariant(
+        name="v",
+        salary_cap=123.0,
+        max_trades={2: 3},
+        counted_onfield_players=21,
+        bye_round_counted_onfield_players=20,
+    ).apply(data.team_rules, rounds)
+
+    assert rules.salary_cap == 123.0
+    assert rules.utility_bench_count == data.team_rules.utility_bench_count
+    assert [new_rounds[r].max_trades for r in (1, 2, 3)] == [2, 3, 2]
+    # Round 2 is the bye round (fewer counted than the season maximum).
+    assert [new_rounds[r].counted_onfield_players for r in (1, 2, 3)] == [21, 20, 21]
+    assert SweepVariant(name="base").apply(data.team_rules, rounds) == (data.team_rules, rounds)
+
+
+def test_sweep_grid_is_a_cartesian_product_with_readable_names() -> None:
+    variants = sweep_grid(salary_cap=[100.0, 200.5], max_trades=[None, {12: 3}])
+
+    assert [v.name for v in variants] == [
+        "salary_cap=100",
+        "salary_cap=100,max_trades={12:3}",
+        "salary_cap=200.5",
+        "salary_cap=200.5,max_trades={12:3}",
+    ]
+    with pytest.raises(ValueError):
+        sweep_grid(bank=[1])
+
+
+def test_run_sweep_matches_direct_solves(tmp_path) -> None:
+    data = make_input_data()
+    base_cap = data.team_rules.salary_cap
+    variants = sweep_grid(salary_cap=[base_cap, base_cap * 0.9], utility_bench_count=[None])
+
+    results = run_sweep(
+        players=data.players,
+        team_rules=data.team_rules,
+        rounds=data.rounds,
+        variants=variants,
+        config=SweepConfig(solver="cbc", output_dir=tmp_path),
+        max_workers=2,
+    )
+
+    assert [r.name for r in results] == [v.name for v in variants]
+    for variant, result in zip(variants, results):
+        rules, rounds = variant.apply(data.team_rules, data.rounds)
+        expected = cbc_optimum(ModelInputData(players=data.players, rounds=rounds, team_rules=rules))
+        assert result.status == "Optimal"
+        assert result.objective_value == pytest.approx(expected)
+        assert result.solution_path is not None and (tmp_path / result.solution_path).exists()
+
+    write_sweep_summary_csv(tmp_path / "summary.csv", results)
+    with (tmp_path / "summary.csv").open(encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["name"] for row in rows] == [r.name for r in results]
+    assert results[0].name in format_sweep_table(results)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pulp
+import pytest
+
+from retro_fantasy.formulation import FormulationOptions, formulate_problem
+from retro_fantasy.matrix import build_matrix_model
+
+from conftest import constraint_signature, make_input_data
+
+
+FLOW = FormulationOptions(trade_flow=True)
+LEAN_FLOW = FormulationOptions(lean=True, trade_flow=True)
+
+
+@pytest.mark.parametrize("options", [FLOW, LEAN_FLOW])
+def test_trade_flow_matrix_build_mode_matches_pulp_build_mode(options: FormulationOptions) -> None:
+    data = make_input_data()
+
+    problem_pulp, _ = formulate_problem(data, build_mode="pulp", options=options)
+    problem_matrix, _ = formulate_problem(data, build_mode="matrix", options=options)
+
+    assert constraint_signature(problem_matrix) == constraint_signature(problem_pulp)
+    assert [(v.name, v.lowBound, v.upBound, v.cat) for v in problem_matrix.variables()] == [
+        (v.name, v.lowBound, v.upBound, v.cat) for v in problem_pulp.variables()
+    ]
+
+
+def test_trade_flow_has_fewer_binaries_and_rows() -> None:
+    data = make_input_data()
+    full = build_matrix_model(data)
+    flow = build_matrix_model(data, options=FLOW)
+
+    n_trades = 2 * len(data.player_ids) * len(data.rounds_excluding_1)
+    assert int(flow.integrality.sum()) == int(full.integrality.sum()) - n_trades
+    assert flow.num_rows < full.num_rows
+    lean = build_matrix_model(data, options=FormulationOptions(lean=True))
+    assert build_matrix_model(data, options=LEAN_FLOW).num_rows < lean.num_rows
+
+    problem, dvs = formulate_problem(data, options=FLOW)
+    assert {"trade_flow_1_2", "trade_link_ub_out_requires_prev_1_2"} <= set(problem.constraints)
+    for prefix in ("trade_link_lb_", "trade_link_ub_in_", "max_trades_in_", "trade_balance_", "no_trade_"):
+        assert not any(name.startswith(prefix) for name in problem.constraints)
+    assert dvs.traded_in[(1, 2)].cat == pulp.LpContinuous
+
+    # Player 3 has no round-3 price: trades are banned by bounds instead of rows.
+    assert dvs.traded_in[(3, 3)].upBound == 0
+    assert dvs.traded_out[(3, 3)].upBound == 0
+
+
+@pytest.mark.parametrize("options", [FLOW, LEAN_FLOW])
+def test_trade_flow_solves_to_same_objective_with_exact_trades(options: FormulationOptions) -> None:
+    data = make_input_data()
+
+    full, _ = formulate_problem(data)
+    flow, flow_dvs = formulate_problem(data, options=options)
+
+    assert pulp.LpStatus[full.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.LpStatus[flow.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    assert pulp.value(flow.objective) == pytest.approx(pulp.value(full.objective))
+
+    # The flow optimum is feasible for every row of the full model: the
+    # continuous trade variables come out exactly 0/1.
+    flow_values = {v.name: v.varValue for v in flow.variables()}
+    for v in full.variables():
+        v.varValue = flow_values[v.name]
+    violated = [name for name, c in full.constraints.items() if not c.valid(eps=1e-6)]
+    assert violated == []
+
+    for (p, r), var in flow_dvs.traded_in.items():
+        moved = round(flow_dvs.x_selected[(p, r)].varValue) - round(flow_dvs.x_selected[(p, r - 1)].varValue)
+        assert var.varValue == pytest.approx(max(0, moved))
+        assert flow_dvs.traded_out[(p, r)].varValue == pytest.approx(max(0, -moved))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+
+import pulp
+import pytest
+
+from retro_fantasy.constructive import build_constructive_plan
+from retro_fantasy.data import ModelInputData, Round
+from retro_fantasy.formulation import formulate_problem
+from retro_fantasy.matrix import build_matrix_model
+from retro_fantasy.solution import (
+    SolutionSummary,
+    build_solution_summary,
+    load_solution_summary,
+    solution_summary_to_json_dict,
+)
+from retro_fantasy.warm_start import apply_warm_start, build_warm_start, load_warm_start, warm_start_vector
+
+from conftest import make_input_data, make_random_input_data
+
+
+def _solved_summary(data: ModelInputData) -> tuple[SolutionSummary, float]:
+    problem, dvs = formulate_problem(data)
+    assert pulp.LpStatus[problem.solve(pulp.PULP_CBC_CMD(msg=False))] == "Optimal"
+    summary = build_solution_summary(model_input_data=data, decision_variables=dvs, problem=problem)
+    return summary, float(pulp.value(problem.objective))
+
+
+def _assert_feasible_start(data: ModelInputData, summary: SolutionSummary) -> float:
+    ws = build_warm_start(data, summary)
+    assert ws is not None
+
+    problem, dvs = formulate_problem(data)
+    apply_warm_start(dvs, ws)
+    for v in problem.variables():
+        v.varValue = v.varValue if v.varValue is not None else 0.0
+
+    violated = [name for name, c in problem.constraints.items() if not c.valid(eps=1e-6)]
+    assert violated == []
+    return float(pulp.value(problem.objective))
+
+
+def test_warm_start_reproduces_previous_optimum() -> None:
+    data = make_input_data()
+    summary, optimum = _solved_summary(data)
+
+    assert _assert_feasible_start(data, summary) == pytest.approx(optimum)
+    assert build_warm_start(data, summary).repaired_rounds == []
+
+
+def test_warm_start_is_repaired_when_trade_limits_tighten() -> None:
+    data = make_input_data()
+    summary, _ = _solved_summary(data)
+
+    # Same season, but no trades allowed after round 1.
+    strict = ModelInputData(
+        players=data.players,
+        rounds={r: Round(number=r, max_trades=0, counted_onfield_players=rd.counted_onfield_players) for r, rd in data.rounds.items()},
+        team_rules=data.team_rules,
+    )
+    _assert_feasible_start(strict, summary)
+    assert build_warm_start(strict, summary).traded_in == {}
+
+
+def test_warm_start_keeps_later_trades_when_a_prior_player_is_missing() -> None:
+    data = make_random_input_data()
+    summary = build_constructive_plan(data).summary
+    full = build_warm_start(data, summary)
+    assert full.repaired_rounds == []
+    assert full.traded_in
+
+    # Drop a round-1 pick the prior plan never trades; only round 1 needs repair.
+    traded = {p for p, _ in full.traded_out}
+    missing = next(e.player_id for e in summary.rounds[1].team if e.player_id not in traded)
+    partial = ModelInputData(
+        players={p: player for p, player in data.players.items() if p != missing},
+        rounds=data.rounds,
+        team_rules=data.team_rules,
+    )
+
+    _assert_feasible_start(partial, summary)
+    ws = build_warm_start(partial, summary)
+    assert ws.repaired_rounds == [1]
+    assert ws.traded_in == full.traded_in
+    assert ws.traded_out == full.traded_out
+
+
+def test_warm_start_round_trips_through_solution_json(tmp_path) -> None:
+    data = make_input_data()
+    summary, _ = _solved_summary(data)
+
+    path = tmp_path / "solution.json"
+    path.write_text(json.dumps(solution_summary_to_json_dict(summary)), encoding="utf-8")
+
+    assert load_solution_summary(path) == summary
+    assert load_warm_start(data, path) == build_warm_start(data, summary)
+
+
+def test_warm_start_vector_aligns_with_matrix_columns() -> None:
+    data = make_input_data()
+    summary, _ = _solved_summary(data)
+    ws = build_warm_start(data, summary)
+
+    mm = build_matrix_model(data)
+    values = warm_start_vector(mm, ws)
+
+    start, _stop = mm.families["bank"]
+    assert values[start:].tolist() == [ws.bank[r] for r in data.round_numbers]
+    assert float(mm.objective @ values) == pytest.approx(summary.objective_value)
+
+
+def test_cbc_solve_accepts_warm_start() -> None:
+    data = make_input_data()
+    summary, optimum = _solved_summary(data)
+
+    problem, dvs = formulate_problem(data)
+    apply_warm_start(dvs, build_warm_start(data, summary))
+    assert pulp.LpStatus[problem.solve(pulp.PULP_CBC_CMD(msg=False, warmStart=True))] == "Optimal"
+    assert pulp.value(problem.objective) == pytest.approx(optimum)